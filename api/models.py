@@ -76,3 +76,11 @@ class PretradeCheckResponse(BaseModel):
     hard_gate: bool = False
     quotas: Optional[Dict[str, Any]] = None
     observability: Dict[str, Any]
+
+
+class PretradeCheckBatchRequest(BaseModel):
+    intents: List[PretradeCheckRequest] = Field(default_factory=list)
+
+
+class PretradeCheckBatchResponse(BaseModel):
+    results: List[PretradeCheckResponse]
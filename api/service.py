@@ -4,13 +4,14 @@ import yaml
 import asyncio
 import uvicorn
 import json
+import logging
 import time
 from fastapi import FastAPI, HTTPException, Request
 from contextlib import asynccontextmanager
 from fastapi.responses import RedirectResponse
 from pathlib import Path
 from pydantic import BaseModel
-from typing import Any, Dict, cast
+from typing import Any, Dict, Optional, cast
 from prometheus_client import make_asgi_app, Histogram, Gauge, Counter
 from dotenv import load_dotenv, find_dotenv
 
@@ -29,11 +30,24 @@ except Exception:
 # Lazy import TradingSystem to avoid heavy deps (e.g., torch) at module import time.
 # We'll attempt to import it during app lifespan and fall back gracefully if unavailable.
 from core.scalper.trap import TrapWindow
-from core.aurora.pipeline import PretradePipeline
-from common.config import load_sprt_cfg, load_config_precedence, apply_env_overrides
+from core.aurora.pipeline import BatchDecideError, PretradePipeline
+from core.aurora.gate_params import GateParams
+from core.aurora.stage_timing import StageTiming
+from core.aurora.embedded import (
+    anti_churn_precheck,
+    apply_posttrade,
+    build_health_guard,
+    build_recalibrator,
+    build_trap_window,
+    canon_symbol,
+    init_anti_churn_state,
+    record_decision,
+)
+from core.config import hotreload
+from common.config import load_sprt_cfg, load_config_precedence, apply_env_overrides, resolve_config_path
 from common.events import EventEmitter
-from core.aurora_event_logger import AuroraEventLogger
-from core.order_logger import OrderLoggers
+from core.aurora_event_logger import AsyncEventEmitter, AuroraEventLogger
+from core.order_logger import CommitPolicy, OrderLoggers, rotation_worker
 from core.ack_tracker import AckTracker
 from risk.manager import RiskManager
 from aurora.health import HealthGuard
@@ -57,16 +71,55 @@ from api.models import (
     PredictionResponse,
     PretradeCheckRequest,
     PretradeCheckResponse,
+    PretradeCheckBatchRequest,
+    PretradeCheckBatchResponse,
 )
 
 
+logger = logging.getLogger("aurora.api.service")
+
+
 # --- Initialization ---
 # Deprecated fallback kept for BC if precedence chain yields empty
 CONFIG_PATH = os.path.join(PROJECT_ROOT, 'configs', 'v4_min.yaml')
+# Upper bound on intents per /pretrade/check_batch request (cfg.pretrade.batch_max / AURORA_PRETRADE_BATCH_MAX)
+PRETRADE_BATCH_MAX = 256
 
 VERSION = get_version()
 
 
+def _load_service_cfg() -> dict:
+    """Config layering used at startup: precedence chain → legacy CONFIG_PATH → env overrides."""
+    cfg = load_config_precedence()
+    if not cfg:
+        # final fallback for legacy deployments
+        with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
+            cfg = yaml.safe_load(f) or {}
+    return apply_env_overrides(cfg)
+
+
+def _reload_cfg(old_cfg: dict, policy: hotreload.HotReloadPolicy) -> Optional[dict]:
+    """Re-read config with the startup layering and apply only whitelisted changed keys.
+
+    Changed keys outside `policy` are logged at warning level and left at their running
+    value, so one rejected edit does not block later whitelisted ones. Returns None when
+    no whitelisted key changed.
+    """
+    new_cfg = _load_service_cfg()
+    if not new_cfg:
+        return None
+    changed = hotreload.diff_dicts(old_cfg or {}, new_cfg)
+    rejected = policy.violations(changed)
+    if rejected:
+        hotreload.logger.warning(
+            "Hot-reload ignored non-whitelisted keys (restart to apply): %s", sorted(rejected)
+        )
+    allowed = changed - rejected
+    if not allowed:
+        return None
+    return hotreload.apply_keys(old_cfg or {}, new_cfg, allowed)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # startup
@@ -75,11 +128,7 @@ async def lifespan(app: FastAPI):
     cfg: dict = {}
     try:
         # Unified precedence: env → defaults chain; then apply env overrides
-        cfg = load_config_precedence()
-        if not cfg:
-            # final fallback for legacy deployments
-            cfg = yaml.safe_load(open(CONFIG_PATH, 'r', encoding='utf-8')) or {}
-        cfg = apply_env_overrides(cfg)
+        cfg = _load_service_cfg()
     except Exception:
         cfg = {}
     # Session log directory
@@ -110,6 +159,35 @@ async def lifespan(app: FastAPI):
         sprt_cfg = None
     app.state.cfg = cfg
     app.state.sprt_cfg = sprt_cfg
+    # Compiled pretrade gate params: built once here, swapped atomically on config change
+    app.state.gate_params = GateParams.from_cfg(cfg)
+    try:
+        batch_max = ((cfg or {}).get('pretrade') or {}).get('batch_max') or os.getenv('AURORA_PRETRADE_BATCH_MAX')
+        app.state.pretrade_batch_max = max(1, int(batch_max)) if batch_max else PRETRADE_BATCH_MAX
+    except Exception:
+        app.state.pretrade_batch_max = PRETRADE_BATCH_MAX
+    app.state.cfg_watcher = None
+    try:
+        watch_env = os.getenv('AURORA_CONFIG_WATCH', '0').strip().lower() in {'1', 'true', 'yes', 'on'}
+        cfg_src = resolve_config_path(os.getenv('AURORA_CONFIG') or os.getenv('AURORA_CONFIG_NAME'))
+        if watch_env and cfg_src is not None:
+            # Only keys under cfg.hotreload.whitelist (as loaded at startup) may change live
+            reload_policy = hotreload.HotReloadPolicy.from_iterable(
+                ((cfg or {}).get('hotreload') or {}).get('whitelist') or []
+            )
+
+            def _on_config_change(path: Path, _mtime: float) -> None:
+                new_cfg = _reload_cfg(app.state.cfg, reload_policy)
+                if new_cfg is None:
+                    return
+                # compile first, then publish; readers see either old or new params, never a mix
+                app.state.gate_params = GateParams.from_cfg(new_cfg)
+                app.state.cfg = new_cfg
+
+            app.state.cfg_watcher = hotreload.FileWatcher(cfg_src, _on_config_change)
+            app.state.cfg_watcher.start()
+    except Exception:
+        app.state.cfg_watcher = None
 
     # Fail-fast: legacy 'shadow' runtime mode has been removed project-wide.
     aurora_mode = os.getenv('AURORA_MODE', 'testnet')
@@ -130,7 +208,22 @@ async def lifespan(app: FastAPI):
         sess_dir: Path = getattr(app.state, 'session_dir', Path('logs'))
     except Exception:
         sess_dir = Path('logs')
-    em_logger = AuroraEventLogger(path=sess_dir / Path(emitter_path).name)
+    # Group-commit durability for JSONL streams (cfg.logging.commit / AURORA_LOG_COMMIT_*)
+    try:
+        commit_policy = CommitPolicy.from_cfg(cfg)
+    except Exception:
+        commit_policy = CommitPolicy()
+    app.state.commit_policy = commit_policy
+    # Rotated parts are compressed/purged in the background; mirror progress to Prometheus
+    try:
+        rotation_worker().set_metrics(
+            pending_gauge=LOG_ROTATION_PENDING,
+            done_counter=LOG_ROTATIONS,
+            seconds_hist=LOG_ROTATION_SECONDS,
+        )
+    except Exception:
+        pass
+    em_logger = AuroraEventLogger(path=sess_dir / Path(emitter_path).name, policy=commit_policy)
     try:
         print(f"[SESSION] logs dir = {sess_dir}")
     except Exception:
@@ -141,6 +234,32 @@ async def lifespan(app: FastAPI):
     except Exception:
         pass
     app.state.events_emitter = em_logger
+    # Per-stage pretrade timings: Prometheus histogram + optional obs copy + sampled trace file
+    try:
+        app.state.stage_timing = StageTiming.from_cfg(cfg, session_dir=sess_dir, histogram=PRETRADE_STAGE_LATENCY)
+    except Exception:
+        app.state.stage_timing = None
+    # Off-event-loop emission: a bounded queue drained by a writer thread (cfg.logging.async / AURORA_EVENTS_*)
+    try:
+        async_cfg = ((cfg or {}).get('logging') or {}).get('async') or {}
+        async_on = async_cfg.get('enabled')
+        if async_on is None:
+            async_on = os.getenv('AURORA_EVENTS_ASYNC', '1').strip().lower() in {'1', 'true', 'yes', 'on'}
+        if async_on:
+            backpressure = str(async_cfg.get('backpressure', os.getenv('AURORA_EVENTS_BACKPRESSURE', 'drop_noncritical')))
+            if backpressure == 'block':
+                # emit() runs on the event loop here; waiting for queue space would stall it
+                logger.warning("events backpressure 'block' is not supported by the service; using 'spill'")
+                backpressure = 'spill'
+            em_async = AsyncEventEmitter(
+                em_logger,
+                maxsize=int(async_cfg.get('queue_size', os.getenv('AURORA_EVENTS_QUEUE_SIZE', 10000))),
+                policy=backpressure,
+            )
+            em_async.set_metrics(depth_gauge=EVENTS_QUEUE_DEPTH, dropped_counter=EVENTS_DROPPED)
+            app.state.events_emitter = em_async
+    except Exception:
+        app.state.events_emitter = em_logger
     # Emit config switched for observability
     try:
         cfg_name = os.getenv('AURORA_CONFIG') or os.getenv('AURORA_CONFIG_NAME') or 'default(v4_min.yaml)'
@@ -159,7 +278,7 @@ async def lifespan(app: FastAPI):
             ack_ttl = int(ack_ttl)
         except Exception:
             ack_ttl = 300
-        ack_tracker = AckTracker(events_emit=lambda code, d: em_logger.emit(code, d), ttl_s=ack_ttl)
+        ack_tracker = AckTracker(events_emit=lambda code, d: app.state.events_emitter.emit(code, d), ttl_s=ack_ttl)
         app.state.ack_tracker = ack_tracker
         import asyncio as _aio
         app.state._ack_scan_stop = _aio.Event()
@@ -197,37 +316,16 @@ async def lifespan(app: FastAPI):
             success_path=(getattr(app.state, 'session_dir', Path('logs')) / 'orders_success.jsonl'),
             failed_path=(getattr(app.state, 'session_dir', Path('logs')) / 'orders_failed.jsonl'),
             denied_path=(getattr(app.state, 'session_dir', Path('logs')) / 'orders_denied.jsonl'),
+            policy=commit_policy,
         )
     except Exception:
         app.state.order_loggers = None
 
     # Trap window
-    trap_cfg = (cfg or {}).get('trap') or {}
-    try:
-        window_s = float(trap_cfg.get('window_s', 2.0))
-    except Exception:
-        window_s = 2.0
-    try:
-        levels = int(trap_cfg.get('levels', 5))
-    except Exception:
-        levels = 5
-    app.state.trap_window = TrapWindow(window_s=window_s, levels=levels)
+    app.state.trap_window = build_trap_window(cfg)
 
     # Health guard (latency p95)
-    try:
-        guard_cfg = (cfg or {}).get('aurora', {}) or {}
-        l_guard_ms = float(guard_cfg.get('latency_guard_ms', os.getenv('AURORA_LATENCY_GUARD_MS', 30)))
-        l_window_sec = int(guard_cfg.get('latency_window_sec', os.getenv('AURORA_LATENCY_WINDOW_SEC', 60)))
-        l_cooloff = int(guard_cfg.get('cooloff_base_sec', os.getenv('AURORA_COOLOFF_SEC', 120)))
-        l_halt_rep = int(guard_cfg.get('halt_threshold_repeats', os.getenv('AURORA_HALT_THRESHOLD_REPEATS', 2)))
-    except Exception:
-        l_guard_ms, l_window_sec, l_cooloff, l_halt_rep = 30.0, 60, 120, 2
-    app.state.health_guard = HealthGuard(
-        threshold_ms=l_guard_ms,
-        window_sec=l_window_sec,
-        base_cooloff_sec=l_cooloff,
-        halt_threshold_repeats=l_halt_rep,
-    )
+    app.state.health_guard = build_health_guard(cfg)
 
     # Trading system (optional). Import lazily so missing torch doesn't break API for shadow-mode gates.
     try:
@@ -259,47 +357,15 @@ async def lifespan(app: FastAPI):
     except Exception:
         app.state.governance = Governance({})
 
+    # Online recalibration fed by posttrade outcomes (off unless calibration.online.enabled)
+    try:
+        app.state.recalibrator = build_recalibrator(cfg)
+    except Exception:
+        app.state.recalibrator = None
+
     # Anti-churn state: per-symbol open rate-limit and cooldown after close (always initialize)
     try:
-        aurora_cfg = (cfg or {}).get('aurora', {}) or {}
-        min_open_interval_ms = aurora_cfg.get('min_open_interval_ms')
-        if min_open_interval_ms is None:
-            try:
-                min_open_interval_ms = int(os.getenv('AURORA_MIN_OPEN_INTERVAL_MS', '0'))
-            except Exception:
-                min_open_interval_ms = 0
-        else:
-            try:
-                min_open_interval_ms = int(min_open_interval_ms)
-            except Exception:
-                min_open_interval_ms = 0
-        cooldown_after_close_ms = aurora_cfg.get('cooldown_after_close_ms')
-        if cooldown_after_close_ms is None:
-            try:
-                cooldown_after_close_ms = int(os.getenv('AURORA_COOLDOWN_AFTER_CLOSE_MS', '0'))
-            except Exception:
-                cooldown_after_close_ms = 0
-        else:
-            try:
-                cooldown_after_close_ms = int(cooldown_after_close_ms)
-            except Exception:
-                cooldown_after_close_ms = 0
-        app.state.min_open_interval_ms = int(max(0, min_open_interval_ms))
-        app.state.cooldown_after_close_ms = int(max(0, cooldown_after_close_ms))
-        # runtime maps
-        app.state._last_open_allow_ms = {}
-        app.state._cooldown_until_ms = {}
-        # Position state: track open direction and since_ms per symbol
-        try:
-            mph = aurora_cfg.get('min_position_hold_ms')
-            if mph is None:
-                mph = int(os.getenv('AURORA_MIN_POSITION_HOLD_MS', '0'))
-            else:
-                mph = int(mph)
-        except Exception:
-            mph = 0
-        app.state.min_position_hold_ms = int(max(0, mph))
-        app.state._position_state = {}
+        init_anti_churn_state(app.state, cfg)
     except Exception:
         app.state.min_open_interval_ms = 0
         app.state.cooldown_after_close_ms = 0
@@ -311,12 +377,36 @@ async def lifespan(app: FastAPI):
     yield
 
     # shutdown
+    watcher = getattr(app.state, 'cfg_watcher', None)
+    if watcher is not None:
+        try:
+            watcher.stop()
+        except Exception:
+            pass
     emitter = getattr(app.state, 'events_emitter', None)
     if emitter is not None and hasattr(emitter, 'close'):
         try:
             emitter.close()
         except Exception:
             pass
+    stage_timing = getattr(app.state, 'stage_timing', None)
+    if stage_timing is not None:
+        try:
+            stage_timing.close()
+        except Exception:
+            pass
+    order_loggers = getattr(app.state, 'order_loggers', None)
+    if order_loggers is not None:
+        try:
+            order_loggers.close()
+        except Exception:
+            pass
+    recalibrator = getattr(app.state, 'recalibrator', None)
+    if recalibrator is not None:
+        try:
+            recalibrator.close()
+        except Exception:
+            pass
     # Stop ack scanner task
     try:
         stp = getattr(app.state, '_ack_scan_stop', None)
@@ -350,6 +440,17 @@ REGIME = Gauge('aurora_regime', 'Current detected market regime')
 REQUESTS = Counter('aurora_prediction_requests_total', 'Total prediction requests')
 OPS_TOKEN_ROTATIONS = Counter('aurora_ops_token_rotations_total', 'Total OPS token rotations')
 EVENTS_EMITTED = Counter('aurora_events_emitted_total', 'Total Aurora events emitted', ['code'])
+EVENTS_QUEUE_DEPTH = Gauge('aurora_events_queue_depth', 'Events waiting in the async emitter queue')
+EVENTS_DROPPED = Counter('aurora_events_dropped_total', 'Events dropped by async emitter backpressure', ['reason'])
+PRETRADE_STAGE_LATENCY = Histogram(
+    'aurora_pretrade_stage_latency_us',
+    'Pretrade pipeline per-stage latency in microseconds',
+    ['stage'],
+    buckets=(1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000),
+)
+LOG_ROTATION_PENDING = Gauge('aurora_log_rotation_pending', 'Rotated log parts waiting for compression/purge')
+LOG_ROTATIONS = Counter('aurora_log_rotations_total', 'Completed log rotation jobs', ['result'])
+LOG_ROTATION_SECONDS = Histogram('aurora_log_rotation_seconds', 'Background compression+purge time per rotated part', buckets=(0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60))
 ORDERS_SUCCESS = Counter('aurora_orders_success_total', 'Total successful orders recorded')
 ORDERS_DENIED = Counter('aurora_orders_denied_total', 'Total denied orders recorded')
 ORDERS_REJECTED = Counter('aurora_orders_rejected_total', 'Total rejected orders recorded')
@@ -395,6 +496,15 @@ def _ops_auth(x_ops_token: str | None = Header(default=None, alias="X-OPS-TOKEN"
     return True
 
 
+def _gate_params(state: Any) -> GateParams:
+    """Return compiled gate params, compiling lazily when lifespan did not run."""
+    gp = getattr(state, 'gate_params', None)
+    if gp is None:
+        gp = GateParams.from_cfg(getattr(state, 'cfg', {}) or {})
+        state.gate_params = gp
+    return gp
+
+
 # --- API Endpoints ---
 @app.post("/predict", response_model=PredictionResponse)
 async def predict(request: PredictionRequest):
@@ -478,34 +588,22 @@ async def readiness(_: bool = Depends(_ops_auth)):
     raise HTTPException(status_code=503, detail=body)
 
 
-@app.post("/pretrade/check", response_model=PretradeCheckResponse)
-async def pretrade_check(request: Request, req: PretradeCheckRequest):
+def _as_dict(v: Any) -> Dict[str, Any]:
+    # Уніфікувати представлення у dict, навіть якщо це Pydantic-моделі
     try:
-        # Уніфікувати представлення у dict, навіть якщо це Pydantic-моделі
-        def _as_dict(v: Any) -> Dict[str, Any]:
-            try:
-                return cast(Dict[str, Any], v.model_dump())  # type: ignore[attr-defined]
-            except Exception:
-                try:
-                    return dict(v)  # type: ignore[arg-type]
-                except Exception:
-                    return cast(Dict[str, Any], v or {})
-
-        acc: Dict[str, Any] = _as_dict(req.account)
-        o: Dict[str, Any] = _as_dict(req.order)
-        m: Dict[str, Any] = _as_dict(req.market)
-    except Exception as e:
-        # Невалідний формат запиту
-        raise HTTPException(status_code=422, detail=str(e))
+        return cast(Dict[str, Any], v.model_dump())  # type: ignore[attr-defined]
+    except Exception:
+        try:
+            return dict(v)  # type: ignore[arg-type]
+        except Exception:
+            return cast(Dict[str, Any], v or {})
 
-    mode = (acc or {}).get('mode', os.getenv('AURORA_MODE', 'testnet'))
-    max_qty = float((o or {}).get('qty', 0.0) or 0.0)
 
-    emitter: EventEmitter | None = getattr(request.app.state, 'events_emitter', None)
-    # Advisory: if prod and trading system isn't ready, emit a service_unhealthy note
+def _service_diagnostics(state: Any, mode: str, emitter: EventEmitter | None) -> list[str]:
+    """Advisory: if prod and trading system isn't ready, emit a service_unhealthy note."""
     diagnostics_local: list[str] = []
     if mode == 'prod':
-        ts = getattr(request.app.state, 'trading_system', None)
+        ts = getattr(state, 'trading_system', None)
         if ts is None or ts.student is None or ts.router is None:
             diagnostics_local.append('service_unhealthy')
             if emitter:
@@ -518,458 +616,274 @@ async def pretrade_check(request: Request, req: PretradeCheckRequest):
                     )
                 except Exception:
                     pass
+    return diagnostics_local
+
+
+def _build_pipeline(state: Any, emitter: EventEmitter | None) -> PretradePipeline:
+    return PretradePipeline(
+        emitter=emitter,
+        trap_window=getattr(state, 'trap_window', None),
+        health_guard=getattr(state, 'health_guard', None),
+        risk_manager=getattr(state, 'risk_manager', None),
+        governance=getattr(state, 'governance', None),
+        cfg=getattr(state, 'cfg', {}) or {},
+        params=_gate_params(state),
+        timing=getattr(state, 'stage_timing', None),
+        recalibrator=getattr(state, 'recalibrator', None),
+    )
+
+
+def _persist_trap_window(state: Any, pipeline: PretradePipeline | None) -> None:
+    # If pipeline created a trap_window lazily, persist it back to app.state
+    try:
+        if pipeline is not None and getattr(pipeline, 'tw', None) is not None and getattr(state, 'trap_window', None) is None:
+            setattr(state, 'trap_window', pipeline.tw)
+    except Exception:
+        pass
+
+
+def _finalize_pretrade(
+    state: Any,
+    emitter: EventEmitter | None,
+    *,
+    mode: str,
+    order: Dict[str, Any],
+    allow: bool,
+    reason: str,
+    obs: Dict[str, Any],
+    risk_scale: float,
+    diagnostics_local: list[str],
+) -> PretradeCheckResponse:
+    """Emit decision side effects (spread trip, denied log, POLICY.DECISION) and build the response."""
+    max_qty = float((order or {}).get('qty', 0.0) or 0.0)
+    quotas = {'trades_pm_left': 999, 'symbol_exposure_left_usdt': 1e12}
+
+    ol: OrderLoggers | None = None
+    if not allow:
+        # Increment counter regardless of file writer availability
+        try:
+            ORDERS_DENIED.inc()
+        except Exception:
+            pass
+        ol = getattr(state, 'order_loggers', None)
+        if ol is None:
+            # Lazy init to keep counters tied to actual writes even if lifespan didn't run
+            try:
+                ol = OrderLoggers()
+                setattr(state, 'order_loggers', ol)
+            except Exception:
+                ol = None
+
+    record_decision(
+        emitter,
+        ol,
+        mode=mode,
+        order=order,
+        allow=allow,
+        reason=reason,
+        obs=obs,
+        spread_limit_bps=_gate_params(state).spread_limit_bps,
+        diagnostics=diagnostics_local,
+    )
+
+    return PretradeCheckResponse(allow=allow, max_qty=max_qty, reason=reason, observability=obs, quotas=quotas, risk_scale=risk_scale)
+
+
+@app.post("/pretrade/check", response_model=PretradeCheckResponse)
+async def pretrade_check(request: Request, req: PretradeCheckRequest):
+    try:
+        acc: Dict[str, Any] = _as_dict(req.account)
+        o: Dict[str, Any] = _as_dict(req.order)
+        m: Dict[str, Any] = _as_dict(req.market)
+    except Exception as e:
+        # Невалідний формат запиту
+        raise HTTPException(status_code=422, detail=str(e))
+
+    state = request.app.state
+    mode = (acc or {}).get('mode', os.getenv('AURORA_MODE', 'testnet'))
+    emitter: EventEmitter | None = getattr(state, 'events_emitter', None)
+    diagnostics_local = _service_diagnostics(state, mode, emitter)
 
     # Anti-churn precheck (rate-limit opens and respect cooldown after close)
     allow: bool = False
     reason: str = "uninitialized"
-    obs: Dict[str, Any]
+    obs: Dict[str, Any] = {"reasons": []}
     risk_scale: float = 1.0
-    obs = {"reasons": []}
     pipeline = None
-    def _canon_symbol(s: Any) -> str | None:
-        try:
-            if not s:
-                return None
-            s2 = str(s).upper().strip()
-            # Normalize forms like 'BINANCE:BTC/USDT' -> 'BTC/USDT'
-            if ':' in s2:
-                s2 = s2.split(':', 1)[-1]
-            return s2
-        except Exception:
-            return None
-
     try:
-        sym_raw = (o or {}).get('symbol') or (m or {}).get('symbol')
-        sym = _canon_symbol(sym_raw)
+        sym = canon_symbol((o or {}).get('symbol') or (m or {}).get('symbol'))
         side = str((o or {}).get('side') or '').lower() or None
         now_ms = int(time.time() * 1000)
-        # Per-symbol cooldown after close
-        cd_until = getattr(request.app.state, '_cooldown_until_ms', {}).get(sym) if sym else None
-        if sym and isinstance(cd_until, (int, float)) and now_ms < int(cd_until) and int(getattr(request.app.state, 'cooldown_after_close_ms', 0)) > 0:
-            allow = False
-            reason = 'cooldown_after_close_active'
-            try:
-                remaining = int(cd_until) - now_ms
-                obs['cooldown_remaining_ms'] = max(0, remaining)
-            except Exception:
-                pass
-            obs['reasons'].append('cooldown_after_close_active')
-            # Emit observability event
-            try:
-                if emitter:
-                    emitter.emit('COOLDOWN.ACTIVE', {'symbol': sym, 'ms_left': obs.get('cooldown_remaining_ms', 0)})
-            except Exception:
-                pass
+        block = anti_churn_precheck(state, sym, side, now_ms, emitter, obs)
+        if block is not None:
+            allow, reason = False, block
         else:
-            # Per-symbol minimal interval between open approvals
-            min_iv = int(getattr(request.app.state, 'min_open_interval_ms', 0))
-            last_ok = getattr(request.app.state, '_last_open_allow_ms', {}).get(sym) if sym else None
-            if sym and min_iv > 0 and isinstance(last_ok, (int, float)) and (now_ms - int(last_ok)) < min_iv:
-                allow = False
-                reason = 'open_rate_limit'
-                try:
-                    obs['rate_limit_ms_left'] = max(0, min_iv - (now_ms - int(last_ok)))
-                except Exception:
-                    pass
-                obs['reasons'].append('open_rate_limit')
+            # Run core pipeline when anti-churn didn't block
+            pipeline = _build_pipeline(state, emitter)
+            allow, reason, obs, risk_scale = pipeline.decide(
+                account=acc,
+                order=o,
+                market=m,
+                fees_bps=float(req.fees_bps or 0.0),
+            )
+            # On allow, stamp last allow time for symbol
+            if allow and sym:
                 try:
-                    if emitter:
-                        emitter.emit('OPEN.RATE_LIMIT', {'symbol': sym, 'ms_left': obs.get('rate_limit_ms_left', 0)})
+                    getattr(state, '_last_open_allow_ms')[sym] = now_ms  # type: ignore[index]
                 except Exception:
                     pass
-            else:
-                # Enforce min position hold and opposite-side block if a position is open
-                pos_state = getattr(request.app.state, '_position_state', {})
-                min_hold = int(getattr(request.app.state, 'min_position_hold_ms', 0))
-                ps = pos_state.get(sym) if sym else None
-                if sym and ps and isinstance(ps, dict):
-                    open_side = ps.get('side')
-                    since_ms = int(ps.get('since_ms') or 0)
-                    if open_side in {'buy','sell'}:
-                        # Block opposite side while position alive
-                        if side and ((open_side == 'buy' and side == 'sell') or (open_side == 'sell' and side == 'buy')):
-                            # Respect min hold window for any side change
-                            if min_hold > 0 and now_ms - since_ms < min_hold:
-                                allow = False
-                                reason = 'position_min_hold_active'
-                                obs['reasons'].append('position_min_hold_active')
-                                obs['position'] = {'symbol': sym, 'side': open_side, 'age_ms': now_ms - since_ms, 'min_hold_ms': min_hold}
-                                try:
-                                    if emitter:
-                                        emitter.emit('POSITION.MIN_HOLD', {'symbol': sym, 'ms_left': max(0, min_hold - (now_ms - since_ms))})
-                                except Exception:
-                                    pass
-                            else:
-                                # Even if hold window elapsed, prevent cross in same tick to avoid self-trade churn
-                                allow = False
-                                reason = 'opposite_side_block'
-                                obs['reasons'].append('opposite_side_block')
-                                obs['position'] = {'symbol': sym, 'side': open_side, 'age_ms': now_ms - since_ms}
-                                try:
-                                    if emitter:
-                                        emitter.emit('POSITION.OPPOSITE_BLOCK', {'symbol': sym, 'open_side': open_side})
-                                except Exception:
-                                    pass
-                short_circuit = False
-                try:
-                    if reason in ('position_min_hold_active','opposite_side_block','open_rate_limit'):
-                        short_circuit = True
-                except Exception:
-                    short_circuit = False
-                if not short_circuit:
-                    # Run core pipeline when anti-churn didn't block
-                    pipeline = PretradePipeline(
-                        emitter=emitter,
-                        trap_window=getattr(request.app.state, 'trap_window', None),
-                        health_guard=getattr(request.app.state, 'health_guard', None),
-                        risk_manager=getattr(request.app.state, 'risk_manager', None),
-                        governance=getattr(request.app.state, 'governance', None),
-                        cfg=getattr(request.app.state, 'cfg', {}) or {},
-                    )
-                    allow, reason, obs, risk_scale = pipeline.decide(
-                        account=acc,
-                        order=o,
-                        market=m,
-                        fees_bps=float(req.fees_bps or 0.0),
-                    )
-                    # On allow, stamp last allow time for symbol
-                    if allow and sym:
-                        try:
-                            getattr(request.app.state, '_last_open_allow_ms')[sym] = now_ms  # type: ignore[index]
-                        except Exception:
-                            pass
     except Exception:
         # On error, fallback to running pipeline to avoid false blocks
-        pipeline = PretradePipeline(
-            emitter=emitter,
-            trap_window=getattr(request.app.state, 'trap_window', None),
-            health_guard=getattr(request.app.state, 'health_guard', None),
-            risk_manager=getattr(request.app.state, 'risk_manager', None),
-            governance=getattr(request.app.state, 'governance', None),
-            cfg=getattr(request.app.state, 'cfg', {}) or {},
-        )
+        pipeline = _build_pipeline(state, emitter)
         allow, reason, obs, risk_scale = pipeline.decide(
             account=acc,
             order=o,
             market=m,
             fees_bps=float(req.fees_bps or 0.0),
         )
-    # If pipeline created a trap_window lazily, persist it back to app.state
-    try:
-        if pipeline is not None and getattr(pipeline, 'tw', None) is not None and getattr(request.app.state, 'trap_window', None) is None:
-            setattr(request.app.state, 'trap_window', pipeline.tw)
-    except Exception:
-        pass
+    _persist_trap_window(state, pipeline)
 
-    # If blocked due to spread — emit observability event (pipeline computes the decision; we add emit here)
-    try:
-        if not allow and isinstance(reason, str) and reason.startswith('spread_bps_too_wide') and emitter is not None:
-            # extract numbers for payload when possible
-            spread_bps_val = obs.get('spread_bps') if isinstance(obs, dict) else None
-            cfg_all_s = getattr(request.app.state, 'cfg', {}) or {}
-            spread_limit_bps = float(((cfg_all_s.get('guards') or {}).get('spread_bps_limit', 100.0)))
-            emitter.emit(
-                type="SPREAD_GUARD_TRIP",
-                severity="warning",
-                code="SPREAD_GUARD_TRIP",
-                payload={'spread_bps': float(spread_bps_val or 0.0), 'limit_bps': float(spread_limit_bps)},
-            )
-    except Exception:
-        pass
+    return _finalize_pretrade(
+        state, emitter,
+        mode=mode, order=o, allow=allow, reason=reason, obs=obs,
+        risk_scale=risk_scale, diagnostics_local=diagnostics_local,
+    )
 
-    # Merge advisory diagnostics (do not contaminate blocking reasons)
+
+@app.post("/pretrade/check_batch", response_model=PretradeCheckBatchResponse)
+async def pretrade_check_batch(request: Request, req: PretradeCheckBatchRequest):
+    """Evaluate a burst of intents in one pass through the pipeline.
+
+    Results match sequential /pretrade/check calls in request order. Anti-churn
+    prechecks run per intent; intents that pass them are decided together via
+    `PretradePipeline.decide_batch`. With a positive min_open_interval_ms, a
+    repeat of a symbol already in flight waits for the next wave, so it sees
+    whether the earlier intent was allowed (→ open_rate_limit) or denied.
+    Batches above `pretrade_batch_max` intents are rejected with 422.
+    """
+    state = request.app.state
+    cap = int(getattr(state, 'pretrade_batch_max', PRETRADE_BATCH_MAX))
+    if len(req.intents) > cap:
+        raise HTTPException(status_code=422, detail=f"batch of {len(req.intents)} intents exceeds max {cap}")
     try:
-        if diagnostics_local:
-            obs.setdefault('diagnostics', [])
-            # ensure uniqueness while preserving order
-            existing = set(obs['diagnostics']) if isinstance(obs.get('diagnostics'), list) else set()
-            for x in diagnostics_local:
-                if x not in existing:
-                    obs['diagnostics'].append(x)
-                    existing.add(x)
-    except Exception:
-        pass
+        items = [(_as_dict(r.account), _as_dict(r.order), _as_dict(r.market), float(r.fees_bps or 0.0)) for r in req.intents]
+    except Exception as e:
+        raise HTTPException(status_code=422, detail=str(e))
 
-    quotas = {'trades_pm_left': 999, 'symbol_exposure_left_usdt': 1e12}
-    reasons_list = (obs.get('reasons') if isinstance(obs, dict) else None) or []
+    emitter: EventEmitter | None = getattr(state, 'events_emitter', None)
+    now_ms = int(time.time() * 1000)
+    min_iv = int(getattr(state, 'min_open_interval_ms', 0))
+    n = len(items)
+    decisions: list[tuple[bool, str, Dict[str, Any], float] | None] = [None] * n
+    modes: list[str] = []
+    diags: list[list[str]] = []
+    for acc, _o, _m, _fees in items:
+        mode = (acc or {}).get('mode', os.getenv('AURORA_MODE', 'testnet'))
+        modes.append(mode)
+        diags.append(_service_diagnostics(state, mode, emitter))
 
-    # If gate denies, log into denied orders stream
-    try:
-        if not allow:
-            # Increment counter regardless of file writer availability
+    pipeline = None
+    remaining = list(range(n))
+    while remaining:
+        wave: list[int] = []
+        deferred: list[int] = []
+        wave_syms: set[str] = set()
+        for i in remaining:
+            acc, o, m, _fees = items[i]
+            obs: Dict[str, Any] = {"reasons": []}
+            sym = None
             try:
-                ORDERS_DENIED.inc()
+                sym = canon_symbol((o or {}).get('symbol') or (m or {}).get('symbol'))
+                if sym and min_iv > 0 and sym in wave_syms:
+                    deferred.append(i)
+                    continue
+                side = str((o or {}).get('side') or '').lower() or None
+                block = anti_churn_precheck(state, sym, side, now_ms, emitter, obs)
             except Exception:
-                pass
-            ol: OrderLoggers | None = getattr(request.app.state, 'order_loggers', None)
-            if ol is None:
-                # Lazy init to keep counters tied to actual writes even if lifespan didn't run
-                try:
-                    ol = OrderLoggers()
-                    setattr(request.app.state, 'order_loggers', ol)
-                except Exception:
-                    ol = None
-            if ol is not None:
-                ol.log_denied(
-                    ts=int(time.time() * 1000),
-                    symbol=o.get('symbol'),
-                    side=o.get('side'),
-                    qty=o.get('qty'),
-                    price=o.get('price'),
-                    deny_reason=reason,
-                    reasons=reasons_list,
-                    observability=obs,
-                )
-                # Optionally also build a structured OrderDenied schema (best-effort, no-op on failure)
+                # On error, fallback to running pipeline to avoid false blocks
+                block = None
+            if block is not None:
+                decisions[i] = (False, block, obs, 1.0)
+                continue
+            wave.append(i)
+            if sym:
+                wave_syms.add(sym)
+        if not wave:
+            break
+        if pipeline is None:
+            pipeline = _build_pipeline(state, emitter)
+        kw = [{'account': items[i][0], 'order': items[i][1], 'market': items[i][2], 'fees_bps': items[i][3]} for i in wave]
+        try:
+            batch = pipeline.decide_batch(kw)
+        except BatchDecideError as e:
+            # rows before the failure already updated HealthGuard/TRAP state; decide only the rest
+            batch = e.decided + [pipeline.decide(**k) for k in kw[len(e.decided):]]
+        except Exception:
+            # failed in the stateless column pass, before any guard state changed
+            batch = [pipeline.decide(**k) for k in kw]
+        for i, dec in zip(wave, batch):
+            decisions[i] = dec
+            if dec[0]:
                 try:
-                    from core.converters import api_order_to_denied_schema
-                    _ = api_order_to_denied_schema(
-                        decision_id=str(obs.get('decision_id') or ''),
-                        order=o,
-                        deny_reason=reason,
-                        reasons=reasons_list,
-                        observability=obs,
-                    )
+                    sym = canon_symbol((items[i][1] or {}).get('symbol') or (items[i][2] or {}).get('symbol'))
+                    if sym:
+                        getattr(state, '_last_open_allow_ms')[sym] = now_ms  # type: ignore[index]
                 except Exception:
                     pass
-    except Exception:
-        pass
-
-    if emitter:
-        emitter.emit(
-            type=POLICY_DECISION,
-            severity=None,
-            code=None,
-            payload={
-                "decision": "EXECUTE" if allow else "NO_OP",
-                "reasons": (obs.get('reasons') if isinstance(obs, dict) else None) or [],
-                "mode": mode,
-                "observability": obs,
-            },
-        )
-
-    return PretradeCheckResponse(allow=allow, max_qty=max_qty, reason=reason, observability=obs, quotas=quotas, risk_scale=risk_scale)
+        remaining = deferred
+    _persist_trap_window(state, pipeline)
+
+    results = []
+    for i, dec in enumerate(decisions):
+        if dec is None:
+            # Not reached by any wave (e.g. short decide_batch result): decide on its own
+            if pipeline is None:
+                pipeline = _build_pipeline(state, emitter)
+            acc, o, m, fees = items[i]
+            dec = pipeline.decide(account=acc, order=o, market=m, fees_bps=fees)
+        allow, reason, obs, risk_scale = dec
+        results.append(_finalize_pretrade(
+            state, emitter,
+            mode=modes[i], order=items[i][1], allow=allow, reason=reason, obs=obs,
+            risk_scale=risk_scale, diagnostics_local=diags[i],
+        ))
+    return PretradeCheckBatchResponse(results=results)
 
 
 @app.post("/posttrade/log")
 async def posttrade_log(request: Request, payload: dict):
     try:
-        # Emit as event for consolidated observability
-        emitter: EventEmitter | None = getattr(request.app.state, 'events_emitter', None)
-        if emitter:
-            try:
-                emitter.emit(type=POSTTRADE_LOG, severity=None, code=None, payload=payload)
-            except Exception:
-                pass
+        state = request.app.state
+        emitter: EventEmitter | None = getattr(state, 'events_emitter', None)
 
         # Persist raw payload line-by-line into logs/orders.jsonl (path configurable via configs.logging.orders_path)
         try:
-            cfg_all = getattr(request.app.state, 'cfg', {}) or {}
-            default_orders = (getattr(request.app.state, 'session_dir', Path('logs')) / 'orders.jsonl')
+            cfg_all = getattr(state, 'cfg', {}) or {}
+            default_orders = (getattr(state, 'session_dir', Path('logs')) / 'orders.jsonl')
             cfg_orders = ((cfg_all.get('logging') or {}).get('orders_path'))
             # Always place consolidated orders file under session dir, keep only basename
-            orders_path = str((getattr(request.app.state, 'session_dir', Path('logs')) / (Path(cfg_orders).name if cfg_orders else default_orders.name)))
-        except Exception:
-            orders_path = str(getattr(request.app.state, 'session_dir', Path('logs')) / 'orders.jsonl')
-        try:
-            p = Path(orders_path)
-            p.parent.mkdir(parents=True, exist_ok=True)
-            rec = dict(payload)
-            rec.setdefault('ts_server', int(time.time() * 1000))
-            with p.open('a', encoding='utf-8') as f:
-                f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+            orders_path = str((getattr(state, 'session_dir', Path('logs')) / (Path(cfg_orders).name if cfg_orders else default_orders.name)))
         except Exception:
-            # do not fail the API if file-write has issues
-            pass
-
-        # Also route into per-stream order logs and emit canonical ORDER.* events
-        try:
-            ol: OrderLoggers | None = getattr(request.app.state, 'order_loggers', None)
-            em_ev: AuroraEventLogger | None = getattr(request.app.state, 'events_emitter', None)
-            if ol is None:
-                # Lazy init to ensure per-stream writes happen in tests without lifespan
-                try:
-                    ol = OrderLoggers()
-                    setattr(request.app.state, 'order_loggers', ol)
-                except Exception:
-                    ol = None
-            if ol is not None:
-                rec = dict(payload)
-                # If the runner posted the raw CCXT order object under 'response', enrich top-level keys
-                try:
-                    resp = rec.get('response') or {}
-                    if isinstance(resp, dict):
-                        # CCXT unified fields are at top-level of resp; exchange raw under resp['info']
-                        rec.setdefault('status', resp.get('status') or (resp.get('info') or {}).get('status'))
-                        rec.setdefault('filled', resp.get('filled') or (resp.get('info') or {}).get('executedQty'))
-                        rec.setdefault('average', resp.get('average') or resp.get('avg_price'))
-                        rec.setdefault('id', resp.get('id') or (resp.get('info') or {}).get('orderId'))
-                except Exception:
-                    pass
-                status = str(rec.get('status', '')).lower()
-                is_failed = bool(rec.get('error') or rec.get('error_code') or rec.get('error_msg'))
-                is_success = status in {"filled", "partially_filled", "partial", "closed"} or (rec.get('filled') or 0) > 0
-                base = {
-                    'ts': rec.get('ts') or rec.get('ts_server') or int(time.time() * 1000),
-                    'symbol': rec.get('symbol'),
-                    'side': rec.get('side'),
-                    'qty': rec.get('qty') or rec.get('amount'),
-                    'price': rec.get('price'),
-                    'order_id': rec.get('order_id') or rec.get('id'),
-                    'status': rec.get('status'),
-                }
-                if is_failed:
-                    base.update({'error_code': rec.get('error_code'), 'error_msg': rec.get('error_msg'), 'retry': rec.get('retry')})
-                    ol.log_failed(**base)
-                    # Optional: build structured core OrderFailed schema (best-effort)
-                    try:
-                        from core.converters import posttrade_to_failed_schema
-                        _ = posttrade_to_failed_schema(rec, decision_id=str(rec.get('decision_id') or ''), snapshot=None)
-                    except Exception:
-                        pass
-                    # Emit ORDER.REJECT event
-                    try:
-                        if em_ev:
-                            em_ev.emit(
-                                'ORDER.REJECT',
-                                {
-                                    'symbol': base.get('symbol'),
-                                    'oid': base.get('order_id'),
-                                    'side': base.get('side'),
-                                    'qty': base.get('qty'),
-                                    'price': base.get('price'),
-                                    'reason_code': base.get('error_code'),
-                                    'reason_detail': base.get('error_msg'),
-                                },
-                                src='api',
-                            )
-                    except Exception:
-                        pass
-                    try:
-                        ORDERS_REJECTED.inc()
-                    except Exception:
-                        pass
-                elif is_success:
-                    base.update({'fill_qty': rec.get('filled'), 'avg_price': rec.get('average') or rec.get('avg_price'), 'fees': rec.get('fee') or rec.get('fees')})
-                    ol.log_success(**base)
-                    # Update position state on successful orders
-                    try:
-                        sym_raw = rec.get('symbol')
-                        sym = (str(sym_raw).upper().strip() if sym_raw else None)
-                        if sym and ':' in sym:
-                            sym = sym.split(':', 1)[-1]
-                        side = (str(rec.get('side') or '') or '').lower() or None
-                        # Determine if this is a close/reduce.
-                        action = (str(payload.get('action')).lower() if isinstance(payload, dict) and payload.get('action') is not None else None)
-                        close_flag = False
-                        try:
-                            close_flag = bool((payload.get('close') if isinstance(payload, dict) else False) or (payload.get('reduceOnly') if isinstance(payload, dict) else False))
-                            resp2 = payload.get('response') if isinstance(payload, dict) else None
-                            if isinstance(resp2, dict):
-                                close_flag = close_flag or bool(resp2.get('close') or resp2.get('reduceOnly'))
-                        except Exception:
-                            close_flag = False
-                        ps_map = getattr(request.app.state, '_position_state', None)
-                        if isinstance(ps_map, dict) and sym:
-                            if action == 'close' or close_flag:
-                                # Clear position state on close
-                                try:
-                                    if sym in ps_map:
-                                        ps_map.pop(sym, None)
-                                except Exception:
-                                    pass
-                            else:
-                                # Set/refresh position state on open/partial fills
-                                try:
-                                    ps_map[sym] = {'side': side, 'since_ms': int(base.get('ts') or time.time() * 1000)}
-                                except Exception:
-                                    pass
-                    except Exception:
-                        pass
-                    # Optional: build structured core OrderSuccess schema (best-effort)
-                    try:
-                        from core.converters import posttrade_to_success_schema
-                        _ = posttrade_to_success_schema(rec, decision_id=str(rec.get('decision_id') or ''), snapshot=None)
-                    except Exception:
-                        pass
-                    # Emit ORDER.PARTIAL or ORDER.FILL based on filled quantity vs qty if available
-                    try:
-                        if em_ev:
-                            fill_qty = rec.get('filled')
-                            qty = rec.get('qty') or rec.get('amount')
-                            code = 'ORDER.FILL'
-                            try:
-                                if fill_qty is not None and qty is not None and float(fill_qty) < float(qty):
-                                    code = 'ORDER.PARTIAL'
-                            except Exception:
-                                code = 'ORDER.FILL'
-                            em_ev.emit(
-                                code,
-                                {
-                                    'symbol': base.get('symbol'),
-                                    'oid': base.get('order_id'),
-                                    'side': base.get('side'),
-                                    'qty': qty,
-                                    'price': base.get('price') or base.get('avg_price'),
-                                    'fill_qty': fill_qty,
-                                },
-                                src='api',
-                            )
-                    except Exception:
-                        pass
-                    try:
-                        ORDERS_SUCCESS.inc()
-                    except Exception:
-                        pass
-                else:
-                    # Pending/unknown status: write only to consolidated orders.jsonl (above) and do not emit reject.
-                    # We'll rely on subsequent updates (fills/partials) to log success, or explicit error fields to log failure.
-                    pass
-        except Exception:
-            pass
+            orders_path = str(getattr(state, 'session_dir', Path('logs')) / 'orders.jsonl')
 
-        # Anti-churn: when a close/reduce observed, set cooldown for the symbol
-        try:
-            def _canon_symbol(s: Any) -> str | None:
-                try:
-                    if not s:
-                        return None
-                    s2 = str(s).upper().strip()
-                    if ':' in s2:
-                        s2 = s2.split(':', 1)[-1]
-                    return s2
-                except Exception:
-                    return None
-
-            sym = _canon_symbol((payload.get('symbol') if isinstance(payload, dict) else None))
-            action = (str(payload.get('action')).lower() if isinstance(payload, dict) and payload.get('action') is not None else None)
-            # Some runners may signal close via boolean flags
-            close_flag = False
+        ol: OrderLoggers | None = getattr(state, 'order_loggers', None)
+        if ol is None:
+            # Lazy init to ensure per-stream writes happen in tests without lifespan
             try:
-                if isinstance(payload, dict):
-                    close_flag = bool(payload.get('close') or payload.get('reduceOnly'))
-                    # Also inspect nested 'response' structure
-                    resp = payload.get('response') or {}
-                    if isinstance(resp, dict):
-                        close_flag = close_flag or bool(resp.get('close') or resp.get('reduceOnly'))
+                ol = OrderLoggers()
+                setattr(state, 'order_loggers', ol)
             except Exception:
-                close_flag = False
-            cd_ms = int(getattr(request.app.state, 'cooldown_after_close_ms', 0))
-            if sym and cd_ms > 0 and (action == 'close' or close_flag):
-                now_ms = int(time.time() * 1000)
-                try:
-                    getattr(request.app.state, '_cooldown_until_ms')[sym] = now_ms + cd_ms  # type: ignore[index]
-                except Exception:
-                    pass
-                # Emit an optional event for observability
-                em_ev2: AuroraEventLogger | None = getattr(request.app.state, 'events_emitter', None)
-                if em_ev2:
-                    try:
-                        em_ev2.emit('AURORA.COOL_OFF', {'symbol': sym, 'until_ms': now_ms + cd_ms}, src='api')
-                    except Exception:
-                        pass
-        except Exception:
-            pass
+                ol = None
+
+        apply_posttrade(
+            state,
+            payload,
+            emitter=emitter,
+            order_loggers=ol,
+            orders_path=orders_path,
+            on_success=ORDERS_SUCCESS.inc,
+            on_reject=ORDERS_REJECTED.inc,
+        )
 
         return {"status": "ok"}
     except Exception as e:
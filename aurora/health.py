@@ -7,6 +7,8 @@ from collections import deque
 
 import numpy as np
 
+from core.utils.quantiles import SlidingQuantile, sketch_enabled
+
 
 @dataclass
 class GuardState:
@@ -33,6 +35,7 @@ class HealthGuard:
         window_sec: int = 60,
         base_cooloff_sec: int = 120,
         halt_threshold_repeats: int = 2,
+        sketch: bool | None = None,
     ) -> None:
         self.threshold_ms = float(threshold_ms)
         self.window_sec = int(window_sec)
@@ -41,6 +44,8 @@ class HealthGuard:
 
         self._samples: Deque[Tuple[float, float]] = deque()  # (ts, latency_ms)
         self._warn_ts: Deque[float] = deque()
+        # Exact sliding p95 without re-sorting the window per sample (AURORA_QUANTILE_SKETCH=0: legacy)
+        self._sq = SlidingQuantile() if sketch_enabled(sketch) else None
         self.state = GuardState()
 
     def _now(self) -> float:
@@ -49,15 +54,23 @@ class HealthGuard:
     def record(self, latency_ms: float, now: float | None = None) -> Tuple[bool, float]:
         now = self._now() if now is None else float(now)
         self._samples.append((now, float(latency_ms)))
+        sq = self._sq
+        if sq is not None:
+            sq.add(latency_ms)
         # evict old
         cutoff = now - self.window_sec
         while self._samples and self._samples[0][0] < cutoff:
-            self._samples.popleft()
+            _, old = self._samples.popleft()
+            if sq is not None:
+                sq.remove(old)
         # compute p95
         if not self._samples:
             return True, 0.0
-        arr = np.array([x[1] for x in self._samples], dtype=float)
-        p95 = float(np.percentile(arr, 95))
+        if sq is not None:
+            p95 = sq.percentile(95)
+        else:
+            arr = np.array([x[1] for x in self._samples], dtype=float)
+            p95 = float(np.percentile(arr, 95))
         if p95 > self.threshold_ms:
             self._register_warn(now)
         return p95 <= self.threshold_ms, p95
@@ -1,7 +1,6 @@
 
 import numpy as np
 from collections import deque
-from scipy.stats import norm
 
 class DynamicICP:
     """
@@ -51,7 +50,7 @@ class DynamicICP:
         alpha += self.aci_influence * min(aci, 1.0) # Обмежуємо вплив ACI
         
         # Обмежуємо alpha в розумних межах
-        alpha_final = np.clip(alpha, 0.01, 0.25)
+        alpha_final = min(0.25, max(0.01, float(alpha)))
         return alpha_final
 
     def predict_interval(self, y_hat, sigma_hat, z, aci):
@@ -70,6 +69,7 @@ class DynamicICP:
         # 2. Обчислюємо квантиль з калібрувального набору
         # Якщо калібрувальний набір ще замалий, використовуємо Гауссівський квантиль
         if len(self.calibration_scores) < 50:
+            from scipy.stats import norm
             q = norm.ppf(1 - dynamic_alpha / 2)
         else:
             # Quantile_{1-alpha} {s_i}
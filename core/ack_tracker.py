@@ -18,10 +18,18 @@ class AckTracker:
     If ACK doesn't arrive within ttl_s, emits ORDER.EXPIRE via provided events_emit callable.
 
     events_emit must support signature: events_emit(event_code: str, details: dict)
+    clock (ns) defaults to wall time; simulations pass a virtual clock's now_ns.
     """
 
-    def __init__(self, events_emit: Callable[[str, dict], None], ttl_s: int = 300, scan_period_s: int = 1):
+    def __init__(
+        self,
+        events_emit: Callable[[str, dict], None],
+        ttl_s: int = 300,
+        scan_period_s: int = 1,
+        clock: Optional[Callable[[], int]] = None,
+    ):
         self.events_emit = events_emit
+        self._clock = clock or time.time_ns
         self.ttl_ns = int(ttl_s) * 1_000_000_000
         self.scan_period_s = max(0.1, float(scan_period_s))
         self.pending: Dict[str, Pending] = {}
@@ -32,11 +40,11 @@ class AckTracker:
         if not cid:
             return
         if t_submit_ns is None:
-            t_submit_ns = time.time_ns()
+            t_submit_ns = self._clock()
         try:
             t_submit_ns = int(t_submit_ns)
         except Exception:
-            t_submit_ns = time.time_ns()
+            t_submit_ns = self._clock()
         self.pending[cid] = Pending(t_submit_ns, str(symbol), str(cid), str(side), float(qty))
 
     def ack(self, cid: str) -> None:
@@ -45,7 +53,7 @@ class AckTracker:
         self.pending.pop(cid, None)
 
     def scan_once(self, now_ns: Optional[int] = None) -> int:
-        now_ns = now_ns or time.time_ns()
+        now_ns = self._clock() if now_ns is None else now_ns
         expired_count = 0
         to_expire = [cid for cid, p in list(self.pending.items()) if (now_ns - p.t_submit_ns) > self.ttl_ns]
         for cid in to_expire:
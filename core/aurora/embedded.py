@@ -0,0 +1,644 @@
+"""
+In-process Aurora gate and the decision glue shared with the FastAPI service.
+
+`api/service.py` and `EmbeddedGate` both go through the helpers below, so a
+runner co-located with the gate gets the same anti-churn prechecks, the same
+events (POLICY.DECISION, SPREAD_GUARD_TRIP, ORDER.*, AURORA.COOL_OFF, ...) and
+the same denied/success/failed order logs as it would over HTTP, without the
+loopback + JSON round trip.
+
+`EmbeddedGate.check()` / `.posttrade()` keep the contract of the HTTP
+`AuroraGate` clients in `skalp_bot`: `check` returns a dict shaped like
+`PretradeCheckResponse` and is fail-closed — any internal error denies with
+`hard_gate=True`; `posttrade` returns True if the record was applied.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from aurora.governance import Governance
+from aurora.health import HealthGuard
+from core.aurora.gate_params import GateParams
+from core.aurora.pipeline import PretradePipeline
+from core.aurora.stage_timing import StageTiming
+from core.aurora_event_logger import AuroraEventLogger
+from core.calibration.online import OnlineRecalibrator
+from core.order_logger import CommitPolicy, OrderLoggers
+from core.scalper.trap import TrapWindow
+from observability.codes import POLICY_DECISION, POSTTRADE_LOG
+from risk.manager import RiskManager
+
+_QUOTAS = {'trades_pm_left': 999, 'symbol_exposure_left_usdt': 1e12}
+
+
+# --- component builders (shared with service lifespan) ---
+
+def build_trap_window(cfg: Dict[str, Any] | None) -> TrapWindow:
+    trap_cfg = (cfg or {}).get('trap') or {}
+    try:
+        window_s = float(trap_cfg.get('window_s', 2.0))
+    except Exception:
+        window_s = 2.0
+    try:
+        levels = int(trap_cfg.get('levels', 5))
+    except Exception:
+        levels = 5
+    return TrapWindow(window_s=window_s, levels=levels)
+
+
+def build_health_guard(cfg: Dict[str, Any] | None) -> HealthGuard:
+    try:
+        guard_cfg = (cfg or {}).get('aurora', {}) or {}
+        l_guard_ms = float(guard_cfg.get('latency_guard_ms', os.getenv('AURORA_LATENCY_GUARD_MS', 30)))
+        l_window_sec = int(guard_cfg.get('latency_window_sec', os.getenv('AURORA_LATENCY_WINDOW_SEC', 60)))
+        l_cooloff = int(guard_cfg.get('cooloff_base_sec', os.getenv('AURORA_COOLOFF_SEC', 120)))
+        l_halt_rep = int(guard_cfg.get('halt_threshold_repeats', os.getenv('AURORA_HALT_THRESHOLD_REPEATS', 2)))
+    except Exception:
+        l_guard_ms, l_window_sec, l_cooloff, l_halt_rep = 30.0, 60, 120, 2
+    return HealthGuard(
+        threshold_ms=l_guard_ms,
+        window_sec=l_window_sec,
+        base_cooloff_sec=l_cooloff,
+        halt_threshold_repeats=l_halt_rep,
+    )
+
+
+def build_recalibrator(cfg: Dict[str, Any] | None) -> OnlineRecalibrator | None:
+    """Online recalibrator from cfg.calibration.online, or None unless `enabled`
+    (env AURORA_CALIB_ONLINE_ENABLED as fallback)."""
+    oc = ((cfg or {}).get('calibration') or {}).get('online') or {}
+    enabled = oc.get('enabled')
+    if enabled is None:
+        enabled = os.getenv('AURORA_CALIB_ONLINE_ENABLED', '0')
+    if str(enabled).strip().lower() not in ('1', 'true', 'on', 'yes'):
+        return None
+    return OnlineRecalibrator.from_cfg(cfg)
+
+
+def _ms_setting(aurora_cfg: Dict[str, Any], key: str, env_key: str) -> int:
+    v = aurora_cfg.get(key)
+    try:
+        v = int(os.getenv(env_key, '0')) if v is None else int(v)
+    except Exception:
+        v = 0
+    return int(max(0, v))
+
+
+def init_anti_churn_state(state: Any, cfg: Dict[str, Any] | None) -> None:
+    """Populate per-symbol anti-churn settings and runtime maps on `state`."""
+    aurora_cfg = (cfg or {}).get('aurora', {}) or {}
+    state.min_open_interval_ms = _ms_setting(aurora_cfg, 'min_open_interval_ms', 'AURORA_MIN_OPEN_INTERVAL_MS')
+    state.cooldown_after_close_ms = _ms_setting(aurora_cfg, 'cooldown_after_close_ms', 'AURORA_COOLDOWN_AFTER_CLOSE_MS')
+    state.min_position_hold_ms = _ms_setting(aurora_cfg, 'min_position_hold_ms', 'AURORA_MIN_POSITION_HOLD_MS')
+    # runtime maps
+    state._last_open_allow_ms = {}
+    state._cooldown_until_ms = {}
+    # Position state: track open direction and since_ms per symbol
+    state._position_state = {}
+
+
+# --- decision glue ---
+
+def canon_symbol(s: Any) -> str | None:
+    try:
+        if not s:
+            return None
+        s2 = str(s).upper().strip()
+        # Normalize forms like 'BINANCE:BTC/USDT' -> 'BTC/USDT'
+        if ':' in s2:
+            s2 = s2.split(':', 1)[-1]
+        return s2
+    except Exception:
+        return None
+
+
+def anti_churn_precheck(
+    state: Any,
+    sym: str | None,
+    side: str | None,
+    now_ms: int,
+    emitter: Any | None,
+    obs: Dict[str, Any],
+) -> str | None:
+    """Rate-limit opens and respect cooldown/position state.
+
+    Returns the blocking reason (and annotates `obs`), or None when the core
+    pipeline should run.
+    """
+    # Per-symbol cooldown after close
+    cd_until = getattr(state, '_cooldown_until_ms', {}).get(sym) if sym else None
+    if sym and isinstance(cd_until, (int, float)) and now_ms < int(cd_until) and int(getattr(state, 'cooldown_after_close_ms', 0)) > 0:
+        try:
+            remaining = int(cd_until) - now_ms
+            obs['cooldown_remaining_ms'] = max(0, remaining)
+        except Exception:
+            pass
+        obs['reasons'].append('cooldown_after_close_active')
+        # Emit observability event
+        try:
+            if emitter:
+                emitter.emit('COOLDOWN.ACTIVE', {'symbol': sym, 'ms_left': obs.get('cooldown_remaining_ms', 0)})
+        except Exception:
+            pass
+        return 'cooldown_after_close_active'
+    # Per-symbol minimal interval between open approvals
+    min_iv = int(getattr(state, 'min_open_interval_ms', 0))
+    last_ok = getattr(state, '_last_open_allow_ms', {}).get(sym) if sym else None
+    if sym and min_iv > 0 and isinstance(last_ok, (int, float)) and (now_ms - int(last_ok)) < min_iv:
+        try:
+            obs['rate_limit_ms_left'] = max(0, min_iv - (now_ms - int(last_ok)))
+        except Exception:
+            pass
+        obs['reasons'].append('open_rate_limit')
+        try:
+            if emitter:
+                emitter.emit('OPEN.RATE_LIMIT', {'symbol': sym, 'ms_left': obs.get('rate_limit_ms_left', 0)})
+        except Exception:
+            pass
+        return 'open_rate_limit'
+    # Enforce min position hold and opposite-side block if a position is open
+    pos_state = getattr(state, '_position_state', {})
+    min_hold = int(getattr(state, 'min_position_hold_ms', 0))
+    ps = pos_state.get(sym) if sym else None
+    if sym and ps and isinstance(ps, dict):
+        open_side = ps.get('side')
+        since_ms = int(ps.get('since_ms') or 0)
+        if open_side in {'buy', 'sell'}:
+            # Block opposite side while position alive
+            if side and ((open_side == 'buy' and side == 'sell') or (open_side == 'sell' and side == 'buy')):
+                # Respect min hold window for any side change
+                if min_hold > 0 and now_ms - since_ms < min_hold:
+                    obs['reasons'].append('position_min_hold_active')
+                    obs['position'] = {'symbol': sym, 'side': open_side, 'age_ms': now_ms - since_ms, 'min_hold_ms': min_hold}
+                    try:
+                        if emitter:
+                            emitter.emit('POSITION.MIN_HOLD', {'symbol': sym, 'ms_left': max(0, min_hold - (now_ms - since_ms))})
+                    except Exception:
+                        pass
+                    return 'position_min_hold_active'
+                # Even if hold window elapsed, prevent cross in same tick to avoid self-trade churn
+                obs['reasons'].append('opposite_side_block')
+                obs['position'] = {'symbol': sym, 'side': open_side, 'age_ms': now_ms - since_ms}
+                try:
+                    if emitter:
+                        emitter.emit('POSITION.OPPOSITE_BLOCK', {'symbol': sym, 'open_side': open_side})
+                except Exception:
+                    pass
+                return 'opposite_side_block'
+    return None
+
+
+def record_decision(
+    emitter: Any | None,
+    order_loggers: OrderLoggers | None,
+    *,
+    mode: str,
+    order: Dict[str, Any],
+    allow: bool,
+    reason: str,
+    obs: Dict[str, Any],
+    spread_limit_bps: float,
+    diagnostics: list[str] | None = None,
+) -> None:
+    """Decision side effects: spread trip event, diagnostics merge, denied log, POLICY.DECISION."""
+    # If blocked due to spread — emit observability event (pipeline computes the decision; we add emit here)
+    try:
+        if not allow and isinstance(reason, str) and reason.startswith('spread_bps_too_wide') and emitter is not None:
+            # extract numbers for payload when possible
+            spread_bps_val = obs.get('spread_bps') if isinstance(obs, dict) else None
+            emitter.emit(
+                type="SPREAD_GUARD_TRIP",
+                severity="warning",
+                code="SPREAD_GUARD_TRIP",
+                payload={'spread_bps': float(spread_bps_val or 0.0), 'limit_bps': float(spread_limit_bps)},
+            )
+    except Exception:
+        pass
+
+    # Merge advisory diagnostics (do not contaminate blocking reasons)
+    try:
+        if diagnostics:
+            obs.setdefault('diagnostics', [])
+            # ensure uniqueness while preserving order
+            existing = set(obs['diagnostics']) if isinstance(obs.get('diagnostics'), list) else set()
+            for x in diagnostics:
+                if x not in existing:
+                    obs['diagnostics'].append(x)
+                    existing.add(x)
+    except Exception:
+        pass
+
+    reasons_list = (obs.get('reasons') if isinstance(obs, dict) else None) or []
+
+    # If gate denies, log into denied orders stream
+    try:
+        if not allow and order_loggers is not None:
+            order_loggers.log_denied(
+                ts=int(time.time() * 1000),
+                symbol=order.get('symbol'),
+                side=order.get('side'),
+                qty=order.get('qty'),
+                price=order.get('price'),
+                deny_reason=reason,
+                reasons=reasons_list,
+                observability=obs,
+            )
+            # Optionally also build a structured OrderDenied schema (best-effort, no-op on failure)
+            try:
+                from core.converters import api_order_to_denied_schema
+                _ = api_order_to_denied_schema(
+                    decision_id=str(obs.get('decision_id') or ''),
+                    order=order,
+                    deny_reason=reason,
+                    reasons=reasons_list,
+                    observability=obs,
+                )
+            except Exception:
+                pass
+    except Exception:
+        pass
+
+    if emitter:
+        emitter.emit(
+            type=POLICY_DECISION,
+            severity=None,
+            code=None,
+            payload={
+                "decision": "EXECUTE" if allow else "NO_OP",
+                "reasons": reasons_list,
+                "mode": mode,
+                "observability": obs,
+            },
+        )
+
+
+def apply_posttrade(
+    state: Any,
+    payload: dict,
+    *,
+    emitter: Any | None,
+    order_loggers: OrderLoggers | None,
+    orders_path: str | Path | None,
+    on_success: Callable[[], None] | None = None,
+    on_reject: Callable[[], None] | None = None,
+) -> None:
+    """Post-trade bookkeeping: consolidated log, per-stream order logs, ORDER.* events,
+    position state, cooldown-after-close and, when the payload carries a resolved
+    outcome (`p_raw`, `y`), the online recalibrator on `state.recalibrator`.
+    Each step is best-effort."""
+    if emitter:
+        try:
+            emitter.emit(type=POSTTRADE_LOG, severity=None, code=None, payload=payload)
+        except Exception:
+            pass
+
+    recal = getattr(state, 'recalibrator', None)
+    if recal is not None and isinstance(payload, dict):
+        p_raw, y = payload.get('p_raw'), payload.get('y')
+        if p_raw is not None and y is not None:
+            try:
+                recal.observe(float(p_raw), int(y))
+            except Exception:
+                pass
+
+    # Persist raw payload line-by-line into the consolidated orders file
+    if orders_path is not None:
+        try:
+            p = Path(orders_path)
+            p.parent.mkdir(parents=True, exist_ok=True)
+            rec = dict(payload)
+            rec.setdefault('ts_server', int(time.time() * 1000))
+            with p.open('a', encoding='utf-8') as f:
+                f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        except Exception:
+            # do not fail the caller if file-write has issues
+            pass
+
+    # Also route into per-stream order logs and emit canonical ORDER.* events
+    try:
+        if order_loggers is not None:
+            ol = order_loggers
+            rec = dict(payload)
+            # If the runner posted the raw CCXT order object under 'response', enrich top-level keys
+            try:
+                resp = rec.get('response') or {}
+                if isinstance(resp, dict):
+                    # CCXT unified fields are at top-level of resp; exchange raw under resp['info']
+                    rec.setdefault('status', resp.get('status') or (resp.get('info') or {}).get('status'))
+                    rec.setdefault('filled', resp.get('filled') or (resp.get('info') or {}).get('executedQty'))
+                    rec.setdefault('average', resp.get('average') or resp.get('avg_price'))
+                    rec.setdefault('id', resp.get('id') or (resp.get('info') or {}).get('orderId'))
+            except Exception:
+                pass
+            status = str(rec.get('status', '')).lower()
+            is_failed = bool(rec.get('error') or rec.get('error_code') or rec.get('error_msg'))
+            is_success = status in {"filled", "partially_filled", "partial", "closed"} or (rec.get('filled') or 0) > 0
+            base = {
+                'ts': rec.get('ts') or rec.get('ts_server') or int(time.time() * 1000),
+                'symbol': rec.get('symbol'),
+                'side': rec.get('side'),
+                'qty': rec.get('qty') or rec.get('amount'),
+                'price': rec.get('price'),
+                'order_id': rec.get('order_id') or rec.get('id'),
+                'status': rec.get('status'),
+            }
+            if is_failed:
+                base.update({'error_code': rec.get('error_code'), 'error_msg': rec.get('error_msg'), 'retry': rec.get('retry')})
+                ol.log_failed(**base)
+                # Optional: build structured core OrderFailed schema (best-effort)
+                try:
+                    from core.converters import posttrade_to_failed_schema
+                    _ = posttrade_to_failed_schema(rec, decision_id=str(rec.get('decision_id') or ''), snapshot=None)
+                except Exception:
+                    pass
+                # Emit ORDER.REJECT event
+                try:
+                    if emitter:
+                        emitter.emit(
+                            'ORDER.REJECT',
+                            {
+                                'symbol': base.get('symbol'),
+                                'oid': base.get('order_id'),
+                                'side': base.get('side'),
+                                'qty': base.get('qty'),
+                                'price': base.get('price'),
+                                'reason_code': base.get('error_code'),
+                                'reason_detail': base.get('error_msg'),
+                            },
+                            src='api',
+                        )
+                except Exception:
+                    pass
+                try:
+                    if on_reject is not None:
+                        on_reject()
+                except Exception:
+                    pass
+            elif is_success:
+                base.update({'fill_qty': rec.get('filled'), 'avg_price': rec.get('average') or rec.get('avg_price'), 'fees': rec.get('fee') or rec.get('fees')})
+                ol.log_success(**base)
+                # Update position state on successful orders
+                try:
+                    sym = canon_symbol(rec.get('symbol'))
+                    side = (str(rec.get('side') or '') or '').lower() or None
+                    # Determine if this is a close/reduce.
+                    action = (str(payload.get('action')).lower() if isinstance(payload, dict) and payload.get('action') is not None else None)
+                    close_flag = False
+                    try:
+                        close_flag = bool((payload.get('close') if isinstance(payload, dict) else False) or (payload.get('reduceOnly') if isinstance(payload, dict) else False))
+                        resp2 = payload.get('response') if isinstance(payload, dict) else None
+                        if isinstance(resp2, dict):
+                            close_flag = close_flag or bool(resp2.get('close') or resp2.get('reduceOnly'))
+                    except Exception:
+                        close_flag = False
+                    ps_map = getattr(state, '_position_state', None)
+                    if isinstance(ps_map, dict) and sym:
+                        if action == 'close' or close_flag:
+                            # Clear position state on close
+                            ps_map.pop(sym, None)
+                        else:
+                            # Set/refresh position state on open/partial fills
+                            try:
+                                ps_map[sym] = {'side': side, 'since_ms': int(base.get('ts') or time.time() * 1000)}
+                            except Exception:
+                                pass
+                except Exception:
+                    pass
+                # Optional: build structured core OrderSuccess schema (best-effort)
+                try:
+                    from core.converters import posttrade_to_success_schema
+                    _ = posttrade_to_success_schema(rec, decision_id=str(rec.get('decision_id') or ''), snapshot=None)
+                except Exception:
+                    pass
+                # Emit ORDER.PARTIAL or ORDER.FILL based on filled quantity vs qty if available
+                try:
+                    if emitter:
+                        fill_qty = rec.get('filled')
+                        qty = rec.get('qty') or rec.get('amount')
+                        code = 'ORDER.FILL'
+                        try:
+                            if fill_qty is not None and qty is not None and float(fill_qty) < float(qty):
+                                code = 'ORDER.PARTIAL'
+                        except Exception:
+                            code = 'ORDER.FILL'
+                        emitter.emit(
+                            code,
+                            {
+                                'symbol': base.get('symbol'),
+                                'oid': base.get('order_id'),
+                                'side': base.get('side'),
+                                'qty': qty,
+                                'price': base.get('price') or base.get('avg_price'),
+                                'fill_qty': fill_qty,
+                            },
+                            src='api',
+                        )
+                except Exception:
+                    pass
+                try:
+                    if on_success is not None:
+                        on_success()
+                except Exception:
+                    pass
+            else:
+                # Pending/unknown status: write only to consolidated orders.jsonl (above) and do not emit reject.
+                # We'll rely on subsequent updates (fills/partials) to log success, or explicit error fields to log failure.
+                pass
+    except Exception:
+        pass
+
+    # Anti-churn: when a close/reduce observed, set cooldown for the symbol
+    try:
+        sym = canon_symbol((payload.get('symbol') if isinstance(payload, dict) else None))
+        action = (str(payload.get('action')).lower() if isinstance(payload, dict) and payload.get('action') is not None else None)
+        # Some runners may signal close via boolean flags
+        close_flag = False
+        try:
+            if isinstance(payload, dict):
+                close_flag = bool(payload.get('close') or payload.get('reduceOnly'))
+                # Also inspect nested 'response' structure
+                resp = payload.get('response') or {}
+                if isinstance(resp, dict):
+                    close_flag = close_flag or bool(resp.get('close') or resp.get('reduceOnly'))
+        except Exception:
+            close_flag = False
+        cd_ms = int(getattr(state, 'cooldown_after_close_ms', 0))
+        if sym and cd_ms > 0 and (action == 'close' or close_flag):
+            now_ms = int(time.time() * 1000)
+            try:
+                getattr(state, '_cooldown_until_ms')[sym] = now_ms + cd_ms  # type: ignore[index]
+            except Exception:
+                pass
+            # Emit an optional event for observability
+            if emitter:
+                try:
+                    emitter.emit('AURORA.COOL_OFF', {'symbol': sym, 'until_ms': now_ms + cd_ms}, src='api')
+                except Exception:
+                    pass
+    except Exception:
+        pass
+
+
+# --- in-process gate ---
+
+class EmbeddedGate:
+    """In-process Aurora pretrade gate with the HTTP `AuroraGate` contract.
+
+    Builds the same `PretradePipeline`, `HealthGuard`, `TrapWindow`,
+    `RiskManager` and `Governance` as the service lifespan and calls
+    `decide()` directly. Events and order logs go to `session_dir` (default:
+    AURORA_SESSION_DIR or logs/).
+    """
+
+    def __init__(
+        self,
+        cfg: Dict[str, Any] | None = None,
+        *,
+        mode: str = "testnet",
+        session_dir: str | Path | None = None,
+        emitter: Any | None = None,
+        order_loggers: OrderLoggers | None = None,
+    ) -> None:
+        if cfg is None:
+            from common.config import apply_env_overrides, load_config_precedence
+            try:
+                cfg = apply_env_overrides(load_config_precedence())
+            except Exception:
+                cfg = {}
+        self.cfg: Dict[str, Any] = cfg or {}
+        self.mode = mode
+        self.session_dir = Path(session_dir or os.getenv("AURORA_SESSION_DIR", "logs"))
+        try:
+            self.session_dir.mkdir(parents=True, exist_ok=True)
+        except Exception:
+            pass
+        policy = CommitPolicy.from_cfg(self.cfg)
+        self.emitter = emitter if emitter is not None else AuroraEventLogger(path=self.session_dir / "aurora_events.jsonl", policy=policy)
+        self.order_loggers = order_loggers if order_loggers is not None else OrderLoggers(
+            success_path=self.session_dir / "orders_success.jsonl",
+            failed_path=self.session_dir / "orders_failed.jsonl",
+            denied_path=self.session_dir / "orders_denied.jsonl",
+            policy=policy,
+        )
+        self.state = SimpleNamespace()
+        init_anti_churn_state(self.state, self.cfg)
+        try:
+            self.state.recalibrator = build_recalibrator(self.cfg)
+        except Exception:
+            self.state.recalibrator = None
+        try:
+            risk_manager = RiskManager(self.cfg)
+        except Exception:
+            risk_manager = RiskManager({})
+        try:
+            governance = Governance(self.cfg)
+        except Exception:
+            governance = Governance({})
+        self.params = GateParams.from_cfg(self.cfg)
+        try:
+            self.timing = StageTiming.from_cfg(self.cfg, session_dir=self.session_dir)
+        except Exception:
+            self.timing = None
+        self.pipeline = PretradePipeline(
+            emitter=self.emitter,
+            trap_window=build_trap_window(self.cfg),
+            health_guard=build_health_guard(self.cfg),
+            risk_manager=risk_manager,
+            governance=governance,
+            cfg=self.cfg,
+            params=self.params,
+            timing=self.timing,
+            recalibrator=self.state.recalibrator,
+        )
+
+    def reload(self, cfg: Dict[str, Any]) -> None:
+        """Recompile gate params from a new cfg (hot-reload callback)."""
+        self.params = self.pipeline.reload(cfg)
+        self.cfg = cfg
+
+    def _decide(self, account: dict, order: dict, market: dict, fees_bps: float) -> Tuple[bool, str, Dict[str, Any], float]:
+        obs: Dict[str, Any] = {"reasons": []}
+        sym = canon_symbol((order or {}).get('symbol') or (market or {}).get('symbol'))
+        side = str((order or {}).get('side') or '').lower() or None
+        now_ms = int(time.time() * 1000)
+        block = anti_churn_precheck(self.state, sym, side, now_ms, self.emitter, obs)
+        if block is not None:
+            return False, block, obs, 1.0
+        allow, reason, obs, risk_scale = self.pipeline.decide(account=account, order=order, market=market, fees_bps=fees_bps)
+        if allow and sym:
+            self.state._last_open_allow_ms[sym] = now_ms
+        return allow, reason, obs, risk_scale
+
+    def check(self, account: dict, order: dict, market: dict, risk_tags=("scalping",), fees_bps: float = 1.0) -> dict:
+        account = {**(account or {}), "mode": (account or {}).get("mode") or self.mode}
+        order = dict(order or {})
+        market = dict(market or {})
+        try:
+            allow, reason, obs, risk_scale = self._decide(account, order, market, float(fees_bps or 0.0))
+            record_decision(
+                self.emitter, self.order_loggers,
+                mode=str(account.get("mode")), order=order, allow=allow, reason=reason, obs=obs,
+                spread_limit_bps=self.params.spread_limit_bps,
+            )
+        except Exception as e:
+            # Fail-closed: an embedded gate failure must never let an order through
+            return {
+                "allow": False,
+                "max_qty": 0.0,
+                "risk_scale": 0.0,
+                "cooldown_ms": 0,
+                "reason": f"aurora_embedded_error:{type(e).__name__}",
+                "hard_gate": True,
+                "quotas": {"trades_pm_left": 0, "symbol_exposure_left_usdt": 0.0},
+                "observability": {"gate_state": "ERROR"},
+            }
+        return {
+            "allow": bool(allow),
+            "max_qty": float(order.get("qty", 0.0) or 0.0),
+            "risk_scale": float(risk_scale),
+            "cooldown_ms": 0,
+            "reason": reason,
+            "hard_gate": False,
+            "quotas": dict(_QUOTAS),
+            "observability": obs,
+        }
+
+    def close(self) -> None:
+        """Commit buffered log lines, release file handles and stop the recalibrator."""
+        for obj in (self.emitter, self.order_loggers, self.timing, self.state.recalibrator):
+            try:
+                if hasattr(obj, 'close'):
+                    obj.close()
+            except Exception:
+                pass
+
+    def posttrade(self, **payload) -> bool:
+        try:
+            apply_posttrade(
+                self.state, payload,
+                emitter=self.emitter,
+                order_loggers=self.order_loggers,
+                orders_path=self.session_dir / "orders.jsonl",
+            )
+            return True
+        except Exception:
+            return False
+
+
+__all__ = [
+    "EmbeddedGate",
+    "anti_churn_precheck",
+    "apply_posttrade",
+    "build_health_guard",
+    "build_recalibrator",
+    "build_trap_window",
+    "canon_symbol",
+    "init_anti_churn_state",
+    "record_decision",
+]
@@ -0,0 +1,180 @@
+"""
+Compiled pretrade gate parameters.
+
+`GateParams` is a frozen snapshot of every knob `PretradePipeline.decide` needs
+(latency/trap/ER/slippage/SPRT/spread limits, order profile, feature flags).
+It is built once from the YAML cfg (env overrides already applied) plus the
+legacy env aliases, so the request hot path performs no env lookups and no
+dict walking. Precedence per key is unchanged: cfg → legacy env alias → default.
+
+Rebuild with `GateParams.from_cfg(new_cfg)` and publish by plain attribute
+assignment (see `PretradePipeline.reload`) — readers take one reference per
+decision, so a swap is atomic from their point of view.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Any, Mapping
+
+_OFF = {'off', '0', 'false'}
+_ON = {'1', 'true', 'yes'}
+
+
+def _pick_float(cfg_val: Any, env: Mapping[str, str], env_key: str, default: float) -> float:
+    try:
+        if cfg_val is not None:
+            return float(cfg_val)
+        e = env.get(env_key)
+        return float(e) if e is not None else float(default)
+    except Exception:
+        return float(default)
+
+
+@dataclass(frozen=True)
+class GateParams:
+    default_mode: str = 'testnet'
+    # latency
+    lmax_ms: float = 30.0
+    # TRAP
+    trap_window_s: float = 2.0
+    trap_levels: int = 5
+    trap_z_threshold: float = 1.64
+    trap_cancel_pctl: int = 90
+    trap_score_threshold: float = 0.8
+    trap_guard_on: bool = True
+    # expected return / slippage
+    pi_min_bps: float = 2.0
+    slip_eta: float = 0.3
+    slip_before_er: bool = False
+    # SPRT
+    sprt_enabled: bool = True
+    sprt_sigma: float = 1.0
+    sprt_A: float = 2.0
+    sprt_B: float = -2.0
+    sprt_max_obs: int = 10
+    sprt_timeout_ms: int = 500
+    # spread
+    spread_limit_bps: float = 100.0
+    # observability
+    icp_obs: bool = False
+    # compiled isotonic table for the expected-return gate ('' → Platt fallback)
+    calib_table_path: str = ''
+
+    @classmethod
+    def from_cfg(cls, cfg: Mapping[str, Any] | None, env: Mapping[str, str] | None = None) -> "GateParams":
+        """Compile params from cfg (env overrides applied) and legacy env aliases."""
+        cfg_all = cfg or {}
+        env = os.environ if env is None else env
+        guards = (cfg_all.get('guards') or cfg_all.get('gates') or {})
+        trap = (cfg_all.get('trap') or {})
+
+        # latency: cfg → legacy AURORA_LMAX_MS → 30
+        lmax_ms = 30.0
+        try:
+            l_cfg = guards.get('latency_ms_limit')
+            l_env = env.get('AURORA_LMAX_MS')
+            if l_cfg is not None:
+                lmax_ms = float(l_cfg)
+            elif l_env is not None and str(l_env).strip():
+                lmax_ms = float(l_env)
+        except Exception:
+            lmax_ms = 30.0
+
+        # TRAP window geometry (used when the pipeline creates a TrapWindow lazily)
+        try:
+            trap_window_s = float(trap.get('window_s', 2.0))
+            trap_levels = int(trap.get('levels', 5))
+        except Exception:
+            trap_window_s, trap_levels = 2.0, 5
+
+        try:
+            z_cfg, cp_cfg = trap.get('z_threshold'), trap.get('cancel_pctl')
+            z_env, cp_env = env.get('AURORA_TRAP_Z_THRESHOLD'), env.get('AURORA_TRAP_CANCEL_PCTL')
+            z_threshold = float(z_cfg) if z_cfg is not None else (float(z_env) if z_env is not None else 1.64)
+            cancel_pctl = int(cp_cfg) if cp_cfg is not None else (int(cp_env) if cp_env is not None else 90)
+        except Exception:
+            z_threshold, cancel_pctl = 1.64, 90
+
+        trap_score_threshold = _pick_float(trap.get('score_threshold'), env, 'AURORA_TRAP_THRESHOLD', 0.8)
+
+        default_trap_on = bool(guards.get('trap_guard_enabled', True))
+        if env.get('PYTEST_CURRENT_TEST'):
+            default_trap_on = True
+        trap_guard_env = str(env.get('TRAP_GUARD', 'on' if default_trap_on else 'off')).lower()
+
+        pi_min_bps = _pick_float((cfg_all.get('risk') or {}).get('pi_min_bps'), env, 'AURORA_PI_MIN_BPS', 2.0)
+        slip_eta = _pick_float((cfg_all.get('slippage') or {}).get('eta_fraction_of_b'), env, 'AURORA_SLIP_ETA', 0.3)
+
+        order_profile = (cfg_all.get('pretrade', {}) or {}).get('order_profile', 'er_before_slip')
+        order_profile = env.get('PRETRADE_ORDER_PROFILE', order_profile)
+
+        # SPRT: cfg.sprt (env overrides applied) → env aliases → defaults; alpha/beta override A/B
+        sprt_enabled_env = env.get('AURORA_SPRT_ENABLED')
+        sprt_enabled = sprt_enabled_env is None or str(sprt_enabled_env).lower() in _ON
+        scfg = (cfg_all.get('sprt') or {})
+        try:
+            sigma = _pick_float(scfg.get('sigma'), env, 'AURORA_SPRT_SIGMA', 1.0)
+            A = _pick_float(scfg.get('A'), env, 'AURORA_SPRT_A', 2.0)
+            B = _pick_float(scfg.get('B'), env, 'AURORA_SPRT_B', -2.0)
+            mo = scfg.get('max_obs')
+            if mo is None:
+                e = env.get('AURORA_SPRT_MAX_OBS')
+                mo = int(e) if e is not None else 10
+            max_obs = int(mo)
+            alpha, beta = scfg.get('alpha'), scfg.get('beta')
+            if alpha is not None and beta is not None:
+                try:
+                    from core.scalper.sprt import thresholds_from_alpha_beta
+                    A, B = thresholds_from_alpha_beta(float(alpha), float(beta))
+                except Exception:
+                    pass
+        except Exception:
+            sigma, A, B, max_obs = 1.0, 2.0, -2.0, 10
+        try:
+            sprt_timeout_ms = int(env.get('AURORA_SPRT_TIMEOUT_MS', '500'))
+        except Exception:
+            sprt_timeout_ms = 500
+
+        # spread: cfg.guards.spread_bps_limit → legacy env aliases → 100
+        try:
+            if 'spread_bps_limit' in guards:
+                val = guards.get('spread_bps_limit')
+                spread_limit_bps = float(val if val is not None else 100.0)
+            else:
+                env_lim = env.get('AURORA_SPREAD_BPS_LIMIT') or env.get('AURORA_SPREAD_MAX_BPS')
+                spread_limit_bps = float(env_lim) if env_lim else 100.0
+        except Exception:
+            spread_limit_bps = 100.0
+
+        # calibration table: cfg.calibration.table_path → AURORA_CALIB_TABLE → none
+        calib_table_path = (cfg_all.get('calibration') or {}).get('table_path')
+        if calib_table_path is None:
+            calib_table_path = env.get('AURORA_CALIB_TABLE', '')
+
+        return cls(
+            default_mode=str(env.get('AURORA_MODE', 'testnet')),
+            lmax_ms=float(lmax_ms),
+            trap_window_s=trap_window_s,
+            trap_levels=trap_levels,
+            trap_z_threshold=float(z_threshold),
+            trap_cancel_pctl=int(cancel_pctl),
+            trap_score_threshold=float(trap_score_threshold),
+            trap_guard_on=trap_guard_env not in _OFF,
+            pi_min_bps=float(pi_min_bps),
+            slip_eta=float(slip_eta),
+            slip_before_er=str(order_profile).lower() == 'slip_before_er',
+            sprt_enabled=bool(sprt_enabled),
+            sprt_sigma=float(sigma),
+            sprt_A=float(A),
+            sprt_B=float(B),
+            sprt_max_obs=int(max_obs),
+            sprt_timeout_ms=int(sprt_timeout_ms),
+            spread_limit_bps=float(spread_limit_bps),
+            icp_obs=str(env.get('AURORA_ICP_OBS', '0')).lower() in _ON,
+            calib_table_path=str(calib_table_path or ''),
+        )
+
+
+__all__ = ["GateParams"]
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Tuple
-import os
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
 
+import numpy as np
+
+from core.aurora.gate_params import GateParams
+from core.aurora.stage_timing import StageClock, StageTiming
 from core.aurora.pretrade import (
     gate_latency,
+    gate_latency_batch,
     gate_expected_return,
+    gate_expected_return_batch,
     gate_slippage,
+    gate_slippage_batch,
     gate_trap,
 )
 from core.scalper.calibrator import IsotonicCalibrator, CalibInput
@@ -17,10 +23,57 @@ from aurora.governance import Governance
 from aurora.health import HealthGuard
 
 
+Decision = Tuple[bool, str, Dict[str, Any], float]
+
+
+class BatchDecideError(RuntimeError):
+    """`decide_batch` failed on row `len(decided)`; rows in `decided` already ran their stateful guards."""
+
+    def __init__(self, decided: List[Decision], cause: BaseException) -> None:
+        super().__init__(f"decide_batch failed at row {len(decided)}: {cause!r}")
+        self.decided = decided
+        self.cause = cause
+
+
+class _BatchGates(NamedTuple):
+    """Column-wise market inputs and stateless gate masks for a batch of intents."""
+
+    latency_ms: np.ndarray
+    slip_bps_est: np.ndarray
+    a_bps: np.ndarray
+    b_bps: np.ndarray
+    score: np.ndarray
+    spread_bps: np.ndarray
+    e_pi_bps: np.ndarray
+    lat_ok: np.ndarray
+    er_ok: np.ndarray
+    slip_ok: np.ndarray
+    spread_ok: np.ndarray
+
+
+def _col(markets: Sequence[Mapping[str, Any]], key: str) -> np.ndarray:
+    return np.fromiter((float(m.get(key, 0.0) or 0.0) for m in markets), dtype=float, count=len(markets))
+
+
+def _make_calibrator(params: GateParams) -> IsotonicCalibrator:
+    """Load the compiled isotonic table if configured; unreadable tables fall back to Platt."""
+    if params.calib_table_path:
+        try:
+            return IsotonicCalibrator.load(params.calib_table_path)
+        except Exception:
+            pass
+    return IsotonicCalibrator()
+
+
 class PretradePipeline:
     """Pretrade decision pipeline. Pure-ish core that orchestrates guards.
 
-    Dependencies are injected to keep FastAPI glue outside.
+    Dependencies are injected to keep FastAPI glue outside. Gate knobs are
+    compiled once into a frozen `GateParams` (pass `params` to share a compiled
+    instance across pipelines); `decide` never touches env or cfg dicts.
+    With `timing`, each gate stage is timed in ns and handed to the `StageTiming` sink.
+    With `recalibrator` (an `OnlineRecalibrator`), the score-calibrated p_tp is
+    passed through its currently served calibrator before the expected-return gate.
     """
 
     def __init__(
@@ -32,6 +85,9 @@ class PretradePipeline:
         risk_manager: RiskManager | None,
         governance: Governance | None = None,
         cfg: Dict[str, Any] | None = None,
+        params: GateParams | None = None,
+        timing: StageTiming | None = None,
+        recalibrator: Any | None = None,
     ) -> None:
         self.emitter = emitter
         self.tw = trap_window
@@ -39,6 +95,37 @@ class PretradePipeline:
         self.rman = risk_manager
         self.gov = governance
         self.cfg = cfg or {}
+        self.params = params if params is not None else GateParams.from_cfg(self.cfg)
+        self._cal = _make_calibrator(self.params)
+        self._icp: Any = None  # DynamicICP, built on first use when icp_obs is on
+        self.timing = timing
+        self.recal = recalibrator
+
+    def _recalibrated(self) -> Any | None:
+        """Calibrator the recalibrator serves right now (None: use p_tp as is)."""
+        recal = self.recal
+        return recal.calibrator if recal is not None else None
+
+    def _e_pi_bps(self, ci: CalibInput) -> float:
+        out = self._cal.e_pi_bps(ci)
+        cur = self._recalibrated()
+        if cur is None:
+            return out.e_pi_bps
+        q = min(1.0, max(0.0, float(cur.calibrate_prob(out.p_tp))))
+        return q * float(ci.b_bps) - (1.0 - q) * float(ci.a_bps) - float(ci.fees_bps + ci.slip_bps)
+
+    def reload(self, cfg: Dict[str, Any] | None) -> GateParams:
+        """Recompile gate params from a new cfg and swap them in atomically.
+
+        Suitable as a hot-reload callback: in-flight `decide` calls keep the
+        snapshot they started with.
+        """
+        params = GateParams.from_cfg(cfg or {})
+        if params.calib_table_path != self.params.calib_table_path:
+            self._cal = _make_calibrator(params)
+        self.params = params
+        self.cfg = cfg or {}
+        return params
 
     def decide(
         self,
@@ -47,43 +134,108 @@ class PretradePipeline:
         order: Dict[str, Any],
         market: Dict[str, Any],
         fees_bps: float,
-    ) -> Tuple[bool, str, Dict[str, Any], float]:
+    ) -> Decision:
         """Return (allow, reason, obs, risk_scale)."""
+        return self._decide(account, order, market, fees_bps, None, 0)
+
+    def decide_batch(self, intents: Sequence[Mapping[str, Any]]) -> List[Decision]:
+        """Decide a burst of intents in one pass.
+
+        Each intent is a mapping with 'account', 'order', 'market' and 'fees_bps'.
+        The stateless latency / expected-return / slippage / spread gates are
+        evaluated over NumPy columns for the whole batch; stateful guards
+        (HealthGuard, TRAP, RiskManager, SPRT, governance) then run per intent
+        in input order, so results match calling `decide` sequentially.
+
+        Errors in the column pass surface before any state is touched. An error
+        on row k is raised as `BatchDecideError` carrying rows < k, whose guard
+        state is already applied, so callers resume from row k instead of
+        re-deciding them.
+        """
+        n = len(intents)
+        if n == 0:
+            return []
+        p = self.params
+        markets = [dict(it.get('market') or {}) for it in intents]
+        fees = np.fromiter((float(it.get('fees_bps') or 0.0) for it in intents), dtype=float, count=n)
+        latency_ms = _col(markets, 'latency_ms')
+        slip = _col(markets, 'slip_bps_est')
+        a_bps = _col(markets, 'a_bps')
+        b_bps = _col(markets, 'b_bps')
+        score = _col(markets, 'score')
+        spread = _col(markets, 'spread_bps')
+        p_tp, e_pi = self._cal.e_pi_bps_batch(score, a_bps, b_bps, fees, slip)
+        cur = self._recalibrated()
+        if cur is not None:
+            q = np.clip(np.asarray(cur.calibrate_prob_batch(p_tp), dtype=float), 0.0, 1.0)
+            e_pi = q * b_bps - (1.0 - q) * a_bps - (fees + slip)
+        pre = _BatchGates(
+            latency_ms=latency_ms,
+            slip_bps_est=slip,
+            a_bps=a_bps,
+            b_bps=b_bps,
+            score=score,
+            spread_bps=spread,
+            e_pi_bps=e_pi,
+            lat_ok=gate_latency_batch(latency_ms, p.lmax_ms),
+            er_ok=gate_expected_return_batch(e_pi, p.pi_min_bps),
+            slip_ok=gate_slippage_batch(slip, b_bps, p.slip_eta),
+            spread_ok=spread <= p.spread_limit_bps,
+        )
+        out: List[Decision] = []
+        for i, it in enumerate(intents):
+            try:
+                out.append(
+                    self._decide(dict(it.get('account') or {}), dict(it.get('order') or {}), markets[i], float(fees[i]), pre, i)
+                )
+            except Exception as e:
+                raise BatchDecideError(out, e) from e
+        return out
+
+    def _decide(
+        self,
+        account: Dict[str, Any],
+        order: Dict[str, Any],
+        market: Dict[str, Any],
+        fees_bps: float,
+        pre: _BatchGates | None,
+        i: int,
+    ) -> Decision:
+        # `pre` carries batch-precomputed columns/masks for row `i`; scalar gates are
+        # only re-run on failing rows to produce the exact same reason strings.
+        clk = StageClock() if self.timing is not None else None
         emitter = self.emitter
         tw = self.tw
         hg = self.hg
         rman = self.rman
-        cfg_all = self.cfg or {}
+        p = self.params
 
-        mode = (account or {}).get('mode', os.getenv('AURORA_MODE', 'testnet'))
+        mode = (account or {}).get('mode', p.default_mode)
         reasons: list[str] = []
         allow = True
         reason = 'ok'
 
-        latency_ms = float(market.get('latency_ms', 0.0) or 0.0)
-        slip_bps_est = float(market.get('slip_bps_est', 0.0) or 0.0)
-        a_bps = float(market.get('a_bps', 0.0) or 0.0)
-        b_bps = float(market.get('b_bps', 0.0) or 0.0)
-        score = float(market.get('score', 0.0) or 0.0)
+        if pre is None:
+            latency_ms = float(market.get('latency_ms', 0.0) or 0.0)
+            slip_bps_est = float(market.get('slip_bps_est', 0.0) or 0.0)
+            a_bps = float(market.get('a_bps', 0.0) or 0.0)
+            b_bps = float(market.get('b_bps', 0.0) or 0.0)
+            score = float(market.get('score', 0.0) or 0.0)
+            spread_bps = float(market.get('spread_bps', 0.0) or 0.0)
+        else:
+            latency_ms = float(pre.latency_ms[i])
+            slip_bps_est = float(pre.slip_bps_est[i])
+            a_bps = float(pre.a_bps[i])
+            b_bps = float(pre.b_bps[i])
+            score = float(pre.score[i])
+            spread_bps = float(pre.spread_bps[i])
         regime = str(market.get('mode_regime', 'normal'))
-        spread_bps = float(market.get('spread_bps', 0.0) or 0.0)
         base_notional = float((order or {}).get('base_notional', (order or {}).get('notional', 0.0)) or 0.0)
 
         # latency cutoff immediate
-        try:
-            # Prefer YAML (env overrides уже применены в cfg), затем поддержим legacy env alias
-            guards_cfg_l = (cfg_all.get('guards') or cfg_all.get('gates') or {})
-            l_from_cfg = guards_cfg_l.get('latency_ms_limit')
-            l_from_env_legacy = os.getenv('AURORA_LMAX_MS')
-            if l_from_cfg is not None:
-                lmax_ms = float(l_from_cfg)
-            elif l_from_env_legacy is not None and str(l_from_env_legacy).strip():
-                lmax_ms = float(l_from_env_legacy)
-            else:
-                lmax_ms = 30.0
-        except Exception:
-            lmax_ms = 30.0
-        if allow and not gate_latency(latency_ms=latency_ms, lmax_ms=lmax_ms, reasons=reasons):
+        lmax_ms = p.lmax_ms
+        lat_ok = pre is not None and bool(pre.lat_ok[i])
+        if allow and not (lat_ok or gate_latency(latency_ms=latency_ms, lmax_ms=lmax_ms, reasons=reasons)):
             allow, reason = False, 'latency_guard'
             if emitter:
                 try:
@@ -95,6 +247,8 @@ class PretradePipeline:
                     )
                 except Exception:
                     pass
+        if clk is not None:
+            clk.lap('latency')
 
         # p95 guard
         if hg is not None:
@@ -125,6 +279,9 @@ class PretradePipeline:
                     except Exception:
                         pass
 
+        if clk is not None:
+            clk.lap('health')
+
         risk_obs = None
         risk_scale = 1.0
 
@@ -134,28 +291,6 @@ class PretradePipeline:
         trap_add_deltas = market.get('trap_add_deltas')
         trap_trades_cnt = market.get('trap_trades_cnt')
         if allow and trap_cancel_deltas is not None and trap_add_deltas is not None and trap_trades_cnt is not None:
-            try:
-                # Prefer cfg.trap, then env, then defaults
-                trap_cfg = (cfg_all.get('trap') or {})
-                z_from_cfg = trap_cfg.get('z_threshold')
-                cp_from_cfg = trap_cfg.get('cancel_pctl')
-                z_env = os.getenv('AURORA_TRAP_Z_THRESHOLD')
-                cp_env = os.getenv('AURORA_TRAP_CANCEL_PCTL')
-                if z_from_cfg is not None:
-                    z_threshold = float(z_from_cfg)
-                elif z_env is not None:
-                    z_threshold = float(z_env)
-                else:
-                    z_threshold = 1.64
-                if cp_from_cfg is not None:
-                    cancel_pctl = int(cp_from_cfg)
-                elif cp_env is not None:
-                    cancel_pctl = int(cp_env)
-                else:
-                    cancel_pctl = 90
-            except Exception:
-                z_threshold, cancel_pctl = 1.64, 90
-
             obi_sign = market.get('obi_sign')
             tfi_sign = market.get('tfi_sign')
 
@@ -165,29 +300,16 @@ class PretradePipeline:
 
             if tw is None:
                 # defaults similar to service
-                try:
-                    trap_cfg_local = (cfg_all.get('trap', {}) or {})
-                    window_s_local = float(trap_cfg_local.get('window_s', 2.0))
-                    levels_local = int(trap_cfg_local.get('levels', 5))
-                except Exception:
-                    window_s_local, levels_local = 2.0, 5
-                tw = TrapWindow(window_s=window_s_local, levels=levels_local)
+                tw = TrapWindow(window_s=p.trap_window_s, levels=p.trap_levels)
                 self.tw = tw
 
-            cfg_all_local = cfg_all
-            guards_cfg = (cfg_all_local.get('guards') or cfg_all_local.get('gates') or {})
-            default_trap_on = bool(guards_cfg.get('trap_guard_enabled', True))
-            if os.getenv('PYTEST_CURRENT_TEST'):
-                default_trap_on = True
-            trap_guard_env = os.getenv('TRAP_GUARD', 'on' if default_trap_on else 'off').lower()
-
             allow_trap, metrics = gate_trap(
                 tw,
                 cancel_deltas=cancel_d,
                 add_deltas=add_d,
                 trades_cnt=trades_cnt,
-                z_threshold=z_threshold,
-                cancel_pctl=cancel_pctl,
+                z_threshold=p.trap_z_threshold,
+                cancel_pctl=p.trap_cancel_pctl,
                 obi_sign=int(obi_sign) if obi_sign is not None else None,
                 tfi_sign=int(tfi_sign) if tfi_sign is not None else None,
                 reasons=reasons,
@@ -207,18 +329,8 @@ class PretradePipeline:
             except Exception:
                 trap_score = None
 
-            # Threshold for composite trap score: cfg.trap.score_threshold → env alias → default
-            try:
-                trap_cfg2 = (cfg_all.get('trap') or {})
-                trap_threshold = trap_cfg2.get('score_threshold')
-                if trap_threshold is None:
-                    t_env = os.getenv('AURORA_TRAP_THRESHOLD')
-                    trap_threshold = float(t_env) if t_env is not None else 0.8
-                else:
-                    trap_threshold = float(trap_threshold)
-            except Exception:
-                trap_threshold = 0.8
-            if allow and trap_score is not None and trap_guard_env not in {'off', '0', 'false'}:
+            trap_threshold = p.trap_score_threshold
+            if allow and trap_score is not None and p.trap_guard_on:
                 if trap_score > trap_threshold:
                     allow = False
                     reason = 'trap_guard_score'
@@ -242,7 +354,7 @@ class PretradePipeline:
                 'trap_score': trap_score,
             }
 
-            if not allow_trap and trap_guard_env not in {'off', '0', 'false'}:
+            if not allow_trap and p.trap_guard_on:
                 allow, reason = False, 'trap_guard'
                 if emitter:
                     try:
@@ -259,46 +371,34 @@ class PretradePipeline:
                         )
                     except Exception:
                         pass
+        if clk is not None:
+            clk.lap('trap')
 
         # ER vs slip
-        order_profile = (cfg_all.get('pretrade', {}) or {}).get('order_profile', 'er_before_slip')
-        order_profile = os.getenv('PRETRADE_ORDER_PROFILE', order_profile)
-
         def _run_er():
             nonlocal allow, reason
-            cal = IsotonicCalibrator()
-            ci = CalibInput(score=score, a_bps=a_bps, b_bps=b_bps, fees_bps=fees_bps, slip_bps=slip_bps_est, regime=regime)
-            out_local = cal.e_pi_bps(ci)
-            try:
-                # Prefer cfg.risk.pi_min_bps (env overrides уже применены), затем env alias, затем default
-                pi_min_local = (cfg_all.get('risk') or {}).get('pi_min_bps')
-                if pi_min_local is None:
-                    env_pi = os.getenv('AURORA_PI_MIN_BPS')
-                    pi_min_local = float(env_pi) if env_pi is not None else 2.0
-                else:
-                    pi_min_local = float(pi_min_local)
-            except Exception:
-                pi_min_local = 2.0
-            er_ok = gate_expected_return(e_pi_bps=out_local.e_pi_bps, pi_min_bps=pi_min_local, reasons=reasons)
+            if pre is None:
+                ci = CalibInput(score=score, a_bps=a_bps, b_bps=b_bps, fees_bps=fees_bps, slip_bps=slip_bps_est, regime=regime)
+                e_pi = self._e_pi_bps(ci)
+                er_ok = gate_expected_return(e_pi_bps=e_pi, pi_min_bps=p.pi_min_bps, reasons=reasons)
+            else:
+                er_ok = bool(pre.er_ok[i]) or gate_expected_return(
+                    e_pi_bps=float(pre.e_pi_bps[i]), pi_min_bps=p.pi_min_bps, reasons=reasons
+                )
             if not er_ok and allow:
                 allow, reason = False, 'expected_return_gate'
+            if clk is not None:
+                clk.lap('expected_return')
 
         def _run_slip():
             nonlocal allow, reason
-            try:
-                # Prefer cfg.slippage.eta_fraction_of_b → env alias → default
-                eta_local = (cfg_all.get('slippage') or {}).get('eta_fraction_of_b')
-                if eta_local is None:
-                    env_eta = os.getenv('AURORA_SLIP_ETA')
-                    eta_local = float(env_eta) if env_eta is not None else 0.3
-                else:
-                    eta_local = float(eta_local)
-            except Exception:
-                eta_local = 0.3
-            if allow and not gate_slippage(slip_bps=slip_bps_est, b_bps=b_bps, eta_fraction_of_b=eta_local, reasons=reasons):
+            slip_ok = pre is not None and bool(pre.slip_ok[i])
+            if allow and not (slip_ok or gate_slippage(slip_bps=slip_bps_est, b_bps=b_bps, eta_fraction_of_b=p.slip_eta, reasons=reasons)):
                 allow, reason = False, 'slippage_guard'
+            if clk is not None:
+                clk.lap('slippage')
 
-        if str(order_profile).lower() == 'slip_before_er':
+        if p.slip_before_er:
             _run_slip(); _run_er()
         else:
             _run_er(); _run_slip()
@@ -320,6 +420,8 @@ class PretradePipeline:
                     reasons.append(reason)
             except Exception as e:
                 reasons.append(f"risk_error:{e}")
+        if clk is not None:
+            clk.lap('risk')
 
         # sprt
         sprt_samples = market.get('sprt_samples')
@@ -327,43 +429,11 @@ class PretradePipeline:
         sprt_llr = None
         sprt_n = None
         if allow and sprt_samples is not None:
-            sprt_enabled_env = os.getenv('AURORA_SPRT_ENABLED')
-            if sprt_enabled_env is None or str(sprt_enabled_env).lower() in {"1", "true", "yes"}:
+            if p.sprt_enabled:
                 try:
-                    # Prefer cfg.sprt values (already with env overrides), then env aliases, then defaults
-                    scfg_d = (cfg_all.get('sprt') or {})
-                    # allow alpha/beta → A/B
-                    alpha = scfg_d.get('alpha'); beta = scfg_d.get('beta')
-                    sigma = scfg_d.get('sigma')
-                    A = scfg_d.get('A'); B = scfg_d.get('B'); max_obs = scfg_d.get('max_obs')
-                    # env aliases fallback
-                    if sigma is None:
-                        e = os.getenv('AURORA_SPRT_SIGMA')
-                        sigma = float(e) if e is not None else 1.0
-                    if A is None:
-                        e = os.getenv('AURORA_SPRT_A')
-                        A = float(e) if e is not None else 2.0
-                    if B is None:
-                        e = os.getenv('AURORA_SPRT_B')
-                        B = float(e) if e is not None else -2.0
-                    if max_obs is None:
-                        e = os.getenv('AURORA_SPRT_MAX_OBS')
-                        max_obs = int(e) if e is not None else 10
-                    # alpha/beta override thresholds when present
-                    if alpha is not None and beta is not None:
-                        try:
-                            from core.scalper.sprt import thresholds_from_alpha_beta
-                            A2, B2 = thresholds_from_alpha_beta(float(alpha), float(beta))
-                            A, B = A2, B2
-                        except Exception:
-                            pass
-                    cfg_s = SprtConfig(mu0=0.0, mu1=score, sigma=sigma, A=A, B=B, max_obs=max_obs)
+                    cfg_s = SprtConfig(mu0=0.0, mu1=score, sigma=p.sprt_sigma, A=p.sprt_A, B=p.sprt_B, max_obs=p.sprt_max_obs)
                     sprt = SPRT(cfg_s)
-                    try:
-                        timeout_ms = int(os.getenv('AURORA_SPRT_TIMEOUT_MS', '500'))
-                    except Exception:
-                        timeout_ms = 500
-                    sprt_decision = sprt.run_with_timeout([float(x) for x in sprt_samples], time_limit_ms=timeout_ms)
+                    sprt_decision = sprt.run_with_timeout([float(x) for x in sprt_samples], time_limit_ms=p.sprt_timeout_ms)
                     sprt_llr = sprt.llr
                     sprt_n = sprt.n_obs
                     if sprt_decision == "REJECT":
@@ -375,32 +445,30 @@ class PretradePipeline:
                         reasons.append("sprt_continue")
                 except Exception:
                     reasons.append("sprt_error")
+        if clk is not None:
+            clk.lap('sprt')
 
         # spread guard
-        try:
-            # Prefer cfg.guards/gates.spread_bps_limit (с применёнными env-override), затем legacy env aliases
-            guards_cfg_s = (cfg_all.get('guards') or cfg_all.get('gates') or {})
-            if 'spread_bps_limit' in guards_cfg_s:
-                val = guards_cfg_s.get('spread_bps_limit')
-                spread_limit_bps = float(val if val is not None else 100.0)
-            else:
-                env_spread_lim = os.getenv('AURORA_SPREAD_BPS_LIMIT') or os.getenv('AURORA_SPREAD_MAX_BPS')
-                spread_limit_bps = float(env_spread_lim) if env_spread_lim else 100.0
-        except Exception:
-            spread_limit_bps = 100.0
-        if spread_bps > float(spread_limit_bps):
+        spread_ok = bool(pre.spread_ok[i]) if pre is not None else spread_bps <= p.spread_limit_bps
+        if not spread_ok:
             allow, reason = False, f'spread_bps_too_wide:{spread_bps:.1f}'
+        if clk is not None:
+            clk.lap('spread')
 
         # ICP observability (optional)
         icp_obs = None
-        if os.getenv('AURORA_ICP_OBS', '0').lower() in {'1', 'true', 'yes'}:
+        if p.icp_obs:
             try:
-                from certification.icp import DynamicICP
-                icp = DynamicICP()
+                icp = self._icp
+                if icp is None:
+                    from certification.icp import DynamicICP
+                    icp = self._icp = DynamicICP()
                 alpha = float(icp.compute_alpha(z=market.get('z'), aci=float(market.get('aci') or 0.0)))
                 icp_obs = {'alpha': alpha, 'is_transition': bool(icp._detect_transition(market.get('z')))}
             except Exception:
                 icp_obs = {'alpha': None, 'is_transition': None}
+            if clk is not None:
+                clk.lap('icp')
 
         obs = {
             'gate_state': 'PASS' if allow else 'BLOCK',
@@ -456,8 +524,12 @@ class PretradePipeline:
             except Exception:
                 # governance failure should not crash the gate; annotate reasons
                 reasons.append('governance_error')
+            if clk is not None:
+                clk.lap('governance')
         # Update obs with (possibly) new reasons/allow flag
         obs['gate_state'] = 'PASS' if allow else 'BLOCK'
         obs['reasons'] = reasons
+        if clk is not None:
+            self.timing.record(clk, obs, allow=allow, reason=reason)  # type: ignore[union-attr]
 
         return allow, reason, obs, risk_scale
@@ -4,6 +4,8 @@ from dataclasses import dataclass, field
 from typing import List
 from typing import Optional
 
+import numpy as np
+
 from core.scalper.trap import TrapWindow, TrapMetrics
 try:
     from core.calibration.icp import SplitConformalBinary
@@ -67,6 +69,29 @@ def gate_slippage(slip_bps: float, b_bps: float | None, eta_fraction_of_b: float
     return False
 
 
+def gate_latency_batch(latency_ms: np.ndarray, lmax_ms: float) -> np.ndarray:
+    """Vectorized `gate_latency`: boolean pass mask, no reasons.
+
+    Callers re-run the scalar gate on failing rows to obtain the reason text.
+    """
+    return np.asarray(latency_ms, dtype=float) <= float(lmax_ms)
+
+
+def gate_expected_return_batch(e_pi_bps: np.ndarray, pi_min_bps: float) -> np.ndarray:
+    """Vectorized `gate_expected_return`: boolean pass mask, no reasons."""
+    return np.asarray(e_pi_bps, dtype=float) > float(pi_min_bps)
+
+
+def gate_slippage_batch(slip_bps: np.ndarray, b_bps: np.ndarray, eta_fraction_of_b: float) -> np.ndarray:
+    """Vectorized `gate_slippage`: True where the row passes *without* diagnostics.
+
+    Rows with non-positive b_bps are reported False so the scalar gate can add
+    its 'skipped' diagnostic (it still allows them).
+    """
+    b = np.asarray(b_bps, dtype=float)
+    return (b > 0.0) & (np.asarray(slip_bps, dtype=float) <= float(eta_fraction_of_b) * b)
+
+
 def gate_trap(
     tw: TrapWindow,
     cancel_deltas: List[float],
@@ -0,0 +1,147 @@
+"""
+Per-stage latency instrumentation for `PretradePipeline`.
+
+`StageClock` takes `perf_counter_ns` laps as the pipeline moves through its
+gates (latency, health, trap, expected_return, slippage, risk, sprt, spread,
+icp, governance). `StageTiming` receives the finished laps and:
+- observes them into a Prometheus histogram labelled by `stage` (optional),
+- copies them into `observability['timings_ns']` when `expose_obs` is set,
+- writes a sampled trace record to a dedicated JSONL file.
+
+Config (cfg.observability.stage_timing, env aliases in parentheses):
+  enabled (AURORA_STAGE_TIMING), obs (AURORA_STAGE_TIMING_OBS),
+  sample_rate (AURORA_STAGE_TRACE_SAMPLE), trace_path (basename, placed in session dir).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from core.order_logger import CommitPolicy, _JsonlWriter
+
+STAGES = (
+    'latency', 'health', 'trap', 'expected_return', 'slippage',
+    'risk', 'sprt', 'spread', 'icp', 'governance',
+)
+
+# Trace lines are diagnostics: group them and skip fsync
+_TRACE_POLICY = CommitPolicy(max_lines=64, max_delay_ms=1000.0, fsync=False, critical_prefixes=())
+
+
+class StageClock:
+    """Lap timer: `lap(stage)` charges the time since the previous lap to `stage`."""
+
+    __slots__ = ('ns', '_t')
+
+    def __init__(self) -> None:
+        self.ns: Dict[str, int] = {}
+        self._t = time.perf_counter_ns()
+
+    def lap(self, stage: str) -> None:
+        now = time.perf_counter_ns()
+        self.ns[stage] = self.ns.get(stage, 0) + (now - self._t)
+        self._t = now
+
+    def total(self) -> int:
+        return sum(self.ns.values())
+
+
+class StageTiming:
+    """Sink for `StageClock` laps: Prometheus histogram, observability copy, sampled trace."""
+
+    def __init__(
+        self,
+        *,
+        histogram: Any | None = None,
+        expose_obs: bool = False,
+        sample_rate: float = 0.0,
+        trace_path: str | Path | None = None,
+        rng: random.Random | None = None,
+    ) -> None:
+        self.expose_obs = bool(expose_obs)
+        self.sample_rate = min(1.0, max(0.0, float(sample_rate)))
+        self._rng = rng or random.Random()
+        self._children: Dict[str, Any] = {}
+        self._hist = histogram
+        self._trace: Optional[_JsonlWriter] = None
+        if trace_path is not None and self.sample_rate > 0.0:
+            self._trace = _JsonlWriter(Path(trace_path), max_bytes=50 * 1024 * 1024, policy=_TRACE_POLICY)
+
+    @classmethod
+    def from_cfg(
+        cls,
+        cfg: Dict[str, Any] | None,
+        *,
+        session_dir: str | Path = 'logs',
+        histogram: Any | None = None,
+        env: Dict[str, str] | None = None,
+    ) -> Optional["StageTiming"]:
+        """Build from cfg.observability.stage_timing; returns None when disabled."""
+        env = os.environ if env is None else env
+        c = (((cfg or {}).get('observability') or {}).get('stage_timing') or {})
+
+        def _flag(key: str, env_key: str, default: bool) -> bool:
+            v = c.get(key)
+            if v is None:
+                v = env.get(env_key)
+            if v is None:
+                return default
+            return v if isinstance(v, bool) else str(v).strip().lower() in {'1', 'true', 'yes', 'on'}
+
+        if not _flag('enabled', 'AURORA_STAGE_TIMING', True):
+            return None
+        try:
+            rate = float(c.get('sample_rate', env.get('AURORA_STAGE_TRACE_SAMPLE', 0.0)))
+        except Exception:
+            rate = 0.0
+        name = Path(str(c.get('trace_path') or 'pretrade_trace.jsonl')).name
+        return cls(
+            histogram=histogram,
+            expose_obs=_flag('obs', 'AURORA_STAGE_TIMING_OBS', False),
+            sample_rate=rate,
+            trace_path=Path(session_dir) / name,
+        )
+
+    def _observe(self, stage: str, ns: int) -> None:
+        child = self._children.get(stage)
+        if child is None:
+            child = self._hist.labels(stage=stage)
+            self._children[stage] = child
+        child.observe(ns / 1000.0)
+
+    def record(self, clock: StageClock, obs: Dict[str, Any], *, allow: bool, reason: str) -> None:
+        ns = clock.ns
+        total = clock.total()
+        if self._hist is not None:
+            try:
+                for stage, v in ns.items():
+                    self._observe(stage, v)
+                self._observe('total', total)
+            except Exception:
+                pass
+        if self.expose_obs:
+            obs['timings_ns'] = {**ns, 'total': total}
+        if self._trace is not None and self._rng.random() < self.sample_rate:
+            try:
+                rec = {
+                    'ts_ns': time.time_ns(),
+                    'allow': bool(allow),
+                    'reason': reason,
+                    'total_ns': total,
+                    'stages_ns': ns,
+                }
+                self._trace.write_line(json.dumps(rec, separators=(',', ':')))
+            except Exception:
+                pass
+
+    def close(self) -> None:
+        if self._trace is not None:
+            self._trace.close()
+
+
+__all__ = ['STAGES', 'StageClock', 'StageTiming']
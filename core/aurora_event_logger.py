@@ -8,12 +8,15 @@ from observability.codes import (
     AURORA_EXPECTED_RETURN_LOW, AURORA_SLIPPAGE_GUARD,
 )
 import json
+import queue
+import threading
 import time
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, Optional
 
 # Reuse robust JSONL writer and small LRU from order logger
-from core.order_logger import _JsonlWriter, _LRUSet  # type: ignore
+from core.order_logger import CommitPolicy, _JsonlWriter, _LRUSet  # type: ignore
 import os
 
 
@@ -68,6 +71,7 @@ class AuroraEventLogger:
         retention_days: int = 7,
         compress: bool = True,
         retention_files: int | None = None,
+        policy: CommitPolicy | None = None,
     ) -> None:
         # Default to session directory if provided via env, else fallback to logs/
         if path is None:
@@ -83,6 +87,7 @@ class AuroraEventLogger:
             retention_days=retention_days,
             compress=compress,
             retention_files=retention_files,
+            policy=policy,
         )
         self._last_health_emit_ts: Dict[str, float] = {}
         self._seen: _LRUSet = _LRUSet(32768)
@@ -175,7 +180,8 @@ class AuroraEventLogger:
             return
         self._seen.add(key)
         try:
-            self._writer.write_line(json.dumps(record, ensure_ascii=False))
+            # Critical codes (ORDER.* by default) bypass group commit
+            self._writer.write_line(json.dumps(record, ensure_ascii=False), critical=self._writer.policy.is_critical(ec))
             # Optional metrics hook
             try:
                 pc = getattr(self, "_prom_counter", None)
@@ -187,6 +193,13 @@ class AuroraEventLogger:
         except Exception:
             pass
 
+    def flush(self) -> None:
+        """Commit buffered events (see CommitPolicy)."""
+        self._writer.flush()
+
+    def close(self) -> None:
+        self._writer.close()
+
     # --- Optional Prometheus hook configuration ---
     def set_counter(self, counter: object) -> None:
         """Attach a Prometheus Counter vector (with label 'code') for increments after successful writes.
@@ -194,3 +207,239 @@ class AuroraEventLogger:
         counter must support: counter.labels(code=str).inc()
         """
         self._prom_counter = counter
+
+
+class AsyncEventEmitter:
+    """Queue-backed front for `AuroraEventLogger` that keeps disk I/O off the caller.
+
+    `emit()` validates the code, stamps `ts_ns` and enqueues; a dedicated writer
+    thread drains the bounded queue into the wrapped logger. When the queue is
+    full the backpressure policy applies:
+    - "block": wait for space (caller stalls, nothing is lost); only for
+      synchronous producers, never from an asyncio event loop (the service
+      does not accept it)
+    - "drop_noncritical": drop non-critical events that find the queue full;
+      critical ones (ORDER.* by default) go to the spill buffer, and keep their
+      order behind earlier spilled ones
+    - "spill": overflow into an in-memory spill buffer (bounded by `spill_max`)
+      drained in order once the queue has room
+
+    After `close()` starts, `emit()` writes through synchronously (under the
+    same lock that admits queued events) until the wrapped logger is closed, and
+    drops with reason "closed" afterwards, so no event is accepted into a queue
+    that nobody drains.
+
+    Optional Prometheus hooks (see `set_metrics`) report queue depth and drops.
+    """
+
+    POLICIES = ("block", "drop_noncritical", "spill")
+    _STOP = object()
+
+    def __init__(
+        self,
+        inner: AuroraEventLogger,
+        maxsize: int = 10000,
+        policy: str = "drop_noncritical",
+        spill_max: int = 100000,
+        critical_prefixes: tuple[str, ...] | None = None,
+    ) -> None:
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown backpressure policy: {policy}")
+        self.inner = inner
+        self.policy = policy
+        self.spill_max = int(spill_max)
+        if critical_prefixes is None:
+            wp = getattr(getattr(inner, "_writer", None), "policy", None)
+            critical_prefixes = tuple(getattr(wp, "critical_prefixes", ("ORDER.",)))
+        self.critical_prefixes = critical_prefixes
+        self._q: "queue.Queue[Any]" = queue.Queue(maxsize=max(1, int(maxsize)))
+        self._spill: Deque[tuple] = deque()
+        self._put_lock = threading.Lock()
+        self._cv = threading.Condition()
+        self._pending = 0
+        self._closed = False        # no more enqueues; emit() writes through
+        self._inner_closed = False  # wrapped logger closed; emit() drops
+        self._depth_gauge: Optional[Any] = None
+        self._drop_counter: Optional[Any] = None
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, name="aurora-events-writer", daemon=True)
+        self._thread.start()
+
+    # --- configuration passthrough ---
+    def set_counter(self, counter: object) -> None:
+        self.inner.set_counter(counter)
+
+    def set_metrics(self, depth_gauge: object | None = None, dropped_counter: object | None = None) -> None:
+        """Attach a Gauge for queue depth and a Counter (label 'reason') for dropped events."""
+        self._depth_gauge = depth_gauge
+        self._drop_counter = dropped_counter
+
+    @property
+    def path(self) -> Path:
+        return self.inner.path
+
+    def depth(self) -> int:
+        return self._q.qsize() + len(self._spill)
+
+    # --- producer side ---
+    def emit(
+        self,
+        event_code: Optional[str] = None,
+        details: Optional[Dict[str, Any]] = None,
+        position_id: Optional[str] = None,
+        src: Optional[str] = None,
+        **kwargs: Any,
+    ) -> None:
+        # Same two signatures as AuroraEventLogger.emit; normalize before enqueueing
+        if (event_code is None or details is None) and ("type" in kwargs or "payload" in kwargs or "code" in kwargs):
+            event_code = kwargs.get("code") or kwargs.get("type")
+            payload = kwargs.get("payload")
+            details = payload if isinstance(payload, dict) else {"payload": payload}
+        if event_code is None:
+            raise ValueError("event_code is required")
+        ec = self.inner._canon_code(str(event_code))
+        if ec not in self.inner.ALLOWED:
+            raise ValueError(f"Unknown event_code: {event_code}")
+        d = dict(details or {})
+        # Stamp at emit time so queueing delay does not skew event timestamps
+        d.setdefault("ts_ns", int(time.time() * 1_000_000_000))
+        item = (ec, d, position_id, src)
+        critical = any(ec.startswith(p) for p in self.critical_prefixes)
+        with self._cv:
+            if self._closed:
+                if self._inner_closed:
+                    self._record_drop("closed")
+                else:
+                    self._write(item)
+                return
+            self._pending += 1
+        if not self._enqueue(item, critical):
+            with self._cv:
+                self._pending -= 1
+                self._cv.notify_all()
+        self._report_depth()
+
+    def _enqueue(self, item: tuple, critical: bool) -> bool:
+        if self.policy == "block":
+            self._q.put(item)
+            return True
+        with self._put_lock:
+            # Once spilling, keep appending to the spill buffer to preserve order;
+            # events that are never spilled (non-critical under drop_noncritical)
+            # still take free queue slots
+            if not self._spill or (self.policy == "drop_noncritical" and not critical):
+                try:
+                    self._q.put_nowait(item)
+                    return True
+                except queue.Full:
+                    pass
+            if self.policy == "drop_noncritical" and not critical:
+                self._record_drop("queue_full")
+                return False
+            if len(self._spill) >= self.spill_max and not critical:
+                self._record_drop("spill_full")
+                return False
+            self._spill.append(item)
+            return True
+
+    def _record_drop(self, reason: str) -> None:
+        self.dropped += 1
+        try:
+            if self._drop_counter is not None:
+                self._drop_counter.labels(reason=reason).inc()
+        except Exception:
+            pass
+
+    def _report_depth(self) -> None:
+        try:
+            if self._depth_gauge is not None:
+                self._depth_gauge.set(self.depth())
+        except Exception:
+            pass
+
+    # --- writer side ---
+    def _write(self, item: tuple) -> None:
+        ec, d, position_id, src = item
+        try:
+            self.inner.emit(ec, d, position_id=position_id, src=src)
+        except Exception:
+            pass
+
+    def _done(self) -> None:
+        with self._cv:
+            self._pending -= 1
+            if self._pending <= 0:
+                self._cv.notify_all()
+
+    def _refill(self) -> None:
+        # Queue drained: move spilled events back in order
+        with self._put_lock:
+            while self._spill:
+                try:
+                    self._q.put_nowait(self._spill[0])
+                except queue.Full:
+                    break
+                self._spill.popleft()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                item = self._q.get_nowait()
+            except queue.Empty:
+                if self._spill:
+                    # refill right away instead of after an idle timeout
+                    self._refill()
+                    continue
+                try:
+                    item = self._q.get(timeout=0.05)
+                except queue.Empty:
+                    item = None
+            if item is self._STOP:
+                return
+            if item is not None:
+                self._write(item)
+                self._done()
+            self._report_depth()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until every accepted event is written and committed. Returns False on timeout."""
+        deadline = time.time() + timeout
+        with self._cv:
+            while self._pending > 0:
+                left = deadline - time.time()
+                if left <= 0:
+                    return False
+                self._cv.wait(left)
+        try:
+            self.inner.flush()
+        except Exception:
+            pass
+        return True
+
+    def close(self, timeout: float = 5.0) -> None:
+        with self._cv:
+            if self._closed:
+                return
+            # every event admitted before this point is counted in _pending
+            self._closed = True
+        self.flush(timeout)
+        try:
+            self._q.put(self._STOP, timeout=timeout)
+            self._thread.join(timeout)
+        except Exception:
+            pass
+        with self._cv:
+            if not self._thread.is_alive():
+                # flush timed out: write what the stopped writer left behind
+                self._refill()
+                while True:
+                    try:
+                        item = self._q.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not self._STOP:
+                        self._write(item)
+                        self._pending -= 1
+                    self._refill()
+            self._inner_closed = True
+            self.inner.close()
@@ -16,10 +16,13 @@ No external dependencies; NumPy is optional. Compatible with `core/types.py` if
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional, Sequence, Tuple
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple, Union
 import math
 import random
 
+from core.calibration.lut import IsotonicLUT
+
 try:
     import numpy as np  # type: ignore
 except Exception:  # pragma: no cover
@@ -226,6 +229,16 @@ class PlattCalibrator:
         """Calibrate a single probability using Platt scaling."""
         return _sigmoid(self.A * float(p_raw) + self.B)
 
+    def predict_p_batch(self, x: Any) -> Any:
+        """Vectorized `calibrate_prob` over an array."""
+        if np is None:
+            return [self.calibrate_prob(v) for v in x]
+        z = self.A * np.asarray(x, dtype=np.float64) + self.B
+        e = np.exp(-np.abs(z))
+        return np.where(z >= 0, 1.0 / (1.0 + e), e / (1.0 + e))
+
+    calibrate_prob_batch = predict_p_batch
+
 
 @dataclass
 class TemperatureScaler:
@@ -271,17 +284,34 @@ class TemperatureScaler:
     def predict_proba(self, p: Sequence[float]) -> List[float]:
         return [_sigmoid(_logit(pi) / self.T) for pi in p]
 
+    def calibrate_prob(self, p_raw: float) -> float:
+        return _sigmoid(_logit(p_raw) / self.T)
+
+    def predict_p_batch(self, p: Any) -> Any:
+        """Vectorized `calibrate_prob` over an array."""
+        if np is None:
+            return [self.calibrate_prob(v) for v in p]
+        q = np.clip(np.asarray(p, dtype=np.float64), 1e-12, 1.0 - 1e-12)
+        z = np.log(q / (1.0 - q)) / self.T
+        e = np.exp(-np.abs(z))
+        return np.where(z >= 0, 1.0 / (1.0 + e), e / (1.0 + e))
+
+    calibrate_prob_batch = predict_p_batch
+
 
 @dataclass
 class IsotonicCalibrator:
     """Isotonic regression (PAV) mapping x→p, where x∈R is score or uncali. prob.
 
-    Implementation: pool-adjacent-violators with unit weights. For prediction,
+    Implementation: stack-based pool-adjacent-violators with unit weights (tied
+    x share one block). For prediction,
     we perform step-function lookup with linear interpolation between knots for
-    smoother behavior.
+    smoother behavior; `fit` compiles the knots into an `IsotonicLUT`, which is
+    also what `save`/`load` persist.
     """
     xs_: List[float] = None  # type: ignore
     ys_: List[float] = None  # type: ignore
+    lut_: Optional[IsotonicLUT] = None
 
     def fit(self, x: Sequence[float], y: Sequence[int]) -> "IsotonicCalibrator":
         pairs = sorted((float(xi), int(yi)) for xi, yi in zip(x, y))
@@ -293,72 +323,88 @@ class IsotonicCalibrator:
         if n == 0:
             self.xs_ = []
             self.ys_ = []
+            self.lut_ = None
             return self
 
-        # Use dynamic programming approach for PAVA
-        blocks = []
-        current_block_start = 0
-
-        for i in range(1, n):
-            if ys[i] >= ys[i-1]:
-                # No violation, continue current block
-                continue
-            else:
-                # Violation found, pool from current_block_start to i
-                block_sum = sum(ys[current_block_start:i+1])
-                block_count = i - current_block_start + 1
-                pooled_value = block_sum / block_count
-
-                # Set all values in current block to pooled value
-                for j in range(current_block_start, i+1):
-                    ys[j] = pooled_value
-
-                current_block_start = i + 1
-
-        # Build the final step function
-        # Remove duplicates and create unique breakpoints
-        self.xs_ = [xs[0]]
-        self.ys_ = [ys[0]]
+        # Stack-based PAV: all points at one x form a block; each new block is
+        # merged into its predecessor while the predecessor's mean is not below
+        # it, so a violation pools back across any number of earlier blocks
+        blocks: List[List[float]] = []  # [sum_y, count, x_first, x_last]
+        i = 0
+        while i < n:
+            j = i
+            sy = 0.0
+            while j < n and xs[j] == xs[i]:
+                sy += ys[j]
+                j += 1
+            blocks.append([sy, float(j - i), xs[i], xs[i]])
+            while len(blocks) > 1 and blocks[-2][0] * blocks[-1][1] >= blocks[-1][0] * blocks[-2][1]:
+                sy, cnt, _, x1 = blocks.pop()
+                prev = blocks[-1]
+                prev[0] += sy
+                prev[1] += cnt
+                prev[3] = x1
+            i = j
+
+        # Step function knots: both ends of each pooled block at its mean
+        self.xs_ = []
+        self.ys_ = []
+        for sy, cnt, x0, x1 in blocks:
+            m = sy / cnt
+            self.xs_.append(x0)
+            self.ys_.append(m)
+            if x1 != x0:
+                self.xs_.append(x1)
+                self.ys_.append(m)
+
+        self.compile()
+        return self
 
-        for i in range(1, n):
-            if xs[i] != self.xs_[-1] or ys[i] != self.ys_[-1]:
-                self.xs_.append(xs[i])
-                self.ys_.append(ys[i])
+    def compile(self) -> Optional[IsotonicLUT]:
+        """Freeze the fitted knots into a lookup table (done by `fit`)."""
+        self.lut_ = IsotonicLUT.from_knots(self.xs_, self.ys_) if self.xs_ else None
+        return self.lut_
 
-        return self
+    def _table(self) -> Optional[IsotonicLUT]:
+        if self.lut_ is None and self.xs_:
+            self.compile()
+        return self.lut_
 
     def predict_proba(self, x: Sequence[float]) -> List[float]:
-        if not self.xs_:
+        lut = self._table()
+        if lut is None:
             return [0.5] * len(list(x))
-        res: List[float] = []
-        for xi in x:
-            xi = float(xi)
-            # find insertion point
-            lo, hi = 0, len(self.xs_) - 1
-            if xi <= self.xs_[0]:
-                res.append(self.ys_[0])
-                continue
-            if xi >= self.xs_[-1]:
-                res.append(self.ys_[-1])
-                continue
-            # binary search
-            while lo <= hi:
-                mid = (lo + hi) // 2
-                if self.xs_[mid] <= xi:
-                    lo = mid + 1
-                else:
-                    hi = mid - 1
-            j = max(1, lo - 1)
-            x0, x1 = self.xs_[j - 1], self.xs_[j]
-            y0, y1 = self.ys_[j - 1], self.ys_[j]
-            # linear interpolation between knots
-            t = 0.0 if x1 == x0 else (xi - x0) / (x1 - x0)
-            res.append((1 - t) * y0 + t * y1)
-        return [min(1.0, max(0.0, r)) for r in res]
+        return [min(1.0, max(0.0, lut(float(xi)))) for xi in x]
+
+    def predict_p_batch(self, x: Any) -> Any:
+        """Vectorized lookup over an array (linear interpolation between knots)."""
+        lut = self._table()
+        if lut is None:
+            return np.full(len(x), 0.5) if np is not None else [0.5] * len(x)
+        out = lut.batch(x)
+        return np.clip(out, 0.0, 1.0) if np is not None else [min(1.0, max(0.0, v)) for v in out]
+
+    calibrate_prob_batch = predict_p_batch
 
     def calibrate_prob(self, p_raw: float) -> float:
         """Calibrate a single probability using isotonic regression."""
-        return self.predict_proba([p_raw])[0]
+        lut = self._table()
+        if lut is None:
+            return 0.5
+        p = lut(float(p_raw))
+        return 0.0 if p < 0.0 else 1.0 if p > 1.0 else p
+
+    def save(self, path: Union[str, Path]) -> Path:
+        lut = self._table()
+        if lut is None:
+            raise ValueError("Isotonic calibrator not fitted")
+        return lut.save(path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "IsotonicCalibrator":
+        lut = IsotonicLUT.load(path)
+        xs, ys = lut.knots
+        return cls(xs_=xs, ys_=ys, lut_=lut)
 
 
 # =============================
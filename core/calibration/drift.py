@@ -12,6 +12,7 @@ Implements (per project structure):
 - GLRDetector: max log-likelihood ratio for change-in-mean (unknown σ) within
   a rolling window; returns stat and alarm if above threshold
 - DriftMonitor: combines both; convenient streaming API `update(logit, ts)`
+- DriftBank: the same detectors over many streams in vectorized state
 
 INPUT SPECIFICATIONS:
 - Input: logit/score series (dimensionless, event-time ordered)
@@ -35,8 +36,7 @@ No external dependencies; NumPy optional. Standalone.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Deque, Dict, List, Optional, Tuple
-from collections import deque
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 import math
 import random
 
@@ -45,6 +45,8 @@ try:
 except Exception:  # pragma: no cover
     np = None  # type: ignore
 
+from core.utils.changepoint import GLRBank, WindowGLR
+
 try:
     from common.events import EventEmitter
     _event_emitter = EventEmitter()
@@ -115,60 +117,32 @@ class GLRDetector:
 
     Threshold `thr` is on the squared standardized mean gap times an empirical
     factor. This is a pragmatic detector; for rigorous control consult Lorden/Page.
+
+    Splits are scanned by the shared window-limited engine
+    (`core.utils.changepoint.WindowGLR`). The default `per_octave=0` scans all
+    splits (exact, O(W) per update); `per_octave>0` opts into a geometric grid
+    of that many splits per doubling, O(log W) per update, whose max can
+    undershoot the exact statistic (up to ~23% low at 8), so `thr` would need
+    re-deriving.
     """
     window: int = 200
     thr: float = 25.0  # typical 16..36 for unit-variance noise
     clip: Optional[float] = 6.0
+    per_octave: int = 0
 
     def __post_init__(self) -> None:
-        self.buf: Deque[float] = deque()
-        self.sum: float = 0.0
-        self.sum2: float = 0.0
+        self._eng = WindowGLR(
+            self.window, per_octave=self.per_octave, weight="min", ddof=0, var_floor=1e-9, clip=self.clip
+        )
 
     def reset(self) -> None:
-        self.buf.clear()
-        self.sum = 0.0
-        self.sum2 = 0.0
+        self._eng.reset()
 
     def _push(self, x: float) -> None:
-        if self.clip is not None:
-            c = float(self.clip)
-            x = max(-c, min(c, float(x)))
-        else:
-            x = float(x)
-        self.buf.append(x)
-        self.sum += x
-        self.sum2 += x * x
-        if len(self.buf) > self.window:
-            y = self.buf.popleft()
-            self.sum -= y
-            self.sum2 -= y * y
+        self._eng.push(x)
 
     def _glr_stat(self) -> float:
-        n = len(self.buf)
-        if n < 2:
-            return 0.0
-        # estimate pooled variance
-        mu = self.sum / n
-        var = max(1e-9, self.sum2 / n - mu * mu)
-        sd = math.sqrt(var)
-        # try all split points τ (leave at least 1 point on each side)
-        best = 0.0
-        # precompute prefix sums
-        s = 0.0
-        k = 0
-        for x in self.buf:
-            k += 1
-            if k == n:
-                break
-            s += x
-            m1 = s / k
-            m2 = (self.sum - s) / (n - k)
-            gap = abs(m1 - m2) / max(1e-12, sd)
-            stat = gap * gap * min(k, n - k)  # scaled by segment size
-            if stat > best:
-                best = stat
-        return best
+        return self._eng.stat()[0]
 
     def update(self, x: float, ts: Optional[float] = None) -> Dict[str, float]:
         self._push(x)
@@ -227,6 +201,69 @@ class DriftMonitor:
         return out
 
 
+# =============================
+# Drift bank (many streams)
+# =============================
+
+class DriftBank:
+    """`DriftMonitor` for `n_streams` independent streams (e.g. symbol × feature).
+
+    CUSUM state is two arrays; the GLR runs on a shared `GLRBank`. `update`
+    advances only the given streams (all when omitted) and returns arrays
+    aligned with them. No events are emitted; callers act on `drift_alarm`.
+    """
+
+    def __init__(
+        self,
+        n_streams: int,
+        *,
+        k: float = 0.25,
+        h: float = 6.0,
+        window: int = 200,
+        thr: float = 25.0,
+        clip: Optional[float] = 6.0,
+        per_octave: int = 0,
+    ) -> None:
+        if np is None:  # pragma: no cover
+            raise RuntimeError("DriftBank requires NumPy")
+        self.k = float(k)
+        self.h = float(h)
+        self.thr = float(thr)
+        self.clip = None if clip is None else abs(float(clip))
+        self.s_pos = np.zeros(int(n_streams))
+        self.s_neg = np.zeros(int(n_streams))
+        self.glr = GLRBank(
+            n_streams, window, per_octave=per_octave, weight="min", ddof=0, var_floor=1e-9
+        )
+
+    def reset(self, streams: Optional[Sequence[int]] = None) -> None:
+        r = self.glr._rows(streams)
+        self.s_pos[r] = 0.0
+        self.s_neg[r] = 0.0
+        self.glr.reset(r)
+
+    def update(self, x: Sequence[float], streams: Optional[Sequence[int]] = None) -> Dict[str, Any]:
+        r = self.glr._rows(streams)
+        x = np.asarray(x, dtype=np.float64).reshape(-1)
+        if self.clip is not None:
+            x = np.clip(x, -self.clip, self.clip)
+        sp = np.maximum(0.0, self.s_pos[r] + x - self.k)
+        sn = np.minimum(0.0, self.s_neg[r] + x + self.k)
+        self.s_pos[r] = sp
+        self.s_neg[r] = sn
+        c_alarm = (sp >= self.h) | (-sn >= self.h)
+        g, _ = self.glr.update(x, r)
+        g_alarm = g >= self.thr
+        return {
+            "cusum_pos": sp,
+            "cusum_neg": sn,
+            "cusum_alarm": c_alarm.astype(np.float64),
+            "glr_stat": g,
+            "glr_alarm": g_alarm.astype(np.float64),
+            "drift_alarm": (c_alarm | g_alarm).astype(np.float64),
+        }
+
+
 # =============================
 # Self-tests (synthetic)
 # =============================
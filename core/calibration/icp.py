@@ -12,12 +12,20 @@ Implements (per project structure):
 - MondrianConformalBinary: per-group (condition key) conformal with global fallback
 - VennAbersBinary: isotonic-based [p_low, p_high] interval via add-one refit trick
 
+All three accept streaming updates (`update`) over an optional rolling
+`window`: conformal scores live in a sorted array (binary-search insert/evict,
+O(log n) p-values, `np.searchsorted` for `p_values_batch`); Venn–Abers
+tabulates both add-one isotonic fits over the calibration scores once, so a
+query is a binary search instead of two refits.
+
 No external dependencies; NumPy optional. Standalone.
 """
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
 import math
 import random
 
@@ -50,6 +58,98 @@ def _nonconformity_binary(p: float, y: int) -> float:
     return y * (1.0 - p) + (1 - y) * p
 
 
+# =============================
+# Split conformal (binary)
+# =============================
+
+class _ScoreWindow:
+    """Sorted nonconformity scores with FIFO eviction once `maxlen` is reached.
+
+    Insert/evict locate their slot by binary search on the sorted list; counts
+    of scores ≥ t are one `bisect_left`. Batch counts use `np.searchsorted` on
+    an array snapshot that is rebuilt lazily after the window changes.
+    """
+
+    __slots__ = ("maxlen", "_sorted", "_fifo", "_arr")
+
+    def __init__(self, maxlen: Optional[int] = None) -> None:
+        self.maxlen = int(maxlen) if maxlen else None
+        self._sorted: List[float] = []
+        self._fifo: Deque[float] = deque()
+        self._arr = None
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    @property
+    def sorted(self) -> List[float]:
+        return self._sorted
+
+    def add(self, s: float) -> None:
+        s = float(s)
+        if self.maxlen is not None and len(self._fifo) >= self.maxlen:
+            old = self._fifo.popleft()
+            del self._sorted[bisect_left(self._sorted, old)]
+        self._fifo.append(s)
+        insort(self._sorted, s)
+        self._arr = None
+
+    def extend(self, scores: Iterable[float]) -> None:
+        vals = [float(s) for s in scores]
+        if len(vals) >= len(self._fifo):
+            # bulk load (always the case from empty): keep the tail and sort once;
+            # one insort per point would be O(n²) in list moves
+            keep = list(self._fifo) + vals
+            if self.maxlen is not None:
+                keep = keep[-self.maxlen:]
+            self._fifo = deque(keep)
+            self._sorted = sorted(keep)
+            self._arr = None
+            return
+        for s in vals:
+            self.add(s)
+
+    def count_ge(self, t: float) -> int:
+        return len(self._sorted) - bisect_left(self._sorted, t)
+
+    def count_ge_batch(self, t: "np.ndarray") -> "np.ndarray":
+        if self._arr is None:
+            self._arr = np.asarray(self._sorted, dtype=np.float64)
+        return len(self._sorted) - np.searchsorted(self._arr, t, side="left")
+
+
+def _p_values(w: _ScoreWindow, p_new: float) -> Tuple[float, float]:
+    """(p_y=1, p_y=0) with +1 smoothing: (#{s_i ≥ s} + 1) / (n + 1)."""
+    n = len(w)
+    if n == 0:
+        return 1.0, 1.0
+    k1 = w.count_ge(_nonconformity_binary(p_new, 1))
+    k0 = w.count_ge(_nonconformity_binary(p_new, 0))
+    return (k1 + 1) / (n + 1), (k0 + 1) / (n + 1)
+
+
+def _p_values_batch(w: _ScoreWindow, p_new: Any) -> Tuple[Any, Any]:
+    if np is None:
+        pairs = [_p_values(w, float(p)) for p in p_new]
+        return [a for a, _ in pairs], [b for _, b in pairs]
+    p = np.clip(np.asarray(p_new, dtype=np.float64), 0.0, 1.0)
+    n = len(w)
+    if n == 0:
+        return np.ones_like(p), np.ones_like(p)
+    k1 = w.count_ge_batch(1.0 - p)
+    k0 = w.count_ge_batch(p)
+    return (k1 + 1) / (n + 1), (k0 + 1) / (n + 1)
+
+
+def _set_from_p_values(p1: float, p0: float, alpha: float) -> List[int]:
+    S = []
+    if p1 > alpha:
+        S.append(1)
+    if p0 > alpha:
+        S.append(0)
+    return S
+
+
 # =============================
 # Split conformal (binary)
 # =============================
@@ -57,50 +157,39 @@ def _nonconformity_binary(p: float, y: int) -> float:
 @dataclass
 class SplitConformalBinary:
     alpha: float = 0.1  # miscoverage level (target coverage 1−α)
+    window: Optional[int] = None  # rolling calibration size (None = keep all)
+
+    def __post_init__(self) -> None:
+        self._w = _ScoreWindow(self.window)
+
+    @property
+    def n(self) -> int:
+        return len(self._w)
+
+    @property
+    def scores(self) -> List[float]:
+        return self._w.sorted
 
     def fit(self, p_hat: Sequence[float], y: Sequence[int]) -> None:
         assert len(p_hat) == len(y)
-        s = [_nonconformity_binary(pi, yi) for pi, yi in zip(p_hat, y)]
-        self.n = len(s)
-        self.scores = sorted(s)
+        self._w = _ScoreWindow(self.window)
+        self._w.extend(_nonconformity_binary(pi, yi) for pi, yi in zip(p_hat, y))
+
+    def update(self, p: float, y: int) -> None:
+        """Add one labelled outcome; evicts the oldest score when the window is full."""
+        self._w.add(_nonconformity_binary(p, y))
 
     def p_values(self, p_new: float) -> Tuple[float, float]:
         """Return p-values (p_y=1, p_y=0) for a new probability p_new=P(y=1)."""
-        n = getattr(self, "n", 0)
-        S = getattr(self, "scores", [])
-        if n == 0:
-            return 1.0, 1.0
-        s1 = _nonconformity_binary(p_new, 1)
-        s0 = _nonconformity_binary(p_new, 0)
-        # count >= s (right tail); S is sorted asc
-        def count_ge(t: float) -> int:
-            # binary search first index > t then n - idx; inclusive ≥ via small epsilon
-            lo, hi = 0, n
-            while lo < hi:
-                mid = (lo + hi) // 2
-                if S[mid] > t:
-                    hi = mid
-                else:
-                    lo = mid + 1
-            # lo is first index with S[lo] > t → #≥ = n - (lo - k_eq)
-            # to ensure ≥, we used (S[mid] > t) branch; so indices equal to t are included
-            ge = n - (lo - 0)
-            return ge
-        ge1 = count_ge(s1)
-        ge0 = count_ge(s0)
-        # conformal p-values with +1 smoothing
-        pval1 = (ge1 + 1) / (n + 1)
-        pval0 = (ge0 + 1) / (n + 1)
-        return float(pval1), float(pval0)
+        return _p_values(self._w, p_new)
+
+    def p_values_batch(self, p_new: Any) -> Tuple[Any, Any]:
+        """Vectorized `p_values`: arrays (p_y=1, p_y=0) aligned with `p_new`."""
+        return _p_values_batch(self._w, p_new)
 
     def predict_set(self, p_new: float) -> List[int]:
         p1, p0 = self.p_values(p_new)
-        S = []
-        if p1 > self.alpha:
-            S.append(1)
-        if p0 > self.alpha:
-            S.append(0)
-        return S
+        return _set_from_p_values(p1, p0, self.alpha)
 
 
 # =============================
@@ -110,156 +199,283 @@ class SplitConformalBinary:
 @dataclass
 class MondrianConformalBinary:
     alpha: float = 0.1
+    window: Optional[int] = None  # per group and for the global fallback
+
+    def __post_init__(self) -> None:
+        self._groups: Dict[str, _ScoreWindow] = {}
+        self._global = _ScoreWindow(self.window)
+
+    @property
+    def bucket(self) -> Dict[str, List[float]]:
+        return {g: w.sorted for g, w in self._groups.items()}
+
+    @property
+    def global_scores(self) -> List[float]:
+        return self._global.sorted
 
     def fit(self, p_hat: Sequence[float], y: Sequence[int], groups: Sequence[str]) -> None:
         assert len(p_hat) == len(y) == len(groups)
-        self.bucket: Dict[str, List[float]] = {}
+        per_group: Dict[str, List[float]] = {}
+        s_all: List[float] = []
         for pi, yi, g in zip(p_hat, y, groups):
             s = _nonconformity_binary(pi, yi)
-            L = self.bucket.setdefault(str(g), [])
-            L.append(s)
-        for k in list(self.bucket.keys()):
-            self.bucket[k].sort()
-        # global fallback
-        self.global_scores = sorted([_nonconformity_binary(pi, yi) for pi, yi in zip(p_hat, y)])
-
-    def _p_values_from_scores(self, scores: Sequence[float], p_new: float) -> Tuple[float, float]:
-        if not scores:
-            return 1.0, 1.0
-        n = len(scores)
-        s1 = _nonconformity_binary(p_new, 1)
-        s0 = _nonconformity_binary(p_new, 0)
-        # count ≥ via binary search
-        import bisect
-        k1 = n - bisect.bisect_left(scores, s1)  # elements >= s1
-        k0 = n - bisect.bisect_left(scores, s0)
-        return (k1 + 1) / (n + 1), (k0 + 1) / (n + 1)
+            per_group.setdefault(str(g), []).append(s)
+            s_all.append(s)
+        self._groups = {}
+        for g, L in per_group.items():
+            w = self._groups[g] = _ScoreWindow(self.window)
+            w.extend(L)
+        self._global = _ScoreWindow(self.window)
+        self._global.extend(s_all)
+
+    def update(self, p: float, y: int, group: str) -> None:
+        s = _nonconformity_binary(p, y)
+        g = str(group)
+        w = self._groups.get(g)
+        if w is None:
+            w = self._groups[g] = _ScoreWindow(self.window)
+        w.add(s)
+        self._global.add(s)
+
+    def _window_for(self, group: Optional[str]) -> _ScoreWindow:
+        if group is not None:
+            w = self._groups.get(str(group))
+            if w is not None and len(w):
+                return w
+        return self._global
 
     def p_values(self, p_new: float, group: Optional[str]) -> Tuple[float, float]:
-        if group is not None and group in getattr(self, "bucket", {}):
-            return self._p_values_from_scores(self.bucket[group], p_new)
-        return self._p_values_from_scores(getattr(self, "global_scores", []), p_new)
+        return _p_values(self._window_for(group), p_new)
+
+    def p_values_batch(self, p_new: Any, groups: Optional[Sequence[Optional[str]]] = None) -> Tuple[Any, Any]:
+        """Vectorized `p_values`; one `searchsorted` per distinct group in the batch."""
+        if groups is None:
+            return _p_values_batch(self._global, p_new)
+        if np is None:
+            pairs = [self.p_values(float(p), g) for p, g in zip(p_new, groups)]
+            return [a for a, _ in pairs], [b for _, b in pairs]
+        p = np.asarray(p_new, dtype=np.float64)
+        keys = np.asarray([None if g is None else str(g) for g in groups], dtype=object)
+        assert keys.shape == p.shape
+        p1 = np.empty_like(p)
+        p0 = np.empty_like(p)
+        for g in set(keys.tolist()):
+            m = keys == g
+            p1[m], p0[m] = _p_values_batch(self._window_for(g), p[m])
+        return p1, p0
 
     def predict_set(self, p_new: float, group: Optional[str]) -> List[int]:
         p1, p0 = self.p_values(p_new, group)
-        S = []
-        if p1 > self.alpha:
-            S.append(1)
-        if p0 > self.alpha:
-            S.append(0)
-        return S
+        return _set_from_p_values(p1, p0, self.alpha)
 
 
 # =============================
-# Isotonic regression (PAV) for Venn–Abers
+# Venn–Abers (binary, precomputed isotonic tables)
 # =============================
 
-@dataclass
-class _Iso:
-    xs: List[float]
-    ys: List[float]
-
-    def fit(self) -> None:
-        # Pool-Adjacent-Violators for isotonic (non-decreasing) fit
-        xs = [float(x) for x in self.xs]
-        ys = [float(y) for y in self.ys]
-        order = sorted(range(len(xs)), key=lambda i: xs[i])
-        x = [xs[i] for i in order]
-        y = [ys[i] for i in order]
-        n = len(x)
-        if n == 0:
-            self.blocks = []
-            return
-        # initialize blocks
-        v = [float(val) for val in y]
-        w = [1.0] * n
-        i = 0
-        while i < len(v) - 1:
-            if v[i] <= v[i + 1]:
-                i += 1
-                continue
-            # pool
-            j = i
-            while j >= 0 and j + 1 < len(v) and v[j] > v[j + 1]:
-                wt = w[j] + w[j + 1]
-                val = (w[j] * v[j] + w[j + 1] * v[j + 1]) / wt
-                v[j] = val
-                w[j] = wt
-                # delete j+1
-                del v[j + 1]
-                del w[j + 1]
-                j -= 1
-            i = max(j, 0)
-        # build blocks with x spans
-        blocks = []
-        idx = 0
-        for val, wt in zip(v, w):
-            if idx < len(x):
-                x_lo = x[idx]
-                x_hi = x[min(len(x) - 1, idx + int(wt) - 1)]
-                blocks.append((x_lo, x_hi, val))
-                idx += int(wt)
-        self.blocks = blocks
-
-    def predict(self, xq: float) -> float:
-        if not hasattr(self, "blocks") or not self.blocks:
-            return 0.5
-        xq = float(xq)
-        # find block
-        for lo, hi, val in self.blocks:
-            if xq <= hi:
-                if xq < lo:
-                    # interpolate with previous block if exists
-                    return val
-                return val
-        return self.blocks[-1][2]
+def _to_logit(p: float) -> float:
+    p = min(1 - 1e-9, max(1e-9, float(p)))
+    return math.log(p / (1 - p))
 
 
-# =============================
-# Venn–Abers (binary, simple refit per query)
-# =============================
+def _cross(o: Tuple[float, float], a: Tuple[float, float], b: Tuple[float, float]) -> float:
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def _slope(a: Tuple[float, float], b: Tuple[float, float]) -> float:
+    return (b[1] - a[1]) / (b[0] - a[0])
+
+
+def _not_below(t: Tuple[float, float], a: Tuple[float, float], b: Tuple[float, float]) -> bool:
+    m = _slope(a, b)
+    return t[1] >= a[1] + m * (t[0] - a[0])
+
+
+def _venn_abers_tables(W: Sequence[float], C: Sequence[float]) -> Tuple[List[float], List[float]]:
+    """Isotonic value at a test point labelled 0 / 1 for every insertion slot.
+
+    W, C are the cumulative weights / label sums of the k distinct sorted
+    scores (W[0] = C[0] = 0), i.e. the cumulative sum diagram P_i = (W_i, C_i).
+    The isotonic fit at a point is the slope of the greatest convex minorant
+    of the CSD there, so both label hypotheses for all k + 1 slots follow from
+    one convex-hull sweep each (Vovk, Petej & Fedorova 2015), O(k) total.
+
+    Returns (p0, p1), each of length k + 1:
+      p0[r] — label 0, test score has r distinct scores ≤ it (bisect_right)
+      p1[j] — label 1, test score has j distinct scores < it (bisect_left)
+    """
+    k = len(W) - 1
+    base = {i: (float(W[i]), float(C[i])) for i in range(k + 1)}
+
+    # label 1: F1[i] = fitted value when the test point joins group i
+    P = dict(base)
+    P[-1] = (-1.0, -1.0)
+    S = [P[-1], P[0]]
+    for i in range(1, k + 1):
+        while len(S) > 1 and _cross(S[-2], S[-1], P[i]) <= 0:
+            S.pop()
+        S.append(P[i])
+    S.reverse()
+    F1 = [0.0] * (k + 1)
+    for i in range(1, k + 1):
+        F1[i] = _slope(S[-1], S[-2])
+        P[i - 1] = (P[i - 2][0] + P[i][0] - P[i - 1][0], P[i - 2][1] + P[i][1] - P[i - 1][1])
+        if _not_below(P[i - 1], S[-1], S[-2]):
+            continue
+        S.pop()
+        while len(S) > 1 and _cross(P[i - 1], S[-1], S[-2]) <= 0:
+            S.pop()
+        S.append(P[i - 1])
+
+    # label 0: mirror sweep from the right
+    P = dict(base)
+    P[k + 1] = (P[k][0] + 1.0, P[k][1])
+    S = [P[k + 1], P[k]]
+    for i in range(k - 1, -1, -1):
+        while len(S) > 1 and _cross(S[-2], S[-1], P[i]) >= 0:
+            S.pop()
+        S.append(P[i])
+    S.reverse()
+    F0 = [0.0] * (k + 1)
+    for i in range(k, 0, -1):
+        F0[i] = _slope(S[-1], S[-2])
+        P[i] = (P[i - 1][0] + P[i + 1][0] - P[i][0], P[i - 1][1] + P[i + 1][1] - P[i][1])
+        if _not_below(P[i], S[-1], S[-2]):
+            continue
+        S.pop()
+        while len(S) > 1 and _cross(P[i], S[-1], S[-2]) >= 0:
+            S.pop()
+        S.append(P[i])
+
+    # A test score strictly between two calibration scores gets the same value
+    # as a tie with its right (label 1) / left (label 0) neighbour; only the
+    # two outer slots need their own max-min / min-max slope.
+    Wk, Ck = float(W[k]), float(C[k])
+    p1_end = max((Ck - C[a] + 1.0) / (Wk - W[a] + 1.0) for a in range(k + 1))
+    p0_start = min(C[b] / (W[b] + 1.0) for b in range(k + 1))
+    p0 = [p0_start] + F0[1:]
+    p1 = F1[1:] + [p1_end]
+    return [min(1.0, max(0.0, v)) for v in p0], [min(1.0, max(0.0, v)) for v in p1]
+
 
 @dataclass
 class VennAbersBinary:
-    """Venn–Abers via isotonic refits with the new point labelled 0 and 1.
+    """Venn–Abers interval [p_low, p_high] from isotonic fits with the new point labelled 0 and 1.
 
     API:
       - fit(scores, y) where `scores` are *monotone* scores (e.g., logits or raw model scores
         increasing with P(y=1)). If you only have probabilities p, you may pass
         scores = logit(p) (guarded inside).
+      - update(score, y) adds one outcome (rolling when `window` is set);
+        update_many(scores, y) adds a batch
       - predict_interval(score_new) → (p_low, p_high)
+      - predict_interval_batch(scores) → (p_low[], p_high[])
+
+    Both isotonic fits are tabulated once per calibration set over the
+    distinct calibration scores, so a query is two binary searches. The tables
+    are not maintained incrementally: a rebuild sorts the whole window
+    (O(n log n), ~tens of ms at n=5000). They are rebuilt lazily on the first
+    query after `fit`, `update_many`, or every `refresh_every`-th `update`;
+    with refresh_every > 1 queries in between use tables that lag the newest
+    (at most refresh_every − 1) outcomes.
     """
+    window: Optional[int] = None
+    refresh_every: int = 1  # updates absorbed before the tables are rebuilt (1 = exact)
+
+    def __post_init__(self) -> None:
+        self._s: Deque[float] = deque(maxlen=self.window or None)
+        self._y: Deque[int] = deque(maxlen=self.window or None)
+        self._logit = True  # probability inputs are mapped to logits
+        self._tab: Optional[Tuple[Any, ...]] = None
+        self._pending = 0  # updates not yet reflected in _tab
+
+    @property
+    def s(self) -> List[float]:
+        return list(self._s)
+
+    @property
+    def y(self) -> List[int]:
+        return list(self._y)
+
     def fit(self, scores: Sequence[float], y: Sequence[int]) -> None:
         assert len(scores) == len(y)
-        self.s = [float(x) for x in scores]
-        self.y = [1 if int(t) == 1 else 0 for t in y]
+        s = [float(x) for x in scores]
         # if scores are probabilities, map to logits to improve monotonicity spacing
-        # guard at 0/1 boundaries
-        def to_logit(p: float) -> float:
-            p = min(1 - 1e-9, max(1e-9, float(p)))
-            return math.log(p / (1 - p))
-        # decide if looks like probs
-        if all(0.0 <= x <= 1.0 for x in self.s):
-            self.s = [to_logit(x) for x in self.s]
-
-    def _calibrate_with_added(self, s_new: float, y_new: int) -> float:
-        xs = self.s + [float(s_new)]
-        ys = self.y + [float(1 if int(y_new) == 1 else 0)]
-        iso = _Iso(xs=xs, ys=ys)
-        iso.fit()
-        return max(0.0, min(1.0, iso.predict(float(s_new))))
+        self._logit = all(0.0 <= x <= 1.0 for x in s)
+        if self._logit:
+            s = [_to_logit(x) for x in s]
+        self._s.clear()
+        self._y.clear()
+        self._s.extend(s)
+        self._y.extend(1 if int(t) == 1 else 0 for t in y)
+        self._tab = None
+        self._pending = 0
+
+    def _append(self, score: float, y: int) -> None:
+        s = float(score)
+        if self._logit and 0.0 <= s <= 1.0:
+            s = _to_logit(s)
+        self._s.append(s)
+        self._y.append(1 if int(y) == 1 else 0)
+
+    def update(self, score: float, y: int) -> None:
+        self._append(score, y)
+        self._pending += 1
+        if self._pending >= max(1, int(self.refresh_every)):
+            self._tab = None
+            self._pending = 0
+
+    def update_many(self, scores: Sequence[float], y: Sequence[int]) -> None:
+        """Add a batch of outcomes; the tables are rebuilt once, on the next query."""
+        assert len(scores) == len(y)
+        for si, yi in zip(scores, y):
+            self._append(si, yi)
+        self._tab = None
+        self._pending = 0
+
+    def _tables(self) -> Tuple[Any, ...]:
+        tab = self._tab
+        if tab is None:
+            ux: List[float] = []
+            W: List[float] = [0.0]
+            C: List[float] = [0.0]
+            for si, yi in sorted(zip(self._s, self._y)):
+                if ux and si == ux[-1]:
+                    W[-1] += 1.0
+                    C[-1] += yi
+                else:
+                    ux.append(si)
+                    W.append(W[-1] + 1.0)
+                    C.append(C[-1] + yi)
+            p0, p1 = _venn_abers_tables(W, C)
+            arrs = (np.asarray(ux, dtype=np.float64), np.asarray(p0), np.asarray(p1)) if np is not None else (None, None, None)
+            tab = self._tab = (ux, p0, p1) + arrs
+        return tab
 
     def predict_interval(self, score_new: float) -> Tuple[float, float]:
         # map prob to logit if necessary (mirror of fit)
         s_new = float(score_new)
         if 0.0 <= s_new <= 1.0:
-            p = min(1 - 1e-9, max(1e-9, s_new))
-            s_new = math.log(p / (1 - p))
-        p0 = self._calibrate_with_added(s_new, 0)
-        p1 = self._calibrate_with_added(s_new, 1)
-        lo = min(p0, p1)
-        hi = max(p0, p1)
-        return lo, hi
+            s_new = _to_logit(s_new)
+        ux, p0, p1 = self._tables()[:3]
+        a = p0[bisect_right(ux, s_new)]
+        b = p1[bisect_left(ux, s_new)]
+        return min(a, b), max(a, b)
+
+    def predict_interval_batch(self, scores: Any) -> Tuple[Any, Any]:
+        if np is None:
+            pairs = [self.predict_interval(float(v)) for v in scores]
+            return [a for a, _ in pairs], [b for _, b in pairs]
+        s = np.asarray(scores, dtype=np.float64)
+        is_p = (s >= 0.0) & (s <= 1.0)
+        if is_p.any():
+            q = np.clip(s[is_p], 1e-9, 1 - 1e-9)
+            s = s.copy()
+            s[is_p] = np.log(q / (1 - q))
+        _, _, _, ux, p0, p1 = self._tables()
+        a = p0[np.searchsorted(ux, s, side="right")]
+        b = p1[np.searchsorted(ux, s, side="left")]
+        return np.minimum(a, b), np.maximum(a, b)
 
 
 # =============================
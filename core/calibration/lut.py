@@ -0,0 +1,132 @@
+"""
+Aurora+ScalpBot — core/calibration/lut.py
+-----------------------------------------
+Compiled isotonic calibration table: a fitted monotone map x→p frozen into
+breakpoint arrays and evaluated by binary search + linear interpolation.
+
+Both isotonic calibrators (`core.calibration.calibrator.IsotonicCalibrator`,
+pure PAV, and `core.scalper.calibrator.IsotonicCalibrator`, sklearn) compile
+into an `IsotonicLUT` after `fit`, so the request path never touches sklearn or
+walks Python lists of knots.
+
+Semantics match `np.interp` / sklearn `IsotonicRegression(out_of_bounds="clip")`:
+- x below the first knot → y[0]; above the last knot → y[-1]
+- between knots → linear interpolation on the bracketing pair
+
+Scalar lookups use `bisect` on plain lists (no NumPy call overhead); batch
+lookups use `np.interp`. Tables persist as small JSON documents.
+
+No external dependencies; NumPy optional (batch falls back to scalar loop).
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
+LUT_KIND = "isotonic_lut"
+LUT_VERSION = 1
+
+
+class IsotonicLUT:
+    """Monotone piecewise-linear lookup table.
+
+    Parameters
+    ----------
+    x : strictly increasing knot positions
+    y : values at the knots (non-decreasing for isotonic fits)
+    meta : free-form JSON-serializable metadata kept with the table
+    """
+
+    __slots__ = ("_x", "_y", "_xa", "_ya", "meta")
+
+    def __init__(self, x: Sequence[float], y: Sequence[float], *, meta: Optional[Dict[str, Any]] = None) -> None:
+        xs = [float(v) for v in x]
+        ys = [float(v) for v in y]
+        if len(xs) != len(ys):
+            raise ValueError("x and y must have the same length")
+        if not xs:
+            raise ValueError("empty table")
+        if any(b <= a for a, b in zip(xs, xs[1:])):
+            raise ValueError("knots must be strictly increasing")
+        self._x: List[float] = xs
+        self._y: List[float] = ys
+        self._xa = np.asarray(xs, dtype=np.float64) if np is not None else None
+        self._ya = np.asarray(ys, dtype=np.float64) if np is not None else None
+        self.meta: Dict[str, Any] = dict(meta or {})
+
+    @classmethod
+    def from_knots(cls, x: Sequence[float], y: Sequence[float], **kw: Any) -> "IsotonicLUT":
+        """Build from sorted knots that may repeat x; ties keep the last y (step-up)."""
+        xs: List[float] = []
+        ys: List[float] = []
+        for xi, yi in zip(x, y):
+            xi, yi = float(xi), float(yi)
+            if xs and xi == xs[-1]:
+                ys[-1] = yi
+            else:
+                xs.append(xi)
+                ys.append(yi)
+        return cls(xs, ys, **kw)
+
+    @property
+    def knots(self) -> Tuple[List[float], List[float]]:
+        return list(self._x), list(self._y)
+
+    def __len__(self) -> int:
+        return len(self._x)
+
+    def __call__(self, v: float) -> float:
+        """Scalar lookup."""
+        xs, ys = self._x, self._y
+        i = bisect_right(xs, v)
+        if i == 0:
+            return ys[0]
+        if i == len(xs):
+            return ys[-1]
+        x0 = xs[i - 1]
+        y0 = ys[i - 1]
+        # same operation order as np.interp, so scalar and batch agree bit-for-bit
+        return (ys[i] - y0) / (xs[i] - x0) * (v - x0) + y0
+
+    def batch(self, v: Any) -> Any:
+        """Vectorized lookup (ndarray in → ndarray out); list in → list out without NumPy."""
+        if np is None:
+            return [self(float(t)) for t in v]
+        return np.interp(np.asarray(v, dtype=np.float64), self._xa, self._ya)
+
+    # -------------------- persistence --------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"kind": LUT_KIND, "version": LUT_VERSION, "x": self._x, "y": self._y, "meta": self.meta}
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "IsotonicLUT":
+        if d.get("kind") != LUT_KIND:
+            raise ValueError(f"not an isotonic table: kind={d.get('kind')!r}")
+        if int(d.get("version", 0)) > LUT_VERSION:
+            raise ValueError(f"unsupported table version {d.get('version')}")
+        return cls(d["x"], d["y"], meta=d.get("meta") or {})
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Write atomically (tmp + rename) so readers never see a partial table."""
+        p = Path(path)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        tmp = p.with_name(p.name + ".tmp")
+        tmp.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+        os.replace(tmp, p)
+        return p
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "IsotonicLUT":
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+__all__ = ["IsotonicLUT", "LUT_KIND", "LUT_VERSION"]
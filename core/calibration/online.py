@@ -0,0 +1,369 @@
+"""
+Aurora+ScalpBot — core/calibration/online.py
+--------------------------------------------
+Streaming recalibration: ingest (p_raw, y) outcomes from posttrade, keep a
+bounded window, refit off the request path and atomically swap in the new
+calibrator.
+
+The gate only ever reads one reference (`_current`) — a fitted, compiled
+calibrator (isotonic → `IsotonicLUT`, Platt, temperature). A refit fits a
+fresh object on a snapshot of the window and rebinds that reference in one
+assignment, so `calibrate_prob` never waits on a fit and never sees a
+half-built model. Before the first fit probabilities pass through unchanged.
+
+Refit triggers (any of):
+- `refit_every_n` new outcomes since the last refit
+- `refit_interval_s` elapsed since the last refit
+- `DriftMonitor` alarm on standardized residuals (y − p)/√(p(1−p)) of the
+  currently served probabilities; the monitor is reset after the swap
+
+Execution modes:
+- "thread"  : daemon thread per refit (at most one in flight)
+- "process" : lazy single-worker spawn-context ProcessPoolExecutor; falls back to inline
+- "inline"  : fit synchronously inside `observe` (tests, offline replays)
+
+Optionally each isotonic swap is also saved as a LUT file (`table_path`,
+atomic tmp + rename) for processes that load calibration tables from disk.
+
+I/O Contract:
+- Input: `observe(p_raw, y, ts)` with p_raw ∈ [0, 1], y ∈ {0, 1}
+- Output: `calibrate_prob(p)` / `predict_p_batch(p)` ∈ [0, 1]
+- Invariants: window ≤ `window` pairs; one refit in flight at a time
+
+No external dependencies; NumPy optional.
+"""
+from __future__ import annotations
+
+from collections import deque
+import logging
+import math
+import os
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable, Deque, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from core.calibration.calibrator import IsotonicCalibrator, PlattCalibrator, TemperatureScaler
+from core.calibration.drift import DriftMonitor
+
+logger = logging.getLogger("aurora.calibration.online")
+
+METHODS = ("isotonic", "platt", "temperature")
+MODES = ("thread", "process", "inline")
+
+
+def _fit_calibrator(method: str, p: Sequence[float], y: Sequence[int]) -> Any:
+    """Fit a fresh calibrator (module-level so process pools can pickle it)."""
+    if method == "platt":
+        return PlattCalibrator().fit(p, y)
+    if method == "temperature":
+        return TemperatureScaler().fit(p, y)
+    cal = IsotonicCalibrator().fit(p, y)
+    cal.compile()
+    return cal
+
+
+class OnlineRecalibrator:
+    """Bounded-window calibrator that refits in the background and hot-swaps.
+
+    Parameters
+    ----------
+    method           : "isotonic" | "platt" | "temperature"
+    window           : max (p_raw, y) pairs kept (oldest dropped first)
+    min_samples      : no fit below this many pairs
+    refit_every_n    : refit after this many new outcomes (0 disables)
+    refit_interval_s : refit after this many seconds (0 disables)
+    drift            : optional DriftMonitor fed with served-probability residuals
+    mode             : "thread" | "process" | "inline"
+    clock            : seconds clock used when `observe` gets no ts
+    table_path       : save each compiled isotonic table here (optional)
+    on_swap          : callback(calibrator, info) after each swap
+    initial          : calibrator served until the first refit
+    """
+
+    def __init__(
+        self,
+        method: str = "isotonic",
+        *,
+        window: int = 5000,
+        min_samples: int = 200,
+        refit_every_n: int = 500,
+        refit_interval_s: float = 300.0,
+        drift: Optional[DriftMonitor] = None,
+        mode: str = "thread",
+        clock: Callable[[], float] = time.time,
+        table_path: Optional[Union[str, Path]] = None,
+        on_swap: Optional[Callable[[Any, Dict[str, Any]], None]] = None,
+        initial: Any = None,
+    ) -> None:
+        m = str(method).lower()
+        if m not in METHODS:
+            raise ValueError("unknown calibration method: " + str(method))
+        md = str(mode).lower()
+        if md not in MODES:
+            raise ValueError("unknown refit mode: " + str(mode))
+        self.method = m
+        self.mode = md
+        self.window = max(1, int(window))
+        self.min_samples = max(2, int(min_samples))
+        self.refit_every_n = max(0, int(refit_every_n))
+        self.refit_interval_s = max(0.0, float(refit_interval_s))
+        self.drift = drift
+        self.table_path = Path(table_path) if table_path else None
+        self.on_swap = on_swap
+        self._clock = clock
+
+        self._buf: Deque[Tuple[float, int]] = deque(maxlen=self.window)
+        self._lock = threading.Lock()
+        self._current: Any = initial
+        self._busy = False
+        self._thread: Optional[threading.Thread] = None
+        self._pool: Any = None
+
+        self._since_fit = 0
+        self._last_fit_ts: Optional[float] = None
+        self._drift_pending = False
+
+        self.version = 0
+        self.n_seen = 0
+        self.n_refits = 0
+        self.n_failed = 0
+        self.last_trigger: Optional[str] = None
+        self.last_fit_ms: Optional[float] = None
+        self.last_fit_n = 0
+
+    @classmethod
+    def from_cfg(
+        cls, cfg: Mapping[str, Any] | None, env: Mapping[str, str] | None = None, **kw: Any
+    ) -> "OnlineRecalibrator":
+        """Build from cfg.calibration.online (env AURORA_CALIB_ONLINE_* as fallback)."""
+        env = os.environ if env is None else env
+        calib = (cfg or {}).get("calibration") or {}
+        oc = calib.get("online") or {}
+
+        def pick(key: str, cast: Callable[[Any], Any], default: Any) -> Any:
+            v = oc.get(key)
+            if v is None:
+                v = env.get("AURORA_CALIB_ONLINE_" + key.upper())
+            try:
+                return default if v is None else cast(v)
+            except Exception:
+                return default
+
+        drift = DriftMonitor() if bool(pick("drift", lambda v: str(v).lower() in ("1", "true", "on", "yes"), True)) else None
+        args: Dict[str, Any] = dict(
+            method=pick("method", str, "isotonic"),
+            window=pick("window", int, 5000),
+            min_samples=pick("min_samples", int, 200),
+            refit_every_n=pick("refit_every_n", int, 500),
+            refit_interval_s=pick("refit_interval_s", float, 300.0),
+            mode=pick("mode", str, "thread"),
+            table_path=oc.get("table_path") or calib.get("table_path"),
+            drift=drift,
+        )
+        args.update(kw)
+        return cls(**args)
+
+    # -------------------- gate path (lock-free reads) --------------------
+
+    @property
+    def calibrator(self) -> Any:
+        return self._current
+
+    @property
+    def ready(self) -> bool:
+        return self._current is not None
+
+    def calibrate_prob(self, p_raw: float) -> float:
+        cur = self._current
+        if cur is None:
+            return float(p_raw)
+        return float(cur.calibrate_prob(p_raw))
+
+    def predict_p_batch(self, p_raw: Any) -> Any:
+        cur = self._current
+        if cur is None:
+            return p_raw
+        return cur.predict_p_batch(p_raw)
+
+    calibrate_prob_batch = predict_p_batch
+
+    # -------------------- ingestion --------------------
+
+    def __len__(self) -> int:
+        return len(self._buf)
+
+    def observe(self, p_raw: float, y: int, ts: Optional[float] = None) -> bool:
+        """Record one resolved outcome; returns True if a refit was started."""
+        p = min(1.0, max(0.0, float(p_raw)))
+        yi = 1 if y else 0
+        with self._lock:
+            self._buf.append((p, yi))
+        self.n_seen += 1
+        self._since_fit += 1
+        now = float(ts) if ts is not None else float(self._clock())
+        if self._last_fit_ts is None:
+            self._last_fit_ts = now
+
+        if self.drift is not None and self._current is not None:
+            q = min(1.0 - 1e-6, max(1e-6, self.calibrate_prob(p)))
+            z = (yi - q) / math.sqrt(q * (1.0 - q))
+            if self.drift.update(z, now).get("drift_alarm", 0.0) > 0.5:
+                self._drift_pending = True
+        return self.maybe_refit(now)
+
+    def observe_many(self, p_raw: Sequence[float], y: Sequence[int], ts: Optional[float] = None) -> bool:
+        started = False
+        for pi, yi in zip(p_raw, y):
+            started = self.observe(pi, yi, ts) or started
+        return started
+
+    def _trigger(self, now: float) -> Optional[str]:
+        if len(self._buf) < self.min_samples:
+            return None
+        if self._current is None:
+            return "initial"
+        if self._drift_pending:
+            return "drift"
+        if self.refit_every_n and self._since_fit >= self.refit_every_n:
+            return "count"
+        if self.refit_interval_s and self._last_fit_ts is not None and now - self._last_fit_ts >= self.refit_interval_s:
+            return "interval"
+        return None
+
+    def maybe_refit(self, now: Optional[float] = None) -> bool:
+        """Start a refit if a trigger is due and none is in flight."""
+        if self._busy:
+            return False
+        t = float(self._clock()) if now is None else float(now)
+        reason = self._trigger(t)
+        if reason is None:
+            return False
+        return self._start(reason, t)
+
+    def refit(self, *, block: bool = True) -> bool:
+        """Force a refit now (ignores triggers, respects min_samples)."""
+        if self._busy or len(self._buf) < self.min_samples:
+            return False
+        started = self._start("manual", float(self._clock()))
+        if block:
+            self.wait()
+        return started
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the in-flight refit (if any) has swapped; False on timeout."""
+        th = self._thread
+        if th is not None:
+            th.join(timeout)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._busy:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.001)
+        return True
+
+    # -------------------- refit machinery --------------------
+
+    def _snapshot(self) -> Tuple[List[float], List[int]]:
+        with self._lock:
+            pairs = list(self._buf)
+        return [p for p, _ in pairs], [y for _, y in pairs]
+
+    def _start(self, reason: str, now: float) -> bool:
+        self._busy = True
+        self._since_fit = 0
+        self._last_fit_ts = now
+        self._drift_pending = False
+        self.last_trigger = reason
+        p, y = self._snapshot()
+        t0 = time.perf_counter()
+
+        if self.mode == "process":
+            pool = self._get_pool()
+            if pool:
+                try:
+                    fut = pool.submit(_fit_calibrator, self.method, p, y)
+                    fut.add_done_callback(lambda f: self._finish(f.result, len(p), t0))
+                    return True
+                except Exception as ex:
+                    logger.debug("process refit unavailable, fitting inline: %s", ex)
+                    self._pool = False
+            self._run(p, y, t0)
+            return True
+        if self.mode == "thread":
+            th = threading.Thread(target=self._run, args=(p, y, t0), name="aurora-recalib", daemon=True)
+            self._thread = th
+            th.start()
+            return True
+        self._run(p, y, t0)
+        return True
+
+    def _get_pool(self) -> Any:
+        if self._pool is None:
+            try:
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+
+                # spawn: never fork the threaded service host
+                self._pool = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+            except Exception:
+                self._pool = False
+        return self._pool
+
+    def _run(self, p: List[float], y: List[int], t0: float) -> None:
+        self._finish(lambda: _fit_calibrator(self.method, p, y), len(p), t0)
+
+    def _finish(self, get: Callable[[], Any], n: int, t0: float) -> None:
+        try:
+            cal = get()
+        except Exception as ex:
+            self.n_failed += 1
+            logger.warning("calibration refit failed (%s): %s", self.method, ex)
+            self._busy = False
+            return
+        self._swap(cal, n, t0)
+
+    def _swap(self, cal: Any, n: int, t0: float) -> None:
+        self._current = cal  # single rebind: readers see old or new, never partial
+        self.version += 1
+        self.n_refits += 1
+        self.last_fit_n = n
+        self.last_fit_ms = (time.perf_counter() - t0) * 1e3
+        if self.drift is not None:
+            self.drift.reset()
+        self._busy = False
+        info = self.stats()
+        if self.table_path is not None and getattr(cal, "lut_", None) is not None:
+            try:
+                cal.save(self.table_path)
+            except Exception as ex:
+                logger.warning("failed to save calibration table %s: %s", self.table_path, ex)
+        if self.on_swap is not None:
+            try:
+                self.on_swap(cal, info)
+            except Exception as ex:
+                logger.debug("on_swap callback error: %s", ex)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "method": self.method,
+            "version": self.version,
+            "n_seen": self.n_seen,
+            "n_window": len(self._buf),
+            "n_refits": self.n_refits,
+            "n_failed": self.n_failed,
+            "last_trigger": self.last_trigger,
+            "last_fit_n": self.last_fit_n,
+            "last_fit_ms": self.last_fit_ms,
+            "busy": self._busy,
+        }
+
+    def close(self) -> None:
+        """Wait for an in-flight refit and release the worker pool."""
+        self.wait(timeout=5.0)
+        if self._pool:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
+
+
+__all__ = ["METHODS", "MODES", "OnlineRecalibrator"]
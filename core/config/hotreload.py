@@ -7,6 +7,7 @@ Provides:
 - HotReloadViolation: exception on whitelist violations
 - HotReloadPolicy: prefix-based allowlist for changed config keys
 - diff_dicts: stable key-diff on nested dicts
+- apply_keys: copy selected changed keys from a new config onto the old one
 - FileWatcher: simple mtime-based file watcher that triggers a callback on change
 
 The policy intentionally uses *prefix semantics*:
@@ -16,6 +17,7 @@ The policy intentionally uses *prefix semantics*:
 This module is standalone and can be used by ConfigManager or elsewhere.
 """
 
+import copy
 import logging
 import threading
 from dataclasses import dataclass
@@ -54,6 +56,28 @@ def diff_dicts(old: Mapping[str, Any], new: Mapping[str, Any]) -> Set[str]:
             changed.add(k)
     return changed
 
+def apply_keys(old: Mapping[str, Any], new: Mapping[str, Any], keys: Iterable[str]) -> Dict[str, Any]:
+    """Return a deep copy of `old` with the flattened `keys` taken from `new` (absent there = removed)."""
+    out = copy.deepcopy(dict(old))
+    b = _flatten(new)
+    keys = sorted(keys, key=lambda k: k not in b)  # removals first, so a leaf can turn into a section
+    for k in keys:
+        *parents, leaf = k.split(".")
+        node = out
+        for p in parents:
+            nxt = node.get(p)
+            if not isinstance(nxt, dict):
+                if k not in b:
+                    break
+                nxt = node[p] = {}
+            node = nxt
+        else:
+            if k in b:
+                node[leaf] = copy.deepcopy(b[k])
+            else:
+                node.pop(leaf, None)
+    return out
+
 # -------------------- Policy --------------------
 
 @dataclass
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import random
 import time
-from typing import Dict, Any, Optional, Callable
+from typing import Dict, Any, Optional, Callable, Tuple
 
 from core.aurora_event_logger import AuroraEventLogger
 
@@ -12,6 +12,14 @@ class SimLocalSink:
 
     Provides submit/cancel/amend/on_tick and emits ORDER_STATUS(sim) XAI events.
     Designed for determinism via optional seed and test-friendly time_func/event collector.
+
+    With a `scheduler` (core.ingestion.des.SimScheduler) time comes from its
+    virtual clock and each status is delivered (emitted, then `on_status(evt)`)
+    after its sampled latency instead of synchronously. A submitted order then
+    reaches the venue only after its action latency: crossing, post-only and
+    taker fills are decided against the latest market known at that virtual
+    time (`update_market`/`on_tick`, else the snapshot given to `submit`), and
+    maker fills only start from ticks after arrival.
     """
 
     def __init__(
@@ -19,6 +27,8 @@ class SimLocalSink:
         cfg: Optional[Dict[str, Any]] = None,
         ev: Optional[AuroraEventLogger] = None,
         time_func: Optional[Callable[[], float]] = None,
+        scheduler: Optional[Any] = None,
+        on_status: Optional[Callable[[Dict[str, Any]], None]] = None,
     ) -> None:
         cfg = cfg or {}
         self.cfg = cfg
@@ -43,11 +53,18 @@ class SimLocalSink:
         # Event logger (test injection)
         self._ev = ev or AuroraEventLogger()
 
-        # time function (ms)
+        # time function (ms); virtual time when driven by a scheduler
+        self._sched = scheduler
+        self._on_status = on_status
+        if time_func is None and scheduler is not None:
+            time_func = scheduler.clock.now_ms
         self._time = time_func or (lambda: int(time.time() * 1000))
 
         # internal orders store
         self._orders: Dict[str, Dict[str, Any]] = {}
+        # scheduler mode: orders still travelling to the venue (oid -> (order, arrival handle))
+        self._inflight: Dict[str, Tuple[Dict[str, Any], Any]] = {}
+        self._market: Dict[str, Any] = {}
 
         # emitted rng seed flag
         self._seed_emitted = False
@@ -60,11 +77,31 @@ class SimLocalSink:
         a, b = self.slip_bps_range
         return float(self.rng.uniform(a, b))
 
+    def _ts_iso(self) -> str:
+        if self._sched is not None:
+            return time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(self._time() / 1000.0)) + 'Z'
+        return time.strftime('%Y-%m-%dT%H:%M:%S') + 'Z'
+
+    def _deliver(self, evt: Dict[str, Any]) -> None:
+        self._ev.emit('ORDER_STATUS(sim)', evt)
+        if self._on_status is not None:
+            self._on_status(evt)
+
+    def _publish(self, evt: Dict[str, Any], delay_ms: int) -> None:
+        if self._sched is None:
+            self._deliver(evt)
+        else:
+            self._sched.schedule_in(int(delay_ms) * 1_000_000, self._deliver, evt)
+
     def _emit_seed_if_needed(self, details: Dict[str, Any]) -> None:
         if not self._seed_emitted and self.rng_seed is not None:
             details['rng_seed'] = self.rng_seed
             self._seed_emitted = True
 
+    def update_market(self, market: Dict[str, Any]) -> None:
+        """Record the latest market snapshot (best_bid/best_ask/liquidity/...) seen by the sink."""
+        self._market.update(market)
+
     def submit(self, order: Dict[str, Any], market: Optional[Dict[str, Any]] = None) -> str:
         oid = order.get('order_id') or f"sim-{int(self._time())}-{self.rng.randint(0, 9999)}"
         o = dict(order)
@@ -73,15 +110,34 @@ class SimLocalSink:
         o['orig_qty'] = float(o.get('qty', 0))
         o['remaining'] = float(o.get('qty', 0))
         o['order_type'] = o.get('order_type', 'limit')
-        self._orders[oid] = o
 
-        # simulate immediate taker if market order or if liquidity crosses
         latency_action = self._sample_latency()
+        if self._sched is None:
+            self._orders[oid] = o
+            self._execute(o, market or {}, latency_action, latency_action)
+            return oid
+        # the order meets the book as of its arrival, not as of submit
+        if market:
+            self.update_market(market)
+        handle = self._sched.schedule_in(latency_action * 1_000_000, self._arrive, oid, latency_action)
+        self._inflight[oid] = (o, handle)
+        return oid
+
+    def _arrive(self, oid: str, latency_action: int) -> None:
+        pending = self._inflight.pop(oid, None)
+        if pending is None:
+            return
+        o = pending[0]
+        self._orders[oid] = o
+        # action latency has elapsed; only the fill report still travels back
+        self._execute(o, dict(self._market), latency_action, 0)
+
+    def _execute(self, o: Dict[str, Any], m: Dict[str, Any], latency_action: int, delay_ms: int) -> None:
+        """Decide reject/taker fill/ack for order `o` against market `m`; statuses go out after `delay_ms`."""
+        oid = o['order_id']
         latency_fill = None
         slip = None
 
-        # obtain market snapshot if provided else empty
-        m = market or {}
         bid = m.get('best_bid')
         ask = m.get('best_ask')
         # simple liquidity model: m['liquidity'] = {'bid': qty, 'ask': qty}
@@ -102,7 +158,7 @@ class SimLocalSink:
             if self.post_only and crossing:
                 evt = {
                     'order_id': oid,
-                    'ts': time.strftime('%Y-%m-%dT%H:%M:%S') + 'Z',
+                    'ts': self._ts_iso(),
                     'side': o.get('side'),
                     'px': o.get('price'),
                     'qty': o['orig_qty'],
@@ -117,9 +173,9 @@ class SimLocalSink:
                     'ttl_ms': self.ttl_ms,
                 }
                 self._emit_seed_if_needed(evt)
-                self._ev.emit('ORDER_STATUS(sim)', evt)
+                self._publish(evt, delay_ms)
                 del self._orders[oid]
-                return oid
+                return
             # if crossing and IOC or not post_only, treat as taker
             if crossing and self.ioc:
                 is_taker_action = True
@@ -142,7 +198,7 @@ class SimLocalSink:
                     reason = 'ioc_no_liquidity'
                     evt = {
                         'order_id': oid,
-                        'ts': time.strftime('%Y-%m-%dT%H:%M:%S') + 'Z',
+                        'ts': self._ts_iso(),
                         'side': o.get('side'),
                         'px': None,
                         'qty': o['orig_qty'],
@@ -157,16 +213,16 @@ class SimLocalSink:
                         'ttl_ms': self.ttl_ms,
                     }
                     self._emit_seed_if_needed(evt)
-                    self._ev.emit('ORDER_STATUS(sim)', evt)
+                    self._publish(evt, delay_ms)
                     del self._orders[oid]
-                    return oid
+                    return
                 else:
                     # leave as ack
                     status = 'new'
                     reason = None
                     evt = {
                         'order_id': oid,
-                        'ts': time.strftime('%Y-%m-%dT%H:%M:%S') + 'Z',
+                        'ts': self._ts_iso(),
                         'side': o.get('side'),
                         'px': None,
                         'qty': o['orig_qty'],
@@ -181,8 +237,8 @@ class SimLocalSink:
                         'ttl_ms': self.ttl_ms,
                     }
                     self._emit_seed_if_needed(evt)
-                    self._ev.emit('ORDER_STATUS(sim)', evt)
-                    return oid
+                    self._publish(evt, delay_ms)
+                    return
 
             # compute fill price
             if ref_px is None:
@@ -197,7 +253,7 @@ class SimLocalSink:
             latency_fill = self._sample_latency()
             evt = {
                 'order_id': oid,
-                'ts': time.strftime('%Y-%m-%dT%H:%M:%S') + 'Z',
+                'ts': self._ts_iso(),
                 'side': o.get('side'),
                 'px': fill_px,
                 'qty': fill_qty,
@@ -225,15 +281,15 @@ class SimLocalSink:
                 }
 
             self._emit_seed_if_needed(evt)
-            self._ev.emit('ORDER_STATUS(sim)', evt)
+            self._publish(evt, delay_ms + latency_fill)
             # remove order
             del self._orders[oid]
-            return oid
+            return
 
         # Fallback: ack
         evt = {
             'order_id': oid,
-            'ts': time.strftime('%Y-%m-%dT%H:%M:%S') + 'Z',
+            'ts': self._ts_iso(),
             'side': o.get('side'),
             'px': o.get('price'),
             'qty': o['orig_qty'],
@@ -248,17 +304,23 @@ class SimLocalSink:
             'ttl_ms': self.ttl_ms,
         }
         self._emit_seed_if_needed(evt)
-        self._ev.emit('ORDER_STATUS(sim)', evt)
-        return oid
+        self._publish(evt, delay_ms)
+        return
 
     def cancel(self, order_id: str) -> bool:
-        if order_id not in self._orders:
+        pending = self._inflight.pop(order_id, None)
+        if pending is not None:
+            o = pending[0]
+            pending[1].cancel()  # cancelled before it reached the venue
+        elif order_id in self._orders:
+            o = self._orders.pop(order_id)
+        else:
             return False
         latency = self._sample_latency()
         evt = {
             'order_id': order_id,
-            'ts': time.strftime('%Y-%m-%dT%H:%M:%S') + 'Z',
-            'side': self._orders[order_id].get('side'),
+            'ts': self._ts_iso(),
+            'side': o.get('side'),
             'px': None,
             'qty': 0.0,
             'status': 'cancelled',
@@ -272,21 +334,23 @@ class SimLocalSink:
             'ttl_ms': self.ttl_ms,
         }
         self._emit_seed_if_needed(evt)
-        self._ev.emit('ORDER_STATUS(sim)', evt)
-        del self._orders[order_id]
+        self._publish(evt, latency)
         return True
 
     def amend(self, order_id: str, fields: Dict[str, Any]) -> bool:
-        if order_id not in self._orders:
+        o = self._orders.get(order_id)
+        if o is None:
+            o = self._inflight.get(order_id, (None,))[0]
+        if o is None:
             return False
-        self._orders[order_id].update(fields)
+        o.update(fields)
         latency = self._sample_latency()
         evt = {
             'order_id': order_id,
-            'ts': time.strftime('%Y-%m-%dT%H:%M:%S') + 'Z',
-            'side': self._orders[order_id].get('side'),
-            'px': self._orders[order_id].get('price'),
-            'qty': self._orders[order_id].get('remaining'),
+            'ts': self._ts_iso(),
+            'side': o.get('side'),
+            'px': o.get('price'),
+            'qty': o.get('remaining'),
             'status': 'replaced',
             'reason': None,
             'latency_ms_action': latency,
@@ -298,10 +362,11 @@ class SimLocalSink:
             'ttl_ms': self.ttl_ms,
         }
         self._emit_seed_if_needed(evt)
-        self._ev.emit('ORDER_STATUS(sim)', evt)
+        self._publish(evt, latency)
         return True
 
     def on_tick(self, market_snapshot: Dict[str, Any]) -> None:
+        self.update_market(market_snapshot)
         # Iterate over orders and perform maker partial fills if applicable
         for oid, o in list(self._orders.items()):
             if o.get('order_type') != 'limit':
@@ -322,7 +387,7 @@ class SimLocalSink:
                 if age > self.ttl_ms:
                     evt = {
                         'order_id': oid,
-                        'ts': time.strftime('%Y-%m-%dT%H:%M:%S') + 'Z',
+                        'ts': self._ts_iso(),
                         'side': o.get('side'),
                         'px': o.get('price'),
                         'qty': o.get('remaining'),
@@ -337,7 +402,7 @@ class SimLocalSink:
                         'ttl_ms': self.ttl_ms,
                     }
                     self._emit_seed_if_needed(evt)
-                    self._ev.emit('ORDER_STATUS(sim)', evt)
+                    self._publish(evt, evt['latency_ms_action'])
                     del self._orders[oid]
                 continue
             # apply partial fill
@@ -345,7 +410,7 @@ class SimLocalSink:
             latency_fill = self._sample_latency()
             evt = {
                 'order_id': oid,
-                'ts': time.strftime('%Y-%m-%dT%H:%M:%S') + 'Z',
+                'ts': self._ts_iso(),
                 'side': o.get('side'),
                 'px': o.get('price'),
                 'qty': fill_qty,
@@ -360,7 +425,7 @@ class SimLocalSink:
                 'ttl_ms': self.ttl_ms,
             }
             self._emit_seed_if_needed(evt)
-            self._ev.emit('ORDER_STATUS(sim)', evt)
+            self._publish(evt, latency_fill)
             if o['remaining'] <= 0:
                 del self._orders[oid]
             
@@ -32,6 +32,7 @@ from pathlib import Path
 
 from core.tca.latency import SLAGate, SLAGateResult
 from core.config.loader import get_config, ConfigError
+from core.utils.quantiles import SlidingQuantile, sketch_enabled
 
 
 NS_PER_MS = 1_000_000
@@ -48,18 +49,24 @@ class SLASummary:
 class _Quantile:
     """Simple deterministic quantile estimator on a bounded window.
 
-    Keeps a deque of last N latencies and computes exact order statistics on
-    demand. For production, this can be replaced with a CKMS or t-digest, but
-    deterministic exact ranks help tests and reproducibility.
+    Keeps the last N latencies and computes exact order statistics on demand.
+    With the quantile sketch enabled (default) the window is a `SlidingQuantile`,
+    so queries do not re-sort; ranks stay exact and deterministic.
     """
 
-    def __init__(self, limit: int = 10_000) -> None:
+    def __init__(self, limit: int = 10_000, sketch: bool | None = None) -> None:
         self._dq: Deque[float] = deque(maxlen=int(limit))
+        self._sq = SlidingQuantile(maxlen=int(limit)) if sketch_enabled(sketch) else None
 
     def push(self, x_ms: float) -> None:
+        if self._sq is not None:
+            self._sq.add(x_ms)
+            return
         self._dq.append(float(x_ms))
 
     def quantile(self, q: float) -> float:
+        if self._sq is not None:
+            return self._sq.quantile(q)
         arr = sorted(self._dq)
         if not arr:
             return 0.0
@@ -71,7 +78,7 @@ class _Quantile:
         return arr[lo] * (1 - frac) + arr[hi] * frac
 
     def summary(self) -> SLASummary:
-        n = len(self._dq)
+        n = len(self._sq) if self._sq is not None else len(self._dq)
         return SLASummary(
             count=n,
             p50_ms=self.quantile(0.5),
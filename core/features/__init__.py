@@ -6,6 +6,7 @@ This package provides various microstructure and market data features
 used in trading signal generation and risk assessment.
 """
 
-from . import microprice, obi, tfi
+from . import obi, orderbook, tfi
+from .orderbook import OrderBook
 
-__all__ = ["microprice", "obi", "tfi"]
\ No newline at end of file
+__all__ = ["OrderBook", "obi", "orderbook", "tfi"]
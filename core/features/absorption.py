@@ -12,6 +12,7 @@ Implements (per project structure):
 - Absorption fraction, resilience, and pressure scores per side
 - TTD (time-to-depletion) proxy at best: q / max(removal_rate − replenish_rate, ε)
 - Queue-ahead estimator (simple): current best size (optionally + expected replenishment)
+- Per-side trade volume/count over window_s (deque windows, int side codes)
 
 I/O Contract:
 - Input: MarketSnapshot with L2 data and recent trades, event-time ordered
@@ -26,7 +27,8 @@ No external deps; NumPy optional. Uses `core.types` as SSOT.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Sequence, Tuple
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
 import math
 import time
 
@@ -37,6 +39,7 @@ except Exception:  # pragma: no cover
 
 # -------- Imports from core.types (SSOT) -----
 from core.types import Trade, Side, MarketSnapshot
+from core.features.orderbook import OrderBook
 
 # ------------------------------------------------------------------------------
 
@@ -68,22 +71,57 @@ class _State:
     ask_q1: float = 0.0
 
 
-def _sum_trades(trades: Sequence[Trade], side: Side, ts_from: float) -> float:
-    s = 0.0
-    for tr in trades:
-        if float(tr.timestamp) <= ts_from:
-            continue
-        if str(tr.side) == str(side) or str(tr.side) == side.value:
-            s += float(tr.size)
-    return s
+_BUY = 1
+_SELL = -1
+# str-Enum members hash like their values, so plain "BUY"/"SELL" hit too
+_SIDE_CODE = {Side.BUY: _BUY, Side.SELL: _SELL, "Side.BUY": _BUY, "Side.SELL": _SELL}
+
+
+def _side_code(side: object) -> int:
+    """Enum-int side code (+1 BUY, −1 SELL, 0 unknown) without string formatting."""
+    try:
+        return _SIDE_CODE.get(side, 0)  # type: ignore[arg-type]
+    except TypeError:
+        return 0
+
+
+class _SideWindow:
+    """Event-time window of one side's trades: running volume and count, O(1) eviction."""
+
+    __slots__ = ("h", "q", "vol", "n")
+
+    def __init__(self, horizon_s: float) -> None:
+        self.h = float(horizon_s)
+        self.q: Deque[Tuple[float, float]] = deque()
+        self.vol = 0.0
+        self.n = 0
+
+    def add(self, ts: float, size: float) -> None:
+        self.q.append((ts, size))
+        self.vol += size
+        self.n += 1
+
+    def evict(self, now_ts: float) -> None:
+        cutoff = now_ts - self.h
+        q = self.q
+        while q and q[0][0] < cutoff:
+            self.vol -= q.popleft()[1]
+            self.n -= 1
+        if not q:
+            self.vol = 0.0  # resync running sum
 
 
 class AbsorptionStream:
     """Streaming estimator of absorption/cancel/replenish dynamics at best quotes.
 
+    Trades enter once — via `ingest_trade` or the new tail of `snap.trades` —
+    into per-side event-time windows with running volume/count, and into the
+    volume pending for the next step, so an update is amortized O(1) no matter
+    how many trades the snapshot carries.
+
     Parameters
     ----------
-    window_s : float  (used only in tests for context; core logic is EMA-based)
+    window_s : float  horizon of the per-side trade volume/count aggregates
     ema_half_life_s : float  half-life for all EMAs
     """
 
@@ -98,14 +136,70 @@ class AbsorptionStream:
         self.cancel_rate_ask = _EMA(self.hl)
         self.replenish_rate_bid = _EMA(self.hl)
         self.replenish_rate_ask = _EMA(self.hl)
+        # per-side trade windows and volume not yet attributed by a step
+        self.win_buy = _SideWindow(self.window_s)
+        self.win_sell = _SideWindow(self.window_s)
+        self._pend_buy = 0.0
+        self._pend_sell = 0.0
+        self._last_trade_ts = -math.inf
+
+    def ingest_trade(self, tr: Trade) -> None:
+        """Feed one trade (event-time ordered); it is attributed at the next step."""
+        self._add_trade(float(tr.timestamp), float(tr.size), _side_code(tr.side))
+
+    def _add_trade(self, ts: float, size: float, code: int) -> None:
+        if code == _BUY:
+            self.win_buy.add(ts, size)
+            self._pend_buy += size
+        elif code == _SELL:
+            self.win_sell.add(ts, size)
+            self._pend_sell += size
+        if ts > self._last_trade_ts:
+            self._last_trade_ts = ts
+
+    def _ingest_tail(self, trades: Sequence[Trade]) -> None:
+        """Ingest only trades newer than anything seen (scans back from the end)."""
+        wm = self._last_trade_ts
+        if self.st.last_ts is not None and float(self.st.last_ts) > wm:
+            wm = float(self.st.last_ts)
+        i = len(trades)
+        while i > 0 and float(trades[i - 1].timestamp) > wm:
+            i -= 1
+        for j in range(i, len(trades)):
+            tr = trades[j]
+            self._add_trade(float(tr.timestamp), float(tr.size), _side_code(tr.side))
 
     def update(self, snap: MarketSnapshot) -> Dict[str, float]:
-        ts = float(snap.timestamp)
+        self._ingest_tail(snap.trades)
+        return self._step(
+            float(snap.timestamp),
+            float(snap.bid_price),
+            float(snap.ask_price),
+            float(snap.bid_volumes_l[0]) if snap.bid_volumes_l else 0.0,
+            float(snap.ask_volumes_l[0]) if snap.ask_volumes_l else 0.0,
+        )
+
+    def update_book(self, book: "OrderBook", ts: float, trades: Sequence[Trade] = ()) -> Dict[str, float]:
+        """Step from an incrementally maintained `OrderBook` (best quotes read in O(1))."""
+        self._ingest_tail(trades)
+        return self._step(float(ts), book.best_bid, book.best_ask, book.bid_qty, book.ask_qty)
+
+    def _step(
+        self,
+        ts: float,
+        p_b1: float,
+        p_a1: float,
+        q_b1: float,
+        q_a1: float,
+    ) -> Dict[str, float]:
+        self.win_buy.evict(ts)
+        self.win_sell.evict(ts)
+        # trades since the previous step
+        sell_mo, buy_mo = self._pend_sell, self._pend_buy
+        self._pend_sell = self._pend_buy = 0.0
         # initialize
         if self.st.last_ts is None:
-            self.st = _State(ts, snap.bid_price, snap.ask_price,
-                             float(snap.bid_volumes_l[0]) if snap.bid_volumes_l else 0.0,
-                             float(snap.ask_volumes_l[0]) if snap.ask_volumes_l else 0.0)
+            self.st = _State(ts, p_b1, p_a1, q_b1, q_a1)
             return self._features()
         dt = max(1e-6, ts - float(self.st.last_ts))
         # unpack prev
@@ -114,14 +208,6 @@ class AbsorptionStream:
         p_a0 = float(self.st.ask_p)
         q_b0 = float(self.st.bid_q1)
         q_a0 = float(self.st.ask_q1)
-        p_b1 = float(snap.bid_price)
-        p_a1 = float(snap.ask_price)
-        q_b1 = float(snap.bid_volumes_l[0]) if snap.bid_volumes_l else 0.0
-        q_a1 = float(snap.ask_volumes_l[0]) if snap.ask_volumes_l else 0.0
-
-        # trades after prev ts
-        sell_mo = _sum_trades(snap.trades, Side.SELL, float(self.st.last_ts))
-        buy_mo = _sum_trades(snap.trades, Side.BUY, float(self.st.last_ts))
 
         # --- BID side ---
         cancel_bid = 0.0
@@ -215,6 +301,11 @@ class AbsorptionStream:
             # TTD proxies
             "ttd_bid_s": ttd_bid,
             "ttd_ask_s": ttd_ask,
+            # trade aggregates over window_s
+            "window_buy_vol": self.win_buy.vol,
+            "window_sell_vol": self.win_sell.vol,
+            "window_buy_n": float(self.win_buy.n),
+            "window_sell_n": float(self.win_sell.n),
         }
 
     # ---------------------- Utility estimators ----------------------
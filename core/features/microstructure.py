@@ -16,9 +16,12 @@ Features are designed for low-latency processing with minimal allocations.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
 import math
 
+if TYPE_CHECKING:  # pragma: no cover
+    from core.features.orderbook import OrderBook
+
 try:  # pragma: no cover
     from core.types import MarketSnapshot, Trade, Side, OrderType, ExecMode
 except Exception:  # pragma: no cover - fallback for standalone testing
@@ -150,6 +153,62 @@ class MicrostructureEngine:
 
         return features
 
+    def compute_book_features(
+        self,
+        book: "OrderBook",
+        timestamp: float,
+        recent_trades: Optional[Sequence[Trade]] = None,
+    ) -> MicrostructureFeatures:
+        """Same features as `compute_features`, read from an incremental `OrderBook`.
+
+        Depth, OBI and micro-price come from the book's running cumulative depth
+        in O(1); absorption walks real ask prices (binary search) instead of the
+        snapshot path's spread-step approximation.
+        """
+        features = MicrostructureFeatures(timestamp=timestamp)
+
+        bid_total, ask_total = book.total_depth()
+        features.quoted_spread = book.spread
+        features.market_depth = bid_total + ask_total
+        features.liquidity_ratio = bid_total / ask_total if ask_total > 0 else 1.0
+
+        features.obi_depth_5 = book.obi(5)
+        features.obi_depth_10 = book.obi(10)
+        if book.weight_depth == self.max_depth:
+            features.obi_weighted = book.weighted_obi()
+        else:
+            features.obi_weighted = self._weighted_obi_from_book(book)
+
+        features.micro_price = book.microprice(features.micro_price_depth)
+
+        if recent_trades:
+            features.volume_imbalance, features.volume_ratio = self._compute_volume_profile(recent_trades)
+
+        # volume resting strictly below mid·(1+1%) on the ask side
+        target_price = book.mid * 1.01
+        absorption_vol = book.depth_to_price("ask", target_price, inclusive=False)
+        features.absorption_ratio = absorption_vol / ask_total if ask_total > 0 else 0.0
+        features.absorption_depth = ask_total
+
+        order_size = 1.0
+        if features.market_depth == 0:
+            features.ttf_estimate, features.queue_position = float('inf'), 1.0
+        else:
+            features.ttf_estimate = order_size / (features.market_depth / 10.0)
+            features.queue_position = min(1.0, order_size / features.market_depth)
+
+        if recent_trades:
+            self._update_trade_history(recent_trades)
+            features.realized_spread = self._compute_realized_spread(book.mid)
+
+        return features
+
+    def _weighted_obi_from_book(self, book: "OrderBook") -> float:
+        bid_weighted = sum(vol / (1 + i) for i, vol in enumerate(book.volumes("bid", self.max_depth)))
+        ask_weighted = sum(vol / (1 + i) for i, vol in enumerate(book.volumes("ask", self.max_depth)))
+        total_weighted = bid_weighted + ask_weighted
+        return (bid_weighted - ask_weighted) / total_weighted if total_weighted > 0 else 0.0
+
     def _compute_obi(self, snapshot: MarketSnapshot, depth: int) -> float:
         """Compute order book imbalance with specified depth."""
         bid_vol = sum(snapshot.bid_volumes_l[:depth])
@@ -34,6 +34,7 @@ except Exception:  # pragma: no cover
 
 # -------- Import from core types -------
 from core.types import MarketSnapshot
+from core.features.orderbook import OrderBook
 
 # =============================
 # Pure feature functions
@@ -106,6 +107,23 @@ class OBIStream:
         }
         return feats
 
+    def update_book(self, book: "OrderBook") -> Dict[str, float]:
+        """Same features from an incrementally maintained `OrderBook` (O(1), no list scans)."""
+        k = self.levels
+        b, a = book.depth_sums(k)
+        den = b + a
+        feats = {
+            "mid": book.mid,
+            "spread": book.spread,
+            "spread_bps": book.spread_bps(),
+            "depth_bid_lk": b,
+            "depth_ask_lk": a,
+            "depth_ratio": 0.0 if den == 0.0 else b / den,
+            "obi_l1": book.obi(1),
+            "obi_lk": 0.0 if den == 0.0 else (b - a) / den,
+        }
+        return feats
+
 
 # =============================
 # Self-tests
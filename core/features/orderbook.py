@@ -0,0 +1,292 @@
+"""
+Aurora+ScalpBot — core/features/orderbook.py
+--------------------------------------------
+Incremental L2 order book on preallocated NumPy arrays.
+
+Each side keeps `max_levels` slots of (key, qty, cum) sorted best-first, where
+key = price for asks and −price for bids, so both sides share one ascending
+layout and `np.searchsorted` finds a level in O(log n). Applying an absolute
+depth delta (price, qty) is:
+- qty change at an existing level: O(1) write + cumulative-depth tail refresh
+  from that level only (vectorized, drift-free)
+- insert/delete: vectorized slice shift + tail refresh from the changed level
+- weighted depth for weighted OBI: updated by delta for qty changes,
+  recomputed over `weight_depth` levels on structural changes
+
+Queries are O(1): best prices and sizes, mid, spread, depth over the first k
+levels (cum[k−1]), OBI@k, weighted OBI, micro-price@k. Queue-ahead and
+depth-to-price are O(log n).
+
+Books deeper than `max_levels` keep the best levels; levels pushed out are
+forgotten until the next snapshot (standard truncated-book behaviour).
+
+I/O Contract:
+- Input: full snapshots (`apply_snapshot`) and absolute level updates
+  (`apply_delta` / `apply_deltas`, qty == 0 removes the level), event-time ordered
+- Output: float metrics; NaN best prices on an empty side
+- Invariants: OBI ∈ [-1, 1], depth ≥ 0, levels strictly sorted best-first
+"""
+from __future__ import annotations
+
+from typing import Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+BID = "bid"
+ASK = "ask"
+
+
+class _BookSide:
+    """One side of the book: best-first arrays with running cumulative depth."""
+
+    __slots__ = ("sign", "cap", "key", "qty", "cum", "n", "w", "wd", "wsum")
+
+    def __init__(self, sign: float, cap: int, weight_depth: int) -> None:
+        self.sign = float(sign)
+        self.cap = int(cap)
+        self.key = np.empty(self.cap, dtype=np.float64)
+        self.qty = np.zeros(self.cap, dtype=np.float64)
+        self.cum = np.zeros(self.cap, dtype=np.float64)
+        self.n = 0
+        self.wd = max(1, min(int(weight_depth), self.cap))
+        # inverse distance from top, as in MicrostructureEngine weighted OBI
+        self.w = 1.0 / (1.0 + np.arange(self.wd, dtype=np.float64))
+        self.wsum = 0.0
+
+    def clear(self) -> None:
+        self.n = 0
+        self.wsum = 0.0
+
+    def _refresh(self, i: int) -> None:
+        n = self.n
+        if i < n:
+            seg = self.cum[i:n]
+            np.cumsum(self.qty[i:n], out=seg)
+            if i:
+                seg += self.cum[i - 1]
+
+    def _reweigh(self) -> None:
+        m = min(self.n, self.wd)
+        self.wsum = float(np.dot(self.qty[:m], self.w[:m])) if m else 0.0
+
+    def load(self, prices: np.ndarray, qtys: np.ndarray) -> None:
+        keep = qtys > 0
+        k = self.sign * prices[keep]
+        q = qtys[keep]
+        order = np.argsort(k, kind="stable")[: self.cap]
+        n = len(order)
+        self.key[:n] = k[order]
+        self.qty[:n] = q[order]
+        self.n = n
+        self._refresh(0)
+        self._reweigh()
+
+    def apply(self, price: float, q: float) -> None:
+        k = self.sign * price
+        n = self.n
+        key, qty = self.key, self.qty
+        i = int(np.searchsorted(key[:n], k)) if n else 0
+        if i < n and key[i] == k:
+            if q <= 0.0:
+                # delete level i
+                key[i:n - 1] = key[i + 1:n]
+                qty[i:n - 1] = qty[i + 1:n]
+                self.n = n - 1
+                self._refresh(i)
+                if i < self.wd:
+                    self._reweigh()
+                return
+            dq = q - qty[i]
+            if dq == 0.0:
+                return
+            qty[i] = q
+            self._refresh(i)
+            if i < self.wd:
+                self.wsum += dq * self.w[i]
+            return
+        if q <= 0.0 or i >= self.cap:
+            # removing an unknown level, or a level beyond the tracked depth
+            return
+        m = n if n < self.cap else n - 1  # worst level drops off a full book
+        key[i + 1:m + 1] = key[i:m]
+        qty[i + 1:m + 1] = qty[i:m]
+        key[i] = k
+        qty[i] = q
+        self.n = m + 1
+        self._refresh(i)
+        if i < self.wd:
+            self._reweigh()
+
+    # --- queries ---
+
+    def best(self) -> float:
+        return self.sign * float(self.key[0]) if self.n else float("nan")
+
+    def top_qty(self) -> float:
+        return float(self.qty[0]) if self.n else 0.0
+
+    def depth(self, k: int) -> float:
+        m = min(int(k), self.n)
+        return float(self.cum[m - 1]) if m > 0 else 0.0
+
+    def index_of(self, price: float) -> Tuple[int, bool]:
+        """(position, exact) of a price: levels[:position] are strictly better."""
+        k = self.sign * price
+        i = int(np.searchsorted(self.key[: self.n], k))
+        return i, (i < self.n and self.key[i] == k)
+
+
+class OrderBook:
+    """Incremental L2 book with O(1) OBI / micro-price / spread queries.
+
+    Parameters
+    ----------
+    max_levels   : preallocated levels per side
+    weight_depth : levels used by weighted OBI (weights 1/(1+i))
+    """
+
+    def __init__(self, symbol: str = "", *, max_levels: int = 1000, weight_depth: int = 20) -> None:
+        self.symbol = symbol
+        self.max_levels = int(max_levels)
+        self.weight_depth = int(weight_depth)
+        self.bids = _BookSide(-1.0, max_levels, weight_depth)
+        self.asks = _BookSide(+1.0, max_levels, weight_depth)
+        self.ts_ns: Optional[int] = None
+        self.updates = 0
+
+    def _side(self, side: str) -> _BookSide:
+        s = str(side).lower()
+        if s in ("bid", "buy", "b", "side.buy"):
+            return self.bids
+        if s in ("ask", "sell", "a", "s", "side.sell"):
+            return self.asks
+        raise ValueError(f"unknown book side: {side!r}")
+
+    # -------------------- updates --------------------
+
+    def apply_snapshot(
+        self,
+        bids: Iterable[Tuple[float, float]],
+        asks: Iterable[Tuple[float, float]],
+        ts_ns: Optional[int] = None,
+    ) -> None:
+        """Replace the book with full depth [(price, qty), ...] per side."""
+        for side, levels in ((self.bids, bids), (self.asks, asks)):
+            arr = np.asarray(list(levels), dtype=np.float64).reshape(-1, 2)
+            side.load(arr[:, 0], arr[:, 1])
+        self.ts_ns = ts_ns
+        self.updates += 1
+
+    def apply_delta(self, side: str, price: float, qty: float, ts_ns: Optional[int] = None) -> None:
+        """Set the absolute size at one price level (qty <= 0 removes it)."""
+        self._side(side).apply(float(price), float(qty))
+        if ts_ns is not None:
+            self.ts_ns = ts_ns
+        self.updates += 1
+
+    def apply_deltas(
+        self,
+        bids: Iterable[Tuple[float, float]] = (),
+        asks: Iterable[Tuple[float, float]] = (),
+        ts_ns: Optional[int] = None,
+    ) -> None:
+        """Apply a depth-diff message (e.g. Binance depthUpdate b/a arrays)."""
+        for p, q in bids:
+            self.bids.apply(float(p), float(q))
+        for p, q in asks:
+            self.asks.apply(float(p), float(q))
+        if ts_ns is not None:
+            self.ts_ns = ts_ns
+        self.updates += 1
+
+    # -------------------- O(1) queries --------------------
+
+    @property
+    def best_bid(self) -> float:
+        return self.bids.best()
+
+    @property
+    def best_ask(self) -> float:
+        return self.asks.best()
+
+    @property
+    def bid_qty(self) -> float:
+        return self.bids.top_qty()
+
+    @property
+    def ask_qty(self) -> float:
+        return self.asks.top_qty()
+
+    @property
+    def mid(self) -> float:
+        return 0.5 * (self.best_bid + self.best_ask)
+
+    @property
+    def spread(self) -> float:
+        return self.best_ask - self.best_bid
+
+    def spread_bps(self) -> float:
+        mid = self.mid
+        return 0.0 if not mid > 0 else 1e4 * self.spread / mid
+
+    def depth_sums(self, levels: int = 5) -> Tuple[float, float]:
+        """(bid, ask) depth over the first k levels."""
+        k = max(1, int(levels))
+        return self.bids.depth(k), self.asks.depth(k)
+
+    def total_depth(self) -> Tuple[float, float]:
+        return self.bids.depth(self.bids.n), self.asks.depth(self.asks.n)
+
+    def obi(self, levels: int = 1) -> float:
+        """(Σq_b − Σq_a) / (Σq_b + Σq_a) over the first k levels."""
+        b, a = self.depth_sums(levels)
+        den = b + a
+        return 0.0 if den == 0.0 else (b - a) / den
+
+    def weighted_obi(self) -> float:
+        b, a = self.bids.wsum, self.asks.wsum
+        den = b + a
+        return 0.0 if den <= 0.0 else (b - a) / den
+
+    def microprice(self, levels: int = 1) -> float:
+        """Inventory-weighted mid: (bid·A_k + ask·B_k) / (A_k + B_k); mid if both empty."""
+        b, a = self.depth_sums(levels)
+        den = b + a
+        if den == 0.0:
+            return self.mid
+        return (self.best_bid * a + self.best_ask * b) / den
+
+    # -------------------- O(log n) queries --------------------
+
+    def queue_ahead(self, side: str, price: float, *, include_better: bool = False) -> float:
+        """Resting size ahead of a new order joining `price` on `side`.
+
+        Default: size already queued at that price (FIFO). include_better adds
+        all strictly better levels, i.e. volume that trades before it can fill.
+        """
+        s = self._side(side)
+        i, exact = s.index_of(float(price))
+        at = float(s.qty[i]) if exact else 0.0
+        if not include_better:
+            return at
+        return (float(s.cum[i - 1]) if i else 0.0) + at
+
+    def depth_to_price(self, side: str, price: float, *, inclusive: bool = True) -> float:
+        """Cumulative size at levels priced better than (or at, if inclusive) `price`."""
+        s = self._side(side)
+        i, exact = s.index_of(float(price))
+        j = i + 1 if (exact and inclusive) else i
+        return float(s.cum[j - 1]) if j else 0.0
+
+    def levels(self, side: str, k: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Copies of (prices, qtys) for the first k levels, best first."""
+        s = self._side(side)
+        m = s.n if k is None else min(int(k), s.n)
+        return s.sign * s.key[:m], s.qty[:m].copy()
+
+    def volumes(self, side: str, k: Optional[int] = None) -> Sequence[float]:
+        """Level sizes as a list (the `bid_volumes_l`/`ask_volumes_l` shape of MarketSnapshot)."""
+        return self.levels(side, k)[1].tolist()
+
+
+__all__ = ["ASK", "BID", "OrderBook"]
@@ -97,6 +97,13 @@ def vpin_volume_buckets(trades: Sequence[Trade], bucket_volume: float, max_bucke
 class TFIStream:
     """Streaming TFI/VPIN extractor on event-time window.
 
+    All state is maintained as trades arrive, so `features()` is O(#windows)
+    regardless of trade rate:
+    - rolling windows share one trade log; each `_Rolling` keeps its own head
+      pointer and running buy/sell sums
+    - VPIN buckets fill incrementally (partial current bucket) and completed
+      bucket imbalances sit in a ring with a running sum
+
     Parameters
     ----------
     window_s : float
@@ -105,27 +112,88 @@ class TFIStream:
         Volume per VPIN bucket (same units as trade size). If <=0, VPIN buckets
         are disabled and only VPIN-like ratio is returned.
     max_trades : int
-        Hard cap on trades retained for VPIN-bucket computation.
+        Completed buckets that started more than `max_trades` trades ago are
+        dropped from the VPIN average (as are buckets older than 10×window_s).
+    windows : extra event-time horizons (seconds); each adds `tfi_<w>s` and
+        `vpin_like_<w>s` features
+    max_buckets : completed buckets averaged by `vpin_bucketed`
     """
-    def __init__(self, window_s: float = 5.0, bucket_volume: float = 100.0, max_trades: int = 5000) -> None:
-        self.win = _Rolling(window_s)
+    def __init__(
+        self,
+        window_s: float = 5.0,
+        bucket_volume: float = 100.0,
+        max_trades: int = 5000,
+        windows: Sequence[float] = (),
+        max_buckets: int = 50,
+    ) -> None:
+        self._log = _TradeLog()
+        self.win = _Rolling(window_s, log=self._log)
+        self.extra: Dict[str, _Rolling] = {
+            f"{float(w):g}s": _Rolling(w, log=self._log) for w in windows if float(w) != float(window_s)
+        }
+        self._all = [self.win, *self.extra.values()]
         self.bucket_volume = float(bucket_volume)
         self.max_trades = int(max_trades)
-        self._trades: Deque[Trade] = deque()
+        self.max_buckets = max(1, int(max_buckets))
+        self._n = 0  # trades ingested
+        # partial bucket
+        self._b = 0.0
+        self._s = 0.0
+        self._start_seq = 0
+        self._start_ts = 0.0
+        # completed buckets: (start trade seq, start ts, imbalance)
+        self._buckets: Deque[Tuple[int, float, float]] = deque()
+        self._imb_sum = 0.0
 
     def ingest_trade(self, tr: Trade) -> None:
         ts = float(tr.timestamp)
-        buy = float(tr.size) if str(tr.side) == "Side.BUY" or str(tr.side) == "BUY" else 0.0
-        sell = float(tr.size) if str(tr.side) == "Side.SELL" or str(tr.side) == "SELL" else 0.0
-        self.win.add(ts, buy=buy, sell=sell)
-        # store for VPIN-bucket (cap by count and evict by time horizon generously)
-        self._trades.append(tr)
-        while len(self._trades) > self.max_trades:
-            self._trades.popleft()
-        # also time-based cleanup to keep fresh
-        cutoff = ts - 10.0 * self.win.h  # keep at most 10×window for bucket VPIN context
-        while self._trades and float(self._trades[0].timestamp) < cutoff:
-            self._trades.popleft()
+        size = float(tr.size)
+        is_buy = str(tr.side) == "Side.BUY" or str(tr.side) == "BUY"
+        is_sell = str(tr.side) == "Side.SELL" or str(tr.side) == "SELL"
+        self._log.append(ts, size if is_buy else 0.0, size if is_sell else 0.0)
+        for w in self._all:
+            w._evict(ts)
+        self._log.trim(min(w.head for w in self._all))
+        if self.bucket_volume > 0.0:
+            self._bucket(ts, size, is_buy)
+        self._n += 1
+
+    def _bucket(self, ts: float, vol: float, is_buy: bool) -> None:
+        V = max(1e-9, self.bucket_volume)
+        if self._b + self._s <= 0.0:
+            self._start_seq, self._start_ts = self._n, ts
+        remain = V - (self._b + self._s)
+        while vol > 0.0:
+            take = min(remain, vol)
+            if is_buy:
+                self._b += take
+            else:
+                self._s += take
+            vol -= take
+            remain -= take
+            if remain <= 1e-12:
+                imb = min(1.0, abs(self._b - self._s) / V)
+                self._buckets.append((self._start_seq, self._start_ts, imb))
+                self._imb_sum += imb
+                if len(self._buckets) > self.max_buckets:
+                    self._imb_sum -= self._buckets.popleft()[2]
+                self._b = self._s = 0.0
+                remain = V
+                # a trade spilling into the next bucket starts it
+                self._start_seq, self._start_ts = self._n, ts
+        # bucket horizon: last max_trades trades and 10×window of event time
+        min_seq = self._n + 1 - self.max_trades
+        cutoff = ts - 10.0 * self.win.h
+        bq = self._buckets
+        while bq and (bq[0][0] < min_seq or bq[0][1] < cutoff):
+            self._imb_sum -= bq.popleft()[2]
+        if not bq:
+            self._imb_sum = 0.0  # resync running sum
+
+    def vpin_bucketed(self) -> float:
+        """Mean imbalance over retained completed buckets (partial bucket ignored)."""
+        n = len(self._buckets)
+        return 0.0 if n == 0 else max(0.0, self._imb_sum) / n
 
     def features(self, now_ts: Optional[float] = None) -> Dict[str, float]:
         if now_ts is None:
@@ -138,10 +206,11 @@ class TFIStream:
             "tfi": tfi,
             "vpin_like": vpin_like(b, s),
         }
-        if self.bucket_volume > 0.0 and self._trades:
-            feats["vpin_bucketed"] = vpin_volume_buckets(list(self._trades), self.bucket_volume, max_buckets=50)
-        else:
-            feats["vpin_bucketed"] = 0.0
+        for name, w in self.extra.items():
+            wb, ws = w.sums(now_ts)
+            feats[f"tfi_{name}"] = wb - ws
+            feats[f"vpin_like_{name}"] = vpin_like(wb, ws)
+        feats["vpin_bucketed"] = self.vpin_bucketed() if self.bucket_volume > 0.0 else 0.0
         return feats
 
 
@@ -152,26 +221,65 @@ class _WinTrade:
     sell: float
 
 
+class _TradeLog:
+    """Append-only trade log addressed by absolute sequence number; shared by windows."""
+    def __init__(self) -> None:
+        self.q: Deque[_WinTrade] = deque()
+        self.base = 0  # sequence number of q[0]
+
+    @property
+    def end(self) -> int:
+        return self.base + len(self.q)
+
+    def append(self, ts: float, buy: float, sell: float) -> None:
+        self.q.append(_WinTrade(ts=ts, buy=buy, sell=sell))
+
+    def at(self, seq: int) -> _WinTrade:
+        return self.q[seq - self.base]
+
+    def trim(self, upto: int) -> None:
+        """Drop entries no window still needs (seq < upto)."""
+        while self.base < upto and self.q:
+            self.q.popleft()
+            self.base += 1
+
+
 class _Rolling:
-    """Rolling event-time window for buy/sell volumes with O(1) evictions."""
-    def __init__(self, horizon_s: float) -> None:
+    """Rolling event-time window for buy/sell volumes with O(1) evictions.
+
+    Reads [head, log.end) of a `_TradeLog`; pass `log=` to share one log
+    between several horizons (the owner trims it), otherwise the window owns it.
+    """
+    def __init__(self, horizon_s: float, log: Optional[_TradeLog] = None) -> None:
         self.h = float(horizon_s)
-        self.q: Deque[_WinTrade] = deque()
+        self._own = log is None
+        self.log = _TradeLog() if log is None else log
+        self.head = self.log.end
+        self._tail = self.head  # next log entry to absorb into sums
         self.bsum = 0.0
         self.ssum = 0.0
 
     def add(self, ts: float, buy: float, sell: float) -> None:
-        self.q.append(_WinTrade(ts=ts, buy=buy, sell=sell))
-        self.bsum += buy
-        self.ssum += sell
+        self.log.append(ts, buy, sell)
         self._evict(ts)
 
     def _evict(self, now_ts: float) -> None:
+        log = self.log
+        while self._tail < log.end:
+            t = log.at(self._tail)
+            self.bsum += t.buy
+            self.ssum += t.sell
+            self._tail += 1
         cutoff = float(now_ts) - self.h
-        while self.q and self.q[0].ts < cutoff:
-            t = self.q.popleft()
+        while self.head < self._tail and log.at(self.head).ts < cutoff:
+            t = log.at(self.head)
             self.bsum -= t.buy
             self.ssum -= t.sell
+            self.head += 1
+        if self.head == self._tail:
+            self.bsum = self.ssum = 0.0  # resync running sums on empty window
+        if self._own:
+            log.trim(self.head)
 
     def sums(self, now_ts: float) -> Tuple[float, float]:
         self._evict(now_ts)
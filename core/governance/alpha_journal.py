@@ -0,0 +1,231 @@
+"""
+Alpha Journal — write-ahead log + compacted snapshots for `AlphaLedger`
+======================================================================
+
+Every ledger mutation is appended as one JSON line before it is applied in
+memory, so a save costs O(record) instead of re-serializing the whole ledger.
+Every `snapshot_every` records the full state is written as a snapshot and
+the journal is truncated, which bounds recovery to one snapshot load plus at
+most `snapshot_every` replayed records. With `retain_closed` set (opt-in),
+the ledger moves closed transactions beyond the newest `retain_closed` to the
+archive before each snapshot and keeps only their per-test/outcome totals, so
+the snapshot stays bounded by open + `retain_closed` transactions + one
+aggregate per test.
+
+Layout under `root`:
+- `snapshot.json` — {"kind", "version", "seq", "state"}; written to a tmp file,
+  fsynced and renamed, so readers see either the old or the new snapshot
+- `journal.jsonl` — records with seq > snapshot seq, one per line:
+    {"seq", "op": "open",  "token", "test_id", "alpha0", "ts_ns"}
+    {"seq", "op": "spend", "token", "amount", "spent", "ts_ns"}
+    {"seq", "op": "close", "token", "outcome", "ts_ns"}
+- `archive.jsonl` — closed transactions compacted out of the snapshot, one
+  `AlphaTxn` dict per line, oldest close first; append-only and never read
+  back on recovery. A crash between archive append and snapshot rename can
+  archive a transaction twice (dedupe by token)
+
+Crash safety:
+- a torn last line (crash mid-append) was never acknowledged; `load()` drops it
+  and truncates the file back to the last complete record
+- a crash between snapshot rename and journal truncation leaves records already
+  covered by the snapshot; they are skipped by seq on replay
+- a damaged record before the tail raises ValueError instead of guessing
+
+The journal is not locked on its own; `AlphaLedger` calls it under its lock.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+SNAPSHOT_KIND = "alpha_ledger"
+SNAPSHOT_VERSION = 1
+
+
+class AlphaJournal:
+    """Append-only journal with periodic snapshots for one `AlphaLedger`."""
+
+    SNAPSHOT = "snapshot.json"
+    JOURNAL = "journal.jsonl"
+    ARCHIVE = "archive.jsonl"
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        *,
+        snapshot_every: int = 1000,
+        fsync: bool = True,
+        retain_closed: Optional[int] = None,
+    ) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.snapshot_every = max(0, int(snapshot_every))  # 0 = only explicit snapshots
+        # closed transactions kept in snapshots (None = keep all, never archive)
+        self.retain_closed = None if retain_closed is None else max(0, int(retain_closed))
+        self.fsync = bool(fsync)
+        self.seq = 0       # seq of the last durable record
+        self.pending = 0   # records in the journal not covered by the snapshot
+        self._fh: Optional[Any] = None
+        self._size = 0
+
+    @property
+    def snapshot_path(self) -> Path:
+        return self.root / self.SNAPSHOT
+
+    @property
+    def journal_path(self) -> Path:
+        return self.root / self.JOURNAL
+
+    @property
+    def archive_path(self) -> Path:
+        return self.root / self.ARCHIVE
+
+    # --- recovery ---
+
+    def load(self) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Return (snapshot state or None, journal records after it) and repair a torn tail."""
+        self._close_fh()
+        state: Optional[Dict[str, Any]] = None
+        base = 0
+        if self.snapshot_path.exists():
+            d = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+            if d.get("kind") != SNAPSHOT_KIND:
+                raise ValueError(f"not an alpha ledger snapshot: kind={d.get('kind')!r}")
+            if int(d.get("version", 0)) > SNAPSHOT_VERSION:
+                raise ValueError(f"unsupported snapshot version {d.get('version')}")
+            base = int(d["seq"])
+            state = d["state"]
+
+        records: List[Dict[str, Any]] = []
+        last = base
+        if self.journal_path.exists():
+            data = self.journal_path.read_bytes()
+            good = 0
+            for line in data.splitlines(keepends=True):
+                end = good + len(line)
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("torn record")
+                    rec = json.loads(line) if line.strip() else None
+                except ValueError:
+                    if end < len(data):
+                        raise ValueError(f"corrupt alpha journal record at byte {good}") from None
+                    break
+                good = end
+                if rec is None:
+                    continue
+                seq = int(rec["seq"])
+                if seq <= last:
+                    if seq > base:
+                        raise ValueError(f"alpha journal seq {seq} is not increasing")
+                    continue  # already in the snapshot
+                records.append(rec)
+                last = seq
+            if good < len(data):
+                with self.journal_path.open("r+b") as fh:
+                    fh.truncate(good)
+                    self._sync(fh)
+        self.seq = last
+        self.pending = len(records)
+        return state, records
+
+    # --- write path ---
+
+    def append(self, rec: Dict[str, Any]) -> int:
+        """Durably append one record (seq assigned here) and return its seq."""
+        seq = self.seq + 1
+        data = json.dumps({"seq": seq, **rec}, separators=(",", ":")).encode("utf-8") + b"\n"
+        fh = self._open()
+        try:
+            fh.write(data)
+            fh.flush()
+            self._sync(fh)
+        except Exception:
+            # Roll back a partial write so the next record does not follow torn bytes
+            try:
+                fh.truncate(self._size)
+            except Exception:
+                pass
+            raise
+        self._size += len(data)
+        self.seq = seq
+        self.pending += 1
+        return seq
+
+    def due(self) -> bool:
+        return self.snapshot_every > 0 and self.pending >= self.snapshot_every
+
+    def snapshot(self, state: Dict[str, Any]) -> None:
+        """Write `state` (as of `seq`) atomically, then truncate the journal."""
+        body = {"kind": SNAPSHOT_KIND, "version": SNAPSHOT_VERSION, "seq": self.seq, "state": state}
+        tmp = self.snapshot_path.with_name(self.SNAPSHOT + ".tmp")
+        with tmp.open("wb") as fh:
+            fh.write(json.dumps(body, separators=(",", ":")).encode("utf-8"))
+            fh.flush()
+            self._sync(fh)
+        os.replace(tmp, self.snapshot_path)
+        self._sync_dir()
+        fh = self._open()
+        fh.truncate(0)
+        self._sync(fh)
+        self._size = 0
+        self.pending = 0
+
+    def archive(self, txns: List[Dict[str, Any]]) -> None:
+        """Durably append closed transactions that the next snapshot will drop."""
+        if not txns:
+            return
+        data = b"".join(json.dumps(t, separators=(",", ":")).encode("utf-8") + b"\n" for t in txns)
+        with self.archive_path.open("a+b") as fh:
+            end = fh.seek(0, os.SEEK_END)
+            if end:
+                fh.seek(end - 1)
+                if fh.read(1) != b"\n":
+                    data = b"\n" + data  # isolate a torn line left by a crash
+            fh.write(data)
+            fh.flush()
+            self._sync(fh)
+
+    def close(self) -> None:
+        self._close_fh()
+
+    # --- helpers ---
+
+    def _open(self) -> Any:
+        if self._fh is None:
+            self._fh = self.journal_path.open("ab")
+            self._size = self._fh.tell()
+        return self._fh
+
+    def _close_fh(self) -> None:
+        fh, self._fh = self._fh, None
+        if fh is not None:
+            try:
+                fh.close()
+            except Exception:
+                pass
+
+    def _sync(self, fh: Any) -> None:
+        if self.fsync:
+            os.fsync(fh.fileno())
+
+    def _sync_dir(self) -> None:
+        # Make the rename durable; not supported on every platform
+        if not self.fsync:
+            return
+        try:
+            fd = os.open(self.root, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+__all__ = ["AlphaJournal", "SNAPSHOT_KIND", "SNAPSHOT_VERSION"]
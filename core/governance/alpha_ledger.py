@@ -13,6 +13,7 @@ Key features:
 - Per-test α allocation with strict spending limits (spent ≤ alpha0)
 - Monotonic spending constraint enforcement
 - JSON-serializable state for persistence
+- Optional write-ahead journal with compacted snapshots (see alpha_journal.py)
 - Thread-safe operations for concurrent test execution
 - Audit trail with timestamps for regulatory compliance
 
@@ -22,15 +23,20 @@ Example usage:
     ledger.spend(token, 0.001)  # spend 0.1% of α budget  
     ledger.spend(token, 0.002)  # total spent: 0.003
     ledger.close(token, "accept")  # finalize test
+
+Durable usage (state is recovered from the journal directory on construction):
+    ledger = AlphaLedger(journal=AlphaJournal("state/alpha", snapshot_every=1000))
 """
 
 import json
 import threading
 import time
 from dataclasses import dataclass, asdict, field
-from typing import Dict, List, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable
 from uuid import uuid4
 
+from core.governance.alpha_journal import AlphaJournal
+
 
 @dataclass
 class AlphaTxn:
@@ -55,14 +61,41 @@ class AlphaTxn:
 
 
 class AlphaLedger:
-    """Thread-safe α-cost accounting ledger for statistical tests."""
+    """Thread-safe α-cost accounting ledger for statistical tests.
+
+    With a `journal`, every open/spend/close is appended to it before being
+    applied, and the state found in the journal directory is recovered here.
+    Timestamps then default to wall-clock `time.time_ns` (persisted values must
+    survive a reboot); without one, to `time.monotonic_ns`. If the journal sets
+    `retain_closed`, each snapshot first moves closed transactions beyond it
+    (oldest close first) to the journal archive. Their alloc/spent/count totals
+    per test and outcome stay in the state, so `summary()` still covers them;
+    `list_transactions()` returns only the retained records.
+    """
 
-    def __init__(self, clock_ns: Callable[[], int] = time.monotonic_ns, eps: float = 1e-12):
+    def __init__(
+        self,
+        clock_ns: Optional[Callable[[], int]] = None,
+        eps: float = 1e-12,
+        journal: Optional[AlphaJournal] = None,
+    ):
+        if clock_ns is None:
+            clock_ns = time.time_ns if journal is not None else time.monotonic_ns
         self._transactions: Dict[str, AlphaTxn] = {}  # token -> transaction
         self._test_index: Dict[str, str] = {}         # test_id -> active_token
+        self._by_test: Dict[str, List[str]] = {}      # test_id -> all tokens, in open order
+        self._archived: Dict[str, dict] = {}          # test_id -> totals of archived txns
         self._lock = threading.RLock()
         self._clock_ns = clock_ns
         self._eps = eps
+        self._journal = journal
+        if journal is not None:
+            state, records = journal.load()
+            if state is not None:
+                self._load_state(state)
+            for rec in records:
+                self._apply(rec)
+            self._maybe_snapshot()
 
     def open(self, test_id: str, alpha0: float) -> str:
         """
@@ -91,18 +124,13 @@ class AlphaLedger:
             
             # Create new transaction
             token = str(uuid4())
-            txn = AlphaTxn(
-                ts_ns=self._clock_ns(),
-                test_id=test_id,
-                alpha0=alpha0,
-                spent=0.0,
-                outcome="open",
-                token=token
-            )
-            
-            self._transactions[token] = txn
-            self._test_index[test_id] = token
-            
+            self._commit({
+                "op": "open",
+                "token": token,
+                "test_id": test_id,
+                "alpha0": alpha0,
+                "ts_ns": self._clock_ns(),
+            })
             return token
 
     def spend(self, token: str, amount: float) -> None:
@@ -137,13 +165,13 @@ class AlphaLedger:
             if new_spent > txn.alpha0:
                 new_spent = txn.alpha0
             
-            # Update spent amount (monotonic increase)
-            txn.spent = new_spent
-            # Аудит-запис
-            txn.history.append({
-                "ts_ns": self._clock_ns(),
+            # Update spent amount (monotonic increase) + audit record
+            self._commit({
+                "op": "spend",
+                "token": token,
                 "amount": amount,
-                "spent": txn.spent,
+                "spent": new_spent,
+                "ts_ns": self._clock_ns(),
             })
 
     def close(self, token: str, outcome: str) -> None:
@@ -171,13 +199,93 @@ class AlphaLedger:
                 raise ValueError(f"allocation already closed with outcome: {txn.outcome}")
             
             # Finalize transaction
-            txn.outcome = outcome
-            txn.closed_ts_ns = self._clock_ns()
-            
+            self._commit({"op": "close", "token": token, "outcome": outcome, "ts_ns": self._clock_ns()})
+
+    # ---- state transitions (shared by live calls and journal replay) ----
+    def _commit(self, rec: Dict[str, Any]) -> None:
+        # Caller holds _lock and has validated rec; journal first, then memory
+        if self._journal is not None:
+            self._journal.append(rec)
+        self._apply(rec)
+        self._maybe_snapshot()
+
+    def _apply(self, rec: Dict[str, Any]) -> None:
+        op = rec["op"]
+        token = rec["token"]
+        if op == "open":
+            test_id = rec["test_id"]
+            self._transactions[token] = AlphaTxn(
+                ts_ns=int(rec["ts_ns"]),
+                test_id=test_id,
+                alpha0=float(rec["alpha0"]),
+                spent=0.0,
+                outcome="open",
+                token=token,
+            )
+            self._test_index[test_id] = token
+            self._by_test.setdefault(test_id, []).append(token)
+            return
+        txn = self._transactions.get(token)
+        if txn is None:
+            raise ValueError(f"journal record for unknown token: {token}")
+        if op == "spend":
+            txn.spent = float(rec["spent"])
+            # Аудит-запис
+            txn.history.append({"ts_ns": int(rec["ts_ns"]), "amount": rec["amount"], "spent": txn.spent})
+        elif op == "close":
+            txn.outcome = rec["outcome"]
+            txn.closed_ts_ns = int(rec["ts_ns"])
             # Remove from active index if this was the active allocation
-            if (txn.test_id in self._test_index and 
-                self._test_index[txn.test_id] == token):
+            if self._test_index.get(txn.test_id) == token:
                 del self._test_index[txn.test_id]
+        else:
+            raise ValueError(f"unknown journal op: {op!r}")
+
+    def _maybe_snapshot(self) -> None:
+        j = self._journal
+        if j is not None and j.due():
+            try:
+                self._archive_closed()
+                j.snapshot(self._state())
+            except OSError:
+                # Records are already durable in the journal; retry on the next commit
+                pass
+
+    def snapshot(self) -> None:
+        """Compact the journal into a snapshot now (no-op without a journal)."""
+        with self._lock:
+            if self._journal is not None:
+                self._archive_closed()
+                self._journal.snapshot(self._state())
+
+    def _archive_closed(self) -> None:
+        # Caller holds _lock. Archive first, then forget: a failed append drops nothing
+        keep = self._journal.retain_closed if self._journal is not None else None
+        if keep is None:
+            return
+        closed = [t for t in self._transactions.values() if t.outcome != "open"]
+        if len(closed) <= keep:
+            return
+        closed.sort(key=lambda t: t.closed_ts_ns or 0)
+        drop = closed[: len(closed) - keep]
+        self._journal.archive([asdict(t) for t in drop])
+        for t in drop:
+            agg = self._archived.setdefault(t.test_id, {"by_outcome": {}, "last": None})
+            row = agg["by_outcome"].setdefault(t.outcome, {"count": 0, "total_spent": 0.0, "total_alloc": 0.0})
+            row["count"] += 1
+            row["total_spent"] += t.spent
+            row["total_alloc"] += t.alpha0
+            if agg["last"] is None or t.ts_ns > agg["last"]["ts_ns"]:
+                agg["last"] = {"alpha0": t.alpha0, "spent": t.spent, "outcome": t.outcome, "ts_ns": t.ts_ns}
+        gone = {t.token for t in drop}
+        for tid in {t.test_id for t in drop}:
+            left = [tok for tok in self._by_test.get(tid, ()) if tok not in gone]
+            if left:
+                self._by_test[tid] = left
+            else:
+                self._by_test.pop(tid, None)
+        for tok in gone:
+            del self._transactions[tok]
 
     def summary(self) -> dict:
         """
@@ -188,8 +296,9 @@ class AlphaLedger:
         """
         with self._lock:
             transactions = list(self._transactions.values())
+            archived = json.loads(json.dumps(self._archived))
         
-        if not transactions:
+        if not transactions and not archived:
             return {
                 "total_alloc": 0.0,
                 "total_spent": 0.0,
@@ -207,6 +316,13 @@ class AlphaLedger:
         
         # Group by test_id (latest transaction per test)
         by_test_id = {}
+        for test_id, agg in archived.items():
+            last = agg["last"]
+            by_test_id[test_id] = {
+                **last,
+                "utilization": last["spent"] / last["alpha0"] if last["alpha0"] > 0 else 0.0,
+                "remaining": max(0.0, last["alpha0"] - last["spent"]),
+            }
         for txn in transactions:
             test_id = txn.test_id
             if test_id not in by_test_id or txn.ts_ns > by_test_id[test_id]["ts_ns"]:
@@ -229,6 +345,17 @@ class AlphaLedger:
             by_outcome[outcome]["total_spent"] += txn.spent
             by_outcome[outcome]["total_alloc"] += txn.alpha0
         
+        # Archived (closed) transactions only survive as totals
+        for agg in archived.values():
+            for outcome, row in agg["by_outcome"].items():
+                acc = by_outcome.setdefault(outcome, {"count": 0, "total_spent": 0.0, "total_alloc": 0.0})
+                acc["count"] += row["count"]
+                acc["total_spent"] += row["total_spent"]
+                acc["total_alloc"] += row["total_alloc"]
+                total_alloc += row["total_alloc"]
+                total_spent += row["total_spent"]
+                closed_tests += row["count"]
+        
         return {
             "total_alloc": total_alloc,
             "total_spent": total_spent,
@@ -257,12 +384,16 @@ class AlphaLedger:
             )
 
     def list_transactions(self, test_id: Optional[str] = None) -> List[AlphaTxn]:
-        """List all transactions, optionally filtered by test_id."""
+        """List retained transactions, optionally filtered by test_id.
+
+        Transactions moved to the journal archive are not listed; `summary()`
+        still accounts for them.
+        """
         with self._lock:
-            transactions = list(self._transactions.values())
-        
-        if test_id is not None:
-            transactions = [txn for txn in transactions if txn.test_id == test_id]
+            if test_id is None:
+                transactions = list(self._transactions.values())
+            else:
+                transactions = [self._transactions[t] for t in self._by_test.get(test_id, ())]
         
         # Return copies sorted by timestamp
         return sorted(
@@ -279,39 +410,50 @@ class AlphaLedger:
             key=lambda x: x.ts_ns
         )
 
-    def to_json(self) -> str:
-        """Serialize ledger state to JSON."""
+    def _state(self) -> dict:
         with self._lock:
-            state = {
+            return {
                 "transactions": {
                     token: asdict(txn) for token, txn in self._transactions.items()
                 },
-                "test_index": self._test_index.copy()
+                "test_index": self._test_index.copy(),
+                "archived": json.loads(json.dumps(self._archived)),
             }
-        return json.dumps(state, indent=2)
+
+    def _load_state(self, state: dict) -> None:
+        # Caller holds _lock
+        self._transactions.clear()
+        self._test_index.clear()
+        self._by_test.clear()
+        for token, txn_dict in state["transactions"].items():
+            txn = AlphaTxn(**txn_dict)
+            self._transactions[token] = txn
+            self._by_test.setdefault(txn.test_id, []).append(token)
+        self._test_index.update(state["test_index"])
+        self._archived = json.loads(json.dumps(state.get("archived", {})))
+
+    def to_json(self) -> str:
+        """Serialize ledger state to JSON."""
+        return json.dumps(self._state(), indent=2)
 
     def from_json(self, json_str: str) -> None:
-        """Restore ledger state from JSON."""
+        """Restore ledger state from JSON (replaces the journaled state with a new snapshot)."""
         state = json.loads(json_str)
         
         with self._lock:
-            # Clear existing state
-            self._transactions.clear()
-            self._test_index.clear()
-            
-            # Restore transactions
-            for token, txn_dict in state["transactions"].items():
-                txn = AlphaTxn(**txn_dict)
-                self._transactions[token] = txn
-            
-            # Restore test index
-            self._test_index.update(state["test_index"])
+            self._load_state(state)
+            if self._journal is not None:
+                self._journal.snapshot(self._state())
 
     def clear(self) -> None:
         """Clear all transactions (for testing/debugging)."""
         with self._lock:
             self._transactions.clear()
             self._test_index.clear()
+            self._by_test.clear()
+            self._archived.clear()
+            if self._journal is not None:
+                self._journal.snapshot(self._state())
 
     # ---- convenience helpers (використаємо в тестах/раннері) ----
     def is_open(self, token: str) -> bool:
@@ -329,4 +471,4 @@ class AlphaLedger:
             return self._test_index.get(test_id)
 
 
-__all__ = ["AlphaTxn", "AlphaLedger"]
\ No newline at end of file
+__all__ = ["AlphaTxn", "AlphaLedger", "AlphaJournal"]
\ No newline at end of file
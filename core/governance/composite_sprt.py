@@ -9,7 +9,8 @@
 """
 
 import numpy as np
-from typing import Dict, List, Optional, Tuple, Union, Any
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple, Union, Any
 from dataclasses import dataclass, field
 from enum import Enum
 from abc import ABC, abstractmethod
@@ -152,36 +153,12 @@ class SubexponentialModel(HypothesisModel):
         sample_skew = float(stats.skew(observations))
         sample_kurt = float(stats.kurtosis(observations))
         
-        # POT (Peak-Over-Threshold) для важких хвостів
-        # Використовуємо тільки додатні спостереження для оцінки хвоста
-        positive_obs = observations[observations > 0]
-        if len(positive_obs) < 10:  # Недостатньо даних для POT
-            tail_index = self.tail_index
-            threshold = 0.0
-            excesses = np.array([])
-            tail_index_ci = (tail_index, tail_index)
+        tail_index, threshold, excesses, k = self._pot_hill(observations)
+        if k > 1:
+            # Bootstrap CI для tail index
+            tail_index_ci = self._bootstrap_tail_index_ci(excesses, k, n_bootstrap=1000)
         else:
-            # Визначаємо threshold як 90-й перцентиль додатніх значень
-            threshold = float(np.percentile(positive_obs, 90))
-            excesses = positive_obs[positive_obs > threshold] - threshold
-            
-            if len(excesses) > 5:  # Мінімум для оцінки
-                # Hill-оцінка для excesses (вже додатні)
-                sorted_excesses = np.sort(excesses)
-                k = max(1, len(excesses) // 4)  # Використовуємо верхні 25%
-                if k > 1:
-                    # excesses вже додатні, тому log безпечний
-                    hill_estimate = np.mean(np.log(sorted_excesses[-k:]) - np.log(sorted_excesses[-k]))
-                    tail_index = 1 / hill_estimate if hill_estimate > 0 else self.tail_index
-                    
-                    # Bootstrap CI для tail index
-                    tail_index_ci = self._bootstrap_tail_index_ci(excesses, k, n_bootstrap=1000)
-                else:
-                    tail_index = self.tail_index
-                    tail_index_ci = (tail_index, tail_index)
-            else:
-                tail_index = self.tail_index
-                tail_index_ci = (tail_index, tail_index)
+            tail_index_ci = (tail_index, tail_index)
         
         return {
             'n': len(observations),
@@ -198,6 +175,32 @@ class SubexponentialModel(HypothesisModel):
             'min': float(np.min(observations))
         }
     
+    def tail_index_estimate(self, observations: np.ndarray) -> float:
+        """POT + Hill tail index без bootstrap CI (як у sufficient_statistics)"""
+        return self._pot_hill(np.asarray(observations, dtype=float))[0]
+    
+    def _pot_hill(self, observations: np.ndarray) -> Tuple[float, float, np.ndarray, int]:
+        """(tail_index, threshold, excesses, k) за POT та Hill-оцінкою; k ≤ 1 → tail_index за замовчуванням"""
+        # POT (Peak-Over-Threshold) для важких хвостів
+        # Використовуємо тільки додатні спостереження для оцінки хвоста
+        positive_obs = observations[observations > 0]
+        if len(positive_obs) < 10:  # Недостатньо даних для POT
+            return self.tail_index, 0.0, np.array([]), 0
+        # Визначаємо threshold як 90-й перцентиль додатніх значень
+        threshold = float(np.percentile(positive_obs, 90))
+        excesses = positive_obs[positive_obs > threshold] - threshold
+        if len(excesses) <= 5:  # Мінімум для оцінки
+            return self.tail_index, threshold, excesses, 0
+        # Hill-оцінка для excesses (вже додатні)
+        sorted_excesses = np.sort(excesses)
+        k = max(1, len(excesses) // 4)  # Використовуємо верхні 25%
+        if k <= 1:
+            return self.tail_index, threshold, excesses, k
+        # excesses вже додатні, тому log безпечний
+        hill_estimate = np.mean(np.log(sorted_excesses[-k:]) - np.log(sorted_excesses[-k]))
+        tail_index = 1 / hill_estimate if hill_estimate > 0 else self.tail_index
+        return tail_index, threshold, excesses, k
+    
     def _bootstrap_tail_index_ci(self, excesses: np.ndarray, k: int, 
                                 n_bootstrap: int = 1000, ci_level: float = 0.95) -> Tuple[float, float]:
         """
@@ -341,8 +344,7 @@ class AlphaSpendingLedger:
         
         return self.cumulative_alpha + min(requested_alpha, allowed_alpha) <= self.total_alpha
     
-    def spend_alpha(self, entry: AlphaSpendingEntry, test_idx: Optional[int] = None) -> bool:
-        """Витратити α та записати в ledger з урахуванням політики"""
+    def _spend(self, entry: AlphaSpendingEntry, test_idx: Optional[int]) -> bool:
         if test_idx is None:
             test_idx = len(self.entries)
             
@@ -351,7 +353,6 @@ class AlphaSpendingLedger:
         actual_spend = min(entry.alpha_spent, allowed_alpha)
         
         if not self.can_spend_alpha(actual_spend, test_idx):
-            logger.warning(f"Cannot spend α={actual_spend}, cumulative={self.cumulative_alpha}, policy={self.policy}")
             return False
             
         # Оновити entry з фактичною витратою
@@ -360,10 +361,28 @@ class AlphaSpendingLedger:
         self.cumulative_alpha += actual_spend
         entry.cumulative_alpha = self.cumulative_alpha
         self.entries.append(entry)
-        
-        logger.info(f"Alpha spent: {actual_spend}, cumulative: {self.cumulative_alpha}, policy: {self.policy}")
         return True
     
+    def spend_alpha(self, entry: AlphaSpendingEntry, test_idx: Optional[int] = None) -> bool:
+        """Витратити α та записати в ledger з урахуванням політики"""
+        if not self._spend(entry, test_idx):
+            logger.warning(f"Cannot spend α={entry.alpha_spent}, cumulative={self.cumulative_alpha}, policy={self.policy}")
+            return False
+        logger.info(f"Alpha spent: {entry.alpha_spent}, cumulative: {self.cumulative_alpha}, policy: {self.policy}")
+        return True
+    
+    def spend_alpha_batch(self, entries: List[AlphaSpendingEntry]) -> List[bool]:
+        """Витратити α для пакету рішень (у порядку списку) з одним записом у лог"""
+        ok = [self._spend(entry, None) for entry in entries]
+        if entries:
+            n_ok = sum(ok)
+            logger.info(
+                f"Alpha spent for {n_ok}/{len(entries)} decisions, cumulative: {self.cumulative_alpha}, policy: {self.policy}"
+            )
+            if n_ok < len(entries):
+                logger.warning(f"Cannot spend α for {len(entries) - n_ok} decisions, policy={self.policy}")
+        return ok
+    
     def set_expected_tests(self, n_tests: int) -> None:
         """Встановити очікувану кількість тестів для планування витрат α"""
         self.n_tests = max(1, n_tests)
@@ -402,17 +421,24 @@ class CompositeSPRT:
                  alpha: float = 0.05, 
                  beta: float = 0.20,
                  alpha_ledger: Optional[AlphaSpendingLedger] = None,
-                 alpha_policy: str = "pocock"):
+                 alpha_policy: str = "pocock",
+                 max_history: int = 1000):
         """
         Args:
             alpha: Рівень значущості (Type I error)
             beta: Рівень потужності (Type II error) 
             alpha_ledger: Ledger для контролю витрат α
             alpha_policy: Політика витрат α ("pocock", "obf", "bh-fdr")
+            max_history: Скільки останніх спостережень зберігати (LLR та n
+                накопичуються незалежно від цього; для тисяч тестів див. SPRTBank).
+                Не застосовується, коли update отримує SubexponentialModel: її
+                fallback-likelihood оцінює tail index по всій вибірці, тож обрізана
+                історія змінила б LLR
         """
         self.alpha = alpha
         self.beta = beta
         self.alpha_policy = alpha_policy
+        self.max_history = max(1, int(max_history))
         
         if alpha_ledger is None:
             alpha_ledger = AlphaSpendingLedger(alpha * 10, policy=alpha_policy)
@@ -433,9 +459,13 @@ class CompositeSPRT:
         
     def reset(self) -> None:
         """Скинути стан тесту"""
-        self.observations: List[float] = []
+        self.observations: Deque[float] = deque(maxlen=self.max_history)
         self.log_lr = 0.0
         self.n_samples = 0
+        # Running sums over all observations (location/scale of the subexponential fallback)
+        self._obs_sum = 0.0
+        self._obs_sumsq = 0.0
+        self._obs_min = float('inf')
         self.sufficient_stats_h0 = {}
         self.sufficient_stats_h1 = {}
         
@@ -461,8 +491,17 @@ class CompositeSPRT:
             SPRTResult з рішенням та метриками
         """
         
+        if self.observations.maxlen is not None and (
+            isinstance(model_h0, SubexponentialModel) or isinstance(model_h1, SubexponentialModel)
+        ):
+            # Subexponential fallback needs the whole sample: lift the cap for this test
+            self.observations = deque(self.observations)
         self.observations.append(observation)
         self.n_samples += 1
+        x = float(observation)
+        self._obs_sum += x
+        self._obs_sumsq += x * x
+        self._obs_min = min(self._obs_min, x)
         
         # Обчислити log-likelihoods
         try:
@@ -551,12 +590,18 @@ class CompositeSPRT:
         if isinstance(model, StudentTModel):
             return self._t_test_likelihood(observation, {}, hypothesis)
         elif isinstance(model, SubexponentialModel):
-            # Use current observations for stats
-            if self.observations:
-                stats = model.sufficient_statistics(np.array(self.observations))
-                return self._subexp_likelihood(observation, stats)
-            else:
+            if not self.observations:
                 return -1  # No data yet
+            # min/var з running sums; лише tail index потребує вибірки (без bootstrap CI,
+            # який likelihood не використовує)
+            n = self.n_samples
+            mean = self._obs_sum / n
+            stats = {
+                'min': self._obs_min,
+                'var': max(0.0, self._obs_sumsq / n - mean * mean),
+                'tail_index': model.tail_index_estimate(np.asarray(self.observations, dtype=float)),
+            }
+            return self._subexp_likelihood(observation, stats)
         else:
             # Gaussian з відомою дисперсією - fallback
             mu = 0.0 if hypothesis == 'h0' else 1.0
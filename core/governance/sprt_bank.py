@@ -0,0 +1,298 @@
+"""
+SPRT bank — thousands of concurrent sequential tests in NumPy state vectors.
+
+One `SPRTBank` holds `n_tests` independent SPRTs (per policy / symbol /
+feature) as arrays of running sufficient statistics: n, Σx, Σx², LLR and a
+decision code. Memory is O(1) per test no matter how long a test runs; no
+observation is stored.
+
+Models (LLR definitions match the single-test implementations):
+- "gaussian"  : known σ, log-LR increments ((x−μ0)² − (x−μ1)²) / 2σ², times
+                the observation weight (`composite_sprt.create_gaussian_sprt`)
+- "bernoulli" : x ∈ {0, 1}, increments x·log(p1/p0) + (1−x)·log((1−p1)/(1−p0))
+- "t"         : unknown σ, GLR from (n, Σx, Σx²) as in `sprt_glr.CompositeSPRT`
+
+`update(tests, x)` applies a batch of observations addressed to any tests,
+in order. Per-test running paths are built with one stable sort and grouped
+cumulative sums, so a test that crosses a boundary mid-batch stops at that
+observation exactly as it would when fed one by one; later observations for
+a decided test are ignored until `reset`. Newly decided tests are returned
+together and their α-spend entries are recorded in the `AlphaSpendingLedger`
+with one `spend_alpha_batch` call.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Any, List, Optional, Sequence, Union
+
+import numpy as np
+
+from core.governance.composite_sprt import AlphaSpendingEntry, AlphaSpendingLedger
+
+logger = logging.getLogger(__name__)
+
+MODELS = ("gaussian", "bernoulli", "t")
+
+CONTINUE = 0
+ACCEPT_H1 = 1
+ACCEPT_H0 = -1
+
+_DECISION_NAMES = {ACCEPT_H1: "accept_h1", ACCEPT_H0: "accept_h0"}
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+
+@dataclass
+class SPRTBankUpdate:
+    """Outcome of one `SPRTBank.update` call (arrays aligned per field group)."""
+
+    tests: np.ndarray        # distinct tests that consumed observations
+    llr: np.ndarray          # LLR of `tests` after the batch
+    n_samples: np.ndarray    # n of `tests` after the batch
+    decision: np.ndarray     # int8 code of `tests`: +1 accept_h1, −1 accept_h0, 0 continue
+    decided: np.ndarray      # subset of `tests` that crossed a boundary in this batch
+    alpha_spent: np.ndarray  # α recorded for each of `decided` (0 if the ledger refused)
+
+
+class SPRTBank:
+    """Vectorized bank of independent SPRTs sharing one model family and α/β."""
+
+    def __init__(
+        self,
+        n_tests: int,
+        *,
+        model: str = "gaussian",
+        mu0: ArrayLike = 0.0,
+        mu1: ArrayLike = 1.0,
+        sigma: ArrayLike = 1.0,
+        p0: ArrayLike = 0.5,
+        p1: ArrayLike = 0.6,
+        alpha: float = 0.05,
+        beta: float = 0.20,
+        min_samples: int = 1,
+        max_samples: Optional[int] = None,
+        alpha_ledger: Optional[AlphaSpendingLedger] = None,
+        alpha_policy: str = "pocock",
+        test_ids: Optional[Sequence[str]] = None,
+        policy_id: str = "default",
+        event_logger: Any = None,
+    ) -> None:
+        if model not in MODELS:
+            raise ValueError(f"model must be one of {MODELS}, got {model!r}")
+        if not 0 < alpha < 1 or not 0 < beta < 1:
+            raise ValueError("alpha and beta must be in (0, 1)")
+        self.n_tests = int(n_tests)
+        self.model = model
+        self.alpha = float(alpha)
+        self.beta = float(beta)
+        self.min_samples = max(1, int(min_samples))
+        self.max_samples = int(max_samples) if max_samples is not None else None
+        self.log_A = math.log((1 - self.beta) / self.alpha)
+        self.log_B = math.log(self.beta / (1 - self.alpha))
+        self.alpha_ledger = alpha_ledger if alpha_ledger is not None else AlphaSpendingLedger(
+            self.alpha * 10, policy=alpha_policy
+        )
+        if test_ids is not None and len(test_ids) != self.n_tests:
+            raise ValueError("test_ids must have n_tests entries")
+        self.test_ids = list(test_ids) if test_ids is not None else None
+        self.policy_id = policy_id
+        self.event_logger = event_logger
+
+        def vec(v: ArrayLike) -> np.ndarray:
+            return np.broadcast_to(np.asarray(v, dtype=np.float64), (self.n_tests,)).copy()
+
+        self.mu0, self.mu1, self.sigma = vec(mu0), vec(mu1), vec(sigma)
+        if model == "gaussian":
+            if np.any(self.sigma <= 0):
+                raise ValueError("sigma must be > 0")
+            # ((x−μ0)² − (x−μ1)²) / 2σ² = a·x + b
+            s2 = self.sigma ** 2
+            self._a = (self.mu1 - self.mu0) / s2
+            self._b = (self.mu0 ** 2 - self.mu1 ** 2) / (2 * s2)
+        elif model == "bernoulli":
+            q0, q1 = vec(p0), vec(p1)
+            if np.any((q0 <= 0) | (q0 >= 1) | (q1 <= 0) | (q1 >= 1)):
+                raise ValueError("p0 and p1 must be in (0, 1)")
+            # x·log(p1/p0) + (1−x)·log((1−p1)/(1−p0)) = a·x + b
+            self._b = np.log((1 - q1) / (1 - q0))
+            self._a = np.log(q1 / q0) - self._b
+        else:
+            if np.any(self.mu0 == self.mu1):
+                raise ValueError("mu0 and mu1 must be different")
+
+        self.n = np.zeros(self.n_tests, dtype=np.int64)
+        self.sum_x = np.zeros(self.n_tests)
+        self.sum_x2 = np.zeros(self.n_tests)
+        self.llr = np.zeros(self.n_tests)
+        self.decision = np.zeros(self.n_tests, dtype=np.int8)
+
+    # ---------------- state ----------------
+
+    def reset(self, tests: Optional[Sequence[int]] = None) -> None:
+        idx = slice(None) if tests is None else np.asarray(tests, dtype=np.int64)
+        self.n[idx] = 0
+        self.sum_x[idx] = 0.0
+        self.sum_x2[idx] = 0.0
+        self.llr[idx] = 0.0
+        self.decision[idx] = CONTINUE
+
+    def active(self) -> np.ndarray:
+        """Indices of tests still sampling."""
+        return np.flatnonzero(self.decision == CONTINUE)
+
+    def _t_llr(self, n: np.ndarray, s1: np.ndarray, s2: np.ndarray, t: np.ndarray) -> np.ndarray:
+        nf = n.astype(np.float64)
+        mean = s1 / np.maximum(nf, 1.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            var = np.where(n > 1, (s2 - s1 * s1 / nf) / (nf - 1.0), 1.0)
+        var = np.where(var <= 0, 1e-6, var)
+        llr = nf / (2 * var) * ((mean - self.mu0[t]) ** 2 - (mean - self.mu1[t]) ** 2)
+        return np.where(n >= self.min_samples, llr, 0.0)
+
+    # ---------------- updates ----------------
+
+    def update(
+        self,
+        tests: Sequence[int],
+        x: ArrayLike,
+        weight: Optional[ArrayLike] = None,
+    ) -> SPRTBankUpdate:
+        """Feed observations `x[i]` to tests `tests[i]` (in order; repeats allowed)."""
+        t = np.asarray(tests, dtype=np.int64).reshape(-1)
+        xv = np.broadcast_to(np.asarray(x, dtype=np.float64), t.shape)
+        if weight is not None and self.model == "t":
+            raise ValueError("weights are not supported for the t model")
+        wv = None if weight is None else np.broadcast_to(np.asarray(weight, dtype=np.float64), t.shape)
+
+        live = self.decision[t] == CONTINUE
+        if not live.all():
+            t, xv = t[live], xv[live]
+            wv = None if wv is None else wv[live]
+        if t.size == 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return SPRTBankUpdate(empty, np.zeros(0), empty, np.zeros(0, dtype=np.int8), empty, np.zeros(0))
+
+        order = np.argsort(t, kind="stable")
+        t, xv = t[order], xv[order]
+        if wv is not None:
+            wv = wv[order]
+        uniq, start, counts = np.unique(t, return_index=True, return_counts=True)
+        grp = np.repeat(np.arange(uniq.size), counts)
+
+        def gcumsum(v: np.ndarray) -> np.ndarray:
+            c = np.cumsum(v)
+            return c - (c[start] - v[start])[grp]
+
+        n_path = self.n[t] + (np.arange(t.size) - start[grp] + 1)
+        s1_path = self.sum_x[t] + gcumsum(xv)
+        s2_path = self.sum_x2[t] + gcumsum(xv * xv)
+        if self.model == "t":
+            llr_path = self._t_llr(n_path, s1_path, s2_path, t)
+        else:
+            inc = self._a[t] * xv + self._b[t]
+            if wv is not None:
+                inc = inc * wv
+            llr_path = self.llr[t] + gcumsum(inc)
+
+        ready = n_path >= self.min_samples
+        hit_h1 = ready & (llr_path >= self.log_A)
+        hit_h0 = ready & (llr_path <= self.log_B) & ~hit_h1
+        stop = hit_h1 | hit_h0
+        if self.max_samples is not None:
+            stop |= n_path >= self.max_samples
+
+        # position per group: first stopping observation, else the group's last one
+        last = start + counts - 1
+        pos = last.copy()
+        stop_at = np.flatnonzero(stop)
+        if stop_at.size:
+            g_stop, first = np.unique(grp[stop_at], return_index=True)
+            pos[g_stop] = stop_at[first]
+        self.n[uniq] = n_path[pos]
+        self.sum_x[uniq] = s1_path[pos]
+        self.sum_x2[uniq] = s2_path[pos]
+        self.llr[uniq] = llr_path[pos]
+        dec = np.where(hit_h1[pos], ACCEPT_H1, np.where(stop[pos], ACCEPT_H0, CONTINUE)).astype(np.int8)
+        self.decision[uniq] = dec
+
+        decided = uniq[dec != CONTINUE]
+        spent = self._spend(decided) if decided.size else np.zeros(0)
+        return SPRTBankUpdate(
+            tests=uniq,
+            llr=self.llr[uniq].copy(),
+            n_samples=self.n[uniq].copy(),
+            decision=dec,
+            decided=decided,
+            alpha_spent=spent,
+        )
+
+    # ---------------- α spending / events ----------------
+
+    def _alpha_requested(self, tests: np.ndarray) -> np.ndarray:
+        """Per-decision α as in `CompositeSPRT._calculate_alpha_spent`."""
+        llr = self.llr[tests]
+        h1 = self.decision[tests] == ACCEPT_H1
+        a = np.where(
+            llr > self.log_A,
+            np.minimum(self.alpha, self.alpha * np.exp(-(llr - self.log_A))),
+            self.alpha * 0.1,
+        )
+        b = np.where(
+            llr < self.log_B,
+            np.minimum(self.beta, self.beta * np.exp(-(self.log_B - llr))),
+            self.beta * 0.1,
+        )
+        return np.where(h1, a, b)
+
+    def test_id(self, i: int) -> str:
+        return self.test_ids[i] if self.test_ids is not None else str(i)
+
+    def _spend(self, decided: np.ndarray) -> np.ndarray:
+        req = self._alpha_requested(decided)
+        now = time.time()
+        test_type = f"SPRTBank_{self.model}"
+        entries: List[AlphaSpendingEntry] = [
+            AlphaSpendingEntry(
+                timestamp=now,
+                test_id=self.test_id(int(i)),
+                policy_id=self.policy_id,
+                alpha_spent=float(a),
+                cumulative_alpha=0.0,
+                decision=_DECISION_NAMES[int(self.decision[i])],
+                llr=float(self.llr[i]),
+                n_observations=int(self.n[i]),
+                test_type=test_type,
+            )
+            for i, a in zip(decided, req)
+        ]
+        ok = self.alpha_ledger.spend_alpha_batch(entries)
+        spent = np.array([e.alpha_spent if o else 0.0 for e, o in zip(entries, ok)])
+        if self.event_logger is not None:
+            self._emit(entries)
+        return spent
+
+    def _emit(self, entries: List[AlphaSpendingEntry]) -> None:
+        try:
+            from observability.codes import SPRT_DECISION_H0, SPRT_DECISION_H1
+
+            for e in entries:
+                self.event_logger.emit(
+                    event_code=SPRT_DECISION_H1 if e.decision == "accept_h1" else SPRT_DECISION_H0,
+                    details={
+                        'test_id': e.test_id,
+                        'policy_id': e.policy_id,
+                        'llr': e.llr,
+                        'n_samples': e.n_observations,
+                        'boundaries': {'log_A': self.log_A, 'log_B': self.log_B},
+                        'alpha_spent': e.alpha_spent,
+                        'decision': e.decision,
+                        'model': self.model,
+                    },
+                    src='sprt_bank',
+                )
+        except Exception as ex:
+            logger.error(f"Failed to log SPRT bank decisions: {ex}")
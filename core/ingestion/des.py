@@ -0,0 +1,231 @@
+"""
+Aurora Ingestion — Discrete-event simulation kernel
+===================================================
+
+One priority queue and one `VirtualClock` drive everything in an unpaced
+backtest: market events, simulated order latencies, ACK/fill callbacks and
+periodic scans (e.g. `AckTracker` expiries). Each pop moves virtual time to
+the event's timestamp and dispatches it, so a day of data runs as fast as the
+CPU allows while every latency still lands at the right point relative to
+the market stream.
+
+Ordering is (ts_ns, priority, insertion seq): equal-time events run in
+priority order, then FIFO, which makes runs deterministic. Callbacks default
+to PRIORITY_CALLBACK, which runs before market data stamped at the same time.
+
+Example
+-------
+    sched = SimScheduler()
+    sink = SimLocalSink(cfg, scheduler=sched, on_status=strategy.on_status)
+    tracker = AckTracker(events_emit=emit, ttl_s=5, clock=sched.clock.now_ns)
+    sched.every(1_000_000_000, tracker.scan_once)
+    sched.feed(Replay(source=src, pace=False).stream(), strategy.on_market)
+    sched.run()
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from core.ingestion.sync_clock import VirtualClock
+
+logger = logging.getLogger("aurora.ingestion.des")
+
+PRIORITY_CALLBACK = 0
+PRIORITY_TIMER = 5
+PRIORITY_MARKET = 10
+
+
+@dataclass(order=True)
+class _Entry:
+    ts_ns: int
+    priority: int
+    seq: int
+    fn: Callable[..., Any] = field(compare=False)
+    args: Tuple[Any, ...] = field(compare=False, default=())
+    cancelled: bool = field(compare=False, default=False)
+    timer: bool = field(compare=False, default=False)
+    done: bool = field(compare=False, default=False)
+
+
+class Handle:
+    """Returned by `schedule_*`; `cancel()` drops the event if it has not run yet."""
+
+    __slots__ = ("_entry", "_sched")
+
+    def __init__(self, entry: _Entry, sched: "SimScheduler") -> None:
+        self._entry = entry
+        self._sched = sched
+
+    @property
+    def ts_ns(self) -> int:
+        return self._entry.ts_ns
+
+    def cancel(self) -> None:
+        e = self._entry
+        if e.cancelled or e.done:
+            return
+        e.cancelled = True
+        if not e.timer:
+            self._sched._live -= 1
+
+
+@dataclass
+class SchedulerStats:
+    dispatched: int = 0
+    market_events: int = 0
+    cancelled: int = 0
+    errors: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return self.__dict__.copy()
+
+
+class SimScheduler:
+    """Virtual-time event loop: schedule callbacks, feed market streams, run."""
+
+    def __init__(self, clock: Optional[VirtualClock] = None, *, strict: bool = True) -> None:
+        self.clock = clock or VirtualClock()
+        self._heap: List[_Entry] = []
+        self._live = 0  # queued, not cancelled, non-timer entries (what keeps timers armed)
+        self._seq = itertools.count()
+        self._strict = bool(strict)
+        self._stop = False
+        self.stats = SchedulerStats()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def now_ns(self) -> int:
+        return self.clock.now_ns()
+
+    def pending(self) -> int:
+        """Queued events other than periodic timers, cancelled ones excluded."""
+        return self._live
+
+    # -------------------- scheduling --------------------
+
+    def schedule_at(self, ts_ns: int, fn: Callable[..., Any], *args: Any, priority: int = PRIORITY_CALLBACK) -> Handle:
+        """Run fn(*args) at virtual time ts_ns (clamped to now: no scheduling into the past)."""
+        return self._push(ts_ns, fn, args, priority, timer=False)
+
+    def _push(self, ts_ns: int, fn: Callable[..., Any], args: Tuple[Any, ...], priority: int, *, timer: bool) -> Handle:
+        ts = max(int(ts_ns), self.clock.now_ns())
+        e = _Entry(ts, int(priority), next(self._seq), fn, args, timer=timer)
+        heapq.heappush(self._heap, e)
+        if not timer:
+            self._live += 1
+        return Handle(e, self)
+
+    def schedule_in(self, delay_ns: int, fn: Callable[..., Any], *args: Any, priority: int = PRIORITY_CALLBACK) -> Handle:
+        return self.schedule_at(self.clock.now_ns() + max(0, int(delay_ns)), fn, *args, priority=priority)
+
+    def every(
+        self,
+        period_ns: int,
+        fn: Callable[..., Any],
+        *args: Any,
+        start_ns: Optional[int] = None,
+        priority: int = PRIORITY_TIMER,
+    ) -> Handle:
+        """Run fn(*args) every period_ns while other events remain queued.
+
+        The timer re-arms only while non-timer events are pending (`pending()`),
+        so timers never keep each other, or an otherwise finished simulation,
+        alive. Cancel via the returned handle.
+        """
+        period = max(1, int(period_ns))
+        box: List[Handle] = []
+
+        def _tick() -> None:
+            fn(*args)
+            if self._live > 0 and not box[0]._entry.cancelled:
+                nxt = self._push(self.clock.now_ns() + period, _tick, (), priority, timer=True)
+                box[0]._entry = nxt._entry
+
+        first = self.clock.now_ns() + period if start_ns is None else int(start_ns)
+        box.append(self._push(first, _tick, (), priority, timer=True))
+        return box[0]
+
+    def feed(
+        self,
+        events: Iterable[Mapping[str, Any]],
+        on_event: Callable[[Mapping[str, Any]], Any],
+        *,
+        ts_key: str = "ts_ns",
+        priority: int = PRIORITY_MARKET,
+    ) -> None:
+        """Schedule a time-ordered market stream lazily (one pending event at a time)."""
+        it: Iterator[Mapping[str, Any]] = iter(events)
+
+        def _pull() -> None:
+            for evt in it:
+                self.schedule_at(int(evt[ts_key]), _dispatch, evt, priority=priority)
+                return
+
+        def _dispatch(evt: Mapping[str, Any]) -> None:
+            self.stats.market_events += 1
+            try:
+                on_event(evt)
+            finally:
+                _pull()
+
+        _pull()
+
+    # -------------------- running --------------------
+
+    def stop(self) -> None:
+        """Stop `run()` after the current event."""
+        self._stop = True
+
+    def step(self) -> bool:
+        """Dispatch the next live event; False when the queue is empty."""
+        heap = self._heap
+        while heap:
+            e = heapq.heappop(heap)
+            if e.cancelled:
+                self.stats.cancelled += 1
+                continue
+            e.done = True
+            if not e.timer:
+                self._live -= 1
+            self.clock.advance_to(e.ts_ns)
+            self.stats.dispatched += 1
+            try:
+                e.fn(*e.args)
+            except Exception as ex:
+                self.stats.errors += 1
+                if self._strict:
+                    raise
+                logger.debug("sim event error at ts=%d: %s", e.ts_ns, ex)
+            return True
+        return False
+
+    def run(self, *, until_ns: Optional[int] = None, max_events: Optional[int] = None) -> SchedulerStats:
+        """Dispatch events in time order until the queue drains, `until_ns`, `max_events` or stop()."""
+        self._stop = False
+        n = 0
+        heap = self._heap
+        while heap and not self._stop:
+            if until_ns is not None and heap[0].ts_ns > until_ns:
+                self.clock.advance_to(max(self.clock.now_ns(), int(until_ns)))
+                break
+            if max_events is not None and n >= max_events:
+                break
+            if self.step():
+                n += 1
+        return self.stats
+
+
+__all__ = [
+    "PRIORITY_CALLBACK",
+    "PRIORITY_MARKET",
+    "PRIORITY_TIMER",
+    "Handle",
+    "SchedulerStats",
+    "SimScheduler",
+]
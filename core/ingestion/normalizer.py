@@ -40,6 +40,10 @@ Design choices:
   • Anti–look-ahead enforcement with per-(symbol,type) state; equal ts_ns ordered by seq if present.
   • Heuristics for vendor aliases, e.g., ts keys: ['ts','timestamp','T','E','time'],
     size keys: ['qty','size','amount'], price keys: ['p','price'] etc.
+  • Fast path: per raw key layout, the resolved aliases and ts unit are learned from
+    the first accepted event and bound into a specialized extractor; anything it
+    does not recognize falls back to the generic path (identical output).
+  • normalize_batch() returns columnar NumPy arrays (NumPy imported lazily).
 
 Usage:
     from core.ingestion.normalizer import Normalizer
@@ -155,6 +159,146 @@ def _coerce_float(x: Any) -> Optional[float]:
     except Exception:
         return None
 
+# -------------------- layout fast path --------------------
+
+_TRADE_TYPES = frozenset(("trade", "aggtrade", "t", "fills"))
+_QUOTE_TYPES = frozenset(("quote", "book_ticker", "book", "depth"))
+# [lo, hi) magnitude bands of _detect_ts_unit → multiplier
+_TS_BANDS = ((float("-inf"), 1e12, 1), (1e12, 1e14, 1_000_000), (1e14, 1e17, 1_000), (1e17, float("inf"), 1_000_000_000))
+
+
+def _kind_of(typ: Optional[str]) -> Optional[str]:
+    """Event kind named by the raw type field (None → infer from fields)."""
+    if typ in _TRADE_TYPES:
+        return "trade"
+    if typ in _QUOTE_TYPES:
+        return "quote"
+    return None
+
+
+def _ts_band(v: float) -> Tuple[float, float, int]:
+    for band in _TS_BANDS:
+        if band[0] <= v < band[1]:
+            return band
+    return _TS_BANDS[0]
+
+
+_FAST_FIELDS = ("price", "size", "bid_px", "ask_px", "bid_sz", "ask_sz")
+
+
+_BAD = object()
+
+
+def _as_float(x: Any) -> Any:
+    """float(x) for the value types the generic path accepts, else _BAD."""
+    t = type(x)
+    if t is float:
+        return x
+    if t is not int and t is not str:
+        return _BAD
+    try:
+        return float(x)
+    except ValueError:
+        return _BAD
+
+
+def _compile_layout(raw: Mapping[str, Any], norm: "Normalizer"):
+    """Build an extractor specialized to raw's exact key tuple and ts unit.
+
+    `_first` picks the first alias present, so for a fixed key tuple the key
+    used per field is fixed as well, and trade/quote inference only depends on
+    which keys exist. The resolved keys are bound into a closure that re-checks
+    only what still varies per event (ts magnitude band, value types,
+    validation) and returns None to send anything unusual down the generic
+    path, so it can only reproduce results the generic path would give.
+    Returns None if raw is not eligible.
+    """
+    ts_key = next((k for k in _TS_KEYS if k in raw), None)
+    sym_key = next((k for k in _SYMBOL_KEYS if k in raw), None)
+    if ts_key is None or sym_key is None or type(raw[ts_key]) not in (int, float):
+        return None
+    lo, hi, mult = _ts_band(float(raw[ts_key]))
+    type_key = next((k for k in _TYPE_KEYS if k in raw), None)
+    seq_key = next((k for k in _SEQ_KEYS if k in raw), None)
+    # resolved key per _FAST_FIELDS entry (None = absent in this layout)
+    fkeys = tuple(next((k for k in keys if k in raw), None) for keys in (
+        _PRICE_KEYS, _SIZE_KEYS, _BID_PX_KEYS, _ASK_PX_KEYS, _BID_SZ_KEYS, _ASK_SZ_KEYS))
+    can_trade = fkeys[0] is not None and fkeys[1] is not None
+    can_quote = fkeys[2] is not None and fkeys[3] is not None
+    # kind used when the type field is absent or unrecognized (see _infer_kind)
+    inferred = "trade" if can_trade else "quote" if can_quote else None
+    has_source = "source" in raw
+    has_side = "side" in raw
+    default_src = norm._source
+    sym_cache = norm._sym_cache
+    kind_cache: Dict[Any, Optional[str]] = {}
+
+    def extract(raw: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+        ts = raw[ts_key]
+        t = type(ts)
+        if (t is not int and t is not float) or not (lo <= float(ts) < hi):
+            return None
+        s = raw[sym_key]
+        if type(s) is not str:
+            return None
+        sym = sym_cache.get(s)
+        if sym is None:
+            return None
+        if type_key is not None:
+            try:
+                kind = kind_cache[raw[type_key]] or inferred
+            except (KeyError, TypeError):
+                return None
+        else:
+            kind = inferred
+        if seq_key is not None:
+            seq = raw[seq_key]
+            if type(seq) is not int:
+                return None
+        else:
+            seq = None
+        vals = []
+        for k in fkeys:
+            if k is None:
+                vals.append(None)
+                continue
+            v = _as_float(raw[k])
+            if v is _BAD:
+                return None
+            vals.append(v)
+        price, size, bid_px, ask_px, bid_sz, ask_sz = vals
+        if kind == "trade" and can_trade:
+            if not (price > 0 and size > 0):
+                return None
+            return {"ts_ns": int(ts * mult), "type": "trade", "symbol": sym,
+                    "source": str(raw["source"]) if has_source else default_src, "seq": seq,
+                    "price": price, "size": size, "side": _normalize_side(raw["side"]) if has_side else None,
+                    "bid_px": None, "bid_sz": None, "ask_px": None, "ask_sz": None}
+        if kind == "quote" and can_quote:
+            if not (0 < bid_px <= ask_px and (bid_sz is None or bid_sz >= 0) and (ask_sz is None or ask_sz >= 0)):
+                return None
+            return {"ts_ns": int(ts * mult), "type": "quote", "symbol": sym,
+                    "source": str(raw["source"]) if has_source else default_src, "seq": seq,
+                    "price": None, "size": None, "side": _normalize_side(raw["side"]) if has_side else None,
+                    "bid_px": bid_px, "bid_sz": bid_sz, "ask_px": ask_px, "ask_sz": ask_sz}
+        return None
+
+    def warm(raw: Mapping[str, Any]) -> None:
+        # fill per-value caches from an event the generic path accepted
+        s = raw[sym_key]
+        if type(s) is str and len(sym_cache) < 4096:
+            sym_cache[s] = _normalize_symbol(s)
+        if type_key is not None and len(kind_cache) < 64:
+            tv = raw[type_key]
+            try:
+                kind_cache[tv] = _kind_of(str(tv).lower() if tv is not None else None)
+            except TypeError:
+                pass
+
+    extract.warm = warm
+    return extract
+
+
 # -------------------- Normalizer --------------------
 
 @dataclass
@@ -167,12 +311,25 @@ class Normalizer:
     """Stateless API with stateful anti-look-ahead enforcement per (symbol, type).
 
     If strict=True, violations raise ValueError; else events are skipped.
+
+    Fast path (fast_path=True): the key layout and timestamp unit of each
+    distinct raw key tuple are learned from its first accepted event and
+    bound into a specialized extractor; events that do not fit (other
+    ts magnitude, unexpected value types) fall back to the generic path.
+    Output is identical either way.
     """
 
-    def __init__(self, *, source_tag: str = "unknown", strict: bool = True) -> None:
+    _MAX_LAYOUTS = 32
+
+    def __init__(self, *, source_tag: str = "unknown", strict: bool = True, fast_path: bool = True) -> None:
         self._source = source_tag
         self._strict = strict
         self._state: Dict[Tuple[str, str], _StreamState] = {}
+        self._fast_path = bool(fast_path)
+        self._layouts: Dict[Tuple[str, ...], Any] = {}
+        self._sym_cache: Dict[str, str] = {}
+        self.fast_hits = 0
+        self.fast_misses = 0
 
     # ---------- public API ----------
 
@@ -194,9 +351,85 @@ class Normalizer:
             if out is not None:
                 yield out
 
+    def normalize_batch(self, raws: Iterable[Mapping[str, Any]]) -> Dict[str, Any]:
+        """Normalize many events into columnar NumPy arrays (dropped events are skipped).
+
+        Columns: ts_ns int64, seq int64 (tickstore.SEQ_NONE = none), type uint8 (0 trade, 1 quote),
+        side int8 (+1 buy, -1 sell, 0 none), symbol/source object arrays,
+        price/size/bid_px/bid_sz/ask_px/ask_sz float64 (NaN = none).
+        Strictness and anti-look-ahead behave as in `normalize`.
+        """
+        import numpy as np
+
+        from core.ingestion.tickstore import SEQ_NONE
+
+        ts: list = []
+        seq: list = []
+        typ: list = []
+        side: list = []
+        sym: list = []
+        src: list = []
+        fl: Tuple[list, ...] = ([], [], [], [], [], [])
+        nan = float("nan")
+        side_code = {"buy": 1, "sell": -1}
+        for r in raws:
+            e = self.normalize(r)
+            if e is None:
+                continue
+            ts.append(e["ts_ns"])
+            s = e["seq"]
+            seq.append(SEQ_NONE if s is None else s)
+            typ.append(0 if e["type"] == "trade" else 1)
+            side.append(side_code.get(e["side"], 0))
+            sym.append(e["symbol"])
+            src.append(e["source"])
+            for col, k in zip(fl, ("price", "size", "bid_px", "bid_sz", "ask_px", "ask_sz")):
+                v = e[k]
+                col.append(nan if v is None else v)
+        out: Dict[str, Any] = {
+            "ts_ns": np.array(ts, dtype=np.int64),
+            "seq": np.array(seq, dtype=np.int64),
+            "type": np.array(typ, dtype=np.uint8),
+            "side": np.array(side, dtype=np.int8),
+            "symbol": np.array(sym, dtype=object),
+            "source": np.array(src, dtype=object),
+        }
+        for col, k in zip(fl, ("price", "size", "bid_px", "bid_sz", "ask_px", "ask_sz")):
+            out[k] = np.array(col, dtype=np.float64)
+        return out
+
     # ---------- internals ----------
 
     def _normalize_impl(self, raw: Mapping[str, Any]) -> Dict[str, Any]:
+        if not self._fast_path or type(raw) is not dict:
+            return self._normalize_generic(raw)
+        layout = tuple(raw)
+        ex = self._layouts.get(layout)
+        if ex is not None:
+            evt = ex(raw)
+            if evt is not None:
+                self.fast_hits += 1
+                return evt
+        self.fast_misses += 1
+        evt = self._normalize_generic(raw)
+        # learn from accepted events only
+        if ex is None and len(self._layouts) < self._MAX_LAYOUTS:
+            ex = _compile_layout(raw, self)
+            if ex is not None:
+                self._layouts[layout] = ex
+        if ex is not None:
+            ex.warm(raw)
+        return evt
+
+    @staticmethod
+    def _infer_kind(price, size, bid_px, ask_px) -> str:
+        if price is not None and size is not None:
+            return "trade"
+        if bid_px is not None and ask_px is not None:
+            return "quote"
+        raise ValueError("unable to infer event type")
+
+    def _normalize_generic(self, raw: Mapping[str, Any]) -> Dict[str, Any]:
         # core fields
         ts_val = _first(raw, _TS_KEYS)
         if ts_val is None:
@@ -228,30 +461,37 @@ class Normalizer:
         ask_sz = _coerce_float(_first(raw, _ASK_SZ_KEYS))
 
         # Heuristic resolution
-        kind: Optional[str] = None
-        if typ in ("trade", "aggtrade", "t", "fills"):
-            kind = "trade"
-        elif typ in ("quote", "book_ticker", "book", "depth"):
-            kind = "quote"
-        else:
-            # infer by keys
-            if price is not None and size is not None:
-                kind = "trade"
-            elif bid_px is not None and ask_px is not None:
-                kind = "quote"
-
-        if kind is None:
-            raise ValueError("unable to infer event type")
-
+        kind = _kind_of(typ) or self._infer_kind(price, size, bid_px, ask_px)
+
+        return self._build(
+            ts_ns, kind, sym, str(raw.get("source", self._source)), seq, _normalize_side(raw.get("side")),
+            price, size, bid_px, ask_px, bid_sz, ask_sz,
+        )
+
+    @staticmethod
+    def _build(
+        ts_ns: int,
+        kind: str,
+        sym: str,
+        source: str,
+        seq: Optional[int],
+        side: Optional[str],
+        price: Optional[float],
+        size: Optional[float],
+        bid_px: Optional[float],
+        ask_px: Optional[float],
+        bid_sz: Optional[float],
+        ask_sz: Optional[float],
+    ) -> Dict[str, Any]:
         base: Dict[str, Any] = {
             "ts_ns": ts_ns,
             "type": kind,
             "symbol": sym,
-            "source": str(raw.get("source", self._source)),
+            "source": source,
             "seq": seq,
             "price": None,
             "size": None,
-            "side": _normalize_side(raw.get("side")),
+            "side": side,
             "bid_px": None,
             "bid_sz": None,
             "ask_px": None,
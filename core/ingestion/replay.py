@@ -6,7 +6,8 @@ Aurora Ingestion — Replay
 
 High-precision record→replay engine that:
   • Reads raw events from an iterable or a source callable
-  • Normalizes into canonical SSOT schema via Normalizer
+  • Normalizes into canonical SSOT schema via Normalizer (skipped for
+    pre-normalized sources such as core.ingestion.tickstore)
   • Enforces anti–look-ahead (delegated to Normalizer) and event pacing via TickClock
   • Supports replay filters (time window, symbols, types) and user hooks
   • Produces deterministic stats for observability/governance
@@ -69,6 +70,7 @@ class Replay:
         pace: bool = True,
         log_every: int = 50_000,
         max_sleep_ns: Optional[int] = None,
+        prenormalized: bool = False,
     ) -> None:
         """
         Parameters
@@ -80,6 +82,7 @@ class Replay:
         pace : if True, wall-sleep to align with event time using clock
         log_every : progress logging interval in processed events
         max_sleep_ns : optional max sleep duration per pacing call (for cancellable runs)
+        prenormalized : source already yields canonical events (e.g. TickStore); skip Normalizer
         """
         self._get_source = source if callable(source) else (lambda: source)  # always callable returning iterable
         self._norm = normalizer or Normalizer(strict=strict)
@@ -88,6 +91,7 @@ class Replay:
         self._clock = clock or (ReplayClock() if self._pace else RealTimeClock())
         self._log_every = int(log_every)
         self._max_sleep_ns = max_sleep_ns
+        self._prenormalized = bool(prenormalized)
         self._stop = False
         self.stats = ReplayStats()
 
@@ -135,7 +139,7 @@ class Replay:
                     dropped_filtered += 1
                     continue
 
-                evt = self._norm.normalize(raw)
+                evt = raw if self._prenormalized else self._norm.normalize(raw)
                 if evt is None:
                     # strict=False in normalizer path
                     dropped_invalid += 1
@@ -182,7 +186,7 @@ class Replay:
                 # Carry over any extra fields from raw into the normalized event
                 # so downstream transform/post-processing can inspect raw tags.
                 try:
-                    if isinstance(raw, dict):
+                    if isinstance(raw, dict) and raw is not evt:
                         for k, v in raw.items():
                             if k not in evt:
                                 evt[k] = v
@@ -26,6 +26,8 @@ API
   • RealTimeClock — thin wrapper over perf_counter_ns(), wall sleeps only
   • ReplayClock   — event_ts→wall mapping with speed, tolerance, re-anchoring
   • ManualClock   — controllable clock for tests
+  • VirtualClock  — simulation time owned by core.ingestion.des.SimScheduler
+                    (never sleeps; sleeping just advances virtual time)
 
 Notes
 -----
@@ -47,6 +49,7 @@ __all__ = [
     "RealTimeClock",
     "ReplayClock",
     "ManualClock",
+    "VirtualClock",
 ]
 
 
@@ -231,3 +234,37 @@ class ManualClock(TickClock):
     def sleep_until_event_ts_ns(self, event_ts_ns: int) -> None:
         # In tests, treat event_ts_ns as target wall for simplicity
         self.sleep_until_wall_ns(int(event_ts_ns))
+
+
+# -------------------- Virtual clock (discrete-event simulation) --------------------
+
+class VirtualClock(TickClock):
+    """Monotone virtual time (ns) for unpaced simulation.
+
+    Owned by a discrete-event scheduler, which moves it to each event's time
+    before dispatch. Sleeps never block: they advance virtual time, so code
+    written against TickClock (e.g. Replay pacing) runs as fast as the CPU allows.
+    """
+
+    def __init__(self, start_ns: int = 0) -> None:
+        self._now = int(start_ns)
+
+    def now_ns(self) -> int:
+        return self._now
+
+    def now_ms(self) -> int:
+        """Virtual epoch ms, drop-in for `time_func` hooks that expect wall ms."""
+        return self._now // 1_000_000
+
+    def advance_to(self, ts_ns: int) -> None:
+        ts = int(ts_ns)
+        if ts < self._now:
+            raise ValueError(f"virtual time regression: {ts} < {self._now}")
+        self._now = ts
+
+    def sleep_until_wall_ns(self, target_wall_ns: int) -> None:
+        if target_wall_ns > self._now:
+            self._now = int(target_wall_ns)
+
+    def sleep_until_event_ts_ns(self, event_ts_ns: int) -> None:
+        self.sleep_until_wall_ns(event_ts_ns)
@@ -0,0 +1,424 @@
+"""
+Aurora Ingestion — Tick Store
+=============================
+
+Columnar, fixed-width binary store for *normalized* market events, one file
+per (symbol, UTC day), read back through `mmap` as zero-copy NumPy views.
+Converting raw JSONL once moves `json.loads` + `Normalizer` out of every
+backtest run.
+
+Layout
+------
+    <root>/index.json                 — {"files": [{symbol, day, path, count, ts_min, ts_max}, ...]}
+    <root>/<SYMBOL>/<YYYYMMDD>.atk    — one tick file
+
+Tick file:
+    bytes [0, 8)        magic b"AURTICK\\x01"
+    bytes [8, 12)       uint32 LE length of the JSON header
+    bytes [12, ...)     JSON header: symbol, day, count, ts_min, ts_max, sources,
+                        columns [{name, dtype, offset}]
+    bytes [4096, ...)   columns, each contiguous and 64-byte aligned, rows sorted
+                        by ts_ns (stable, so per-stream order is preserved)
+
+Columns (missing values: NaN for floats, INT64_MIN for seq, 0 for side):
+    ts_ns <i8, seq <i8, type u1 (0 trade, 1 quote), side i1 (+1 buy, -1 sell),
+    src <u2 (index into header 'sources'), price, size, bid_px, bid_sz, ask_px, ask_sz <f8
+
+Only the canonical schema of `Normalizer` is stored; extra raw keys are not.
+
+Usage
+-----
+    from core.ingestion.tickstore import TickStore, TickStoreWriter
+    with TickStoreWriter("data/ticks") as w:
+        for evt in Normalizer(strict=False).normalize_iter(raws):
+            w.append(evt)
+
+    store = TickStore("data/ticks")
+    replay = Replay(source=store.source(symbols={"BTCUSDT"}), prenormalized=True, pace=False)
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import mmap
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+import numpy as np
+
+MAGIC = b"AURTICK\x01"
+HEADER_SIZE = 4096
+_ALIGN = 64
+_DAY_NS = 86_400 * 1_000_000_000
+SEQ_NONE = int(np.iinfo(np.int64).min)
+
+COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("ts_ns", "<i8"),
+    ("seq", "<i8"),
+    ("type", "u1"),
+    ("side", "i1"),
+    ("src", "<u2"),
+    ("price", "<f8"),
+    ("size", "<f8"),
+    ("bid_px", "<f8"),
+    ("bid_sz", "<f8"),
+    ("ask_px", "<f8"),
+    ("ask_sz", "<f8"),
+)
+ROW_DTYPE = np.dtype(list(COLUMNS))
+
+_TYPES = ("trade", "quote")
+_TYPE_CODE = {"trade": 0, "quote": 1}
+_SIDE_CODE = {"buy": 1, "sell": -1}
+_SIDE_NAME = {1: "buy", -1: "sell", 0: None}
+_FLOAT_FIELDS = ("price", "size", "bid_px", "bid_sz", "ask_px", "ask_sz")
+
+
+def day_of(ts_ns: int) -> str:
+    """UTC calendar day (YYYYMMDD) of an epoch-ns timestamp."""
+    days = int(ts_ns) // _DAY_NS
+    return str(np.datetime64(days, "D")).replace("-", "")
+
+
+def _nan(x: Any) -> float:
+    return float("nan") if x is None else float(x)
+
+
+# -------------------- reader --------------------
+
+
+class TickFile:
+    """Read-only view over one tick file; `columns[name]` are zero-copy mmap views."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._fh = self.path.open("rb")
+        try:
+            self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            self._fh.close()
+            raise ValueError(f"not a tick file: {self.path}")
+        if self._mm[:8] != MAGIC:
+            self.close()
+            raise ValueError(f"not a tick file: {self.path}")
+        hlen = int.from_bytes(self._mm[8:12], "little")
+        self.header: Dict[str, Any] = json.loads(bytes(self._mm[12:12 + hlen]).decode("utf-8"))
+        self.symbol: str = self.header["symbol"]
+        self.day: str = self.header["day"]
+        self.count: int = int(self.header["count"])
+        self.sources: List[str] = list(self.header.get("sources") or [])
+        self.columns: Dict[str, np.ndarray] = {
+            c["name"]: np.frombuffer(self._mm, dtype=np.dtype(c["dtype"]), count=self.count, offset=int(c["offset"]))
+            for c in self.header["columns"]
+        }
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __enter__(self) -> "TickFile":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        # Views must be dropped before the mapping can be closed
+        self.columns = {}
+        try:
+            self._mm.close()
+        except BufferError:
+            # a caller still holds a view; the mapping is released with it
+            pass
+        except Exception:
+            pass
+        self._fh.close()
+
+    def span(self, start_ts_ns: Optional[int] = None, end_ts_ns: Optional[int] = None) -> Tuple[int, int]:
+        """Row range [i0, i1) with start <= ts_ns <= end (binary search on the sorted ts column)."""
+        ts = self.columns["ts_ns"]
+        i0 = 0 if start_ts_ns is None else int(np.searchsorted(ts, int(start_ts_ns), side="left"))
+        i1 = self.count if end_ts_ns is None else int(np.searchsorted(ts, int(end_ts_ns), side="right"))
+        return i0, max(i0, i1)
+
+    def iter_events(
+        self,
+        start_ts_ns: Optional[int] = None,
+        end_ts_ns: Optional[int] = None,
+        *,
+        types: Optional[Set[str]] = None,
+        chunk: int = 65_536,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield canonical event dicts (same schema as `Normalizer.normalize`)."""
+        i0, i1 = self.span(start_ts_ns, end_ts_ns)
+        cols = self.columns
+        sym = self.symbol
+        sources = self.sources or ["unknown"]
+        want = None if types is None else {_TYPE_CODE[t] for t in types if t in _TYPE_CODE}
+        for a in range(i0, i1, chunk):
+            b = min(i1, a + chunk)
+            # one tolist() per column per chunk instead of per-element numpy scalars
+            c = {name: cols[name][a:b].tolist() for name, _ in COLUMNS}
+            fl = [[None if v != v else v for v in c[f]] for f in _FLOAT_FIELDS]
+            for j, (ts, seq, typ, side, src) in enumerate(zip(c["ts_ns"], c["seq"], c["type"], c["side"], c["src"])):
+                if want is not None and typ not in want:
+                    continue
+                yield {
+                    "ts_ns": ts,
+                    "type": _TYPES[typ],
+                    "symbol": sym,
+                    "source": sources[src],
+                    "seq": None if seq == SEQ_NONE else seq,
+                    "price": fl[0][j],
+                    "size": fl[1][j],
+                    "side": _SIDE_NAME.get(side),
+                    "bid_px": fl[2][j],
+                    "bid_sz": fl[3][j],
+                    "ask_px": fl[4][j],
+                    "ask_sz": fl[5][j],
+                }
+
+
+@dataclass(frozen=True)
+class TickFileInfo:
+    symbol: str
+    day: str
+    path: Path
+    count: int
+    ts_min: int
+    ts_max: int
+
+
+class TickStore:
+    """Directory of tick files with a JSON index for file selection."""
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+
+    def files(
+        self,
+        *,
+        symbols: Optional[Set[str]] = None,
+        start_ts_ns: Optional[int] = None,
+        end_ts_ns: Optional[int] = None,
+    ) -> List[TickFileInfo]:
+        """Indexed files overlapping the time window, sorted by (day, symbol)."""
+        out: List[TickFileInfo] = []
+        for rec in _load_index(self.root).values():
+            if symbols is not None and rec["symbol"] not in symbols:
+                continue
+            if start_ts_ns is not None and int(rec["ts_max"]) < int(start_ts_ns):
+                continue
+            if end_ts_ns is not None and int(rec["ts_min"]) > int(end_ts_ns):
+                continue
+            out.append(TickFileInfo(rec["symbol"], rec["day"], self.root / rec["path"], int(rec["count"]), int(rec["ts_min"]), int(rec["ts_max"])))
+        out.sort(key=lambda f: (f.day, f.symbol))
+        return out
+
+    def open(self, symbol: str, day: str) -> TickFile:
+        return TickFile(self.root / symbol / f"{day}.atk")
+
+    def iter_events(
+        self,
+        *,
+        symbols: Optional[Set[str]] = None,
+        start_ts_ns: Optional[int] = None,
+        end_ts_ns: Optional[int] = None,
+        types: Optional[Set[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield events day by day; symbols of the same day are merged by ts_ns."""
+        by_day: Dict[str, List[TickFileInfo]] = {}
+        for f in self.files(symbols=symbols, start_ts_ns=start_ts_ns, end_ts_ns=end_ts_ns):
+            by_day.setdefault(f.day, []).append(f)
+        for day in sorted(by_day):
+            tfs = [TickFile(f.path) for f in by_day[day]]
+            try:
+                its = [tf.iter_events(start_ts_ns, end_ts_ns, types=types) for tf in tfs]
+                if len(its) == 1:
+                    yield from its[0]
+                else:
+                    yield from heapq.merge(*its, key=lambda e: e["ts_ns"])
+            finally:
+                for tf in tfs:
+                    tf.close()
+
+    def source(self, **kwargs: Any):
+        """Callable source for `Replay(source=..., prenormalized=True)`."""
+        return lambda: self.iter_events(**kwargs)
+
+
+# -------------------- writer --------------------
+
+
+def _index_path(root: Path) -> Path:
+    return root / "index.json"
+
+
+def _load_index(root: Path) -> Dict[str, Dict[str, Any]]:
+    p = _index_path(root)
+    if not p.exists():
+        return {}
+    try:
+        data = json.loads(p.read_text(encoding="utf-8"))
+        return {rec["path"]: rec for rec in data.get("files", [])}
+    except Exception:
+        return {}
+
+
+class _Spool:
+    """Row-major temp file for one (symbol, day); transposed into columns on finalize."""
+
+    def __init__(self, path: Path, batch: int) -> None:
+        self.path = path
+        self.tmp = path.with_name(path.name + ".rows.tmp")
+        self.tmp.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = self.tmp.open("wb")
+        self._buf: List[tuple] = []
+        self._batch = batch
+        self.sources: List[str] = []
+        self._src_ix: Dict[str, int] = {}
+        if path.exists():
+            # extend an existing file (e.g. a second input covering the same day)
+            with TickFile(path) as tf:
+                for s in tf.sources:
+                    self._src(s)
+                self._fh.write(self._rows_from(tf).tobytes())
+
+    @staticmethod
+    def _rows_from(tf: TickFile) -> np.ndarray:
+        rows = np.empty(tf.count, dtype=ROW_DTYPE)
+        for name, _ in COLUMNS:
+            rows[name] = tf.columns[name]
+        return rows
+
+    def _src(self, s: str) -> int:
+        ix = self._src_ix.get(s)
+        if ix is None:
+            ix = len(self.sources)
+            self.sources.append(s)
+            self._src_ix[s] = ix
+        return ix
+
+    def add(self, evt: Mapping[str, Any]) -> None:
+        seq = evt.get("seq")
+        self._buf.append((
+            int(evt["ts_ns"]),
+            SEQ_NONE if seq is None else int(seq),
+            _TYPE_CODE[evt["type"]],
+            _SIDE_CODE.get(evt.get("side"), 0),
+            self._src(str(evt.get("source", "unknown"))),
+            _nan(evt.get("price")),
+            _nan(evt.get("size")),
+            _nan(evt.get("bid_px")),
+            _nan(evt.get("bid_sz")),
+            _nan(evt.get("ask_px")),
+            _nan(evt.get("ask_sz")),
+        ))
+        if len(self._buf) >= self._batch:
+            self._drain()
+
+    def _drain(self) -> None:
+        if self._buf:
+            self._fh.write(np.array(self._buf, dtype=ROW_DTYPE).tobytes())
+            self._buf.clear()
+
+    def finalize(self, symbol: str, day: str) -> Dict[str, Any]:
+        self._drain()
+        self._fh.close()
+        n = self.tmp.stat().st_size // ROW_DTYPE.itemsize
+        rows = np.memmap(self.tmp, dtype=ROW_DTYPE, mode="r", shape=(n,)) if n else np.empty(0, dtype=ROW_DTYPE)
+        order = np.argsort(rows["ts_ns"], kind="stable")
+
+        cols: List[Dict[str, Any]] = []
+        off = HEADER_SIZE
+        for name, dt in COLUMNS:
+            cols.append({"name": name, "dtype": dt, "offset": off})
+            off += -(-(n * np.dtype(dt).itemsize) // _ALIGN) * _ALIGN
+        ts = rows["ts_ns"]
+        header = {
+            "version": 1,
+            "symbol": symbol,
+            "day": day,
+            "count": int(n),
+            "ts_min": int(ts.min()) if n else 0,
+            "ts_max": int(ts.max()) if n else 0,
+            "sources": self.sources,
+            "columns": cols,
+        }
+        hb = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        if 12 + len(hb) > HEADER_SIZE:
+            raise ValueError("tick file header too large")
+
+        part = self.path.with_name(self.path.name + ".part")
+        with part.open("wb") as fh:
+            fh.write(MAGIC + len(hb).to_bytes(4, "little") + hb)
+            for c in cols:
+                fh.seek(c["offset"])
+                fh.write(np.ascontiguousarray(rows[c["name"]][order]).tobytes())
+            fh.truncate(off)
+            fh.flush()
+            os.fsync(fh.fileno())
+        del rows, ts
+        os.replace(part, self.path)
+        self.tmp.unlink(missing_ok=True)
+        return header
+
+
+class TickStoreWriter:
+    """Route normalized events to per-(symbol, day) spools; `close()` writes files + index."""
+
+    def __init__(self, root: str | Path, *, batch: int = 8192) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._batch = int(batch)
+        self._spools: Dict[Tuple[str, str], _Spool] = {}
+        self.appended = 0
+
+    def __enter__(self) -> "TickStoreWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def append(self, evt: Mapping[str, Any]) -> None:
+        key = (str(evt["symbol"]), day_of(int(evt["ts_ns"])))
+        sp = self._spools.get(key)
+        if sp is None:
+            sp = _Spool(self.root / key[0] / f"{key[1]}.atk", self._batch)
+            self._spools[key] = sp
+        sp.add(evt)
+        self.appended += 1
+
+    def extend(self, events: Iterable[Mapping[str, Any]]) -> int:
+        n = 0
+        for e in events:
+            self.append(e)
+            n += 1
+        return n
+
+    def close(self) -> List[Dict[str, Any]]:
+        index = _load_index(self.root)
+        written: List[Dict[str, Any]] = []
+        for (symbol, day), sp in sorted(self._spools.items()):
+            h = sp.finalize(symbol, day)
+            rel = f"{symbol}/{day}.atk"
+            index[rel] = {"symbol": symbol, "day": day, "path": rel, "count": h["count"], "ts_min": h["ts_min"], "ts_max": h["ts_max"]}
+            written.append(index[rel])
+        self._spools.clear()
+        tmp = _index_path(self.root).with_suffix(".json.tmp")
+        tmp.write_text(json.dumps({"files": sorted(index.values(), key=lambda r: r["path"])}, indent=1), encoding="utf-8")
+        os.replace(tmp, _index_path(self.root))
+        return written
+
+
+__all__ = [
+    "COLUMNS",
+    "ROW_DTYPE",
+    "TickFile",
+    "TickFileInfo",
+    "TickStore",
+    "TickStoreWriter",
+    "day_of",
+]
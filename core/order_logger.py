@@ -4,6 +4,7 @@ import gzip
 import io
 import json
 import os
+import queue
 import threading
 import time
 from dataclasses import dataclass, field
@@ -84,12 +85,205 @@ class _FileLock:
             self._mtx.release()
 
 
+@dataclass(frozen=True)
+class CommitPolicy:
+    """Group-commit durability policy for `_JsonlWriter`.
+
+    Lines are buffered in-process and committed (written, flushed and, if
+    `fsync`, fsynced) as one group when any trigger fires:
+    - `max_lines` lines are buffered (1 = commit every line, the legacy behaviour)
+    - the oldest buffered line is `max_delay_ms` old (checked on write and by a
+      background flusher when > 0)
+    - a line is written with `critical=True` (e.g. ORDER.* events)
+    """
+
+    max_lines: int = 1
+    max_delay_ms: float = 0.0
+    fsync: bool = True
+    critical_prefixes: Tuple[str, ...] = ("ORDER.",)
+
+    @classmethod
+    def from_cfg(cls, cfg: Dict[str, Any] | None = None, env: Dict[str, str] | None = None) -> "CommitPolicy":
+        """Build from cfg.logging.commit with env aliases AURORA_LOG_COMMIT_LINES / _MS / AURORA_LOG_FSYNC."""
+        env = os.environ if env is None else env
+        c = (((cfg or {}).get("logging") or {}).get("commit") or {})
+        d = cls()
+
+        def _pick(key: str, env_key: str, default: Any) -> Any:
+            v = c.get(key)
+            if v is None:
+                v = env.get(env_key)
+            return default if v is None else v
+
+        try:
+            max_lines = max(1, int(_pick("max_lines", "AURORA_LOG_COMMIT_LINES", d.max_lines)))
+        except Exception:
+            max_lines = d.max_lines
+        try:
+            max_delay_ms = max(0.0, float(_pick("max_delay_ms", "AURORA_LOG_COMMIT_MS", d.max_delay_ms)))
+        except Exception:
+            max_delay_ms = d.max_delay_ms
+        fs = _pick("fsync", "AURORA_LOG_FSYNC", d.fsync)
+        fsync = fs if isinstance(fs, bool) else str(fs).strip().lower() not in {"0", "false", "no", "off"}
+        prefixes = c.get("critical_prefixes")
+        critical = tuple(str(x) for x in prefixes) if isinstance(prefixes, (list, tuple)) else d.critical_prefixes
+        return cls(max_lines=max_lines, max_delay_ms=max_delay_ms, fsync=fsync, critical_prefixes=critical)
+
+    def is_critical(self, code: str | None) -> bool:
+        return bool(code) and any(str(code).startswith(p) for p in self.critical_prefixes)
+
+
+def _gzip_file(src: str, dst: str) -> int:
+    """Gzip `src` into `dst` and remove `src`. Returns input bytes.
+
+    Module-level so it can be shipped to a process pool.
+    """
+    n = 0
+    try:
+        with open(src, "rb") as fin, gzip.open(dst, "wb") as fout:
+            while True:
+                chunk = fin.read(1024 * 256)
+                if not chunk:
+                    break
+                fout.write(chunk)
+                n += len(chunk)
+    except BaseException:
+        # Leave the plain part in place and no truncated archive behind
+        try:
+            os.unlink(dst)
+        except Exception:
+            pass
+        raise
+    try:
+        os.unlink(src)
+    except Exception:
+        pass
+    return n
+
+
+class _RotationWorker:
+    """Background compression + retention purge for rotated JSONL parts.
+
+    A single daemon thread serializes jobs, so purges never race each other.
+    Parts of at least `process_min_bytes` are gzipped in a one-process pool to
+    keep the GIL free for writers; smaller parts are compressed on the thread.
+    Progress is kept in `stats` and can be mirrored to Prometheus via `set_metrics`.
+    """
+
+    def __init__(self, process_min_bytes: int = 64 * 1024 * 1024) -> None:
+        self.process_min_bytes = process_min_bytes
+        self._q: "queue.Queue[Tuple[Any, Path]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._pool: Any = None
+        self._cv = threading.Condition()
+        self._start_lock = threading.Lock()
+        self.stats: Dict[str, float] = {"pending": 0, "completed": 0, "failed": 0, "bytes_in": 0, "last_seconds": 0.0}
+        self._pending_gauge: Optional[Any] = None
+        self._done_counter: Optional[Any] = None
+        self._seconds_hist: Optional[Any] = None
+
+    def set_metrics(self, pending_gauge: object | None = None, done_counter: object | None = None, seconds_hist: object | None = None) -> None:
+        """Attach a Gauge (pending jobs), a Counter with label 'result' and a Histogram of job seconds."""
+        self._pending_gauge = pending_gauge
+        self._done_counter = done_counter
+        self._seconds_hist = seconds_hist
+
+    def submit(self, writer: Any, path: Path) -> None:
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="jsonl-rotation", daemon=True)
+                self._thread.start()
+        with self._cv:
+            self.stats["pending"] += 1
+        self._report()
+        self._q.put((writer, path))
+
+    def run_in_process(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if self._pool is None:
+            try:
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+                # spawn: never fork a process that is full of writer threads
+                self._pool = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+            except Exception:
+                self._pool = False
+        if not self._pool:
+            return fn(*args)
+        try:
+            return self._pool.submit(fn, *args).result()
+        except Exception:
+            # Broken pool (e.g. fork unavailable): compress inline from now on
+            self._pool = False
+            return fn(*args)
+
+    def wait_idle(self, timeout: float = 30.0) -> bool:
+        deadline = time.time() + timeout
+        with self._cv:
+            while self.stats["pending"] > 0:
+                left = deadline - time.time()
+                if left <= 0:
+                    return False
+                self._cv.wait(left)
+        return True
+
+    def _report(self) -> None:
+        try:
+            if self._pending_gauge is not None:
+                self._pending_gauge.set(self.stats["pending"])
+        except Exception:
+            pass
+
+    def _run(self) -> None:
+        while True:
+            writer, path = self._q.get()
+            t0 = time.perf_counter()
+            ok = True
+            size = 0
+            try:
+                size = path.stat().st_size if path.exists() else 0
+                writer._compress(path, pool_run=self.run_in_process if size >= self.process_min_bytes else None)
+            except Exception:
+                ok = False
+                size = 0
+            try:
+                writer._purge()
+            except Exception:
+                pass
+            dt = time.perf_counter() - t0
+            with self._cv:
+                self.stats["pending"] -= 1
+                self.stats["completed" if ok else "failed"] += 1
+                self.stats["bytes_in"] += size
+                self.stats["last_seconds"] = dt
+                self._cv.notify_all()
+            try:
+                if self._done_counter is not None:
+                    self._done_counter.labels(result="ok" if ok else "error").inc()
+                if self._seconds_hist is not None:
+                    self._seconds_hist.observe(dt)
+            except Exception:
+                pass
+            self._report()
+
+
+_ROTATION_WORKER = _RotationWorker()
+
+
+def rotation_worker() -> _RotationWorker:
+    """Process-wide rotation worker (for metrics wiring and shutdown waits)."""
+    return _ROTATION_WORKER
+
+
 class _JsonlWriter:
     """Append-only JSONL writer with daily+size rotation, gzip on roll, and retention cleanup.
 
-    - current file is plain JSONL at base_path
-    - on rotation, the file is renamed to base_path.YYYYMMDD.HHMMSS.partN.jsonl and gzipped to .gz
+    - current file is plain JSONL at base_path, kept open between commits
+    - lines are buffered and committed in groups according to `policy` (see CommitPolicy)
+    - on rotation, the file is renamed to base_path.YYYYMMDD.HHMMSS.partN.jsonl under the lock and
+      gzipped to .gz by the background rotation worker (see _RotationWorker)
     - retention_days controls deletion of .gz archives older than N days
+    - rotation is checked once per commit from an in-memory size counter; the inode is
+      compared so a file rotated by another process is reopened
     """
 
     def __init__(
@@ -100,6 +294,8 @@ class _JsonlWriter:
         compress: bool = True,
         retention_files: int | None = None,
         time_fn: Callable[[], float] | None = None,
+        policy: CommitPolicy | None = None,
+        background_rotation: bool = True,
     ) -> None:
         self.base_path = base_path
         self.max_bytes = max_bytes
@@ -112,22 +308,28 @@ class _JsonlWriter:
         self._lock = _FileLock(self.base_path.with_suffix(self.base_path.suffix + ".lock"))
         self._last_day = self._now_day()
         self._part_idx = 0
+        self.policy = policy or CommitPolicy()
+        self.background_rotation = background_rotation
         # Ensure current file exists
         self.base_path.touch(exist_ok=True)
+        # Buffered lines awaiting commit; guarded by _mtx (the file lock is only taken per commit)
+        self._mtx = threading.RLock()
+        self._buf: list[str] = []
+        self._buf_t0: float = 0.0
+        self._fh: Optional[io.TextIOWrapper] = None
+        self._ino: Optional[int] = None
+        self._size: int = 0
+        self._closed = False
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if self.policy.max_delay_ms > 0:
+            self._flusher = threading.Thread(target=self._flush_loop, name=f"jsonl-flush:{self.base_path.name}", daemon=True)
+            self._flusher.start()
 
     def _now_day(self) -> str:
         t = self._time()
         return time.strftime("%Y%m%d", time.gmtime(t))
 
-    def _should_rotate(self) -> bool:
-        try:
-            st = self.base_path.stat()
-            size_ok = st.st_size < self.max_bytes
-        except FileNotFoundError:
-            size_ok = True
-        day = self._now_day()
-        return (day != self._last_day) or (not size_ok)
-
     def _next_part_name(self) -> Path:
         ts = time.strftime("%Y%m%d.%H%M%S", time.gmtime(self._time()))
         self._part_idx += 1
@@ -135,23 +337,22 @@ class _JsonlWriter:
 
     def _gzip_and_purge(self, path: Path) -> None:
         try:
-            gz = path.with_suffix(path.suffix + ".gz")
-            if self.compress:
-                with path.open("rb") as fin, gzip.open(gz, "wb") as fout:
-                    while True:
-                        chunk = fin.read(1024 * 256)
-                        if not chunk:
-                            break
-                        fout.write(chunk)
-                try:
-                    path.unlink(missing_ok=True)
-                except Exception:
-                    pass
-            else:
-                # Keep plain .jsonl rotated file if compression disabled
-                gz = path
-        except Exception:
-            pass
+            self._compress(path)
+        finally:
+            self._purge()
+
+    def _compress(self, path: Path, pool_run: Callable[..., Any] | None = None) -> None:
+        """Gzip a rotated part; raises on failure (the plain part is kept)."""
+        # Keep plain .jsonl rotated file if compression disabled
+        if not self.compress:
+            return
+        gz = path.with_suffix(path.suffix + ".gz")
+        if pool_run is not None:
+            pool_run(_gzip_file, str(path), str(gz))
+        else:
+            _gzip_file(str(path), str(gz))
+
+    def _purge(self) -> None:
         # Purge old gz files
         try:
             cutoff = self._time() - self.retention_days * 86400
@@ -176,34 +377,114 @@ class _JsonlWriter:
         except Exception:
             pass
 
-    def write_line(self, line: str) -> None:
-        # The whole write + rotate is done under a process+file lock
-        with self._lock:
+    # --- handle management ---
+
+    def _open(self) -> None:
+        fh = self.base_path.open("a", encoding="utf-8")
+        st = os.fstat(fh.fileno())
+        self._fh, self._ino, self._size = fh, st.st_ino, st.st_size
+
+    def _close_fh(self) -> None:
+        fh, self._fh, self._ino = self._fh, None, None
+        if fh is not None:
             try:
-                if self._should_rotate():
-                    # rotate current base_path
-                    try:
-                        roll_to = self._next_part_name()
-                        if self.base_path.exists() and self.base_path.stat().st_size > 0:
-                            self.base_path.rename(roll_to)
-                            self._gzip_and_purge(roll_to)
-                    except Exception:
-                        # best-effort; reset day even if rename failed to avoid tight loop
-                        pass
-                    self._last_day = self._now_day()
-                # append atomically
-                with self.base_path.open("a", encoding="utf-8") as f:
-                    f.write(line)
-                    if not line.endswith("\n"):
-                        f.write("\n")
-                    f.flush()
+                fh.close()
+            except Exception:
+                pass
+
+    def _ensure_open(self) -> None:
+        # Reopen if another writer rotated/removed the file under us
+        if self._fh is not None:
+            try:
+                if os.stat(self.base_path).st_ino == self._ino:
+                    return
+            except FileNotFoundError:
+                pass
+            self._close_fh()
+        self._open()
+
+    def _rotate(self) -> None:
+        self._close_fh()
+        try:
+            roll_to = self._next_part_name()
+            if self.base_path.exists() and self.base_path.stat().st_size > 0:
+                # Only the rename happens under the lock; gzip + retention run on the rotation worker
+                self.base_path.rename(roll_to)
+                if self.background_rotation:
+                    _ROTATION_WORKER.submit(self, roll_to)
+                else:
+                    self._gzip_and_purge(roll_to)
+        except Exception:
+            # best-effort; reset day even if rename failed to avoid tight loop
+            pass
+        self._last_day = self._now_day()
+
+    # --- write path ---
+
+    def write_line(self, line: str, critical: bool = False) -> None:
+        if not line.endswith("\n"):
+            line += "\n"
+        with self._mtx:
+            if not self._buf:
+                self._buf_t0 = self._time()
+            self._buf.append(line)
+            if (
+                critical
+                or self._closed
+                or len(self._buf) >= self.policy.max_lines
+                or (self.policy.max_delay_ms > 0 and (self._time() - self._buf_t0) * 1000.0 >= self.policy.max_delay_ms)
+            ):
+                self._commit()
+
+    def flush(self) -> None:
+        """Commit any buffered lines now."""
+        with self._mtx:
+            if self._buf:
+                self._commit()
+
+    def close(self, timeout: float = 30.0) -> None:
+        self._stop.set()
+        with self._mtx:
+            if self._buf:
+                self._commit()
+            self._closed = True
+            self._close_fh()
+        # Let pending compression of our rotated parts finish
+        _ROTATION_WORKER.wait_idle(timeout)
+
+    def _flush_loop(self) -> None:
+        period = max(0.001, self.policy.max_delay_ms / 1000.0)
+        while not self._stop.wait(period):
+            try:
+                with self._mtx:
+                    if self._buf and (self._time() - self._buf_t0) * 1000.0 >= self.policy.max_delay_ms:
+                        self._commit()
+            except Exception:
+                pass
+
+    def _commit(self) -> None:
+        # Caller holds _mtx. The group write + rotate is done under the process+file lock.
+        lines, self._buf = self._buf, []
+        try:
+            with self._lock:
+                self._ensure_open()
+                if self._size >= self.max_bytes or self._now_day() != self._last_day:
+                    self._rotate()
+                    self._open()
+                data = "".join(lines)
+                fh = self._fh
+                assert fh is not None
+                fh.write(data)
+                fh.flush()
+                if self.policy.fsync:
                     try:
-                        os.fsync(f.fileno())
+                        os.fsync(fh.fileno())
                     except Exception:
                         pass
-            except Exception:
-                # best-effort logging only
-                pass
+                self._size += len(data.encode("utf-8")) if not data.isascii() else len(data)
+        except Exception:
+            # best-effort logging only
+            self._close_fh()
 
 
 @dataclass
@@ -215,13 +496,22 @@ class OrderLoggers:
     retention_days: int = 7
     compress: bool = True
     retention_files: int | None = None
+    policy: CommitPolicy | None = None
     _seen_cid_ts: _LRUSet = field(default_factory=lambda: _LRUSet(16384))
     _run_id: str = field(default_factory=lambda: time.strftime("%Y%m%d-%H%M%S", time.gmtime()))
 
     def __post_init__(self):
-        self._w_success = _JsonlWriter(self.success_path, self.max_bytes, self.retention_days, compress=self.compress, retention_files=self.retention_files)
-        self._w_failed = _JsonlWriter(self.failed_path, self.max_bytes, self.retention_days, compress=self.compress, retention_files=self.retention_files)
-        self._w_denied = _JsonlWriter(self.denied_path, self.max_bytes, self.retention_days, compress=self.compress, retention_files=self.retention_files)
+        self._w_success = _JsonlWriter(self.success_path, self.max_bytes, self.retention_days, compress=self.compress, retention_files=self.retention_files, policy=self.policy)
+        self._w_failed = _JsonlWriter(self.failed_path, self.max_bytes, self.retention_days, compress=self.compress, retention_files=self.retention_files, policy=self.policy)
+        self._w_denied = _JsonlWriter(self.denied_path, self.max_bytes, self.retention_days, compress=self.compress, retention_files=self.retention_files, policy=self.policy)
+
+    def flush(self) -> None:
+        for w in (self._w_success, self._w_failed, self._w_denied):
+            w.flush()
+
+    def close(self) -> None:
+        for w in (self._w_success, self._w_failed, self._w_denied):
+            w.close()
 
     # --- Schema mapping helpers ---
     @staticmethod
@@ -291,7 +581,7 @@ class OrderLoggers:
         }
         return rec
 
-    def _write(self, writer: _JsonlWriter, rec: Dict[str, Any]) -> None:
+    def _write(self, writer: _JsonlWriter, rec: Dict[str, Any], critical: bool = False) -> None:
         # Idempotency/dedup: cid + ts_ns if present
         cid = rec.get("cid")
         ts_ns = rec.get("ts_ns")
@@ -301,7 +591,7 @@ class OrderLoggers:
                 return
             self._seen_cid_ts.add(key)
         try:
-            writer.write_line(json.dumps(rec, ensure_ascii=False))
+            writer.write_line(json.dumps(rec, ensure_ascii=False), critical=critical)
         except Exception:
             pass
 
@@ -315,7 +605,8 @@ class OrderLoggers:
             if self._seen_cid_ts.contains(key):
                 return
             self._seen_cid_ts.add(key)
-        self._write(self._w_success, rec)
+        # Fills/rejects are committed immediately; denies may ride the group commit
+        self._write(self._w_success, rec, critical=True)
 
     def log_failed(self, **kwargs: Any) -> None:
         # Normalize reason into reason_code if missing
@@ -336,7 +627,7 @@ class OrderLoggers:
             if self._seen_cid_ts.contains(key):
                 return
             self._seen_cid_ts.add(key)
-        self._write(self._w_failed, rec)
+        self._write(self._w_failed, rec, critical=True)
 
     def log_denied(self, **kwargs: Any) -> None:
         # Prefer AURORA guard code if provided
@@ -18,7 +18,11 @@ We trigger a change when T_n ≥ h (threshold).
 
 Properties
 ----------
-- Windowed O(W) update per sample using cumulative sums
+- Window-limited update: ring of running prefix sums
+  (`core.utils.changepoint.WindowGLR`); the default `per_octave=0` scans every
+  split, `per_octave>0` opts into a geometric grid of candidate splits,
+  O(log W) per sample, whose max can fall below the exact statistic (re-derive
+  `threshold` before enabling it)
 - Robust to unknown μ via differenced means
 - Optionally estimate σ^2 from the window (pooled variance)
 
@@ -32,7 +36,9 @@ Usage
 """
 
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Optional, Tuple
+
+from core.utils.changepoint import WindowGLR
 
 
 @dataclass
@@ -52,6 +58,7 @@ class GLRMeanShift:
         sigma2: Optional[float] = None,
         reset_on_trigger: bool = True,
         min_samples: int = 30,
+        per_octave: int = 0,
     ) -> None:
         if window < 2:
             raise ValueError("window must be >= 2")
@@ -60,55 +67,22 @@ class GLRMeanShift:
         self.sigma2_known = sigma2 if (sigma2 is not None and sigma2 > 0.0) else None
         self.reset_on_trigger = bool(reset_on_trigger)
         self.min_samples = int(min_samples)
-        # buffers
-        self._x: List[float] = []
+        self._eng = WindowGLR(self.W, per_octave=per_octave, weight="glr", sigma2=self.sigma2_known, ddof=1)
         self._n = 0
 
     def reset(self) -> None:
-        self._x.clear()
+        self._eng.reset()
         self._n = 0
 
     @property
     def n(self) -> int:
         return self._n
 
-    def _window_sigma2(self) -> float:
-        # unbiased sample variance over current window (n-1 in denominator)
-        n = len(self._x)
-        if n <= 1:
-            return 1.0
-        mean = sum(self._x) / n
-        var = sum((xi - mean) ** 2 for xi in self._x) / max(1, n - 1)
-        return max(var, 1e-18)
-
     def _statistic(self) -> Tuple[float, Optional[int]]:
-        x = self._x
-        n = len(x)
-        if n < 2:
-            return 0.0, None
-        # prefix sums for O(n) scan
-        S = [0.0] * (n + 1)
-        for i in range(1, n + 1):
-            S[i] = S[i - 1] + x[i - 1]
-        sigma2 = self.sigma2_known if self.sigma2_known is not None else self._window_sigma2()
-        best = 0.0
-        k_hat: Optional[int] = None
-        for k in range(1, n):
-            n1 = k
-            n2 = n - k
-            m1 = (S[k] - S[0]) / n1
-            m2 = (S[n] - S[k]) / n2
-            stat = (n1 * n2 / n) * ((m1 - m2) ** 2) / sigma2
-            if stat > best:
-                best = stat
-                k_hat = k
-        return best, k_hat
+        return self._eng.stat()
 
     def update(self, x_new: float) -> GLRResult:
-        self._x.append(float(x_new))
-        if len(self._x) > self.W:
-            # drop oldest
-            self._x.pop(0)
+        self._eng.push(x_new)
         self._n += 1
 
         # compute statistic over current window
@@ -35,6 +35,7 @@ from dataclasses import dataclass
 from typing import Deque, List, Optional, Tuple
 
 from core.config.loader import get_config, ConfigError
+from core.utils.quantiles import SlidingQuantile, sketch_enabled
 
 
 def _quantile(xs: List[float], q: float) -> float:
@@ -67,6 +68,7 @@ class RegimeManager:
         grind_q: Optional[float] = None,
         window: int = 2000,
         min_dwell: int = 250,
+        sketch: Optional[bool] = None,
     ) -> None:
         # load defaults from config if not provided
         if trend_q is None or grind_q is None:
@@ -89,6 +91,8 @@ class RegimeManager:
 
         self._rets: Deque[float] = deque(maxlen=self.W)
         self._absrets: Deque[float] = deque(maxlen=self.W)
+        # Exact sliding order statistics of |r| (AURORA_QUANTILE_SKETCH=0: sort per update)
+        self._abs_sq: Optional[SlidingQuantile] = SlidingQuantile(maxlen=self.W) if sketch_enabled(sketch) else None
         self._n = 0
         self._ticks_since_change = 0
         self._regime: str = "grind"  # conservative start
@@ -96,6 +100,8 @@ class RegimeManager:
     def reset(self) -> None:
         self._rets.clear()
         self._absrets.clear()
+        if self._abs_sq is not None:
+            self._abs_sq.clear()
         self._n = 0
         self._ticks_since_change = 0
         self._regime = "grind"
@@ -104,9 +110,15 @@ class RegimeManager:
         # robust volatility proxy: median(|r_t|) over window
         if not self._absrets:
             return 0.0
+        if self._abs_sq is not None:
+            return self._abs_sq.quantile(0.5)
         return _quantile(list(self._absrets), 0.5)
 
     def _thresholds(self) -> Tuple[float, float]:
+        if self._abs_sq is not None:
+            if not self._absrets:
+                return 0.0, 0.0
+            return self._abs_sq.quantile(self.q_lo), self._abs_sq.quantile(self.q_hi)
         arr = list(self._absrets)
         if not arr:
             return 0.0, 0.0
@@ -116,6 +128,8 @@ class RegimeManager:
         r = float(ret)
         self._rets.append(r)
         self._absrets.append(abs(r))
+        if self._abs_sq is not None:
+            self._abs_sq.add(abs(r))
         self._n += 1
         self._ticks_since_change += 1
 
@@ -8,7 +8,8 @@ Run self-tests: `python repo/core/risk/cvar.py`
 
 Implements (per project structure):
 - Empirical VaR/CVaR from samples (loss domain or PnL domain)
-- Rolling (streaming) VaR/CVaR with O(log n) updates (sorted multiset)
+- Rolling (streaming) VaR/CVaR with O(log n) updates and queries
+  (Fenwick-indexed `SlidingQuantile`), multi-alpha in one call
 - Portfolio CVaR from scenario returns: L = −R·w; CVaRα(L)
 - CVaR-minimizing weights via projected subgradient (simplex for long-only) or
   L1-ball projection for leverage-capped long/short
@@ -17,13 +18,13 @@ No external dependencies; NumPy optional.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
 from typing import Deque, Dict, Iterable, List, Optional, Sequence, Tuple
-import bisect
 import math
 import random
 from collections import deque
 
+from core.utils.quantiles import SlidingQuantile
+
 try:
     import numpy as np  # type: ignore
 except Exception:  # pragma: no cover
@@ -126,59 +127,58 @@ def var_with_ci(losses: Sequence[float], alpha: float = 0.99, *, method: str = "
 # Rolling (streaming) VaR / CVaR
 # =============================
 
-@dataclass
-class _Item:
-    loss: float
-    uid: int
-
-
 class RollingCVaR:
-    """Rolling VaR/CVaR over the last N samples using a sorted multiset.
+    """Rolling VaR/CVaR over the last N samples.
 
-    Operations: update(loss) in O(log N); metrics(): (VaRα, CVaRα).
+    Losses are kept in a Fenwick-indexed blocked sorted list
+    (`SlidingQuantile(tail_sums=True)`, window managed here):
+    update(loss) and metrics() are O(log N) (plus a bounded in-block scan),
+    independent of the window size. `metrics_multi(alphas)` answers several
+    confidence levels from the same window in one call.
     """
 
     def __init__(self, window_n: int = 2000, alpha: float = 0.99) -> None:
         self.N = int(window_n)
         self.alpha = float(alpha)
-        self.q: Deque[_Item] = deque()
-        self.sorted: List[Tuple[float, int]] = []  # (loss, uid)
-        self._uid = 0
+        self.q: Deque[float] = deque()
+        self._index = SlidingQuantile(block=64, tail_sums=True, refresh=max(1024, 4 * self.N))
         self._sum = 0.0
 
+    @property
+    def sorted(self) -> List[float]:
+        """Sorted losses in the window (O(N) copy; diagnostics only)."""
+        return self._index.values()
+
     def update(self, loss: float) -> None:
         l = max(0.0, float(loss))
-        it = _Item(l, self._uid)
-        self._uid += 1
-        # append to deque
-        self.q.append(it)
+        self.q.append(l)
         self._sum += l
-        # insert into sorted
-        bisect.insort(self.sorted, (it.loss, it.uid))
+        self._index.add(l)
         # evict
         while len(self.q) > self.N:
             old = self.q.popleft()
-            self._sum -= old.loss
-            k = bisect.bisect_left(self.sorted, (old.loss, old.uid))
-            if 0 <= k < len(self.sorted) and self.sorted[k] == (old.loss, old.uid):
-                self.sorted.pop(k)
-            else:  # fallback linear search (should rarely happen)
-                for j in range(max(0, k - 3), min(len(self.sorted), k + 4)):
-                    if self.sorted[j] == (old.loss, old.uid):
-                        self.sorted.pop(j)
-                        break
+            self._sum -= old
+            self._index.remove(old)
+
+    def _at(self, alpha: float) -> Tuple[float, float]:
+        n = len(self._index)
+        a = min(1.0, max(0.0, float(alpha)))
+        k = int(math.ceil(a * n) - 1)
+        k = max(0, min(n - 1, k))
+        var, s = self._index.tail(k)
+        # float tail sum can land a hair under VaR when the tail is all ties
+        return float(var), max(float(var), s / (n - k))
 
     def metrics(self) -> Tuple[float, float]:
-        if not self.sorted:
+        if not len(self._index):
             return 0.0, 0.0
-        var = _quantile([v for (v, _) in self.sorted], self.alpha)
-        # tail sum via index
-        n = len(self.sorted)
-        k = int(math.ceil(self.alpha * n) - 1)
-        k = max(0, min(n - 1, k))
-        tail_vals = [self.sorted[i][0] for i in range(k, n)]
-        cvar = sum(tail_vals) / max(1, len(tail_vals))
-        return var, cvar
+        return self._at(self.alpha)
+
+    def metrics_multi(self, alphas: Iterable[float]) -> Dict[float, Tuple[float, float]]:
+        """{alpha: (VaRα, CVaRα)} for every requested alpha over the current window."""
+        if not len(self._index):
+            return {float(a): (0.0, 0.0) for a in alphas}
+        return {float(a): self._at(a) for a in alphas}
 
 
 # =============================
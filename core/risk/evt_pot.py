@@ -12,8 +12,12 @@ Implements (per project structure):
 - GPD parameter fit on exceedances X−u via method-of-moments (MoM) with guards,
   optional quasi-Newton refinement (stable by default off)
 - Tail quantile (VaR_p) and tail ES (CVaR_p) using POT formulas
-- Bootstrap CI for VaR_p (percentile CI)
-- RollingPOT windowed estimator with on-demand report()
+- Bootstrap CI for VaR_p (percentile CI); with NumPy the resamples are drawn as
+  (rows × n_exc) index matrices in fixed-size chunks, optionally fanned out
+  over a process pool
+- RollingPOT windowed estimator: sorted window + running excess moments, so
+  report() is O(1); add() locates by bisection in O(log n) but the sorted-list
+  insert/delete shifts O(n) elements (a memmove, fast for windows of a few 1e4)
 
 No external dependencies; NumPy optional.
 
@@ -25,7 +29,7 @@ This module internally applies max(0, x) but explicit convention ensures clarity
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
 import bisect
 import math
 import random
@@ -40,6 +44,13 @@ except Exception:  # pragma: no cover
 # Utilities
 # =============================
 
+def _spawn_context() -> Any:
+    # spawn: bootstrap pools run inside threaded hosts, where fork can deadlock
+    import multiprocessing
+
+    return multiprocessing.get_context("spawn")
+
+
 def _quantile(values: Sequence[float], q: float) -> float:
     if not values:
         return 0.0
@@ -50,6 +61,13 @@ def _quantile(values: Sequence[float], q: float) -> float:
     return xs[k]
 
 
+def _quantile_index(n: int, q: float) -> int:
+    """Index of the order statistic `_quantile` returns for n sorted values."""
+    q = min(1.0, max(0.0, float(q)))
+    k = int(math.ceil(q * n) - 1)
+    return max(0, min(n - 1, k))
+
+
 def _mean_var(xs: Sequence[float]) -> Tuple[float, float]:
     n = len(xs)
     if n == 0:
@@ -88,6 +106,10 @@ def fit_gpd_mom(excesses: Sequence[float], *, clip_xi: Tuple[float, float] = (-0
     if not x:
         return 0.0, 1e-9
     mu, var = _mean_var(x)
+    return _gpd_from_mean_var(mu, var, clip_xi)
+
+
+def _gpd_from_mean_var(mu: float, var: float, clip_xi: Tuple[float, float] = (-0.25, 0.9)) -> Tuple[float, float]:
     if var <= 0.0 or var <= mu * mu:
         xi = 0.0
         beta = max(1e-9, mu)
@@ -141,18 +163,102 @@ def pot_var_es(est: GPDEstimate, p: float) -> Tuple[float, float]:
     return var_p, es_p
 
 
-def pot_var_bootstrap(losses: Sequence[float], p: float, *, q_u: float = 0.95, n_boot: int = 300, seed: int = 7, ci: Tuple[float, float] = (0.05, 0.95)) -> Dict[str, float]:
+# Resample cells per chunk (rows × n_exc); chunking is fixed by n_exc, so results
+# depend on the seed only, not on how chunks are spread over workers
+_BOOT_CELLS = 1 << 20
+_BOOT_MAX_ROWS = 256
+
+
+def _boot_var_chunk(exc: Any, rows: int, seed: Any, u: float, zeta: float, p: float) -> Any:
+    """VaR_p for `rows` bootstrap resamples of `exc` (NumPy; module-level for pickling)."""
+    x = np.asarray(exc, dtype=np.float64)
+    rng = np.random.default_rng(seed)
+    b = x[rng.integers(0, x.size, size=(int(rows), x.size))]
+    mu = b.mean(axis=1)
+    var = b.var(axis=1, ddof=1)
+    expo = (var <= 0.0) | (var <= mu * mu)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        xi = np.clip(0.5 * (1.0 - (mu * mu) / var), -0.25, 0.9)
+    xi = np.where(expo, 0.0, xi)
+    beta = np.maximum(1e-9, np.where(expo, mu, mu * (1.0 - xi)))
+    # pot_var_es, vectorized
+    p = min(1.0 - 1e-12, max(0.0, float(p)))
+    ratio = max(1e-12, float(zeta)) / max(1e-12, 1.0 - p)
+    small = np.abs(xi) < 1e-12
+    xi_safe = np.where(small, 1.0, xi)
+    y = np.where(small, beta * math.log(ratio), (beta / xi_safe) * (ratio ** xi_safe - 1.0))
+    return u + np.maximum(0.0, y)
+
+
+def _map_chunks(fn: Any, chunks: List[Tuple[Any, ...]], executor: Any = None) -> List[Any]:
+    """Map fn over chunks on `executor` (concurrent.futures); inline if absent or broken."""
+    if executor is not None and len(chunks) > 1:
+        try:
+            futs = [executor.submit(fn, *c) for c in chunks]
+            return [f.result() for f in futs]
+        except Exception:
+            pass
+    return [fn(*c) for c in chunks]
+
+
+def _bootstrap_var_ci(
+    exc: Sequence[float],
+    u: float,
+    zeta: float,
+    p: float,
+    *,
+    n_boot: int,
+    seed: int,
+    ci: Tuple[float, float],
+    executor: Any = None,
+) -> Tuple[float, float]:
+    """Percentile CI of VaR_p over exceedance resamples with u and ζ held fixed."""
+    n_exc = len(exc)
+    n_boot = int(n_boot)
+    if np is not None:
+        per = max(1, min(_BOOT_MAX_ROWS, _BOOT_CELLS // max(1, n_exc)))
+        sizes = [min(per, n_boot - i) for i in range(0, n_boot, per)]
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        x = np.asarray(exc, dtype=np.float64)
+        parts = _map_chunks(_boot_var_chunk, [(x, r, sd, u, zeta, p) for r, sd in zip(sizes, seeds)], executor)
+        vals = np.sort(np.concatenate(parts)) if parts else np.zeros(0)
+        if vals.size == 0:
+            return 0.0, 0.0
+        return float(vals[_quantile_index(vals.size, ci[0])]), float(vals[_quantile_index(vals.size, ci[1])])
+    rnd = random.Random(seed)
+    out: List[float] = []
+    for _ in range(n_boot):
+        bs = [exc[rnd.randrange(0, n_exc)] for __ in range(n_exc)]
+        xi, beta = fit_gpd_mom(bs)
+        v, _ = pot_var_es(GPDEstimate(xi, beta, u, zeta, n_exc, 0), p)
+        out.append(v)
+    return _quantile(out, ci[0]), _quantile(out, ci[1])
+
+
+def pot_var_bootstrap(
+    losses: Sequence[float],
+    p: float,
+    *,
+    q_u: float = 0.95,
+    n_boot: int = 300,
+    seed: int = 7,
+    ci: Tuple[float, float] = (0.05, 0.95),
+    workers: int = 1,
+    executor: Any = None,
+) -> Dict[str, float]:
     """Bootstrap percentile CI for VaR_p via resampling exceedances.
 
     Keeps the same threshold u and tail fraction ζ̂; resamples exceedances with
-    replacement, re-fits (MoM), recomputes VaR_p each time.
+    replacement, re-fits (MoM), recomputes VaR_p each time. With NumPy all
+    resamples of a chunk are fitted at once; chunks run on `executor` if given,
+    else on a temporary process pool when `workers` > 1.
     """
-    rnd = random.Random(seed)
     L = [max(0.0, float(z)) for z in losses]
     if not L:
         return {"var": 0.0, "lo": 0.0, "hi": 0.0, "u": 0.0, "zeta": 0.0}
     u = select_threshold(L, q=q_u)
-    exc = [x - u for x in L if x > u]
+    # sorted: resamples depend on the window contents, not arrival order (as in RollingPOT)
+    exc = sorted(x - u for x in L if x > u)
     n_total = len(L)
     n_exc = len(exc)
     zeta = 0.0 if n_total == 0 else n_exc / n_total
@@ -161,16 +267,13 @@ def pot_var_bootstrap(losses: Sequence[float], p: float, *, q_u: float = 0.95, n
     var_p, _ = pot_var_es(est, p)
     if n_exc < 5:
         return {"var": var_p, "lo": var_p, "hi": var_p, "u": u, "zeta": zeta}
-    vals: List[float] = []
-    for _ in range(int(n_boot)):
-        bs = [exc[rnd.randrange(0, n_exc)] for __ in range(n_exc)]
-        xi, beta = fit_gpd_mom(bs)
-        est_b = GPDEstimate(xi, beta, u, zeta, n_exc, n_total)
-        v, _ = pot_var_es(est_b, p)
-        vals.append(v)
-    lo_q, hi_q = ci
-    lo = _quantile(vals, lo_q)
-    hi = _quantile(vals, hi_q)
+    kw = dict(n_boot=n_boot, seed=seed, ci=ci)
+    if executor is None and workers > 1 and np is not None:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=int(workers), mp_context=_spawn_context()) as pool:
+            lo, hi = _bootstrap_var_ci(exc, u, zeta, p, executor=pool, **kw)
+    else:
+        lo, hi = _bootstrap_var_ci(exc, u, zeta, p, executor=executor, **kw)
     return {"var": var_p, "lo": lo, "hi": hi, "u": u, "zeta": zeta}
 
 
@@ -179,21 +282,90 @@ def pot_var_bootstrap(losses: Sequence[float], p: float, *, q_u: float = 0.95, n
 # =============================
 
 class RollingPOT:
-    """Maintain a window of recent losses and provide POT tail metrics on demand."""
-    def __init__(self, window_n: int = 5000, q_u: float = 0.95) -> None:
+    """Maintain a window of recent losses and provide POT tail metrics on demand.
+
+    Besides the arrival-order deque, the window is kept sorted, so the threshold
+    u = Q_q(window) is one index lookup. Count and the first two moments of the
+    values above u are updated on every add/evict and, when u moves, by the few
+    values between the old and new u; sums are taken relative to a reference
+    near u (reset on a full recompute every `window_n` adds) to avoid
+    cancellation. report() then fits the GPD by MoM from these moments in O(1).
+
+    `workers` > 1 runs bootstrap chunks on a lazily created process pool;
+    call close() to shut it down.
+    """
+    def __init__(self, window_n: int = 5000, q_u: float = 0.95, *, workers: int = 1) -> None:
         self.N = int(window_n)
         self.q_u = float(q_u)
         self.q: Deque[float] = deque()
+        self.workers = int(workers)
+        self._pool: Any = None
+        self._xs: List[float] = []  # window, sorted
+        self._u = 0.0
+        self._k = 0      # values > u
+        self._c = 0.0    # moment reference
+        self._s1 = 0.0   # Σ(x − c) over values > u
+        self._s2 = 0.0   # Σ(x − c)² over values > u
+        self._adds = 0
+
+    def _acc(self, x: float, sign: int) -> None:
+        d = x - self._c
+        self._k += sign
+        self._s1 += sign * d
+        self._s2 += sign * d * d
+
+    def _retarget(self) -> None:
+        xs = self._xs
+        u_new = xs[_quantile_index(len(xs), self.q_u)] if xs else 0.0
+        u = self._u
+        if u_new > u:
+            for v in xs[bisect.bisect_right(xs, u):bisect.bisect_right(xs, u_new)]:
+                self._acc(v, -1)
+        elif u_new < u:
+            for v in xs[bisect.bisect_right(xs, u_new):bisect.bisect_right(xs, u)]:
+                self._acc(v, +1)
+        self._u = u_new
+
+    def _resync(self) -> None:
+        # Exact recompute with the reference moved to the current u
+        self._c = self._u
+        self._k = 0
+        self._s1 = self._s2 = 0.0
+        for v in self._xs[bisect.bisect_right(self._xs, self._u):]:
+            self._acc(v, +1)
 
     def add(self, loss: float) -> None:
         x = max(0.0, float(loss))
         self.q.append(x)
+        bisect.insort(self._xs, x)
+        if x > self._u:
+            self._acc(x, +1)
         while len(self.q) > self.N:
-            self.q.popleft()
-
-    def report(self, p: float = 0.99, with_bootstrap: bool = False, n_boot: int = 200) -> Dict[str, float]:
-        L = list(self.q)
-        est = pot_fit(L, q_u=self.q_u)
+            y = self.q.popleft()
+            del self._xs[bisect.bisect_left(self._xs, y)]
+            if y > self._u:
+                self._acc(y, -1)
+        self._retarget()
+        self._adds += 1
+        if self._adds >= self.N:
+            self._adds = 0
+            self._resync()
+
+    def estimate(self) -> GPDEstimate:
+        """GPD fit of the current window (same as pot_fit(window, q_u)) in O(1)."""
+        n, k, u = len(self._xs), self._k, self._u
+        if k == 0:
+            return GPDEstimate(0.0, 1e-9, u, 0.0, 0, n)
+        d = u - self._c
+        e1 = self._s1 - k * d
+        e2 = self._s2 - 2.0 * d * self._s1 + k * d * d
+        mu = e1 / k
+        var = max(0.0, e2 - e1 * e1 / k) / max(1, k - 1)
+        xi, beta = _gpd_from_mean_var(mu, var)
+        return GPDEstimate(xi=xi, beta=beta, u=u, zeta=k / n, n_exc=k, n_total=n)
+
+    def report(self, p: float = 0.99, with_bootstrap: bool = False, n_boot: int = 200, seed: int = 7) -> Dict[str, float]:
+        est = self.estimate()
         var_p, es_p = pot_var_es(est, p)
         out = {
             "method": "POT",
@@ -209,10 +381,30 @@ class RollingPOT:
             "es_p": es_p,
         }
         if with_bootstrap:
-            ci = pot_var_bootstrap(L, p, q_u=self.q_u, n_boot=n_boot)
-            out.update({"var_lo": ci["lo"], "var_hi": ci["hi"]})
+            lo = hi = var_p
+            if est.n_exc >= 5:
+                exc = [v - est.u for v in self._xs[len(self._xs) - est.n_exc:]]
+                lo, hi = _bootstrap_var_ci(
+                    exc, est.u, est.zeta, p, n_boot=n_boot, seed=seed, ci=(0.05, 0.95), executor=self._executor()
+                )
+            out.update({"var_lo": lo, "var_hi": hi})
         return out
 
+    def _executor(self) -> Any:
+        if self.workers > 1 and np is not None and self._pool is None:
+            try:
+                from concurrent.futures import ProcessPoolExecutor
+                self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=_spawn_context())
+            except Exception:
+                self._pool = False
+        return self._pool or None
+
+    def close(self) -> None:
+        """Shut down the bootstrap worker pool, if one was started."""
+        if self._pool:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
+
 
 # =============================
 # Self-tests
@@ -10,11 +10,16 @@ Implement IsotonicCalibrator with fit/predict_p/e_pi_bps.
 """
 
 from dataclasses import dataclass
-from typing import Protocol, Optional, Any
+import math
+import os
+from pathlib import Path
+from typing import Protocol, Optional, Any, Union
 
 import numpy as np
 import structlog
 
+from core.calibration.lut import IsotonicLUT
+
 try:  # optional
     from sklearn.isotonic import IsotonicRegression
 except Exception:  # pragma: no cover - sklearn may be missing
@@ -43,6 +48,7 @@ class CalibOutput:
 class Calibrator(Protocol):
     def fit(self, scores: np.ndarray, y: np.ndarray) -> None: ...
     def predict_p(self, score: float) -> float: ...
+    def predict_p_batch(self, scores: np.ndarray) -> np.ndarray: ...
     def e_pi_bps(self, ci: CalibInput) -> CalibOutput: ...
 
 
@@ -50,13 +56,28 @@ class IsotonicCalibrator:
     """Isotonic regression calibrator with Platt fallback.
 
     If scikit-learn is unavailable, falls back to a sigmoid with k=2.0.
+
+    After `fit` the isotonic map is compiled into an `IsotonicLUT` (breakpoint
+    arrays), so `predict_p`/`predict_p_batch` are a bisect / `np.interp` lookup
+    rather than a per-call sklearn `predict`. The table can be saved and loaded
+    without sklearn. `calibrator.entry` is logged at debug level for one in
+    `log_every` calls of `e_pi_bps` (default: env `AURORA_CALIB_LOG_EVERY`,
+    else 1000; 0 disables).
     """
 
-    def __init__(self) -> None:
+    def __init__(self, *, log_every: Optional[int] = None, table: Optional[IsotonicLUT] = None) -> None:
         self._iso: Optional[Any] = IsotonicRegression(out_of_bounds="clip") if IsotonicRegression else None
         self._platt_k: float = 2.0
         # If we use isotonic, we'll fit on domain [-1,1]
         self._fitted: bool = False
+        self._lut: Optional[IsotonicLUT] = table
+        if log_every is None:
+            try:
+                log_every = int(os.getenv("AURORA_CALIB_LOG_EVERY", "1000"))
+            except ValueError:
+                log_every = 1000
+        self.log_every = max(0, int(log_every))
+        self._calls = 0
 
     def fit(self, scores: np.ndarray, y: np.ndarray) -> None:
         scores = np.asarray(scores, dtype=float)
@@ -64,6 +85,7 @@ class IsotonicCalibrator:
         mask = np.isfinite(scores) & np.isfinite(y)
         scores = scores[mask]
         y = y[mask]
+        self._lut = None
         if scores.size == 0:
             self._fitted = False
             return
@@ -71,23 +93,64 @@ class IsotonicCalibrator:
             xs = np.clip(scores, -1.0, 1.0)
             ys = np.clip(y, 0.0, 1.0)
             self._iso.fit(xs, ys)
+            self._lut = IsotonicLUT.from_knots(
+                self._iso.X_thresholds_, np.clip(self._iso.y_thresholds_, 0.0, 1.0), meta={"domain": [-1.0, 1.0]}
+            )
             self._fitted = True
         else:
             # Platt fallback has no fit (fixed slope), could estimate k but keep simple
             self._fitted = True
 
+    @property
+    def table(self) -> Optional[IsotonicLUT]:
+        """Compiled isotonic table (None until fitted with sklearn or loaded)."""
+        return self._lut
+
+    def save(self, path: Union[str, Path]) -> Path:
+        if self._lut is None:
+            raise ValueError("no compiled isotonic table to save (fit with scikit-learn first)")
+        return self._lut.save(path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path], **kwargs: Any) -> "IsotonicCalibrator":
+        """Restore a saved table; prediction needs neither sklearn nor a refit."""
+        return cls(table=IsotonicLUT.load(path), **kwargs)
+
     def predict_p(self, score: float) -> float:
-        if not self._fitted:
-            # Fallback sigmoid
-            p = 1.0 / (1.0 + np.exp(-self._platt_k * float(score)))
-            return float(np.clip(p, 0.0, 1.0))
-        if self._iso is not None:
-            xs = float(np.clip(score, -1.0, 1.0))
-            p = float(self._iso.predict([xs])[0])
-            return float(np.clip(p, 0.0, 1.0))
-        # Fallback
-        p = 1.0 / (1.0 + np.exp(-self._platt_k * float(score)))
-        return float(np.clip(p, 0.0, 1.0))
+        lut = self._lut
+        if lut is not None:
+            # knots lie in [-1, 1] and the table clamps outside them
+            return lut(float(score))
+        # Fallback sigmoid (unfitted, or fitted without sklearn)
+        z = self._platt_k * float(score)
+        if z >= 0:
+            return 1.0 / (1.0 + math.exp(-z))
+        ez = math.exp(z)
+        return ez / (1.0 + ez)
+
+    def predict_p_batch(self, scores: np.ndarray) -> np.ndarray:
+        """Vectorized `predict_p` over an array of scores."""
+        s = np.asarray(scores, dtype=float)
+        if self._lut is not None:
+            p = self._lut.batch(s)
+        else:
+            p = 1.0 / (1.0 + np.exp(-self._platt_k * s))
+        return np.clip(p, 0.0, 1.0)
+
+    def e_pi_bps_batch(
+        self,
+        score: np.ndarray,
+        a_bps: np.ndarray,
+        b_bps: np.ndarray,
+        fees_bps: np.ndarray,
+        slip_bps: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Vectorized `e_pi_bps`. Returns (p_tp, e_pi_bps) arrays; no per-row logging."""
+        p = self.predict_p_batch(score)
+        a = np.asarray(a_bps, dtype=float)
+        b = np.asarray(b_bps, dtype=float)
+        e_pi = p * b - (1.0 - p) * a - (np.asarray(fees_bps, dtype=float) + np.asarray(slip_bps, dtype=float))
+        return p, e_pi
 
     def e_pi_bps(self, ci: CalibInput) -> CalibOutput:
         p = self.predict_p(ci.score)
@@ -95,15 +158,18 @@ class IsotonicCalibrator:
         b = float(ci.b_bps)
         fees_slip = float(ci.fees_bps + ci.slip_bps)
         e_pi = p * b - (1.0 - p) * a - fees_slip
-        logger.info(
-            "calibrator.entry",
-            score=ci.score,
-            p_tp=p,
-            e_pi_bps=e_pi,
-            a_bps=a,
-            b_bps=b,
-            fees_bps=float(ci.fees_bps),
-            slip_bps=float(ci.slip_bps),
-            regime=ci.regime,
-        )
-        return CalibOutput(p_tp=float(np.clip(p, 0.0, 1.0)), e_pi_bps=float(e_pi))
+        self._calls += 1
+        if self.log_every and self._calls % self.log_every == 1 % self.log_every:
+            logger.debug(
+                "calibrator.entry",
+                score=ci.score,
+                p_tp=p,
+                e_pi_bps=e_pi,
+                a_bps=a,
+                b_bps=b,
+                fees_bps=float(ci.fees_bps),
+                slip_bps=float(ci.slip_bps),
+                regime=ci.regime,
+                sampled_every=self.log_every,
+            )
+        return CalibOutput(p_tp=min(1.0, max(0.0, p)), e_pi_bps=float(e_pi))
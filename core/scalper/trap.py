@@ -43,6 +43,8 @@ from typing import Iterable, Optional, Tuple, List, Literal
 
 import numpy as np
 
+from core.utils.quantiles import SlidingQuantile, sketch_enabled
+
 
 @dataclass(frozen=True)
 class TrapMetrics:
@@ -55,23 +57,30 @@ class TrapMetrics:
 
 
 class RollingPercentiles:
-    """Simple rolling percentile estimator backed by a finite buffer.
+    """Rolling percentile estimator over the last `maxlen` values.
 
-    This is a pragmatic implementation for tests and small windows. For production
-    a streaming estimator (e.g., P²/TDigest) is recommended.
+    By default backed by an exact `SlidingQuantile` window (no sort per call);
+    `sketch=False` (or AURORA_QUANTILE_SKETCH=0) keeps the legacy buffer +
+    `np.percentile` path. Both return identical values.
     """
 
-    def __init__(self, maxlen: int = 240) -> None:
+    def __init__(self, maxlen: int = 240, sketch: bool | None = None) -> None:
         self._buf: list[float] = []
         self._maxlen = maxlen
+        self._sq = SlidingQuantile(maxlen=maxlen) if sketch_enabled(sketch) else None
 
     def add(self, x: float) -> None:
+        if self._sq is not None:
+            self._sq.add(x)
+            return
         self._buf.append(float(x))
         if len(self._buf) > self._maxlen:
             # drop oldest
             self._buf.pop(0)
 
     def percentiles(self, pcts: Iterable[float]) -> list[float]:
+        if self._sq is not None:
+            return [self._sq.percentile(p) for p in pcts]
         if not self._buf:
             return [0.0 for _ in pcts]
         arr = np.array(self._buf, dtype=float)
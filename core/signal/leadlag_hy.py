@@ -13,15 +13,18 @@ Implements (§ R1/Road_map alignment):
 - Lead–lag correlation scan via HY with timestamp shift grid (y shifted by τ)
 - Rolling betas: β_{x|y} = Cov(x,y)/Var(y), β_{y|x} = Cov(x,y)/Var(x)
 - Minimal memory (deques), recompute-on-demand inside query for correctness
+- With NumPy: per-symbol return arrays cached incrementally on ingestion, HY
+  covariance for a whole lag grid in one vectorized sweep (`hy_cov_lags`), and
+  a universe-wide lead–lag matrix fanned out over a process pool
 
-NumPy is optional and not required.
+NumPy is optional and not required (pure-Python fallback per lag).
 """
 from __future__ import annotations
 
 from collections import deque
 from dataclasses import dataclass
 from enum import Enum
-from typing import Deque, Dict, cast, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Deque, Dict, cast, Iterable, List, Optional, Sequence, Tuple
 import math
 import random
 import time
@@ -67,6 +70,130 @@ class _PricePoint:
     logp: float
 
 
+class _ReturnCache:
+    """Append-only log-return intervals (t0, t1, r) for one symbol, NumPy-backed.
+
+    Mirrors `_returns` over the deque: a return is appended when a tick arrives
+    strictly after the previous one, and is tagged with the sequence number of
+    its start point so count-based eviction (`max_points`) matches the deque.
+    """
+
+    __slots__ = ("t0", "t1", "r", "seq", "n", "head", "_npts", "_last_t", "_last_lp")
+
+    def __init__(self, cap: int = 1024) -> None:
+        cap = max(16, int(cap))
+        self.t0 = np.empty(cap, dtype=np.float64)
+        self.t1 = np.empty(cap, dtype=np.float64)
+        self.r = np.empty(cap, dtype=np.float64)
+        self.seq = np.empty(cap, dtype=np.int64)
+        self.n = 0
+        self.head = 0
+        self._npts = 0
+        self._last_t: Optional[float] = None
+        self._last_lp = math.nan
+
+    def add(self, t: float, lp: float) -> None:
+        if self._last_t is not None and t > self._last_t and lp == lp and self._last_lp == self._last_lp:
+            if self.n == len(self.t0):
+                self._grow()
+            i = self.n
+            self.t0[i] = self._last_t
+            self.t1[i] = t
+            self.r[i] = lp - self._last_lp
+            self.seq[i] = self._npts - 1
+            self.n = i + 1
+        self._last_t = t
+        self._last_lp = lp
+        self._npts += 1
+
+    def _grow(self) -> None:
+        live = self.n - self.head
+        cap = len(self.t0)
+        if live * 2 > cap:
+            cap *= 2
+        for name in ("t0", "t1", "r", "seq"):
+            old = getattr(self, name)
+            arr = np.empty(cap, dtype=old.dtype)
+            arr[:live] = old[self.head:self.n]
+            setattr(self, name, arr)
+        self.n = live
+        self.head = 0
+
+    def evict(self, cutoff: float, max_points: int) -> None:
+        """Drop returns starting before `cutoff` or at points beyond the count cap."""
+        h, n = self.head, self.n
+        if h < n:
+            h += int(np.searchsorted(self.t0[h:n], cutoff, side="left"))
+            h += int(np.searchsorted(self.seq[h:n], self._npts - max_points, side="left"))
+        self.head = h
+
+    def window(self) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        h, n = self.head, self.n
+        return self.t0[h:n], self.t1[h:n], self.r[h:n]
+
+
+def hy_cov_lags(
+    rx: Tuple["np.ndarray", "np.ndarray", "np.ndarray"],
+    ry: Tuple["np.ndarray", "np.ndarray", "np.ndarray"],
+    lags: Sequence[float],
+) -> Tuple["np.ndarray", float, float]:
+    """HY covariance of X with Y shifted by each lag, in one vectorized sweep.
+
+    rx/ry are (t0, t1, r) arrays of contiguous, time-ordered return intervals.
+    For X interval (a, b] the overlapping shifted-Y intervals (c+τ, d+τ] form a
+    contiguous run [lo, hi): lo = #{d ≤ a−τ}, hi = #{c < b−τ}; so
+    cov(τ) = Σ_i r_i · (S[hi_i] − S[lo_i]) with S the prefix sum of Y returns.
+    All lags share one `searchsorted` call. Returns (cov[len(lags)], var_x, var_y).
+    """
+    a, b, r = rx
+    c, d, sy = ry
+    varx = float(np.dot(r, r))
+    vary = float(np.dot(sy, sy))
+    tau = np.asarray(lags, dtype=np.float64).reshape(-1, 1)
+    if len(r) == 0 or len(sy) == 0:
+        return np.zeros(tau.shape[0]), varx, vary
+    S = np.concatenate(([0.0], np.cumsum(sy)))
+    lo = np.searchsorted(d, (a - tau).ravel(), side="right")
+    hi = np.searchsorted(c, (b - tau).ravel(), side="left")
+    contrib = (S[hi] - S[np.minimum(lo, hi)]).reshape(tau.shape[0], -1)
+    return contrib @ r, varx, vary
+
+
+def _hy_summary(cov: "np.ndarray", varx: float, vary: float, lags: Sequence[float]) -> Dict[str, object]:
+    den = math.sqrt(varx * vary) if varx > 0 and vary > 0 else 0.0
+    corr = cov / den if den > 0 else np.zeros_like(cov)
+    k = int(np.argmax(np.abs(corr))) if len(corr) else 0
+    # first maximal |corr| wins, as in the per-lag loop
+    best_corr = float(corr[k]) if len(corr) and corr[k] != 0.0 else 0.0
+    best_lag = float(lags[k]) if best_corr != 0.0 else 0.0
+    return {
+        "corr_by_lag": {float(t): float(c) for t, c in zip(lags, corr)},
+        "best_lag": best_lag,
+        "best_corr": best_corr,
+    }
+
+
+def _scan_pairs(
+    arrays: Dict[str, Tuple["np.ndarray", "np.ndarray", "np.ndarray"]],
+    pairs: Sequence[Tuple[str, str]],
+    lags: Sequence[float],
+) -> List[Tuple[str, str, float, float, float, float]]:
+    """Worker: (x, y, corr@0, beta_x_on_y@0, best_lag, best_corr) per pair."""
+    grid = list(lags)
+    if 0.0 not in grid:
+        grid.append(0.0)
+    z = grid.index(0.0)
+    out = []
+    for x, y in pairs:
+        cov, varx, vary = hy_cov_lags(arrays[x], arrays[y], grid)
+        den = math.sqrt(varx * vary) if varx > 0 and vary > 0 else 0.0
+        corr0 = float(cov[z]) / den if den > 0 else 0.0
+        beta = float(cov[z]) / vary if vary > 0 else 0.0
+        summ = _hy_summary(cov[: len(lags)], varx, vary, lags)
+        out.append((x, y, corr0, beta, cast(float, summ["best_lag"]), cast(float, summ["best_corr"])))
+    return out
+
+
 class CrossAssetHY:
     """Streaming buffers + on-demand HY estimators.
 
@@ -76,12 +203,17 @@ class CrossAssetHY:
         Rolling horizon for retaining ticks (seconds).
     max_points : int
         Hard cap per symbol to bound memory; oldest points are evicted first.
+    workers : int
+        Process-pool size for `lead_lag_matrix` (≤1: compute inline).
     """
 
-    def __init__(self, window_s: float = 60.0, max_points: int = 8000) -> None:
+    def __init__(self, window_s: float = 60.0, max_points: int = 8000, *, workers: int = 0) -> None:
         self.window_s = float(window_s)
         self.max_points = int(max_points)
+        self.workers = int(workers)
         self._buf: Dict[str, Deque[_PricePoint]] = {}
+        self._ret: Dict[str, _ReturnCache] = {}
+        self._pool: Any = None
 
     # --------------------------- Ingestion ---------------------------
     def add_tick(self, symbol: str, ts: float, price: float) -> None:
@@ -90,6 +222,14 @@ class CrossAssetHY:
         dq = self._buf.setdefault(symbol, deque())
         logp = math.log(price)
         dq.append(_PricePoint(t=float(ts), logp=logp))
+        if np is not None:
+            rc = self._ret.get(symbol)
+            if rc is None:
+                rc = self._ret[symbol] = _ReturnCache()
+            elif rc.n == len(rc.t0):
+                # amortized: drop stale returns before the cache would grow
+                rc.evict(float(ts) - self.window_s, self.max_points)
+            rc.add(float(ts), logp)
         # evict by count
         while len(dq) > self.max_points:
             dq.popleft()
@@ -192,10 +332,16 @@ class CrossAssetHY:
 
         Positive lag means Y is shifted forward by τ: we estimate Corr(X_t, Y_{t+τ}).
         """
-        rx = self._prepare_returns(sym_x, now_ts)
-        ry0 = self._prepare_returns(sym_y, now_ts)
-        ry = self._shift_returns(ry0, lag_s)
-        cov, varx, vary = self._hy_cov_from_returns(rx, ry)
+        if np is not None:
+            covs, varx, vary = hy_cov_lags(
+                self.return_arrays(sym_x, now_ts), self.return_arrays(sym_y, now_ts), (lag_s,)
+            )
+            cov = float(covs[0])
+        else:
+            rx = self._prepare_returns(sym_x, now_ts)
+            ry0 = self._prepare_returns(sym_y, now_ts)
+            ry = self._shift_returns(ry0, lag_s)
+            cov, varx, vary = self._hy_cov_from_returns(rx, ry)
         corr = 0.0 if varx <= 0 or vary <= 0 else cov / math.sqrt(varx * vary)
         beta_x_on_y = 0.0 if vary <= 0 else cov / vary
         beta_y_on_x = 0.0 if varx <= 0 else cov / varx
@@ -220,7 +366,22 @@ class CrossAssetHY:
 
         Note: Positive lag means Y is shifted forward by τ (Corr(X_t, Y_{t+τ})).
         If Y leads X by L>0 (i.e., Y_t ≈ X_{t+L}), the best lag tends to −L.
+        With NumPy the whole grid (plus lag 0) is one `hy_cov_lags` sweep.
         """
+        if np is not None:
+            grid = [float(t) for t in lags] + [0.0]
+            cov, varx, vary = hy_cov_lags(
+                self.return_arrays(sym_x, now_ts), self.return_arrays(sym_y, now_ts), grid
+            )
+            out = _hy_summary(cov[:-1], varx, vary, grid[:-1])
+            c0 = float(cov[-1])
+            return {
+                "hy_corr_0": 0.0 if varx <= 0 or vary <= 0 else c0 / math.sqrt(varx * vary),
+                "hy_cov_0": c0,
+                "beta_x_on_y_0": 0.0 if vary <= 0 else c0 / vary,
+                "beta_y_on_x_0": 0.0 if varx <= 0 else c0 / varx,
+                **out,
+            }
         best_lag = 0.0
         best_corr = 0.0
         corr_by_lag: Dict[float, float] = {}
@@ -242,6 +403,96 @@ class CrossAssetHY:
         }
 
 
+    # -------------------- Vectorized / universe API --------------------
+    def return_arrays(
+        self, sym: str, now_ts: Optional[float] = None
+    ) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """(t0, t1, r) views of the cached returns inside the window (requires NumPy)."""
+        rc = self._ret.get(sym)
+        if rc is None:
+            e = np.empty(0, dtype=np.float64)
+            return e, e, e
+        if now_ts is None:
+            dq = self._buf.get(sym)
+            now_ts = dq[-1].t if dq else rc._last_t or 0.0
+        self._evict_old(sym, now_ts)
+        rc.evict(float(now_ts) - self.window_s, self.max_points)
+        return rc.window()
+
+    def _run_chunks(self, fn: Callable[..., Any], chunks: List[Tuple[Any, ...]]) -> List[Any]:
+        """Map fn over chunks on a lazily created process pool; inline if unavailable."""
+        if self.workers > 1 and len(chunks) > 1 and self._pool is None:
+            try:
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+                # spawn: forking a threaded host process can deadlock the workers
+                self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+            except Exception:
+                self._pool = False
+        if self.workers > 1 and len(chunks) > 1 and self._pool:
+            try:
+                futs = [self._pool.submit(fn, *c) for c in chunks]
+                return [f.result() for f in futs]
+            except Exception:
+                # Broken pool (e.g. workers failed to start): compute inline from now on
+                self._pool = False
+        return [fn(*c) for c in chunks]
+
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started."""
+        if self._pool:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
+
+    def lead_lag_matrix(
+        self,
+        symbols: Optional[Sequence[str]] = None,
+        *,
+        lags: Sequence[float] = (-2.0, -1.0, -0.5, -0.25, 0.0, 0.25, 0.5, 1.0, 2.0),
+        now_ts: Optional[float] = None,
+    ) -> Dict[str, object]:
+        """Pairwise HY lead–lag over a symbol universe (requires NumPy).
+
+        Each symbol's windowed return arrays are sliced once from the cache, then
+        the N·(N−1)/2 pairs are split into `workers` chunks evaluated on the
+        process pool (inline when workers ≤ 1). Returns symmetric `corr_0`,
+        `beta` (row on column, lag 0), and antisymmetric `best_lag` plus
+        symmetric `best_corr` N×N arrays, with `symbols` giving the row order.
+        """
+        if np is None:
+            raise RuntimeError("lead_lag_matrix requires NumPy")
+        syms = list(self._buf) if symbols is None else list(symbols)
+        ts = now_ts
+        if ts is None:
+            ts = max((dq[-1].t for s in syms for dq in [self._buf.get(s)] if dq), default=0.0)
+        arrays = {s: tuple(a.copy() for a in self.return_arrays(s, ts)) for s in syms}
+        pairs = [(syms[i], syms[j]) for i in range(len(syms)) for j in range(i + 1, len(syms))]
+        n_chunks = max(1, min(self.workers, len(pairs))) if self.workers > 1 else 1
+        chunks: List[Tuple[Any, ...]] = []
+        for k in range(n_chunks):
+            part = pairs[k::n_chunks]
+            need = {s for p in part for s in p}
+            chunks.append(({s: arrays[s] for s in need}, part, tuple(float(t) for t in lags)))
+        idx = {s: i for i, s in enumerate(syms)}
+        n = len(syms)
+        corr0 = np.eye(n)
+        beta = np.eye(n)
+        best_lag = np.zeros((n, n))
+        best_corr = np.eye(n)
+        for res in self._run_chunks(_scan_pairs, chunks):
+            for x, y, c0, b_xy, lag, bc in res:
+                i, j = idx[x], idx[y]
+                corr0[i, j] = corr0[j, i] = c0
+                beta[i, j] = b_xy
+                var_x = float(np.dot(arrays[x][2], arrays[x][2]))
+                var_y = float(np.dot(arrays[y][2], arrays[y][2]))
+                # β_{y|x} = cov/var_x = β_{x|y}·var_y/var_x
+                beta[j, i] = b_xy * var_y / var_x if var_x > 0 else 0.0
+                best_lag[i, j], best_lag[j, i] = lag, -lag
+                best_corr[i, j] = best_corr[j, i] = bc
+        return {"symbols": syms, "corr_0": corr0, "beta": beta, "best_lag": best_lag, "best_corr": best_corr}
+
+
 # =============================
 # Self-tests (synthetic irregular streams)
 # =============================
@@ -37,12 +37,19 @@ Usage
     )
     # out = {"score": ..., "p_raw": ..., "p": ..., "components": {...}}
 
+    # replay/backtest: one call for many events (NumPy, imported lazily)
+    batch = model.score_batch({"obi": obi_arr, "microprice": mp_arr}, calibrator=cal)
+    # batch.score, batch.p_raw, batch.p are arrays; batch.row(i) -> ScoreOutput
+
 """
 
 from dataclasses import dataclass
-from typing import Any, Dict, Mapping, Optional, Protocol, runtime_checkable, Union
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Protocol, Sequence, Tuple, runtime_checkable, Union
 import math
 
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+
 from core.config.loader import get_config, ConfigError
 
 
@@ -58,6 +65,11 @@ class ModelProto(Protocol):
 class TransformerProto(Protocol):
     def transform(self, p: float) -> float: ...
 
+@runtime_checkable
+class BatchCalibratorProto(Protocol):
+    def calibrate_prob(self, p: float) -> float: ...
+    def calibrate_prob_batch(self, p: "np.ndarray") -> "np.ndarray": ...
+
 
 def _sigmoid(z: float) -> float:
     # numerically stable sigmoid
@@ -91,6 +103,60 @@ class ScoreOutput:
         return d
 
 
+@dataclass
+class ScoreBatch:
+    """Column-wise `ScoreOutput` for n events (arrays of shape (n,))."""
+
+    score: "np.ndarray"
+    p_raw: "np.ndarray"
+    p: "np.ndarray"
+    components: Dict[str, "np.ndarray"]
+
+    def __len__(self) -> int:
+        return int(self.score.shape[0])
+
+    def row(self, i: int) -> ScoreOutput:
+        return ScoreOutput(
+            score=float(self.score[i]),
+            p_raw=float(self.p_raw[i]),
+            p=float(self.p[i]),
+            components={k: float(v[i]) for k, v in self.components.items()},
+        )
+
+    def as_dict(self) -> Dict[str, "np.ndarray"]:
+        d: Dict[str, "np.ndarray"] = {"score": self.score, "p_raw": self.p_raw, "p": self.p}
+        for k, v in self.components.items():
+            d[f"comp_{k}"] = v
+        return d
+
+
+def _calibrate_scalar(calibrator: Any, p_raw: float) -> float:
+    if hasattr(calibrator, "calibrate_prob"):
+        return float(calibrator.calibrate_prob(p_raw))
+    if hasattr(calibrator, "predict_proba"):
+        return float(calibrator.predict_proba(p_raw))
+    if hasattr(calibrator, "transform"):
+        return float(calibrator.transform(p_raw))
+    # unknown calibrator interface — leave raw prob
+    return p_raw
+
+
+# `_calibrate_scalar` priority; a batch method is used only as the vectorized
+# form of the scalar method that would have been picked
+_SCALAR_TO_BATCH = (("calibrate_prob", "calibrate_prob_batch"), ("predict_proba", None), ("transform", None))
+
+
+def _calibrate_array(calibrator: Any, p_raw: "np.ndarray") -> "np.ndarray":
+    import numpy as np
+
+    for scalar, batch in _SCALAR_TO_BATCH:
+        if hasattr(calibrator, scalar):
+            if batch is not None and hasattr(calibrator, batch):
+                return np.asarray(getattr(calibrator, batch)(p_raw), dtype=np.float64)
+            return np.fromiter((_calibrate_scalar(calibrator, float(x)) for x in p_raw), dtype=np.float64, count=len(p_raw))
+    return p_raw
+
+
 class ScoreModel:
     def __init__(
         self,
@@ -121,6 +187,9 @@ class ScoreModel:
                     uca = True
         self._gamma = float(g)
         self._use_cross = bool(uca)
+        # dense weight vector in fixed feature order, compiled on first batch call
+        self._names: Tuple[str, ...] = tuple(self._w)
+        self._w_vec: Optional["np.ndarray"] = None
 
     # --------- public API ---------
 
@@ -164,15 +233,7 @@ class ScoreModel:
         p = p_raw
         if calibrator is not None:
             # flexible adapter
-            if hasattr(calibrator, "calibrate_prob"):
-                p = float(calibrator.calibrate_prob(p_raw))
-            elif hasattr(calibrator, "predict_proba"):
-                p = float(calibrator.predict_proba(p_raw))
-            elif hasattr(calibrator, "transform"):
-                p = float(calibrator.transform(p_raw))
-            else:
-                # unknown calibrator interface — leave raw prob
-                p = p_raw
+            p = _calibrate_scalar(calibrator, p_raw)
             # clamp to [0,1]
             p = 0.0 if p < 0.0 else 1.0 if p > 1.0 else p
 
@@ -184,6 +245,75 @@ class ScoreModel:
         }
         return ScoreOutput(score=s, p_raw=p_raw, p=p, components=comps)
 
+    def score_batch(
+        self,
+        features: Union["np.ndarray", Mapping[str, Any]],
+        *,
+        cross_beta: Union[None, float, "np.ndarray"] = None,
+        cross_return: Union[None, float, "np.ndarray"] = None,
+        calibrator: Optional[Union[BatchCalibratorProto, CalibratorProto, ModelProto, TransformerProto]] = None,
+    ) -> ScoreBatch:
+        """Vectorized `score_event` over n events.
+
+        Parameters
+        ----------
+        features : (n, d) array with columns in `feature_names()` order, or a
+            mapping name -> (n,) array (missing names treated as 0.0)
+        cross_beta, cross_return : scalars or (n,) arrays (optional)
+        calibrator : any calibrator accepted by `score_event`, dispatched in the
+            same order; `calibrate_prob_batch(p_raw) -> p` is used in place of
+            per-element `calibrate_prob` when present
+        """
+        import numpy as np
+
+        w = self._compiled_weights()
+        if isinstance(features, Mapping):
+            n = len(np.asarray(next(iter(features.values())), dtype=np.float64).ravel()) if features else 0
+            lin = np.zeros(n, dtype=np.float64)
+            for k, wk in zip(self._names, w):
+                col = features.get(k)
+                if col is not None:
+                    lin += wk * np.asarray(col, dtype=np.float64).ravel()
+        else:
+            X = np.asarray(features, dtype=np.float64)
+            if X.ndim == 1:
+                X = X.reshape(1, -1) if len(w) != 1 else X.reshape(-1, 1)
+            if X.shape[1] != len(w):
+                raise ValueError(f"features has {X.shape[1]} columns, expected {len(w)} {self._names}")
+            n = X.shape[0]
+            lin = X @ w
+
+        if self._use_cross and self._gamma != 0.0 and cross_beta is not None and cross_return is not None:
+            cross = self._gamma * np.asarray(cross_beta, dtype=np.float64) * np.asarray(cross_return, dtype=np.float64)
+            cross = np.broadcast_to(cross, (n,)).astype(np.float64)
+        else:
+            cross = np.zeros(n, dtype=np.float64)
+
+        s = lin + self._b + cross
+        z = np.clip(s, -40.0, 40.0)
+        # same two-branch stable sigmoid as `_sigmoid`
+        e = np.exp(-np.abs(z))
+        p_raw = np.where(z >= 0, 1.0 / (1.0 + e), e / (1.0 + e))
+
+        p = p_raw
+        if calibrator is not None:
+            p = np.clip(_calibrate_array(calibrator, p_raw), 0.0, 1.0)
+
+        comps = {
+            "lin": lin,
+            "intercept": np.full(n, self._b),
+            "cross": cross,
+            "gamma": np.full(n, self._gamma),
+        }
+        return ScoreBatch(score=s, p_raw=p_raw, p=p, components=comps)
+
+    def _compiled_weights(self) -> "np.ndarray":
+        if self._w_vec is None:
+            import numpy as np
+
+            self._w_vec = np.array([self._w[k] for k in self._names], dtype=np.float64)
+        return self._w_vec
+
     def score_only(self, features: Mapping[str, Any], *, cross_beta: Optional[float] = None, cross_return: Optional[float] = None) -> float:
         return self.score_event(features=features, cross_beta=cross_beta, cross_return=cross_return).score
 
@@ -195,6 +325,10 @@ class ScoreModel:
     def weights(self) -> Mapping[str, float]:
         return dict(self._w)
 
+    def feature_names(self) -> Sequence[str]:
+        """Column order expected by `score_batch` for array input."""
+        return self._names
+
     def intercept(self) -> float:
         return self._b
 
@@ -0,0 +1,301 @@
+"""
+Window-limited Gaussian GLR change-point engine (change in mean).
+
+For the last n ≤ W points of a stream and a split into a head of n1 points
+and a tail of n2 = n − n1 points, the statistic is
+
+    T(n1) = w(n1, n2) · (x̄_head − x̄_tail)² / σ²
+
+with w = n1·n2/n (the textbook GLR, `weight="glr"`) or min(n1, n2) (the
+calibration drift detector's variant, `weight="min"`); the detector value
+is max over the candidate splits, and k_hat is the head length at the max.
+
+Instead of rebuilding prefix sums and scanning all W − 1 splits per tick,
+each stream keeps a ring of W + 1 running prefix sums of x and x² (relative
+to the stream's first value, rebased every W ticks so they never grow), so
+any split's segment sums are two ring reads. Candidate splits form a
+geometric grid in both the tail and the head length (`per_octave` per
+doubling, Lai-style window-limited GLR): O(log W) fixed work per tick
+instead of O(W). The grid max is a lower bound on the exhaustive scan and
+the gap shrinks as `per_octave` grows; `per_octave=0` keeps every split
+(exact, still without the rebuild).
+
+- `WindowGLR` — one stream, pure Python (no NumPy call overhead per tick)
+- `GLRBank`   — S independent streams in (S, W + 1) arrays; one vectorized
+                 gather per tick over the streams that received a value
+
+σ² is either fixed (`sigma2`) or the window variance with `ddof`.
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover
+    np = None  # type: ignore
+
+WEIGHTS = ("glr", "min")
+
+
+def split_grid(window: int, per_octave: int = 8) -> List[int]:
+    """Candidate tail lengths in 1..window−1, largest first (= head length ascending).
+
+    `per_octave <= 0` returns every split; otherwise tail and head lengths
+    round(2^(i/per_octave)), so the grid is dense at both ends of the window.
+    """
+    top = int(window) - 1
+    if top < 1:
+        return []
+    if per_octave <= 0:
+        return list(range(top, 0, -1))
+    ms = {top}
+    i = 0
+    while True:
+        g = int(round(2.0 ** (i / float(per_octave))))
+        if g > top:
+            break
+        ms.add(g)  # recent change: short tail
+        ms.add(int(window) - g)  # old change: short head
+        i += 1
+    return sorted(ms, reverse=True)
+
+
+def _check(window: int, weight: str) -> None:
+    if int(window) < 2:
+        raise ValueError("window must be >= 2")
+    if weight not in WEIGHTS:
+        raise ValueError(f"weight must be one of {WEIGHTS}, got {weight!r}")
+
+
+class WindowGLR:
+    """Single-stream window-limited GLR over the last `window` points."""
+
+    __slots__ = (
+        "W", "weight", "sigma2", "ddof", "var_floor", "clip", "grid",
+        "_P", "_Q", "_h", "_n", "_seen", "_ref",
+    )
+
+    def __init__(
+        self,
+        window: int,
+        *,
+        per_octave: int = 8,
+        weight: str = "glr",
+        sigma2: Optional[float] = None,
+        ddof: int = 1,
+        var_floor: float = 1e-18,
+        clip: Optional[float] = None,
+    ) -> None:
+        _check(window, weight)
+        self.W = int(window)
+        self.weight = weight
+        self.sigma2 = float(sigma2) if sigma2 is not None and sigma2 > 0.0 else None
+        self.ddof = int(ddof)
+        self.var_floor = float(var_floor)
+        self.clip = None if clip is None else abs(float(clip))
+        self.grid = split_grid(self.W, per_octave)
+        self.reset()
+
+    def reset(self) -> None:
+        self._P = [0.0] * (self.W + 1)
+        self._Q = [0.0] * (self.W + 1)
+        self._h = 0
+        self._n = 0
+        self._seen = 0
+        self._ref: Optional[float] = None
+
+    def __len__(self) -> int:
+        return self._n
+
+    def push(self, x: float) -> None:
+        x = float(x)
+        if self.clip is not None:
+            x = max(-self.clip, min(self.clip, x))
+        if self._ref is None:
+            self._ref = x
+        d = x - self._ref
+        P, Q, L = self._P, self._Q, self.W + 1
+        h = self._h
+        nh = h + 1 if h + 1 < L else 0
+        P[nh] = P[h] + d
+        Q[nh] = Q[h] + d * d
+        self._h = nh
+        if self._n < self.W:
+            self._n += 1
+        self._seen += 1
+        if self._seen % self.W == 0:
+            j = (nh - self._n) % L
+            bp, bq = P[j], Q[j]
+            for i in range(L):
+                P[i] -= bp
+                Q[i] -= bq
+
+    def mean_var(self) -> Tuple[float, float]:
+        """Window mean and variance (σ² used by the statistic)."""
+        n = self._n
+        if n == 0:
+            return 0.0, self.sigma2 or 0.0
+        L = self.W + 1
+        j = (self._h - n) % L
+        s = self._P[self._h] - self._P[j]
+        mean = s / n + (self._ref or 0.0)
+        if self.sigma2 is not None:
+            return mean, self.sigma2
+        q = self._Q[self._h] - self._Q[j]
+        var = (q - s * s / n) / max(1, n - self.ddof)
+        return mean, max(self.var_floor, var)
+
+    def stat(self) -> Tuple[float, Optional[int]]:
+        """(max statistic, head length k_hat) over the candidate splits; (0, None) if n < 2."""
+        n = self._n
+        if n < 2:
+            return 0.0, None
+        _, var = self.mean_var()
+        P, L, h = self._P, self.W + 1, self._h
+        p_now = P[h]
+        s_win = p_now - P[(h - n) % L]
+        use_min = self.weight == "min"
+        best = 0.0
+        k_hat: Optional[int] = None
+        for m in self.grid:
+            n1 = n - m
+            if n1 < 1:
+                continue
+            t = p_now - P[(h - m) % L]
+            diff = (s_win - t) / n1 - t / m
+            w = (n1 if n1 < m else m) if use_min else n1 * m / n
+            s = w * diff * diff / var
+            if s > best:
+                best = s
+                k_hat = n1
+        return best, k_hat
+
+    def update(self, x: float) -> Tuple[float, Optional[int]]:
+        self.push(x)
+        return self.stat()
+
+
+class GLRBank:
+    """`WindowGLR` for `n_streams` independent streams in shared NumPy state.
+
+    `update(x, streams)` advances only the listed streams (unique indices or a
+    boolean mask; all streams when omitted) and returns (stat, k_hat) arrays for
+    them; k_hat is −1 where no split beats 0.
+    """
+
+    def __init__(
+        self,
+        n_streams: int,
+        window: int,
+        *,
+        per_octave: int = 8,
+        weight: str = "glr",
+        sigma2: Optional[float] = None,
+        ddof: int = 1,
+        var_floor: float = 1e-18,
+        clip: Optional[float] = None,
+    ) -> None:
+        if np is None:  # pragma: no cover
+            raise RuntimeError("GLRBank requires NumPy")
+        _check(window, weight)
+        self.S = int(n_streams)
+        self.W = int(window)
+        self.weight = weight
+        self.sigma2 = float(sigma2) if sigma2 is not None and sigma2 > 0.0 else None
+        self.ddof = int(ddof)
+        self.var_floor = float(var_floor)
+        self.clip = None if clip is None else abs(float(clip))
+        self.grid = np.asarray(split_grid(self.W, per_octave), dtype=np.int64)
+        L = self.W + 1
+        self._P = np.zeros((self.S, L))
+        self._Q = np.zeros((self.S, L))
+        self._h = np.zeros(self.S, dtype=np.int64)
+        self._n = np.zeros(self.S, dtype=np.int64)
+        self._seen = np.zeros(self.S, dtype=np.int64)
+        self._ref = np.zeros(self.S)
+        self._has_ref = np.zeros(self.S, dtype=bool)
+
+    def _rows(self, streams: Optional[Sequence[int]]) -> "np.ndarray":
+        if streams is None:
+            return np.arange(self.S)
+        r = np.asarray(streams)
+        if r.dtype == bool:
+            return np.flatnonzero(r)
+        return r.astype(np.int64, copy=False)
+
+    def reset(self, streams: Optional[Sequence[int]] = None) -> None:
+        r = self._rows(streams)
+        self._P[r] = 0.0
+        self._Q[r] = 0.0
+        self._h[r] = 0
+        self._n[r] = 0
+        self._seen[r] = 0
+        self._has_ref[r] = False
+
+    def counts(self, streams: Optional[Sequence[int]] = None) -> "np.ndarray":
+        return self._n[self._rows(streams)].copy()
+
+    def push(self, x: Sequence[float], streams: Optional[Sequence[int]] = None) -> "np.ndarray":
+        r = self._rows(streams)
+        x = np.asarray(x, dtype=np.float64).reshape(-1)
+        if self.clip is not None:
+            x = np.clip(x, -self.clip, self.clip)
+        first = ~self._has_ref[r]
+        if first.any():
+            self._ref[r[first]] = x[first]
+            self._has_ref[r[first]] = True
+        d = x - self._ref[r]
+        L = self.W + 1
+        h0 = self._h[r]
+        h1 = (h0 + 1) % L
+        self._P[r, h1] = self._P[r, h0] + d
+        self._Q[r, h1] = self._Q[r, h0] + d * d
+        self._h[r] = h1
+        self._n[r] = np.minimum(self._n[r] + 1, self.W)
+        self._seen[r] += 1
+        rb = r[self._seen[r] % self.W == 0]
+        if rb.size:
+            j = (self._h[rb] - self._n[rb]) % L
+            self._P[rb] -= self._P[rb, j][:, None]
+            self._Q[rb] -= self._Q[rb, j][:, None]
+        return r
+
+    def stat(self, streams: Optional[Sequence[int]] = None) -> Tuple["np.ndarray", "np.ndarray"]:
+        r = self._rows(streams)
+        L = self.W + 1
+        h = self._h[r]
+        n = self._n[r]
+        nf = n.astype(np.float64)
+        p_now = self._P[r, h]
+        j = (h - n) % L
+        s_win = p_now - self._P[r, j]
+        if self.sigma2 is not None:
+            var = np.full(r.size, self.sigma2)
+        else:
+            q_win = self._Q[r, h] - self._Q[r, j]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                var = (q_win - s_win * s_win / nf) / np.maximum(1, n - self.ddof)
+            var = np.maximum(self.var_floor, np.nan_to_num(var))
+        M = self.grid
+        if M.size == 0 or r.size == 0:
+            return np.zeros(r.size), np.full(r.size, -1, dtype=np.int64)
+        t = p_now[:, None] - self._P[r[:, None], (h[:, None] - M[None, :]) % L]
+        n1 = n[:, None] - M[None, :]
+        valid = n1 >= 1
+        n1f = np.where(valid, n1, 1).astype(np.float64)
+        diff = (s_win[:, None] - t) / n1f - t / M[None, :]
+        if self.weight == "min":
+            w = np.minimum(n1f, M[None, :])
+        else:
+            w = n1f * M[None, :] / np.maximum(nf, 1.0)[:, None]
+        s = np.where(valid, w * diff * diff / var[:, None], 0.0)
+        a = np.argmax(s, axis=1)
+        ix = np.arange(r.size)
+        best = s[ix, a]
+        k_hat = np.where(best > 0.0, n1[ix, a], -1)
+        return best, k_hat
+
+    def update(self, x: Sequence[float], streams: Optional[Sequence[int]] = None) -> Tuple["np.ndarray", "np.ndarray"]:
+        return self.stat(self.push(x, streams))
@@ -0,0 +1,304 @@
+"""
+Sliding-window quantiles without sort-per-call.
+
+`SlidingQuantile` keeps the window in a blocked sorted list (sorted blocks of
+~`block` values plus a list of block maxima) and a Fenwick tree of per-block
+counts: add/remove cost O(log n + block) (plus an O(n / block) index rebuild
+when a block splits or empties, i.e. amortized over ~block updates) and a
+rank/quantile query is a Fenwick descent, O(log(n / block)), versus
+O(n log n) for sorting the buffer (or `np.percentile`) on every call. It is
+exact, so callers migrated from sort-based estimators return the same numbers:
+
+- `quantile(q)`     — linear interpolation at pos = q·(n−1), computed as
+                      a·(1−f) + b·f like the repo's `_quantile` helpers
+- `percentile(p)`   — NumPy's default 'linear' method, bit-compatible with
+                      `np.percentile(buf, p)`
+- `quantile_lower(q)` — the ⌈q·n⌉−1 order statistic (empirical VaR style)
+
+Windows are either count-based (`maxlen`, oldest evicted on add) or managed
+by the caller through `remove(x)` (time-based windows). NaN inputs are ignored.
+
+With `tail_sums=True` a second Fenwick tree holds per-block sums, so
+`tail(k)` (k-th value and the sum of ranks k..n−1) costs
+O(log(n / block) + block) instead of a walk over the blocks (rolling CVaR).
+It is also rebuilt every `refresh` updates, which bounds floating drift from
+incremental +=/−=.
+
+`sketch_enabled()` is the migration flag shared by the modules that use this
+(AURORA_QUANTILE_SKETCH=0 restores their legacy sort-per-call paths).
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from bisect import bisect_left, insort
+from collections import deque
+from itertools import chain
+from typing import Deque, Iterable, List, Optional, Tuple
+
+
+def sketch_enabled(flag: Optional[bool] = None) -> bool:
+    """Resolve the per-instance flag: explicit bool wins, else AURORA_QUANTILE_SKETCH (default on)."""
+    if flag is not None:
+        return bool(flag)
+    return os.getenv('AURORA_QUANTILE_SKETCH', '1').strip().lower() not in {'0', 'false', 'no', 'off'}
+
+
+class SlidingQuantile:
+    """Exact order-statistic window over floats (blocked sorted list)."""
+
+    def __init__(
+        self,
+        maxlen: Optional[int] = None,
+        block: int = 256,
+        *,
+        tail_sums: bool = False,
+        refresh: int = 100_000,
+    ) -> None:
+        self.maxlen = int(maxlen) if maxlen is not None else None
+        self._load = max(8, int(block))
+        self._blocks: List[List[float]] = []
+        self._maxes: List[float] = []
+        self._n = 0
+        self._fifo: Optional[Deque[float]] = deque() if self.maxlen is not None else None
+        # Fenwick trees over per-block counts (always) and sums (tail_sums=True only)
+        self._indexed = bool(tail_sums)
+        self._refresh = max(1, int(refresh))
+        self._since = 0
+        self._fc: List[int] = [0]
+        self._fs: List[float] = [0.0]
+
+    def __len__(self) -> int:
+        return self._n
+
+    def clear(self) -> None:
+        self._blocks.clear()
+        self._maxes.clear()
+        self._n = 0
+        if self._fifo is not None:
+            self._fifo.clear()
+        self._fc, self._fs, self._since = [0], [0.0], 0
+
+    # --- updates ---
+
+    def add(self, x: float) -> None:
+        x = float(x)
+        if x != x:  # NaN
+            return
+        self._insert(x)
+        if self._fifo is not None:
+            self._fifo.append(x)
+            if len(self._fifo) > self.maxlen:  # type: ignore[operator]
+                self._remove(self._fifo.popleft())
+
+    def extend(self, xs: Iterable[float]) -> None:
+        for x in xs:
+            self.add(x)
+
+    def remove(self, x: float) -> bool:
+        """Remove one occurrence of x (for caller-managed windows). Returns False if absent."""
+        x = float(x)
+        if x != x:
+            return False
+        return self._remove(x)
+
+    def _insert(self, x: float) -> None:
+        blocks, maxes = self._blocks, self._maxes
+        self._n += 1
+        if not blocks:
+            blocks.append([x])
+            maxes.append(x)
+            self._rebuild()
+            return
+        i = bisect_left(maxes, x)
+        if i == len(blocks):
+            i -= 1
+            blk = blocks[i]
+            blk.append(x)
+            maxes[i] = x
+        else:
+            blk = blocks[i]
+            insort(blk, x)
+        if len(blk) > 2 * self._load:
+            half = blk[self._load:]
+            del blk[self._load:]
+            blocks.insert(i + 1, half)
+            maxes[i] = blk[-1]
+            maxes.insert(i + 1, half[-1])
+            self._rebuild()
+        else:
+            self._bump(i, 1, x)
+
+    def _remove(self, x: float) -> bool:
+        blocks, maxes = self._blocks, self._maxes
+        i = bisect_left(maxes, x)
+        if i == len(blocks):
+            return False
+        blk = blocks[i]
+        j = bisect_left(blk, x)
+        if j == len(blk) or blk[j] != x:
+            return False
+        del blk[j]
+        self._n -= 1
+        if not blk:
+            del blocks[i]
+            del maxes[i]
+            self._rebuild()
+            return True
+        if j == len(blk):
+            maxes[i] = blk[-1]
+        self._bump(i, -1, -x)
+        return True
+
+    # --- Fenwick index ---
+
+    def _rebuild(self) -> None:
+        m = len(self._blocks)
+        fc = [0] * (m + 1)
+        for i, blk in enumerate(self._blocks, 1):
+            fc[i] += len(blk)
+            j = i + (i & -i)
+            if j <= m:
+                fc[j] += fc[i]
+        self._fc = fc
+        if self._indexed:
+            fs = [0.0] * (m + 1)
+            for i, blk in enumerate(self._blocks, 1):
+                fs[i] += sum(blk)
+                j = i + (i & -i)
+                if j <= m:
+                    fs[j] += fs[i]
+            self._fs = fs
+            self._since = 0
+
+    def _bump(self, i: int, dc: int, ds: float) -> None:
+        fc = self._fc
+        m = len(fc) - 1
+        i += 1
+        if not self._indexed:
+            while i <= m:
+                fc[i] += dc
+                i += i & -i
+            return
+        self._since += 1
+        if self._since >= self._refresh:
+            self._rebuild()
+            return
+        fs = self._fs
+        while i <= m:
+            fc[i] += dc
+            fs[i] += ds
+            i += i & -i
+
+    def _locate(self, k: int) -> Tuple[int, int]:
+        """(block index, offset) of the k-th smallest value (0-based)."""
+        fc = self._fc
+        m = len(fc) - 1
+        pos = 0
+        step = 1 << m.bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= m and fc[nxt] <= k:
+                pos = nxt
+                k -= fc[nxt]
+            step >>= 1
+        return pos, k
+
+    def _prefix_sum(self, b: int) -> float:
+        fs = self._fs
+        s = 0.0
+        while b > 0:
+            s += fs[b]
+            b -= b & -b
+        return s
+
+    # --- queries ---
+
+    def kth(self, k: int) -> float:
+        """k-th smallest value (0-based)."""
+        if not 0 <= k < self._n:
+            raise IndexError(k)
+        b, off = self._locate(k)
+        return self._blocks[b][off]
+
+    def tail(self, k: int) -> Tuple[float, float]:
+        """(k-th smallest value, sum of values at ranks k..n−1)."""
+        if not 0 <= k < self._n:
+            raise IndexError(k)
+        b, off = self._locate(k)
+        blk = self._blocks[b]
+        if self._indexed:
+            total = self._prefix_sum(len(self._fs) - 1)
+            s = total - self._prefix_sum(b + 1) + sum(blk[off:])
+        else:
+            s = float(sum(chain(blk[off:], *self._blocks[b + 1:])))
+        return blk[off], s
+
+    def _pair(self, lo: int) -> Tuple[float, float]:
+        # (lo-th, (lo+1)-th clipped) from one Fenwick descent
+        bi, k = self._locate(lo)
+        blk = self._blocks[bi]
+        a = blk[k]
+        if lo + 1 >= self._n:
+            return a, a
+        if k + 1 < len(blk):
+            return a, blk[k + 1]
+        return a, self._blocks[bi + 1][0]
+
+    def quantile(self, q: float) -> float:
+        """Linear-interpolated quantile, q in [0,1] (clipped). 0.0 on empty window."""
+        n = self._n
+        if n == 0:
+            return 0.0
+        q = 0.0 if q < 0.0 else 1.0 if q > 1.0 else q
+        pos = q * (n - 1)
+        lo = int(pos)
+        a, b = self._pair(lo)
+        frac = pos - lo
+        return a * (1 - frac) + b * frac
+
+    def percentile(self, p: float) -> float:
+        """Same result as `np.percentile(window, p)` (method='linear'). 0.0 on empty window."""
+        n = self._n
+        if n == 0:
+            return 0.0
+        v = (float(p) / 100.0) * (n - 1)
+        lo = int(math.floor(v))
+        lo = 0 if lo < 0 else n - 1 if lo > n - 1 else lo
+        a, b = self._pair(lo)
+        g = v - lo
+        d = b - a
+        # NumPy _lerp: a + d*g, evaluated from b for g >= 0.5
+        return b - d * (1 - g) if g >= 0.5 else a + d * g
+
+    def quantile_lower(self, q: float) -> float:
+        """Order statistic at index ceil(q·n)−1 (clipped); 0.0 on empty window."""
+        n = self._n
+        if n == 0:
+            return 0.0
+        a = min(1.0, max(0.0, float(q)))
+        k = max(0, min(n - 1, int(math.ceil(a * n) - 1)))
+        return self.kth(k)
+
+    def count_sum_ge(self, x: float) -> Tuple[int, float]:
+        """(count, sum) of window values >= x."""
+        i = bisect_left(self._maxes, x)
+        if i == len(self._blocks):
+            return 0, 0.0
+        blk = self._blocks[i]
+        j = bisect_left(blk, x)
+        rest = self._blocks[i + 1:]
+        cnt = len(blk) - j + sum(len(b) for b in rest)
+        # one sum() over the ascending tail, same as summing a sorted slice
+        return cnt, float(sum(chain(blk[j:], *rest)))
+
+    def values(self) -> List[float]:
+        """Sorted copy of the window."""
+        out: List[float] = []
+        for blk in self._blocks:
+            out.extend(blk)
+        return out
+
+
+__all__ = ['SlidingQuantile', 'sketch_enabled']
@@ -25,6 +25,7 @@ from typing import Deque, Dict, Iterable, List, Optional, Tuple
 
 from core.config.loader import get_config, ConfigError
 from core.calibration.calibrator import PrequentialMetrics
+from core.utils.quantiles import SlidingQuantile, sketch_enabled
 
 NS_PER_SEC = 1_000_000_000
 
@@ -172,10 +173,19 @@ class CvarBreachAlert(BaseAlert):
     if CVaR magnitude exceeds configured limit.
     """
 
-    def __init__(self, *, window_size: int = 2000, alpha: float = 0.95, min_interval_ns: int = 60 * NS_PER_SEC) -> None:
+    def __init__(
+        self,
+        *,
+        window_size: int = 2000,
+        alpha: float = 0.95,
+        min_interval_ns: int = 60 * NS_PER_SEC,
+        sketch: Optional[bool] = None,
+    ) -> None:
         super().__init__(min_interval_ns=min_interval_ns)
         self._alpha = float(alpha)
         self._rets: Deque[float] = deque(maxlen=int(window_size))
+        # Sorted loss magnitudes of the window, maintained incrementally (AURORA_QUANTILE_SKETCH=0: sort per update)
+        self._losses: Optional[SlidingQuantile] = SlidingQuantile() if sketch_enabled(sketch) else None
         try:
             cfg = get_config()
             self._limit = float(cfg.get("risk.cvar.limit", 0.02))
@@ -184,17 +194,33 @@ class CvarBreachAlert(BaseAlert):
             self._limit = 0.02
 
     def update(self, ts_ns: int, ret: float) -> Optional[AlertResult]:
-        self._rets.append(float(ret))
+        r = float(ret)
+        lq = self._losses
+        if lq is not None:
+            if len(self._rets) == self._rets.maxlen:
+                old = self._rets[0]
+                if old < 0.0:
+                    lq.remove(-old)
+            if r < 0.0:
+                lq.add(-r)
+        self._rets.append(r)
         if len(self._rets) < 50:
             return None
-        losses = sorted([-r for r in self._rets if r < 0.0])  # positive magnitudes of losses
-        if not losses:
-            return None
-        # empirical VaR at alpha: quantile of loss distribution
-        var = _quantile(losses, self._alpha)
-        # empirical CVaR = mean of tail beyond VaR
-        tail = [l for l in losses if l >= var]
-        cvar = sum(tail) / max(1, len(tail))
+        if lq is not None:
+            if not len(lq):
+                return None
+            var = lq.quantile(self._alpha)
+            n_tail, s_tail = lq.count_sum_ge(var)
+            cvar = s_tail / max(1, n_tail)
+        else:
+            losses = sorted([-r for r in self._rets if r < 0.0])  # positive magnitudes of losses
+            if not losses:
+                return None
+            # empirical VaR at alpha: quantile of loss distribution
+            var = _quantile(losses, self._alpha)
+            # empirical CVaR = mean of tail beyond VaR
+            tail = [l for l in losses if l >= var]
+            cvar = sum(tail) / max(1, len(tail))
         if cvar >= self._limit and self._debounced(ts_ns):
             return AlertResult(True, f"CvarBreachAlert: CVaR {cvar:.4f} >= limit {self._limit:.4f} at alpha={self._alpha}")
         return None
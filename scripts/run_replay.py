@@ -26,6 +26,8 @@ Input format
 ------------
 JSONL with 1 raw event per line (dict). Supported keys include any aliases
 recognized by Normalizer (ts/T/time, price/p, qty/size, bid/ask, etc.).
+Alternatively `--tickstore DIR` replays a pre-normalized binary tick store
+built by tools/build_tickstore.py (no JSON parsing / normalization per run).
 
 Notes
 -----
@@ -163,7 +165,9 @@ def make_decision(
 
 def main() -> None:
     ap = argparse.ArgumentParser(description="Aurora replay runner")
-    ap.add_argument("--input", type=str, default="", help="JSONL events; empty -> synthetic stream")
+    ap.add_argument("--input", type=str, default="", help="JSONL events (file, directory or comma-separated files, merged by time); empty -> synthetic stream")
+    ap.add_argument("--tickstore", type=str, default="", help="Tick store root (tools/build_tickstore.py); overrides --input")
+    ap.add_argument("--symbols", type=str, default="", help="Comma-separated symbols to replay from --tickstore")
     ap.add_argument("--config", type=str, default="configs/default.toml")
     ap.add_argument("--schema", type=str, default="configs/schema.json")
     ap.add_argument("--profile", type=str, default="", help="Apply named profile from config (e.g. local_low)")
@@ -298,7 +302,21 @@ def main() -> None:
         print(f"PROFILE: applied {args.profile} -> {out_path}")
 
     # Source
-    if args.input:
+    prenormalized = False
+    if args.tickstore:
+        from core.ingestion.tickstore import TickStore
+
+        syms = {s.strip().upper() for s in args.symbols.split(",") if s.strip()} or None
+        src = TickStore(args.tickstore).source(symbols=syms)
+        prenormalized = True
+    elif args.input and (Path(args.input).is_dir() or "," in args.input):
+        from core.ingestion.merged_source import MergedSource
+
+        if Path(args.input).is_dir():
+            src = MergedSource.from_glob(args.input)
+        else:
+            src = MergedSource.from_paths([p.strip() for p in args.input.split(",") if p.strip()])
+    elif args.input:
         src = read_jsonl(Path(args.input))
     else:
         src = synthetic_stream(1000)
@@ -306,7 +324,7 @@ def main() -> None:
     # Ingestion
     norm = Normalizer(source_tag="replay", strict=False)
     clock = ReplayClock(speed=max(1e-6, float(args.speed)))
-    replay = Replay(source=src, normalizer=norm, clock=clock, strict=False, pace=True)
+    replay = Replay(source=src, normalizer=norm, clock=clock, strict=False, pace=True, prenormalized=prenormalized)
 
     # Model & calibration
     # Simple default weights for demo: rely on inline features
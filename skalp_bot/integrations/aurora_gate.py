@@ -53,3 +53,15 @@ class AuroraGate:
             return True
         except Exception:
             return False
+
+
+def make_gate(base_url: str = "http://127.0.0.1:8037", mode: str = "testnet", timeout_s: float = DEFAULT_TIMEOUT_S, http_gate=None):
+    """Return the gate selected by AURORA_GATE_MODE: 'http' (default) or 'embedded' (in-process pipeline).
+
+    `http_gate(base_url=, mode=, timeout_s=)` builds the HTTP client (AuroraGate by default).
+    Either way `check()` returns a PretradeCheckResponse-shaped dict and `posttrade()` a bool.
+    """
+    if os.getenv("AURORA_GATE_MODE", "http").strip().lower() == "embedded":
+        from core.aurora.embedded import EmbeddedGate
+        return EmbeddedGate(mode=mode)
+    return (http_gate or AuroraGate)(base_url=base_url, mode=mode, timeout_s=timeout_s)
@@ -63,14 +63,14 @@ class AuroraGate:
         # Fail-closed: deny on network error
         return {"allow": False, "reason": "NETWORK_ERROR", "hard_gate": True, "observability": {"gate_state": "ERROR"}}
 
-    def posttrade(self, **payload) -> dict:
+    def posttrade(self, **payload) -> bool:
         if self._requests is None:
-            return {"ok": True}
+            return True
         try:
             r = self._requests.post(f"{self.base_url}/posttrade/log", json=payload, timeout=self.timeout_s)
-            return {"ok": bool(r.ok), "status": r.status_code}
-        except Exception as e:
-            return {"ok": False, "error": str(e)}
+            return bool(r.ok)
+        except Exception:
+            return False
 
 
 # --- Simple feature/alpha helpers (kept consistent with tests mocks) ---
@@ -225,8 +225,14 @@ def main(config_path: Optional[str] = None, base_url: Optional[str] = None) -> N
         max_weight=portfolio_config.get("max_weight", 0.2)
     )
 
-    # Gate client
-    gate = AuroraGate(base_url=base_url, mode=mode, timeout_s=float(os.getenv("AURORA_HTTP_TIMEOUT_MS", "120")) / 1000.0)
+    # Gate client: HTTP by default; AURORA_GATE_MODE=embedded runs the pretrade pipeline in-process
+    from skalp_bot.integrations.aurora_gate import make_gate
+    gate = make_gate(
+        base_url=base_url,
+        mode=mode,
+        timeout_s=float(os.getenv("AURORA_HTTP_TIMEOUT_MS", "120")) / 1000.0,
+        http_gate=AuroraGate,
+    )
 
     st = _State()
     # simple TP threshold (fractional move from entry); env override
@@ -10,6 +10,8 @@ def test_events_rotation_smoke(tmp_path: Path):
     # write enough events to trigger rotation
     for i in range(200):
         logger.emit("ORDER.SUBMIT", {"symbol": "X", "cid": f"C{i}", "ts_ns": i})
+    # compression runs on the background rotation worker; close() waits for it
+    logger.close()
     # current file exists
     assert p.exists()
     # some gz archives should exist
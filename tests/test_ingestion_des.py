@@ -0,0 +1,114 @@
+import pytest
+
+from core.ack_tracker import AckTracker
+from core.execution.sim_local_sink import SimLocalSink
+from core.ingestion.des import PRIORITY_MARKET, SimScheduler
+from core.ingestion.replay import Replay
+from core.ingestion.sync_clock import VirtualClock
+
+MS = 1_000_000
+
+
+class _Ev:
+    def __init__(self):
+        self.events = []
+
+    def emit(self, code, details):
+        self.events.append((code, details))
+
+
+def test_time_priority_fifo_and_cancel():
+    s = SimScheduler()
+    seen = []
+    s.schedule_at(20, seen.append, "c")
+    s.schedule_at(10, seen.append, "m", priority=PRIORITY_MARKET)
+    s.schedule_at(10, seen.append, "a")
+    s.schedule_at(10, seen.append, "b")
+    s.schedule_at(15, seen.append, "x").cancel()
+    s.schedule_at(30, seen.append, "late")
+    st = s.run(until_ns=25)
+    assert seen == ["a", "b", "m", "c"]
+    assert s.now_ns() == 25 and len(s) == 1
+    assert st.dispatched == 4 and st.cancelled == 1
+    s.run()
+    assert seen[-1] == "late" and s.now_ns() == 30
+    with pytest.raises(ValueError):
+        VirtualClock(5).advance_to(4)
+
+
+def test_sink_latency_interleaves_with_market_stream():
+    s = SimScheduler(VirtualClock(1_000 * MS))
+    cfg = {"order_sink": {"sim_local": {"latency_ms_range": [10, 10], "seed": 1, "post_only": False}}}
+    log = []
+    sink = SimLocalSink(cfg, ev=_Ev(), scheduler=s, on_status=lambda e: log.append(("status", s.now_ns(), e["status"])))
+    market = {"best_bid": 99.0, "best_ask": 100.0, "liquidity": {"bid": 1.0, "ask": 1.0}}
+
+    def on_market(evt):
+        log.append(("mkt", evt["ts_ns"]))
+        if evt["ts_ns"] == 1_000 * MS:
+            sink.submit({"side": "buy", "qty": 0.5, "order_type": "market"}, market)
+
+    ticks = [{"ts_ns": (1_000 + d) * MS} for d in (0, 5, 15, 25)]
+    s.feed(ticks, on_market)
+    s.run()
+    # fill arrives after action (10ms) + fill (10ms) latency, between the 15ms and 25ms ticks
+    assert log == [("mkt", 1_000 * MS), ("mkt", 1_005 * MS), ("mkt", 1_015 * MS),
+                   ("status", 1_020 * MS, "filled"), ("mkt", 1_025 * MS)]
+    assert s.stats.market_events == 4
+
+
+def test_sink_order_meets_the_book_at_arrival_time():
+    s = SimScheduler(VirtualClock(0))
+    cfg = {"order_sink": {"sim_local": {"latency_ms_range": [10, 10], "seed": 1, "post_only": False}}}
+    ev = _Ev()
+    sink = SimLocalSink(cfg, ev=ev, scheduler=s)
+    sink.submit({"order_id": "a", "side": "buy", "qty": 1.0, "price": 100.0},
+                {"best_bid": 100.5, "best_ask": 101.0, "liquidity": {"bid": 5.0, "ask": 5.0}})
+    sink.submit({"order_id": "b", "side": "buy", "qty": 1.0, "price": 100.0})
+    # the ask drops through the limit while both orders are in flight
+    s.schedule_at(5 * MS, sink.update_market, {"best_bid": 99.0, "best_ask": 99.5})
+    s.schedule_at(6 * MS, sink.cancel, "b")
+    s.run()
+    status = {d["order_id"]: (d["status"], d["px"]) for _, d in ev.events}
+    assert status["a"][0] == "filled" and status["a"][1] == pytest.approx(99.5, rel=1e-3)
+    assert status["b"] == ("cancelled", None)
+    assert sink._orders == {} and sink._inflight == {}
+
+
+def test_ack_tracker_expiry_on_virtual_time():
+    s = SimScheduler(VirtualClock(0))
+    expired = []
+    tr = AckTracker(events_emit=lambda code, d: expired.append((code, d["cid"], s.now_ns())), ttl_s=1, clock=s.clock.now_ns)
+    s.every(250 * MS, tr.scan_once)
+    s.schedule_at(100 * MS, tr.add_submit, "BTCUSDT", "c1", "buy", 1.0)
+    s.schedule_at(200 * MS, tr.add_submit, "BTCUSDT", "c2", "buy", 1.0)
+    s.schedule_at(500 * MS, tr.ack, "c2")
+    s.feed(({"ts_ns": t * 100 * MS} for t in range(1, 31)), lambda e: None)
+    s.run()
+    assert expired == [("ORDER.EXPIRE", "c1", 1250 * MS)]
+    # periodic timer does not keep a drained simulation alive
+    assert len(s) == 0 and s.now_ns() <= 3250 * MS
+
+
+def test_replay_pacing_on_virtual_clock_does_not_sleep():
+    raw = [{"ts": t, "type": "trade", "symbol": "BTCUSDT", "price": 1.0, "qty": 1.0} for t in (10**9, 10**11, 10**11 + 5)]
+    clk = VirtualClock()
+    out = list(Replay(source=raw, clock=clk, pace=True).stream())
+    assert len(out) == 3 and clk.now_ns() == 10**11 + 5
+
+
+def test_periodic_timers_do_not_keep_each_other_alive():
+    sched = SimScheduler()
+    ticks = {"a": 0, "b": 0}
+    sched.every(1000, lambda: ticks.__setitem__("a", ticks["a"] + 1))
+    sched.every(1500, lambda: ticks.__setitem__("b", ticks["b"] + 1))
+    sched.schedule_at(5000, lambda: None)
+    late = sched.schedule_at(9000, lambda: None)
+    late.cancel()  # cancelled events do not count as pending
+    assert sched.pending() == 1
+    sched.run(max_events=1000)
+    assert sched.pending() == 0
+    assert len(sched) == 0 or all(e.cancelled for e in sched._heap)
+    # timers stop re-arming once the t=5000 callback has run (b was armed at 4500)
+    assert ticks == {"a": 5, "b": 4}
+    assert sched.now_ns() <= 6000
@@ -0,0 +1,80 @@
+import gzip
+import json
+
+import pytest
+
+from core.ingestion.merged_source import MergedSource, group_rotated, group_streams
+from core.ingestion.normalizer import Normalizer
+from core.ingestion.replay import Replay
+from core.ingestion.sync_clock import ManualClock
+
+
+def _write(path, rows, gz=False):
+    data = "".join(json.dumps(r) + "\n" for r in rows)
+    if gz:
+        with gzip.open(path, "wt", encoding="utf-8") as fh:
+            fh.write(data)
+    else:
+        path.write_text(data, encoding="utf-8")
+
+
+def _trades(sym, ts_list):
+    return [{"ts": t, "type": "trade", "symbol": sym, "price": 1.0 + i, "qty": 1.0} for i, t in enumerate(ts_list)]
+
+
+@pytest.mark.parametrize("threads", [True, False])
+def test_kway_merge_across_files_and_gzip(tmp_path, threads):
+    _write(tmp_path / "btc.jsonl", _trades("BTCUSDT", [1, 4, 4, 9]))
+    _write(tmp_path / "eth.jsonl.gz", _trades("ETHUSDT", [2, 3, 4, 10]), gz=True)
+    (tmp_path / "sol.jsonl").write_text("not json\n" + json.dumps(_trades("SOLUSDT", [5])[0]) + "\n", encoding="utf-8")
+
+    src = MergedSource.from_glob(tmp_path, chunk=2, readahead=1, threads=threads)
+    out = [(r["ts"], r["symbol"]) for r in src]
+    # ties keep stream order (streams sorted by path)
+    assert out == [(1, "BTCUSDT"), (2, "ETHUSDT"), (3, "ETHUSDT"), (4, "BTCUSDT"), (4, "BTCUSDT"),
+                   (4, "ETHUSDT"), (5, "SOLUSDT"), (9, "BTCUSDT"), (10, "ETHUSDT")]
+    assert src.stats == {"streams": 3, "records": 9, "bad_lines": 1}
+    # re-iterable
+    assert len(list(src)) == 9
+
+
+def test_rotated_parts_chain_before_live_file(tmp_path):
+    base = tmp_path / "events.jsonl"
+    p2 = tmp_path / "events.jsonl.20240101.000500.part2.jsonl.gz"
+    p1 = tmp_path / "events.jsonl.20240101.000100.part1.jsonl"
+    _write(p1, _trades("BTCUSDT", [1, 2]))
+    _write(p2, _trades("BTCUSDT", [3]), gz=True)
+    _write(base, _trades("BTCUSDT", [4]))
+    assert group_rotated([base, p2, p1]) == [[p1, p2, base]]
+
+    r = Replay(source=MergedSource.from_paths([base, p2, p1]), normalizer=Normalizer(strict=True),
+               clock=ManualClock(start_wall_ns=0))
+    assert [e["ts_ns"] for e in r.stream()] == [1, 2, 3, 4]
+
+
+def test_day_files_chain_per_symbol_and_threads_are_capped(tmp_path):
+    (tmp_path / "BTCUSDT").mkdir()
+    d1, d2 = tmp_path / "BTCUSDT" / "20240101.jsonl", tmp_path / "BTCUSDT" / "20240102.jsonl.gz"
+    e1, e2 = tmp_path / "ethusdt-2024-01-01.jsonl", tmp_path / "ethusdt-2024-01-02.jsonl"
+    e2p = tmp_path / "ethusdt-2024-01-02.jsonl.20240102.000100.part1.jsonl"
+    _write(d1, _trades("BTCUSDT", [1, 5]))
+    _write(d2, _trades("BTCUSDT", [7, 9]), gz=True)
+    _write(e1, _trades("ETHUSDT", [2, 6]))
+    _write(e2p, _trades("ETHUSDT", [8]))
+    _write(e2, _trades("ETHUSDT", [10]))
+    assert group_streams([e2, d2, e2p, e1, d1]) == [[d1, d2], [e1, e2p, e2]]
+
+    src = MergedSource.from_glob(tmp_path, chunk=1, readahead=1, max_threads=1)
+    assert [r["ts"] for r in src] == [1, 2, 5, 6, 7, 8, 9, 10]
+    assert src.stats["streams"] == 2
+
+
+def test_early_stop_and_reader_errors(tmp_path):
+    _write(tmp_path / "a.jsonl", _trades("BTCUSDT", list(range(1, 5000))))
+    _write(tmp_path / "b.jsonl", _trades("ETHUSDT", list(range(1, 5000))))
+    it = iter(MergedSource.from_glob(tmp_path, chunk=16, readahead=1))
+    assert next(it)["ts"] == 1
+    it.close()  # stops background readers
+
+    with pytest.raises(FileNotFoundError):
+        list(MergedSource([tmp_path / "missing.jsonl"]))
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from core.ingestion.normalizer import Normalizer
+from core.ingestion.replay import Replay
+from core.ingestion.sync_clock import ManualClock
+from core.ingestion.tickstore import TickFile, TickStore, TickStoreWriter, day_of
+
+MS = 1_000_000
+DAY = 86_400_000 * MS
+T0 = 1_700_000_000_000 * MS  # 2023-11-14; raw events carry epoch ms
+
+
+def _raws():
+    return [
+        {"ts": (T0 + 300 * MS) // MS, "type": "trade", "symbol": "btcusdt", "price": 100.5, "qty": 0.5, "side": "buy", "seq": 7},
+        {"ts": (T0 + 100 * MS) // MS, "symbol": "BTCUSDT", "bid": 99.5, "ask": 100.5, "bid_size": 1.0},
+        {"ts": (T0 + 200 * MS) // MS, "type": "trade", "symbol": "ETHUSDT", "price": 10.0, "qty": 2.0, "source": "binance"},
+        {"ts": (T0 + DAY + 5 * MS) // MS, "type": "trade", "symbol": "BTCUSDT", "price": 101.0, "qty": 0.1, "side": "sell"},
+    ]
+
+
+def _normalized():
+    # per-stream order only; the store sorts each file by ts_ns
+    return [Normalizer(source_tag="replay", strict=True).normalize(r) for r in _raws()]
+
+
+def test_roundtrip_matches_normalizer_output(tmp_path):
+    evts = _normalized()
+    with TickStoreWriter(tmp_path) as w:
+        w.extend(evts)
+
+    store = TickStore(tmp_path)
+    files = store.files()
+    assert [(f.symbol, f.day, f.count) for f in files] == [
+        ("BTCUSDT", day_of(T0), 2), ("ETHUSDT", day_of(T0), 1), ("BTCUSDT", day_of(T0 + DAY), 1),
+    ]
+    out = list(store.iter_events())
+    assert out == sorted(evts, key=lambda e: e["ts_ns"])
+
+    with TickFile(files[0].path) as tf:
+        ts = tf.columns["ts_ns"]
+        assert isinstance(ts, np.ndarray) and not ts.flags.writeable
+        assert ts.tolist() == [T0 + 100 * MS, T0 + 300 * MS]
+        assert tf.span(T0 + 150 * MS, T0 + 400 * MS) == (1, 2)
+
+
+def test_filters_and_incremental_extend(tmp_path):
+    evts = _normalized()
+    with TickStoreWriter(tmp_path) as w:
+        w.extend(evts[:2])
+    with TickStoreWriter(tmp_path) as w:
+        w.extend(evts[2:])
+
+    store = TickStore(tmp_path)
+    assert len(store.files()) == 3
+    btc = list(store.iter_events(symbols={"BTCUSDT"}, types={"trade"}))
+    assert [e["ts_ns"] for e in btc] == [T0 + 300 * MS, T0 + DAY + 5 * MS]
+    assert btc[0]["seq"] == 7 and btc[0]["side"] == "buy" and btc[0]["bid_px"] is None
+    window = list(store.iter_events(start_ts_ns=T0 + 150 * MS, end_ts_ns=T0 + 250 * MS))
+    assert [(e["symbol"], e["source"]) for e in window] == [("ETHUSDT", "binance")]
+
+
+def test_replay_prenormalized_skips_normalizer(tmp_path):
+    with TickStoreWriter(tmp_path) as w:
+        w.extend(_normalized())
+
+    class _NoNorm(Normalizer):
+        def normalize(self, raw):
+            raise AssertionError("normalizer must not run")
+
+    clk = ManualClock(start_wall_ns=T0)
+    r = Replay(source=TickStore(tmp_path).source(), normalizer=_NoNorm(), clock=clk, prenormalized=True)
+    out = list(r.stream(types={"trade"}))
+    assert [e["ts_ns"] for e in out] == [T0 + 200 * MS, T0 + 300 * MS, T0 + DAY + 5 * MS]
+    assert r.stats.normalized == 4 and r.stats.emitted == 3
+
+
+def test_rejects_foreign_file(tmp_path):
+    p = tmp_path / "x.atk"
+    p.write_bytes(b"not a tick file at all")
+    with pytest.raises(ValueError):
+        TickFile(p)
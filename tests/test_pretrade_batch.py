@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import importlib
+
+from fastapi.testclient import TestClient
+
+from core.aurora.gate_params import GateParams
+from core.aurora.pipeline import BatchDecideError, PretradePipeline
+
+
+def _intent(**market):
+    m = {"latency_ms": 1.0, "score": 0.5, "a_bps": 5.0, "b_bps": 20.0, "spread_bps": 2.0}
+    m.update(market)
+    return {
+        "account": {"mode": "testnet"},
+        "order": {"symbol": "BTCUSDT", "side": "buy", "qty": 0.01, "price": 100.0, "base_notional": 1.0},
+        "market": m,
+        "fees_bps": 0.5,
+    }
+
+
+def _pipe():
+    # slippage first so the no-b diagnostic row reaches the slippage gate
+    params = GateParams(slip_before_er=True)
+    return PretradePipeline(emitter=None, trap_window=None, health_guard=None, risk_manager=None, params=params)
+
+
+def test_decide_batch_matches_sequential_decide():
+    intents = [
+        _intent(),
+        _intent(latency_ms=500.0),                    # latency guard
+        _intent(score=-1.0),                          # expected return gate
+        _intent(slip_bps_est=7.0),                    # slippage guard
+        _intent(b_bps=0.0, a_bps=0.0, score=5.0),     # slippage skipped diagnostic
+        _intent(spread_bps=1000.0),                   # spread guard
+    ]
+    seq = [_pipe().decide(**it) for it in intents]
+    batch = _pipe().decide_batch(intents)
+    assert len(batch) == len(seq)
+    for (a1, r1, o1, s1), (a2, r2, o2, s2) in zip(seq, batch):
+        assert (a1, r1, s1) == (a2, r2, s2)
+        assert o1["reasons"] == o2["reasons"]
+    assert [d[1] for d in batch][:4] == ["ok", "latency_guard", "expected_return_gate", "slippage_guard"]
+    assert "slippage_guard_skipped_no_b" in batch[4][2]["reasons"]
+    assert batch[5][1].startswith("spread_bps_too_wide")
+
+
+class _FlakyGuard:
+    """HealthGuard stand-in that records latencies and fails once on latency 42."""
+
+    threshold_ms = 1e9
+
+    def __init__(self):
+        self.recorded = []
+        self.failed = False
+
+    def record(self, latency_ms):
+        self.recorded.append(latency_ms)
+        if latency_ms == 42.0 and not self.failed:
+            self.failed = True
+            raise RuntimeError("guard glitch")
+        return True, 0.0
+
+    def enforce(self):
+        return True, None
+
+    def snapshot(self):
+        return {}
+
+
+def test_decide_batch_error_carries_rows_already_decided():
+    hg = _FlakyGuard()
+    pipe = PretradePipeline(emitter=None, trap_window=None, health_guard=hg, risk_manager=None,
+                            params=GateParams(slip_before_er=True))
+    try:
+        pipe.decide_batch([_intent(), _intent(latency_ms=2.0), _intent(latency_ms=42.0), _intent()])
+    except BatchDecideError as e:
+        assert [d[1] for d in e.decided] == ["ok", "ok"] and isinstance(e.cause, RuntimeError)
+    else:  # pragma: no cover
+        raise AssertionError("expected BatchDecideError")
+    assert hg.recorded == [1.0, 2.0, 42.0]
+
+
+def test_check_batch_fallback_does_not_redecide_finished_rows():
+    svc = importlib.import_module("api.service")
+    client = TestClient(svc.app)
+    prev = getattr(svc.app.state, "health_guard", None)
+    svc.app.state.health_guard = hg = _FlakyGuard()
+    try:
+        body = {"intents": [_intent(latency_ms=3.0), _intent(latency_ms=42.0), _intent(latency_ms=4.0)]}
+        for it, sym in zip(body["intents"], ["LTCUSDT", "BNBUSDT", "TRXUSDT"]):
+            it["order"]["symbol"] = sym
+        r = client.post("/pretrade/check_batch", json=body)
+        assert r.status_code == 200 and len(r.json()["results"]) == 3
+        # the failed row is retried once; the row before it is not recorded twice
+        assert hg.recorded == [3.0, 42.0, 42.0, 4.0]
+    finally:
+        svc.app.state.health_guard = prev
+
+
+def test_decide_batch_empty():
+    assert _pipe().decide_batch([]) == []
+
+
+def test_check_batch_endpoint_returns_result_per_intent():
+    svc = importlib.import_module("api.service")
+    client = TestClient(svc.app)
+    body = {"intents": [_intent(), _intent(spread_bps=1000.0)]}
+    body["intents"][1]["order"]["symbol"] = "ETHUSDT"
+    r = client.post("/pretrade/check_batch", json=body)
+    assert r.status_code == 200
+    results = r.json()["results"]
+    assert len(results) == 2
+    assert results[1]["allow"] is False
+    assert "spread" in results[1]["reason"]
+    for res in results:
+        assert isinstance(res["observability"], dict)
+
+
+def test_check_batch_rate_limits_repeated_symbol():
+    svc = importlib.import_module("api.service")
+    client = TestClient(svc.app)
+    prev = getattr(svc.app.state, "min_open_interval_ms", 0)
+    svc.app.state.min_open_interval_ms = 60_000
+    svc.app.state._last_open_allow_ms = {}
+    try:
+        body = {"intents": [_intent(), _intent()]}
+        body["intents"][0]["order"]["symbol"] = "XRPUSDT"
+        body["intents"][1]["order"]["symbol"] = "XRPUSDT"
+        results = client.post("/pretrade/check_batch", json=body).json()["results"]
+        assert results[1]["allow"] is False
+        assert results[1]["reason"] == "open_rate_limit"
+    finally:
+        svc.app.state.min_open_interval_ms = prev
+        svc.app.state._last_open_allow_ms = {}
+
+
+def test_check_batch_denied_first_intent_does_not_rate_limit_repeat():
+    svc = importlib.import_module("api.service")
+    client = TestClient(svc.app)
+    prev = getattr(svc.app.state, "min_open_interval_ms", 0)
+    svc.app.state.min_open_interval_ms = 60_000
+    svc.app.state._last_open_allow_ms = {}
+    try:
+        body = {"intents": [_intent(spread_bps=1000.0), _intent(), _intent(), _intent()]}
+        for it, sym in zip(body["intents"], ["ADAUSDT", "ADAUSDT", "ADAUSDT", "DOTUSDT"]):
+            it["order"]["symbol"] = sym
+        results = client.post("/pretrade/check_batch", json=body).json()["results"]
+        assert [r["allow"] for r in results] == [False, True, False, True]
+        assert results[0]["reason"].startswith("spread")
+        assert results[2]["reason"] == "open_rate_limit"
+    finally:
+        svc.app.state.min_open_interval_ms = prev
+        svc.app.state._last_open_allow_ms = {}
+
+
+def test_check_batch_rejects_oversized_batch():
+    svc = importlib.import_module("api.service")
+    client = TestClient(svc.app)
+    prev = getattr(svc.app.state, "pretrade_batch_max", svc.PRETRADE_BATCH_MAX)
+    svc.app.state.pretrade_batch_max = 2
+    try:
+        r = client.post("/pretrade/check_batch", json={"intents": [_intent()] * 3})
+        assert r.status_code == 422
+        assert client.post("/pretrade/check_batch", json={"intents": [_intent()] * 2}).status_code == 200
+    finally:
+        svc.app.state.pretrade_batch_max = prev
@@ -0,0 +1,45 @@
+import pytest
+
+from core.features.absorption import AbsorptionStream, _mock_stream, _side_code
+from core.types import MarketSnapshot, Side
+
+
+def test_side_codes():
+    assert _side_code(Side.BUY) == 1 and _side_code("SELL") == -1
+    assert _side_code("Side.BUY") == 1 and _side_code(None) == 0 and _side_code([]) == 0
+
+
+def test_window_aggregates_match_brute_force():
+    snaps = _mock_stream()
+    ab = AbsorptionStream(window_s=1.0)
+    seen = {}
+    for s in snaps:
+        f = ab.update(s)
+        for tr in s.trades:
+            seen[(tr.timestamp, tr.side, tr.size)] = tr
+        live = [t for t in seen.values() if t.timestamp >= s.timestamp - 1.0]
+        buys = [float(t.size) for t in live if t.side == Side.BUY]
+        sells = [float(t.size) for t in live if t.side == Side.SELL]
+        assert f["window_buy_vol"] == pytest.approx(sum(buys))
+        assert f["window_sell_vol"] == pytest.approx(sum(sells))
+        assert (f["window_buy_n"], f["window_sell_n"]) == (len(buys), len(sells))
+
+
+def test_ingest_trade_path_matches_snapshot_trades():
+    snaps = _mock_stream()
+    a, b = AbsorptionStream(), AbsorptionStream()
+    fed = set()
+    for s in snaps:
+        fa = a.update(s)
+        for tr in s.trades:
+            if id(tr) not in fed:
+                fed.add(id(tr))
+                b.ingest_trade(tr)
+        bare = MarketSnapshot(
+            timestamp=s.timestamp,
+            bid_price=s.bid_price,
+            ask_price=s.ask_price,
+            bid_volumes_l=s.bid_volumes_l,
+            ask_volumes_l=s.ask_volumes_l,
+        )
+        assert b.update(bare) == pytest.approx(fa)
@@ -0,0 +1,167 @@
+import json
+import random
+import time
+
+import pytest
+
+from core.governance.alpha_journal import AlphaJournal
+from core.governance.alpha_ledger import AlphaLedger
+
+
+class _Clock:
+    def __init__(self):
+        self.t = 0
+
+    def __call__(self):
+        self.t += 1000
+        return self.t
+
+
+def _drive(ledger, n_ops, seed):
+    rng = random.Random(seed)
+    for _ in range(n_ops):
+        tid = f"sprt:{rng.randint(0, 9)}"
+        tok = ledger.active_token_for(tid)
+        if tok is None:
+            ledger.open(tid, alpha0=0.05)
+        elif rng.random() < 0.8 and ledger.remaining(tok) > 0.002:
+            ledger.spend(tok, 0.001)
+        else:
+            ledger.close(tok, rng.choice(["accept", "reject", "abandon"]))
+
+
+def test_recovery_reproduces_state_and_bounds_journal(tmp_path):
+    j = AlphaJournal(tmp_path, snapshot_every=50, fsync=False)
+    live = AlphaLedger(clock_ns=_Clock(), journal=j)
+    _drive(live, 437, seed=1)
+    j.close()
+    assert (tmp_path / AlphaJournal.SNAPSHOT).exists()
+    assert len((tmp_path / AlphaJournal.JOURNAL).read_bytes().splitlines()) < 50
+
+    back = AlphaLedger(journal=AlphaJournal(tmp_path, snapshot_every=50, fsync=False))
+    assert back.to_json() == live.to_json()
+    for tid in (f"sprt:{i}" for i in range(10)):
+        assert back.list_transactions(tid) == live.list_transactions(tid)
+        assert all(t.test_id == tid for t in back.list_transactions(tid))
+    assert sum(len(back.list_transactions(f"sprt:{i}")) for i in range(10)) == len(back.list_transactions())
+
+
+def test_torn_tail_is_dropped_and_appends_continue(tmp_path):
+    j = AlphaJournal(tmp_path, snapshot_every=0, fsync=False)
+    led = AlphaLedger(clock_ns=_Clock(), journal=j)
+    tok = led.open("t", 0.05)
+    led.spend(tok, 0.01)
+    j.close()
+    path = tmp_path / AlphaJournal.JOURNAL
+    good = path.read_bytes()
+    path.write_bytes(good + b'{"seq":3,"op":"spend","tok')  # crash mid-append
+
+    j2 = AlphaJournal(tmp_path, snapshot_every=0, fsync=False)
+    led2 = AlphaLedger(clock_ns=_Clock(), journal=j2)
+    assert path.read_bytes() == good and j2.seq == 2
+    assert led2.get_transaction(tok).spent == pytest.approx(0.01)
+    led2.spend(tok, 0.02)
+    j2.close()
+    led3 = AlphaLedger(journal=AlphaJournal(tmp_path, fsync=False))
+    assert led3.get_transaction(tok).spent == pytest.approx(0.03)
+    assert [h["amount"] for h in led3.get_transaction(tok).history] == [0.01, 0.02]
+
+
+def test_records_covered_by_snapshot_are_not_replayed_twice(tmp_path):
+    j = AlphaJournal(tmp_path, snapshot_every=0, fsync=False)
+    led = AlphaLedger(clock_ns=_Clock(), journal=j)
+    tok = led.open("t", 0.05)
+    led.spend(tok, 0.01)
+    journal_before = (tmp_path / AlphaJournal.JOURNAL).read_bytes()
+    led.snapshot()
+    # crash after the snapshot rename but before the journal was truncated
+    (tmp_path / AlphaJournal.JOURNAL).write_bytes(journal_before)
+    j.close()
+
+    back = AlphaLedger(journal=AlphaJournal(tmp_path, fsync=False))
+    assert back.get_transaction(tok).spent == pytest.approx(0.01)
+    assert len(back.get_transaction(tok).history) == 1
+
+
+def test_corrupt_record_before_tail_raises(tmp_path):
+    j = AlphaJournal(tmp_path, snapshot_every=0, fsync=False)
+    led = AlphaLedger(clock_ns=_Clock(), journal=j)
+    tok = led.open("t", 0.05)
+    led.spend(tok, 0.01)
+    j.close()
+    path = tmp_path / AlphaJournal.JOURNAL
+    lines = path.read_bytes().splitlines(keepends=True)
+    path.write_bytes(b"garbage\n" + lines[1])
+    with pytest.raises(ValueError, match="corrupt"):
+        AlphaLedger(journal=AlphaJournal(tmp_path, fsync=False))
+
+
+def test_clear_and_from_json_rewrite_snapshot(tmp_path):
+    led = AlphaLedger(clock_ns=_Clock(), journal=AlphaJournal(tmp_path / "a", fsync=False))
+    led.close(led.open("x", 0.05), "accept")
+    blob = led.to_json()
+    led.clear()
+    assert AlphaLedger(journal=AlphaJournal(tmp_path / "a", fsync=False)).list_transactions() == []
+
+    other = AlphaLedger(clock_ns=_Clock(), journal=AlphaJournal(tmp_path / "b", fsync=False))
+    other.from_json(blob)
+    snap = json.loads((tmp_path / "b" / AlphaJournal.SNAPSHOT).read_text())
+    assert snap["kind"] == "alpha_ledger" and snap["state"] == json.loads(blob)
+    back = AlphaLedger(journal=AlphaJournal(tmp_path / "b", fsync=False))
+    assert back.to_json() == blob and len(back.list_transactions("x")) == 1
+
+
+def test_snapshot_archives_old_closed_txns_and_stays_bounded(tmp_path):
+    j = AlphaJournal(tmp_path, snapshot_every=20, fsync=False, retain_closed=5)
+    live = AlphaLedger(clock_ns=_Clock(), journal=j)
+    _drive(live, 600, seed=2)
+    live.snapshot()
+    j.close()
+
+    snap = json.loads((tmp_path / AlphaJournal.SNAPSHOT).read_text())["state"]["transactions"]
+    closed = [t for t in snap.values() if t["outcome"] != "open"]
+    assert len(closed) == 5
+    assert {t["token"] for t in snap.values() if t["outcome"] == "open"} == {
+        live.active_token_for(f"sprt:{i}") for i in range(10)
+    } - {None}
+    archived = [json.loads(line) for line in (tmp_path / AlphaJournal.ARCHIVE).read_bytes().splitlines()]
+    assert archived and all(t["outcome"] != "open" for t in archived)
+    assert not {t["token"] for t in archived} & set(snap)
+    assert max(t["closed_ts_ns"] for t in archived) <= min(t["closed_ts_ns"] for t in closed)
+
+    back = AlphaLedger(journal=AlphaJournal(tmp_path, fsync=False, retain_closed=5))
+    assert back.to_json() == live.to_json()
+    assert sum(len(back.list_transactions(f"sprt:{i}")) for i in range(10)) == len(back.list_transactions())
+
+    full = AlphaLedger(clock_ns=_Clock())
+    _drive(full, 600, seed=2)
+    want, got = full.summary(), back.summary()
+    assert got["total_alloc"] == pytest.approx(want["total_alloc"])
+    assert got["total_spent"] == pytest.approx(want["total_spent"])
+    assert (got["active_tests"], got["closed_tests"]) == (want["active_tests"], want["closed_tests"])
+    assert {k: v["count"] for k, v in got["by_outcome"].items()} == {
+        k: v["count"] for k, v in want["by_outcome"].items()
+    }
+    assert got["by_test_id"].keys() == want["by_test_id"].keys()
+
+
+def test_archiving_is_opt_in_and_summary_keeps_archived_spend(tmp_path):
+    assert AlphaJournal(tmp_path / "d", fsync=False).retain_closed is None
+    led = AlphaLedger(clock_ns=_Clock(), journal=AlphaJournal(tmp_path, fsync=False, retain_closed=2))
+    for i in range(10):
+        tok = led.open(f"t{i}", 0.05)
+        led.spend(tok, 0.005)
+        led.close(tok, "reject")
+    led.snapshot()
+    s = led.summary()
+    assert s["total_spent"] == pytest.approx(0.05) and s["total_alloc"] == pytest.approx(0.5)
+    assert s["closed_tests"] == 10 and s["by_outcome"]["reject"]["count"] == 10
+    assert s["by_test_id"]["t0"]["spent"] == pytest.approx(0.005)
+    assert led.list_transactions("t0") == [] and len(led.list_transactions()) == 2
+    led.clear()
+    assert led.summary()["total_spent"] == 0.0
+
+
+def test_default_clock_is_wall_clock_with_a_journal(tmp_path):
+    assert AlphaLedger(journal=AlphaJournal(tmp_path, fsync=False))._clock_ns is time.time_ns
+    assert AlphaLedger()._clock_ns is time.monotonic_ns
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+import pytest
+
+from core.aurora_event_logger import AsyncEventEmitter, AuroraEventLogger
+
+
+class _Counter:
+    def __init__(self):
+        self.by_reason = {}
+
+    def labels(self, reason):
+        c = self
+
+        class _L:
+            def inc(self_inner):
+                c.by_reason[reason] = c.by_reason.get(reason, 0) + 1
+
+        return _L()
+
+
+class _SlowLogger(AuroraEventLogger):
+    """Writer blocked until released, to fill the queue deterministically."""
+
+    def __init__(self, path):
+        super().__init__(path=path)
+        self.gate = threading.Event()
+
+    def emit(self, *a, **kw):
+        self.gate.wait(5.0)
+        super().emit(*a, **kw)
+
+
+def _codes(p):
+    return [json.loads(x)['event_code'] for x in p.read_text(encoding='utf-8').splitlines()]
+
+
+def test_events_written_by_writer_thread_and_flushed(tmp_path):
+    p = tmp_path / 'aurora_events.jsonl'
+    em = AsyncEventEmitter(AuroraEventLogger(path=p))
+    for i in range(50):
+        em.emit(type='POLICY.DECISION', severity=None, code=None, payload={'i': i})
+    em.emit('ORDER.FILL', {'symbol': 'X', 'oid': '1'}, src='api')
+    assert em.flush()
+    codes = _codes(p)
+    assert len(codes) == 51 and codes[-1] == 'ORDER.FILL'
+    em.close()
+
+
+def test_unknown_code_rejected_synchronously(tmp_path):
+    em = AsyncEventEmitter(AuroraEventLogger(path=tmp_path / 'e.jsonl'))
+    with pytest.raises(ValueError):
+        em.emit('NOT.A.CODE', {})
+    em.close()
+
+
+def test_drop_noncritical_keeps_critical(tmp_path):
+    p = tmp_path / 'aurora_events.jsonl'
+    inner = _SlowLogger(p)
+    em = AsyncEventEmitter(inner, maxsize=2, policy='drop_noncritical')
+    dropped = _Counter()
+    em.set_metrics(dropped_counter=dropped)
+    for i in range(10):
+        em.emit('POLICY.DECISION', {'i': i})
+    em.emit('ORDER.REJECT', {'symbol': 'X', 'oid': 'r'})
+    inner.gate.set()
+    em.close()
+    codes = _codes(p)
+    assert 'ORDER.REJECT' in codes
+    assert dropped.by_reason.get('queue_full', 0) >= 1
+    assert len(codes) + em.dropped == 11
+
+
+def test_spill_preserves_order_without_loss(tmp_path):
+    p = tmp_path / 'aurora_events.jsonl'
+    inner = _SlowLogger(p)
+    em = AsyncEventEmitter(inner, maxsize=2, policy='spill')
+    for i in range(20):
+        em.emit('POLICY.DECISION', {'i': i})
+    assert em.depth() > 2
+    inner.gate.set()
+    em.close()
+    rows = [json.loads(x) for x in p.read_text(encoding='utf-8').splitlines()]
+    assert [r['details']['i'] for r in rows] == list(range(20))
+    assert em.dropped == 0
+
+
+def test_drop_noncritical_uses_free_slots_while_critical_spilled(tmp_path):
+    p = tmp_path / 'aurora_events.jsonl'
+    inner = _SlowLogger(p)
+    em = AsyncEventEmitter(inner, maxsize=2, policy='drop_noncritical')
+    em.emit('POLICY.DECISION', {'i': 0})  # taken by the blocked writer
+    deadline = time.time() + 5.0
+    while em._q.qsize() and time.time() < deadline:
+        time.sleep(0.001)
+    em.emit('POLICY.DECISION', {'i': 1})
+    em.emit('POLICY.DECISION', {'i': 2})  # queue full
+    em.emit('ORDER.REJECT', {'symbol': 'X', 'oid': 'r'})  # spilled
+    assert em.dropped == 0 and len(em._spill) == 1
+    with em._put_lock:
+        em._q.get_nowait()  # a slot frees up while the spill is non-empty
+    em.emit('POLICY.DECISION', {'i': 3})
+    assert em.dropped == 0
+    em._done()
+    inner.gate.set()
+    em.close()
+    codes = _codes(p)
+    assert codes.count('POLICY.DECISION') == 3 and 'ORDER.REJECT' in codes
+
+
+def test_spill_drains_without_idle_timeouts(tmp_path):
+    p = tmp_path / 'aurora_events.jsonl'
+    inner = _SlowLogger(p)
+    em = AsyncEventEmitter(inner, maxsize=1, policy='spill')
+    for i in range(200):
+        em.emit('POLICY.DECISION', {'i': i})
+    t0 = time.perf_counter()
+    inner.gate.set()
+    assert em.flush()
+    # one 50 ms idle wait per refill cycle would take ~10 s here
+    assert time.perf_counter() - t0 < 2.0
+    em.close()
+    rows = [json.loads(x) for x in p.read_text(encoding='utf-8').splitlines()]
+    assert [r['details']['i'] for r in rows] == list(range(200))
+
+
+class _PausingPrefixes:
+    """critical_prefixes that park a producer thread mid-emit until released."""
+
+    def __init__(self):
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def __iter__(self):
+        if threading.current_thread() is not threading.main_thread():
+            self.entered.set()
+            self.release.wait(5.0)
+        return iter(('ORDER.',))
+
+
+def test_emit_racing_close_is_written_or_counted(tmp_path):
+    p = tmp_path / 'aurora_events.jsonl'
+    gate = _PausingPrefixes()
+    em = AsyncEventEmitter(AuroraEventLogger(path=p), critical_prefixes=gate)
+    th = threading.Thread(target=em.emit, args=('POLICY.DECISION', {'i': 0}))
+    th.start()
+    assert gate.entered.wait(5.0)
+    em.close()  # the writer is gone before the parked emit resumes
+    gate.release.set()
+    th.join(5.0)
+    assert em._pending == 0 and em.flush(timeout=0.1)
+    assert len(_codes(p)) + em.dropped == 1 and em.depth() == 0
@@ -0,0 +1,100 @@
+import random
+
+import numpy as np
+import pytest
+
+from core.calibration.drift import CUSUMDetector, DriftBank, DriftMonitor, GLRDetector
+from core.regime.glr import GLRMeanShift
+from core.utils.changepoint import GLRBank, WindowGLR, split_grid
+
+
+def _scan(xs, weight, ddof):
+    """Exhaustive split scan over the whole buffer (the pre-engine algorithm)."""
+    n = len(xs)
+    if n < 2:
+        return 0.0, None
+    mu = sum(xs) / n
+    var = sum((x - mu) ** 2 for x in xs) / max(1, n - ddof)
+    best, k_hat = 0.0, None
+    for k in range(1, n):
+        gap = sum(xs[:k]) / k - sum(xs[k:]) / (n - k)
+        w = min(k, n - k) if weight == "min" else k * (n - k) / n
+        s = w * gap * gap / var
+        if s > best:
+            best, k_hat = s, k
+    return best, k_hat
+
+
+def test_split_grid_is_dense_at_both_ends():
+    assert split_grid(6, per_octave=0) == [5, 4, 3, 2, 1]
+    g = split_grid(512, per_octave=4)
+    assert g == sorted(set(g), reverse=True)
+    assert {1, 2, 3, 4, 511, 510, 509, 508} <= set(g)
+    assert len(g) < 100
+
+
+@pytest.mark.parametrize("weight,ddof", [("glr", 1), ("min", 0)])
+def test_exact_grid_matches_exhaustive_scan_across_rebases(weight, ddof):
+    rng = random.Random(5)
+    eng = WindowGLR(40, per_octave=0, weight=weight, ddof=ddof)
+    buf = []
+    for t in range(300):  # several full-window rebases, large offset
+        x = 1e4 + rng.gauss(0.0, 1.0) + (2.0 if 150 <= t < 200 else 0.0)
+        buf = (buf + [x])[-40:]
+        stat, k_hat = eng.update(x)
+        ref, ref_k = _scan(buf, weight, ddof)
+        assert stat == pytest.approx(ref, rel=1e-6, abs=1e-9)
+        assert k_hat == ref_k
+    mean, var = eng.mean_var()
+    assert mean == pytest.approx(np.mean(buf)) and var == pytest.approx(np.var(buf, ddof=ddof))
+
+
+def test_bank_matches_per_stream_engines_with_partial_updates():
+    rng = np.random.default_rng(1)
+    S, W = 24, 64
+    bank = GLRBank(S, W, per_octave=4, clip=3.0)
+    ref = [WindowGLR(W, per_octave=4, clip=3.0) for _ in range(S)]
+    for t in range(400):
+        mask = rng.random(S) < 0.6
+        x = rng.normal(size=S) + (t > 200) * np.linspace(0.0, 2.0, S)
+        stat, k_hat = bank.update(x[mask], mask)
+        want = [ref[i].update(x[i]) for i in np.flatnonzero(mask)]
+        assert np.allclose(stat, [s for s, _ in want], rtol=1e-9, atol=1e-12)
+        assert k_hat.tolist() == [-1 if k is None else k for _, k in want]
+    bank.reset([0, 1])
+    assert bank.counts([0, 1, 2]).tolist()[:2] == [0, 0]
+
+
+def test_geometric_grid_detects_recent_shift_like_full_scan():
+    rng = random.Random(11)
+    fast = GLRMeanShift(window=256, threshold=40.0, min_samples=30, per_octave=8)
+    full = GLRMeanShift(window=256, threshold=40.0, min_samples=30, per_octave=0)
+    default = GLRMeanShift(window=256, threshold=40.0, min_samples=30)
+    hits = {}
+    for t in range(900):
+        x = rng.gauss(0.0, 1.0) + (1.0 if t >= 600 else 0.0)
+        for name, det in (("fast", fast), ("full", full), ("default", default)):
+            if det.update(x).triggered and name not in hits:
+                hits[name] = t
+    assert hits["default"] == hits["full"]  # exact scan unless the grid is opted into
+    assert 600 <= hits["full"] <= hits["fast"] <= hits["full"] + 10
+
+
+def test_drift_bank_matches_drift_monitors():
+    rng = np.random.default_rng(2)
+    S = 8
+    bank = DriftBank(S, k=0.25, h=6.0, window=50, thr=20.0, clip=4.0)
+    mons = [
+        DriftMonitor(cusum=CUSUMDetector(k=0.25, h=6.0, clip=4.0), glr=GLRDetector(window=50, thr=20.0, clip=4.0))
+        for _ in range(S)
+    ]
+    alarms = 0
+    for t in range(300):
+        x = rng.normal(size=S) * 1.5 + (t > 150) * 1.2
+        out = bank.update(x)
+        for i, m in enumerate(mons):
+            ref = m.update(float(x[i]))
+            for key in ("cusum_pos", "cusum_neg", "glr_stat", "drift_alarm"):
+                assert out[key][i] == pytest.approx(ref[key], rel=1e-9, abs=1e-12)
+        alarms += int(out["drift_alarm"].sum())
+    assert alarms > 0
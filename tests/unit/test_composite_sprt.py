@@ -389,6 +389,37 @@ class TestCompositeSPRT:
         assert len(sprt.observations) == 0
         assert sprt.log_lr == 0
 
+    def test_subexponential_fallback_ignores_history_cap(self):
+        """Subexp fallback LLR не залежить від max_history і збігається з повною вибіркою"""
+        rng = np.random.default_rng(7)
+        obs = np.concatenate([rng.normal(0, 1, 150), rng.pareto(1.5, 50) * 3])
+        rng.shuffle(obs)
+
+        def run(max_history):
+            sprt = CompositeSPRT(alpha=1e-12, beta=1e-12, max_history=max_history)
+            del sprt.params_h0, sprt.params_h1  # no fixed params: model-fitted fallback
+            h0, h1 = SubexponentialModel(2.0), SubexponentialModel(1.5)
+            return sprt, [sprt.update(x, h0, h1).log_likelihood_ratio for x in obs]
+
+        capped, llr_capped = run(20)
+        _, llr_full = run(10_000)
+        assert llr_capped == pytest.approx(llr_full, rel=1e-12)
+        assert len(capped.observations) == len(obs)
+
+        # reference: parameters re-estimated from the whole sample each step
+        ref, llr = CompositeSPRT(alpha=1e-12, beta=1e-12), 0.0
+        h0, h1 = SubexponentialModel(2.0), SubexponentialModel(1.5)
+        for i, x in enumerate(obs):
+            head = obs[: i + 1]
+            st0 = {'min': head.min(), 'var': head.var(), 'tail_index': h0.tail_index_estimate(head)}
+            st1 = {'min': head.min(), 'var': head.var(), 'tail_index': h1.tail_index_estimate(head)}
+            llr += ref._subexp_likelihood(x, st1) - ref._subexp_likelihood(x, st0)
+            if i % 40 == 0:
+                assert llr_full[i] == pytest.approx(llr, rel=1e-6, abs=1e-9)
+        capped.reset()
+        assert capped.observations.maxlen == 20
+
+
 class TestPropertyBased:
     """Property-based тести згідно вимог архітектора"""
     
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+
+from core.aurora.embedded import EmbeddedGate
+
+
+class _Emitter:
+    def __init__(self):
+        self.events = []
+
+    def emit(self, *args, **kwargs):
+        code = kwargs.get('type') or (args[0] if args else None)
+        self.events.append(code)
+
+
+def _gate(tmp_path, cfg=None):
+    em = _Emitter()
+    g = EmbeddedGate(cfg or {}, mode='testnet', session_dir=tmp_path, emitter=em)
+    return g, em
+
+
+def _market(**kw):
+    m = {'latency_ms': 1.0, 'score': 0.5, 'a_bps': 5.0, 'b_bps': 20.0, 'spread_bps': 2.0}
+    m.update(kw)
+    return m
+
+
+def _order(symbol='BTCUSDT', side='buy'):
+    return {'symbol': symbol, 'side': side, 'qty': 0.01, 'price': 100.0, 'base_notional': 1.0}
+
+
+def test_check_allows_and_emits_policy_decision(tmp_path):
+    g, em = _gate(tmp_path)
+    res = g.check({}, _order(), _market(), fees_bps=0.5)
+    assert res['allow'] is True, res['reason']
+    assert res['hard_gate'] is False
+    assert res['max_qty'] == 0.01
+    assert 'POLICY.DECISION' in em.events
+
+
+def test_denied_order_is_logged_with_spread_trip(tmp_path):
+    g, em = _gate(tmp_path)
+    res = g.check({}, _order(), _market(spread_bps=1000.0), fees_bps=0.5)
+    assert res['allow'] is False
+    assert res['reason'].startswith('spread_bps_too_wide')
+    assert 'SPREAD_GUARD_TRIP' in em.events
+    rows = (tmp_path / 'orders_denied.jsonl').read_text(encoding='utf-8').splitlines()
+    assert rows and json.loads(rows[-1])['reason_code'].startswith('spread_bps_too_wide')
+
+
+def test_internal_error_fails_closed(tmp_path):
+    g, _ = _gate(tmp_path)
+
+    def _boom(**_kw):
+        raise RuntimeError('x')
+
+    g.pipeline.decide = _boom  # type: ignore[assignment]
+    res = g.check({}, _order(), _market())
+    assert res['allow'] is False
+    assert res['hard_gate'] is True
+    assert res['reason'] == 'aurora_embedded_error:RuntimeError'
+
+
+def test_rate_limit_and_cooldown_after_close(tmp_path):
+    cfg = {'aurora': {'min_open_interval_ms': 60_000, 'cooldown_after_close_ms': 60_000}}
+    g, _ = _gate(tmp_path, cfg)
+    assert g.check({}, _order('ETHUSDT'), _market(), fees_bps=0.5)['allow'] is True
+    assert g.check({}, _order('ETHUSDT'), _market(), fees_bps=0.5)['reason'] == 'open_rate_limit'
+
+    assert g.posttrade(symbol='SOLUSDT', side='sell', qty=1.0, status='closed', filled=1.0, action='close') is True
+    res = g.check({}, _order('SOLUSDT'), _market(), fees_bps=0.5)
+    assert res['reason'] == 'cooldown_after_close_active'
+    assert (tmp_path / 'orders.jsonl').exists()
+    assert (tmp_path / 'orders_success.jsonl').exists()
+
+
+def test_make_gate_selects_client_and_posttrade_returns_bool(tmp_path, monkeypatch):
+    from skalp_bot.integrations.aurora_gate import make_gate
+
+    class _Http:
+        def __init__(self, base_url, mode, timeout_s):
+            self.args = (base_url, mode, timeout_s)
+
+    monkeypatch.setenv('AURORA_GATE_MODE', 'http')
+    g = make_gate(base_url='http://x', mode='testnet', timeout_s=0.1, http_gate=_Http)
+    assert isinstance(g, _Http) and g.args == ('http://x', 'testnet', 0.1)
+
+    monkeypatch.setenv('AURORA_GATE_MODE', 'embedded')
+    monkeypatch.setenv('AURORA_SESSION_DIR', str(tmp_path))
+    g = make_gate(mode='testnet', http_gate=_Http)
+    assert isinstance(g, EmbeddedGate)
+    import core.aurora.embedded as emb
+
+    def _fail(*_a, **_kw):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(emb, 'apply_posttrade', _fail)
+    assert g.posttrade(symbol='X', status='closed') is False
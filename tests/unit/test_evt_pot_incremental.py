@@ -0,0 +1,76 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import core.risk.evt_pot as evt
+from core.risk.evt_pot import RollingPOT, pot_fit, pot_var_bootstrap, pot_var_es
+
+
+def _losses(n, seed):
+    rng = random.Random(seed)
+    out = []
+    for i in range(n):
+        x = rng.expovariate(1.5) if rng.random() < 0.8 else 1.0 + rng.paretovariate(3.0)
+        if i % 50 == 0:
+            x = 0.0  # clipped gains produce ties at zero
+        if i % 37 == 0:
+            x = round(x, 1)  # ties around the threshold
+        out.append(x)
+    return out
+
+
+def test_rolling_estimate_matches_refit_on_window():
+    L = _losses(6000, seed=1)
+    rp = RollingPOT(window_n=700, q_u=0.9)
+    rp.report()  # empty window
+    for i, x in enumerate(L):
+        rp.add(x)
+        if i % 53 == 0 or i < 20:
+            a = rp.estimate()
+            b = pot_fit(list(rp.q), q_u=0.9)
+            assert (a.u, a.n_exc, a.n_total, a.zeta) == (b.u, b.n_exc, b.n_total, b.zeta)
+            assert a.xi == pytest.approx(b.xi, abs=1e-10)
+            assert a.beta == pytest.approx(b.beta, rel=1e-10)
+    rep = rp.report(p=0.99)
+    assert (rep["var_p"], rep["es_p"]) == pytest.approx(pot_var_es(pot_fit(list(rp.q), q_u=0.9), 0.99))
+
+
+def test_vectorized_bootstrap_is_seeded_and_executor_independent():
+    L = _losses(4000, seed=2)
+    a = pot_var_bootstrap(L, 0.995, q_u=0.9, n_boot=600, seed=3)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        b = pot_var_bootstrap(L, 0.995, q_u=0.9, n_boot=600, seed=3, executor=pool)
+    assert a == b
+    assert a["lo"] <= a["var"] <= a["hi"]
+
+    old = evt._BOOT_CELLS
+    evt._BOOT_CELLS = 1  # one resample per chunk
+    try:
+        small = pot_var_bootstrap(L, 0.995, q_u=0.9, n_boot=7, seed=3)
+    finally:
+        evt._BOOT_CELLS = old
+    assert small["lo"] <= small["hi"]
+
+
+def test_vectorized_bootstrap_agrees_with_pure_python_loop(monkeypatch):
+    L = _losses(5000, seed=4)
+    vec = pot_var_bootstrap(L, 0.99, q_u=0.9, n_boot=2000)
+    monkeypatch.setattr(evt, "np", None)
+    ref = pot_var_bootstrap(L, 0.99, q_u=0.9, n_boot=2000)
+    assert vec["var"] == ref["var"]
+    width = ref["hi"] - ref["lo"]
+    assert vec["lo"] == pytest.approx(ref["lo"], abs=0.1 * width)
+    assert vec["hi"] == pytest.approx(ref["hi"], abs=0.1 * width)
+
+
+def test_rolling_report_bootstrap_uses_window_exceedances():
+    L = _losses(3000, seed=5)
+    rp = RollingPOT(window_n=1000, q_u=0.9)
+    for x in L:
+        rp.add(x)
+    rep = rp.report(p=0.995, with_bootstrap=True, n_boot=300)
+    ref = pot_var_bootstrap(list(rp.q), 0.995, q_u=0.9, n_boot=300)
+    assert rep["var_p"] == pytest.approx(ref["var"])
+    assert (rep["var_lo"], rep["var_hi"]) == pytest.approx((ref["lo"], ref["hi"]))
+    rp.close()
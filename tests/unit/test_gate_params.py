@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from core.aurora.gate_params import GateParams
+from core.aurora.pipeline import PretradePipeline
+
+
+def _decide(pipe: PretradePipeline, **market):
+    base = {'latency_ms': 1.0, 'score': 0.5, 'a_bps': 5.0, 'b_bps': 20.0, 'spread_bps': 2.0}
+    base.update(market)
+    return pipe.decide(account={'mode': 'testnet'}, order={'base_notional': 10.0}, market=base, fees_bps=0.5)
+
+
+def test_cfg_takes_precedence_over_env_aliases():
+    env = {'AURORA_LMAX_MS': '5', 'AURORA_PI_MIN_BPS': '9', 'AURORA_SPREAD_BPS_LIMIT': '1'}
+    cfg = {'guards': {'latency_ms_limit': 50, 'spread_bps_limit': 80}, 'risk': {'pi_min_bps': 1.5}}
+    p = GateParams.from_cfg(cfg, env=env)
+    assert p.lmax_ms == 50.0
+    assert p.pi_min_bps == 1.5
+    assert p.spread_limit_bps == 80.0
+
+
+def test_env_aliases_and_defaults():
+    env = {
+        'AURORA_LMAX_MS': '12',
+        'AURORA_SLIP_ETA': '0.5',
+        'AURORA_SPREAD_MAX_BPS': '40',
+        'PRETRADE_ORDER_PROFILE': 'slip_before_er',
+        'TRAP_GUARD': 'off',
+        'AURORA_SPRT_ENABLED': 'false',
+        'AURORA_ICP_OBS': '1',
+    }
+    p = GateParams.from_cfg({}, env=env)
+    assert p.lmax_ms == 12.0
+    assert p.slip_eta == 0.5
+    assert p.spread_limit_bps == 40.0
+    assert p.slip_before_er is True
+    assert p.trap_guard_on is False
+    assert p.sprt_enabled is False
+    assert p.icp_obs is True
+
+    d = GateParams.from_cfg(None, env={})
+    assert d == GateParams()
+
+
+def test_sprt_alpha_beta_override_thresholds():
+    p = GateParams.from_cfg({'sprt': {'alpha': 0.05, 'beta': 0.1, 'A': 9.0}}, env={})
+    assert abs(p.sprt_A - 2.890) < 1e-3
+    assert p.sprt_B < 0.0
+
+
+def test_bad_values_fall_back_to_defaults():
+    p = GateParams.from_cfg({'guards': {'latency_ms_limit': 'x'}, 'trap': {'z_threshold': 'nan?'}}, env={})
+    assert p.lmax_ms == 30.0
+    assert p.trap_z_threshold == 1.64
+
+
+def test_pipeline_uses_params_and_reload_swaps_atomically():
+    pipe = PretradePipeline(
+        emitter=None, trap_window=None, health_guard=None, risk_manager=None,
+        cfg={'guards': {'spread_bps_limit': 100.0}},
+    )
+    allow, reason, _, _ = _decide(pipe, spread_bps=50.0)
+    assert allow, reason
+
+    old = pipe.params
+    new = pipe.reload({'guards': {'spread_bps_limit': 10.0}})
+    assert pipe.params is new and new is not old
+    assert old.spread_limit_bps == 100.0
+
+    allow, reason, _, _ = _decide(pipe, spread_bps=50.0)
+    assert not allow and reason.startswith('spread_bps_too_wide')
+
+
+def test_pipeline_accepts_precompiled_params():
+    params = GateParams(lmax_ms=5.0)
+    pipe = PretradePipeline(emitter=None, trap_window=None, health_guard=None, risk_manager=None, params=params)
+    assert pipe.params is params
+    allow, reason, obs, _ = _decide(pipe, latency_ms=10.0)
+    assert not allow and reason == 'latency_guard'
+    assert any(r.startswith('latency_guard_exceeded') for r in obs['reasons'])
+
+
+def test_icp_observability_reuses_one_predictor():
+    pipe = PretradePipeline(emitter=None, trap_window=None, health_guard=None, risk_manager=None,
+                            params=GateParams(icp_obs=True))
+    _, _, obs1, _ = _decide(pipe, aci=0.5)
+    icp = pipe._icp
+    _, _, obs2, _ = _decide(pipe, aci=3.0)
+    assert pipe._icp is icp and icp is not None
+    assert obs1['icp'] == {'alpha': 0.1 + 0.01 * 0.5, 'is_transition': False}
+    assert obs2['icp']['alpha'] == 0.1 + 0.01
+
+
+def test_service_reload_uses_startup_layering_and_whitelist(tmp_path, monkeypatch, caplog):
+    import logging
+
+    from api.service import _load_service_cfg, _reload_cfg
+    from core.config.hotreload import HotReloadPolicy
+
+    path = tmp_path / 'cfg.yaml'
+    monkeypatch.setenv('AURORA_CONFIG', str(path))
+    monkeypatch.delenv('AURORA_SPREAD_BPS_LIMIT', raising=False)
+    path.write_text('guards:\n  spread_bps_limit: 10.0\nrisk:\n  cvar:\n    limit: 1.0\n', encoding='utf-8')
+    policy = HotReloadPolicy.from_iterable(['guards.spread_bps_limit'])
+    old = _load_service_cfg()
+    assert old['guards']['spread_bps_limit'] == 10.0
+    assert _reload_cfg(old, policy) is None  # unchanged
+
+    path.write_text('guards:\n  spread_bps_limit: 25.0\nrisk:\n  cvar:\n    limit: 1.0\n', encoding='utf-8')
+    new = _reload_cfg(old, policy)
+    assert new is not None and GateParams.from_cfg(new).spread_limit_bps == 25.0
+
+    path.write_text('guards:\n  spread_bps_limit: 25.0\nrisk:\n  cvar:\n    limit: 9.0\n', encoding='utf-8')
+    with caplog.at_level(logging.WARNING, logger='aurora.config.hotreload'):
+        assert _reload_cfg(new, policy) is None  # only a non-whitelisted key changed
+    assert 'risk.cvar.limit' in caplog.text
+
+    # a pending rejected edit does not block later whitelisted ones
+    path.write_text('guards:\n  spread_bps_limit: 30.0\nrisk:\n  cvar:\n    limit: 9.0\n', encoding='utf-8')
+    newer = _reload_cfg(new, policy)
+    assert newer['guards']['spread_bps_limit'] == 30.0 and newer['risk']['cvar']['limit'] == 1.0
+    caplog.clear()
+    with caplog.at_level(logging.WARNING, logger='aurora.config.hotreload'):
+        assert _reload_cfg(new, HotReloadPolicy.from_iterable([])) is None  # no whitelist: nothing applies
+    assert 'guards.spread_bps_limit' in caplog.text
@@ -0,0 +1,165 @@
+import random
+
+import numpy as np
+import pytest
+
+from core.calibration.icp import MondrianConformalBinary, SplitConformalBinary, VennAbersBinary
+
+
+def _pav_value_at(xs, ys, xq):
+    """Reference isotonic fit (ties pooled) evaluated at xq ∈ xs."""
+    ux, w, c = [], [], []
+    for x, y in sorted(zip(xs, ys)):
+        if ux and ux[-1] == x:
+            w[-1] += 1
+            c[-1] += y
+        else:
+            ux.append(x)
+            w.append(1)
+            c.append(y)
+    stack = []  # [label sum, weight, first group]
+    for i in range(len(ux)):
+        stack.append([c[i], w[i], i])
+        while len(stack) > 1 and stack[-2][0] / stack[-2][1] > stack[-1][0] / stack[-1][1]:
+            top = stack.pop()
+            stack[-1][0] += top[0]
+            stack[-1][1] += top[1]
+    j = ux.index(xq)
+    return [sc / sw for sc, sw, first in stack if first <= j][-1]
+
+
+def _data(n, seed):
+    rng = random.Random(seed)
+    p = [rng.random() for _ in range(n)]
+    y = [1 if rng.random() < pi else 0 for pi in p]
+    return p, y
+
+
+def test_split_rolling_window_matches_refit_and_batch():
+    p, y = _data(3000, seed=1)
+    cp = SplitConformalBinary(alpha=0.1, window=500)
+    cp.fit(p[:1200], y[:1200])
+    assert cp.n == 500
+    for pi, yi in zip(p[1200:1700], y[1200:1700]):
+        cp.update(pi, yi)
+
+    ref = SplitConformalBinary(alpha=0.1)
+    ref.fit(p[1200:1700], y[1200:1700])
+    assert cp.n == 500 and cp.scores == ref.scores
+
+    q = np.array(p[2000:2300] + [0.0, 1.0, 1.7, -0.2])
+    p1, p0 = cp.p_values_batch(q)
+    assert p1.shape == q.shape
+    assert np.allclose(p1, [ref.p_values(v)[0] for v in q])
+    assert np.allclose(p0, [ref.p_values(v)[1] for v in q])
+    assert SplitConformalBinary().p_values(0.3) == (1.0, 1.0)
+
+
+def test_split_p_values_count_ties_as_conforming():
+    cp = SplitConformalBinary(alpha=0.1)
+    cp.fit([0.8, 0.8, 0.2], [1, 1, 0])  # scores 0.2, 0.2, 0.2
+    # new y=1 at p=0.8 has score 0.2: all three calibration scores are ≥ it
+    assert cp.p_values(0.8) == (pytest.approx(1.0), pytest.approx(0.25))
+
+
+def test_mondrian_updates_per_group_with_global_fallback():
+    p, y = _data(2000, seed=2)
+    groups = ["lo" if pi < 0.4 else "hi" for pi in p]
+    mon = MondrianConformalBinary(alpha=0.1, window=300)
+    for pi, yi, g in zip(p[:1500], y[:1500], groups[:1500]):
+        mon.update(pi, yi, g)
+    assert set(mon.bucket) == {"lo", "hi"}
+    assert all(len(v) == 300 for v in mon.bucket.values()) and len(mon.global_scores) == 300
+
+    for g in ("lo", "hi"):
+        idx = [i for i in range(1500) if groups[i] == g][-300:]
+        sub = SplitConformalBinary()
+        sub.fit([p[i] for i in idx], [y[i] for i in idx])
+        assert mon.bucket[g] == sub.scores
+
+    q = np.array(p[1500:1700])
+    qg = groups[1500:1700]
+    qg[0] = "unseen"
+    qg[1] = None
+    p1, p0 = mon.p_values_batch(q, qg)
+    assert np.allclose(p1, [mon.p_values(v, g)[0] for v, g in zip(q, qg)])
+    assert np.allclose(p0, [mon.p_values(v, g)[1] for v, g in zip(q, qg)])
+    assert mon.p_values(q[0], "unseen") == mon.p_values(q[0], None)
+    g1, g0 = mon.p_values_batch(q)
+    assert np.allclose(g1, [mon.p_values(v, None)[0] for v in q])
+    assert np.allclose(g0, [mon.p_values(v, None)[1] for v in q])
+
+
+def test_venn_abers_tables_match_add_one_isotonic_refits():
+    rng = random.Random(7)
+    for _ in range(200):
+        n = rng.randint(1, 40)
+        xs = [rng.choice([float(rng.randint(-4, 4)), rng.uniform(-4.0, 4.0)]) for _ in range(n)]
+        ys = [rng.randint(0, 1) for _ in range(n)]
+        va = VennAbersBinary()
+        va.fit(xs, ys)
+        qs = [rng.uniform(-6.0, 6.0) for _ in range(4)] + [rng.choice(xs), -10.0, 10.0]
+        qs = [q for q in qs if not 0.0 <= q <= 1.0]  # probabilities would be mapped to logits
+        for q in qs:
+            p0 = _pav_value_at(xs + [q], ys + [0], q)
+            p1 = _pav_value_at(xs + [q], ys + [1], q)
+            assert va.predict_interval(q) == (pytest.approx(min(p0, p1)), pytest.approx(max(p0, p1)))
+        lo, hi = va.predict_interval_batch(np.array(qs))
+        assert lo.tolist() == [va.predict_interval(q)[0] for q in qs]
+        assert hi.tolist() == [va.predict_interval(q)[1] for q in qs]
+
+    assert VennAbersBinary().predict_interval(2.0) == (0.0, 1.0)
+
+
+def test_venn_abers_rolling_window_equals_fit_on_tail():
+    p, y = _data(900, seed=4)
+    va = VennAbersBinary(window=400)
+    va.fit(p[:200], y[:200])
+    for pi, yi in zip(p[200:], y[200:]):
+        va.update(pi, yi)
+    ref = VennAbersBinary()
+    ref.fit(p[500:], y[500:])
+    assert va.s == ref.s
+    q = np.linspace(0.01, 0.99, 37)
+    lo, hi = va.predict_interval_batch(q)
+    rlo, rhi = ref.predict_interval_batch(q)
+    assert np.array_equal(lo, rlo) and np.array_equal(hi, rhi)
+    assert np.all((0.0 <= lo) & (lo <= hi) & (hi <= 1.0))
+
+
+def test_split_bulk_fit_matches_incremental_updates():
+    p, y = _data(5000, seed=7)
+    bulk = SplitConformalBinary(window=1500)
+    bulk.fit(p, y)
+    inc = SplitConformalBinary(window=1500)
+    for pi, yi in zip(p, y):
+        inc.update(pi, yi)
+    assert bulk.scores == inc.scores and bulk.n == 1500
+    # later updates evict in the original arrival order
+    for pi, yi in zip(p[:300], y[:300]):
+        bulk.update(pi, yi)
+        inc.update(pi, yi)
+    assert bulk.scores == inc.scores
+
+
+def test_venn_abers_refresh_schedule_and_batch_update():
+    p, y = _data(1200, seed=8)
+    q = np.linspace(0.01, 0.99, 25)
+    lazy = VennAbersBinary(window=500, refresh_every=50)
+    lazy.fit(p[:500], y[:500])
+    stale = lazy.predict_interval_batch(q)
+    for pi, yi in zip(p[500:549], y[500:549]):
+        lazy.update(pi, yi)
+    # 49 updates: still served from the tables built after fit
+    assert all(np.array_equal(a, b) for a, b in zip(lazy.predict_interval_batch(q), stale))
+    lazy.update(p[549], y[549])
+    ref = VennAbersBinary()
+    ref.fit(p[50:550], y[50:550])
+    assert all(np.array_equal(a, b) for a, b in zip(lazy.predict_interval_batch(q), ref.predict_interval_batch(q)))
+
+    batch = VennAbersBinary(window=500)
+    batch.fit(p[:500], y[:500])
+    batch.update_many(p[500:800], y[500:800])
+    ref.fit(p[300:800], y[300:800])
+    assert batch.s == ref.s
+    assert all(np.array_equal(a, b) for a, b in zip(batch.predict_interval_batch(q), ref.predict_interval_batch(q)))
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from core.calibration.calibrator import IsotonicCalibrator as PavCalibrator
+from core.calibration.lut import IsotonicLUT
+from core.scalper import calibrator as scal
+from core.scalper.calibrator import CalibInput, IsotonicCalibrator
+
+
+def test_lut_scalar_batch_and_roundtrip(tmp_path):
+    lut = IsotonicLUT.from_knots([-1.0, -0.2, -0.2, 0.3, 1.0], [0.1, 0.2, 0.4, 0.6, 0.9], meta={"src": "t"})
+    assert lut.knots == ([-1.0, -0.2, 0.3, 1.0], [0.1, 0.4, 0.6, 0.9])
+    q = np.linspace(-2.0, 2.0, 101)
+    ref = np.interp(q, [-1.0, -0.2, 0.3, 1.0], [0.1, 0.4, 0.6, 0.9])
+    assert np.array_equal(lut.batch(q), ref)
+    assert [lut(float(v)) for v in q] == ref.tolist()
+
+    back = IsotonicLUT.load(lut.save(tmp_path / "cal" / "iso.json"))
+    assert back.knots == lut.knots and back.meta == {"src": "t"}
+    with pytest.raises(ValueError):
+        IsotonicLUT([0.0, 0.0], [0.1, 0.2])
+
+
+def test_pav_calibrator_interpolates_between_bracketing_knots(tmp_path):
+    cal = PavCalibrator().fit([0.1, 0.2, 0.3, 0.4, 0.5, 0.6], [0, 0, 1, 0, 1, 1])
+    xs, ys = cal.xs_, cal.ys_
+    q = [0.05, 0.15, 0.42, 0.55, 0.7]
+    expect = np.interp(q, xs, ys)
+    assert cal.predict_proba(q) == pytest.approx(expect.tolist())
+    assert cal.predict_p_batch(np.array(q)) == pytest.approx(expect)
+    assert cal.calibrate_prob(0.55) == pytest.approx(expect[3])
+
+    loaded = PavCalibrator.load(cal.save(tmp_path / "pav.json"))
+    assert loaded.predict_proba(q) == cal.predict_proba(q)
+    assert PavCalibrator().predict_proba([0.3]) == [0.5]
+
+
+def test_scalper_calibrator_matches_sklearn_and_persists(tmp_path):
+    pytest.importorskip("sklearn")
+    rng = np.random.default_rng(3)
+    s = rng.uniform(-1.2, 1.2, 5000)
+    y = (rng.uniform(size=s.size) < 1.0 / (1.0 + np.exp(-3.0 * s))).astype(float)
+    cal = IsotonicCalibrator(log_every=0)
+    cal.fit(s, y)
+    q = rng.uniform(-1.5, 1.5, 500)
+    ref = np.clip(cal._iso.predict(np.clip(q, -1.0, 1.0)), 0.0, 1.0)
+    assert np.allclose(cal.predict_p_batch(q), ref, atol=1e-12)
+    assert np.allclose([cal.predict_p(float(v)) for v in q], ref, atol=1e-12)
+
+    loaded = IsotonicCalibrator.load(cal.save(tmp_path / "iso.json"))
+    assert np.array_equal(loaded.predict_p_batch(q), cal.predict_p_batch(q))
+
+
+def test_entry_logging_is_sampled(monkeypatch):
+    seen = []
+    monkeypatch.setattr(scal.logger, "debug", lambda *a, **k: seen.append(k))
+    cal = IsotonicCalibrator(log_every=10)
+    ci = CalibInput(score=0.2, a_bps=5.0, b_bps=8.0, fees_bps=1.0, slip_bps=0.5, regime="trend")
+    for _ in range(25):
+        out = cal.e_pi_bps(ci)
+    assert len(seen) == 3 and seen[0]["sampled_every"] == 10
+    # unfitted: Platt fallback with k=2
+    assert out.p_tp == pytest.approx(1.0 / (1.0 + np.exp(-0.4)))
+
+
+def test_pipeline_loads_table_from_cfg(tmp_path):
+    from core.aurora.pipeline import PretradePipeline
+
+    path = IsotonicLUT([-1.0, 1.0], [0.2, 0.8]).save(tmp_path / "gate.json")
+    pipe = PretradePipeline(
+        emitter=None, trap_window=None, health_guard=None, risk_manager=None,
+        cfg={"calibration": {"table_path": str(path)}},
+    )
+    assert pipe._cal.predict_p(0.0) == pytest.approx(0.5)
+    pipe.reload({})
+    assert pipe._cal.table is None
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import time
+
+from core.aurora_event_logger import AuroraEventLogger
+from core.order_logger import CommitPolicy, _JsonlWriter
+
+
+def _lines(p):
+    return p.read_text(encoding='utf-8').splitlines()
+
+
+def test_policy_from_cfg_and_env():
+    p = CommitPolicy.from_cfg({'logging': {'commit': {'max_lines': 64, 'fsync': False}}}, env={'AURORA_LOG_COMMIT_LINES': '8'})
+    assert p.max_lines == 64 and p.fsync is False
+    p = CommitPolicy.from_cfg({}, env={'AURORA_LOG_COMMIT_LINES': '8', 'AURORA_LOG_COMMIT_MS': '5', 'AURORA_LOG_FSYNC': 'off'})
+    assert (p.max_lines, p.max_delay_ms, p.fsync) == (8, 5.0, False)
+    assert CommitPolicy.from_cfg(None, env={}) == CommitPolicy()
+    assert CommitPolicy().is_critical('ORDER.FILL') and not CommitPolicy().is_critical('POLICY.DECISION')
+
+
+def test_lines_buffered_until_group_size(tmp_path):
+    p = tmp_path / 'x.jsonl'
+    w = _JsonlWriter(p, policy=CommitPolicy(max_lines=3, fsync=False))
+    w.write_line('{"a":1}')
+    w.write_line('{"a":2}')
+    assert _lines(p) == []
+    w.write_line('{"a":3}')
+    assert len(_lines(p)) == 3
+    w.write_line('{"a":4}')
+    w.close()
+    assert len(_lines(p)) == 4
+
+
+def test_critical_line_commits_pending_group(tmp_path):
+    p = tmp_path / 'aurora_events.jsonl'
+    lg = AuroraEventLogger(path=p, policy=CommitPolicy(max_lines=100, fsync=False))
+    lg.emit('POLICY.DECISION', {'decision': 'NO_OP'})
+    assert _lines(p) == []
+    lg.emit('ORDER.FILL', {'symbol': 'X', 'oid': '1'})
+    assert len(_lines(p)) == 2
+
+
+def test_time_trigger_flushes_in_background(tmp_path):
+    p = tmp_path / 'x.jsonl'
+    w = _JsonlWriter(p, policy=CommitPolicy(max_lines=1000, max_delay_ms=10, fsync=False))
+    w.write_line('{"a":1}')
+    deadline = time.time() + 2.0
+    while not _lines(p) and time.time() < deadline:
+        time.sleep(0.01)
+    assert len(_lines(p)) == 1
+    w.close()
+
+
+def test_grouped_rotation(tmp_path):
+    p = tmp_path / 'x.jsonl'
+    w = _JsonlWriter(p, max_bytes=256, policy=CommitPolicy(max_lines=4, fsync=False))
+    for i in range(200):
+        w.write_line('{"i":%d,"pad":"xxxxxxxxxxxxxxxxxxxx"}' % i)
+    w.close()
+    assert list(tmp_path.glob('x.jsonl.*.jsonl.gz'))
@@ -0,0 +1,84 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+from core.signal import leadlag_hy as hy_mod
+from core.signal.leadlag_hy import CrossAssetHY, hy_cov_lags, _simulate_irregular_streams
+
+LAGS = [-2.0, -1.0, -0.75, -0.5, -0.25, 0.0, 0.25, 0.5, 1.0]
+
+
+def _loaded(window_s=30.0, max_points=400, **kw):
+    X, Y = _simulate_irregular_streams(T=60.0, seed=5)
+    hy = CrossAssetHY(window_s=window_s, max_points=max_points, **kw)
+    for sym, t, p in sorted([("X", t, p) for t, p in X] + [("Y", t, p) for t, p in Y], key=lambda z: z[1]):
+        hy.add_tick(sym, t, p)
+    return hy
+
+
+def test_lag_grid_matches_pairwise_sweep():
+    hy = _loaded()
+    rx = hy._prepare_returns("X", None)
+    ry = hy._prepare_returns("Y", None)
+    cov, varx, vary = hy_cov_lags(hy.return_arrays("X"), hy.return_arrays("Y"), LAGS)
+    for k, lag in enumerate(LAGS):
+        ref, vx, vy = hy._hy_cov_from_returns(rx, hy._shift_returns(ry, lag))
+        assert cov[k] == pytest.approx(ref, rel=1e-12, abs=1e-15)
+    assert (varx, vary) == pytest.approx((vx, vy))
+
+
+def test_scan_matches_pure_python_fallback(monkeypatch):
+    hy = _loaded()
+    fast = hy.lead_lag_scan("X", "Y", lags=LAGS)
+    monkeypatch.setattr(hy_mod, "np", None)
+    slow = hy.lead_lag_scan("X", "Y", lags=LAGS)
+    assert fast["best_lag"] == slow["best_lag"] == 0.5
+    for key in ("hy_corr_0", "hy_cov_0", "beta_x_on_y_0", "beta_y_on_x_0", "best_corr"):
+        assert fast[key] == pytest.approx(slow[key], rel=1e-9)
+    assert fast["corr_by_lag"] == pytest.approx(slow["corr_by_lag"], rel=1e-9)
+
+
+def test_universe_matrix_matches_pair_scans():
+    rng = random.Random(0)
+    hy = CrossAssetHY(window_s=20.0)
+    syms = ["A", "B", "C", "D"]
+    lp = {s: 0.0 for s in syms}
+    t = 0.0
+    while t < 30.0:
+        t += rng.expovariate(80.0)
+        s = rng.choice(syms)
+        lp[s] += rng.gauss(0.0, 1e-3) + (lp["A"] - lp[s]) * 0.2
+        hy.add_tick(s, t, 100.0 * math.exp(lp[s]))
+    m = hy.lead_lag_matrix(syms, lags=LAGS)
+    assert m["symbols"] == syms
+    assert np.allclose(m["corr_0"], m["corr_0"].T)
+    assert np.allclose(m["best_lag"], -m["best_lag"].T)
+    for i, x in enumerate(syms):
+        for j, y in enumerate(syms):
+            if i == j:
+                continue
+            scan = hy.lead_lag_scan(x, y, lags=LAGS)
+            assert m["corr_0"][i, j] == pytest.approx(scan["hy_corr_0"], abs=1e-12)
+            assert m["beta"][i, j] == pytest.approx(scan["beta_x_on_y_0"], abs=1e-12)
+            if i < j:
+                assert m["best_lag"][i, j] == scan["best_lag"]
+                assert m["best_corr"][i, j] == pytest.approx(scan["best_corr"], abs=1e-12)
+    # process pool path gives the same matrix
+    hy.workers = 2
+    try:
+        m2 = hy.lead_lag_matrix(syms, lags=LAGS)
+    finally:
+        hy.close()
+    assert np.allclose(m2["corr_0"], m["corr_0"]) and np.array_equal(m2["best_lag"], m["best_lag"])
+
+
+def test_return_cache_stays_bounded_without_reads():
+    hy = CrossAssetHY(window_s=5.0, max_points=300)
+    for i in range(50_000):
+        hy.add_tick("X", i * 0.01, 100.0 + math.sin(i * 0.1))
+    rc = hy._ret["X"]
+    assert len(rc.t0) <= 1024 and rc.n - rc.head <= 1024
+    t0, _, _ = hy.return_arrays("X")
+    assert len(t0) == 299 and t0[0] >= 499.99 - 5.0
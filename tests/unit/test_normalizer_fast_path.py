@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from core.ingestion.normalizer import Normalizer
+from core.ingestion.tickstore import SEQ_NONE
+
+
+def _weird(rnd):
+    return rnd.choice([None, "x", "", True, float("nan"), -1.0, 0, "12.5", 3, 2.5, [1]])
+
+
+def _events(n, seed):
+    rnd = random.Random(seed)
+    layouts = [
+        lambda t: {"e": rnd.choice(["trade", "aggTrade", "T", "weird", None]), "E": t, "s": rnd.choice(["btcusdt", "ETH USDT"]),
+                   "p": str(100 + rnd.random()), "q": "0.5", "side": rnd.choice(["b", "SELL", None])},
+        lambda t: {"ts": t, "symbol": "BTCUSDT", "bid": 99.0 + rnd.random(), "ask": 100.0, "bid_size": 1.0, "ask_size": 2},
+        lambda t: {"time": t / 1000.0, "sym": "SOLUSDT", "price": 5.0, "size": 1, "seq": rnd.randint(0, 3), "source": "x"},
+        lambda t: {"timestamp": t, "instrument": "ADA", "type": "quote", "b": 1.0, "a": 1.0, "bs": None},
+    ]
+    t = 1_700_000_000_000
+    out = []
+    for _ in range(n):
+        t += rnd.randint(0, 3)
+        r = rnd.choice(layouts)(t)
+        if rnd.random() < 0.15:  # corrupt one field, sometimes the ts unit band
+            k = rnd.choice(list(r))
+            r[k] = t * 1_000_000 if k in ("E", "ts", "timestamp") and rnd.random() < 0.5 else _weird(rnd)
+        out.append(r)
+    return out
+
+
+def _eq(a, b):
+    if a is None or b is None:
+        return a is b
+    if list(a) != list(b):
+        return False
+    return all(x == y or (isinstance(x, float) and math.isnan(x) and math.isnan(y)) for x, y in zip(a.values(), b.values()))
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_fast_path_matches_generic(seed):
+    raws = _events(3000, seed)
+    fast, slow = Normalizer(strict=False), Normalizer(strict=False, fast_path=False)
+    for r in raws:
+        assert _eq(fast.normalize(r), slow.normalize(r)), r
+    assert fast.fast_hits > 1000
+
+
+def test_fast_path_strict_errors_unchanged():
+    n = Normalizer(strict=True)
+    n.normalize({"ts": 10, "symbol": "BTCUSDT", "bid": 1.0, "ask": 2.0})
+    with pytest.raises(ValueError, match="crossed book"):
+        n.normalize({"ts": 11, "symbol": "BTCUSDT", "bid": 3.0, "ask": 2.0})
+    with pytest.raises(ValueError, match="anti-look-ahead"):
+        n.normalize({"ts": 9, "symbol": "BTCUSDT", "bid": 1.0, "ask": 2.0})
+
+
+def test_normalize_batch_columns():
+    raws = [
+        {"ts": 1, "type": "trade", "symbol": "BTCUSDT", "price": 10.0, "qty": 2.0, "side": "buy", "seq": 4},
+        {"ts": 2, "symbol": "BTCUSDT", "bid": 9.0, "ask": 11.0},
+        {"ts": 3, "symbol": "BTCUSDT"},  # dropped
+    ]
+    b = Normalizer(strict=False).normalize_batch(raws)
+    assert b["ts_ns"].dtype == np.int64 and b["ts_ns"].tolist() == [1, 2]
+    assert b["type"].tolist() == [0, 1] and b["side"].tolist() == [1, 0] and b["seq"].tolist() == [4, SEQ_NONE]
+    assert b["symbol"].tolist() == ["BTCUSDT", "BTCUSDT"]
+    assert b["price"][0] == 10.0 and math.isnan(b["price"][1]) and b["ask_px"][1] == 11.0 and math.isnan(b["bid_sz"][1])
@@ -0,0 +1,155 @@
+import math
+import random
+
+import pytest
+
+from core.calibration.calibrator import IsotonicCalibrator
+from core.calibration.drift import CUSUMDetector, DriftMonitor, GLRDetector
+from core.calibration.lut import IsotonicLUT
+from core.calibration.online import OnlineRecalibrator
+
+
+def _outcomes(n, seed=3, bias=0.0):
+    """p_raw over-confident by design: true p = sigmoid(0.5·logit(p_raw) + bias)."""
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        p = rng.uniform(0.02, 0.98)
+        z = 0.5 * math.log(p / (1 - p)) + bias
+        out.append((p, 1 if rng.random() < 1 / (1 + math.exp(-z)) else 0))
+    return out
+
+
+def test_passthrough_until_first_fit_then_matches_batch_fit():
+    rc = OnlineRecalibrator("isotonic", window=500, min_samples=200, refit_every_n=0, refit_interval_s=0, mode="inline")
+    data = _outcomes(600)
+    assert rc.calibrate_prob(0.7) == 0.7
+    for i, (p, y) in enumerate(data[:199]):
+        assert rc.observe(p, y, ts=float(i)) is False
+    assert not rc.ready
+    assert rc.observe(*data[199], ts=199.0) is True
+    assert rc.version == 1 and rc.last_trigger == "initial"
+
+    # window stays bounded and a forced refit uses exactly its contents
+    for i, (p, y) in enumerate(data[200:]):
+        rc.observe(p, y, ts=200.0 + i)
+    assert len(rc) == 500 and rc.version == 1
+    assert rc.refit() is True and rc.version == 2
+    ref = IsotonicCalibrator().fit([p for p, _ in data[100:]], [y for _, y in data[100:]])
+    for q in (0.05, 0.3, 0.5, 0.81, 0.97):
+        assert rc.calibrate_prob(q) == pytest.approx(ref.calibrate_prob(q))
+    assert list(rc.predict_p_batch([0.3, 0.81])) == pytest.approx([ref.calibrate_prob(0.3), ref.calibrate_prob(0.81)])
+
+
+def test_count_and_interval_triggers():
+    rc = OnlineRecalibrator("platt", min_samples=50, refit_every_n=100, refit_interval_s=0, mode="inline")
+    data = _outcomes(400)
+    for i, (p, y) in enumerate(data):
+        rc.observe(p, y, ts=float(i))
+    # initial fit at 50, then every 100 new outcomes
+    assert rc.version == 4 and rc.last_trigger == "count"
+
+    rc2 = OnlineRecalibrator("temperature", min_samples=50, refit_every_n=0, refit_interval_s=60, mode="inline")
+    for i, (p, y) in enumerate(data[:200]):
+        rc2.observe(p, y, ts=float(i))
+    # first fit at ts=49, then at 109 and 169
+    assert rc2.version == 3 and rc2.last_trigger == "interval"
+    assert 0.0 < rc2.calibrate_prob(0.9) < 0.9
+
+
+def test_drift_alarm_forces_refit():
+    drift = DriftMonitor(cusum=CUSUMDetector(k=0.5, h=8.0, clip=6.0), glr=GLRDetector(window=100, thr=1e9))
+    triggers = []
+    rc = OnlineRecalibrator(
+        "isotonic",
+        window=300,
+        min_samples=200,
+        refit_every_n=0,
+        refit_interval_s=0,
+        drift=drift,
+        mode="inline",
+        on_swap=lambda cal, info: triggers.append(info["last_trigger"]),
+    )
+    for i, (p, y) in enumerate(_outcomes(300)):
+        rc.observe(p, y, ts=float(i))
+    assert rc.version == 1
+    before = rc.calibrate_prob(0.5)
+    # regime shift: outcomes become far more positive than served probabilities
+    for i, (p, y) in enumerate(_outcomes(300, seed=9, bias=2.5)):
+        rc.observe(p, y, ts=300.0 + i)
+    assert triggers[0] == "initial" and "drift" in triggers[1:]
+    # drift refits moved served p toward the new base rate; once the window
+    # holds only post-shift outcomes it sits near it
+    assert rc.calibrate_prob(0.5) > before + 0.1
+    assert rc.refit() is True and rc.calibrate_prob(0.5) > 0.75
+
+
+def test_thread_refit_swaps_without_blocking_and_saves_table(tmp_path):
+    swaps = []
+    path = tmp_path / "calib.json"
+    rc = OnlineRecalibrator(
+        "isotonic",
+        min_samples=100,
+        refit_every_n=0,
+        refit_interval_s=0,
+        mode="thread",
+        table_path=path,
+        on_swap=lambda cal, info: swaps.append(info["version"]),
+    )
+    for i, (p, y) in enumerate(_outcomes(150)):
+        rc.observe(p, y, ts=float(i))
+        rc.calibrate_prob(p)  # gate reads keep working while a fit may be in flight
+    assert rc.wait(timeout=5.0)
+    assert rc.version == 1 and swaps == [1] and not rc.stats()["busy"]
+    lut = IsotonicLUT.load(path)
+    assert lut(0.42) == pytest.approx(rc.calibrate_prob(0.42))
+    rc.close()
+
+
+def test_from_cfg_precedence():
+    cfg = {"calibration": {"online": {"method": "platt", "window": 1000}}}
+    rc = OnlineRecalibrator.from_cfg(cfg, env={"AURORA_CALIB_ONLINE_WINDOW": "9", "AURORA_CALIB_ONLINE_MIN_SAMPLES": "77"})
+    assert rc.method == "platt" and rc.window == 1000 and rc.min_samples == 77
+    assert isinstance(rc.drift, DriftMonitor)
+    with pytest.raises(ValueError):
+        OnlineRecalibrator("beta")
+
+
+def test_isotonic_fit_is_monotone_and_pools_backwards():
+    rng = random.Random(11)
+    x = [rng.random() for _ in range(2000)]
+    y = [rng.randint(0, 1) for _ in range(2000)]
+    cal = IsotonicCalibrator().fit(x, y)
+    assert all(b >= a for a, b in zip(cal.ys_, cal.ys_[1:]))
+    assert all(b > a for a, b in zip(cal.xs_, cal.xs_[1:]))
+    # a late violation pools back across every earlier block
+    back = IsotonicCalibrator().fit([1, 2, 3, 4], [0, 1, 1, 0])
+    assert back.ys_ == pytest.approx([0.0, 2 / 3, 2 / 3])
+    # tied x are pooled before comparing with neighbours
+    tied = IsotonicCalibrator().fit([1, 1, 2, 2], [0, 1, 1, 1])
+    assert tied.ys_ == pytest.approx([0.5, 1.0])
+
+
+def test_posttrade_outcomes_feed_the_gate(tmp_path):
+    from core.aurora.embedded import EmbeddedGate
+
+    cfg = {"calibration": {"online": {
+        "enabled": True, "mode": "inline", "min_samples": 50, "refit_every_n": 0, "refit_interval_s": 0, "drift": False,
+    }}}
+    g = EmbeddedGate(cfg, session_dir=tmp_path)
+    market = {"latency_ms": 1.0, "score": 0.5, "a_bps": 5.0, "b_bps": 20.0, "spread_bps": 2.0}
+    order = {"symbol": "BTCUSDT", "side": "buy", "qty": 0.01, "base_notional": 1.0}
+    try:
+        recal = g.state.recalibrator
+        assert recal is not None and g.pipeline.recal is recal
+        assert g.check({}, order, market, fees_bps=0.5)["allow"] is True
+        for _ in range(50):
+            assert g.posttrade(symbol="BTCUSDT", status="closed", p_raw=0.73, y=0) is True
+        assert recal.ready and recal.calibrate_prob(0.73) == 0.0
+        res = g.check({}, dict(order, symbol="ETHUSDT"), market, fees_bps=0.5)
+        assert res["allow"] is False and res["reason"] == "expected_return_gate"
+        batch = g.pipeline.decide_batch([{"account": {}, "order": order, "market": market, "fees_bps": 0.5}])
+        assert batch[0][1] == "expected_return_gate"
+    finally:
+        g.close()
+    assert EmbeddedGate({}, session_dir=tmp_path / "off").state.recalibrator is None
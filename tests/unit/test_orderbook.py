@@ -0,0 +1,123 @@
+import math
+import random
+
+import pytest
+
+from core.features.absorption import AbsorptionStream
+from core.features.microstructure import MicrostructureEngine
+from core.features.obi import OBIStream, obi_l1, obi_lk
+from core.features.orderbook import OrderBook
+
+
+def _reference(levels, best_first_key):
+    items = sorted(((p, q) for p, q in levels.items() if q > 0), key=best_first_key)
+    return [p for p, _ in items], [q for _, q in items]
+
+
+def _random_book(seed=7, n=400):
+    rng = random.Random(seed)
+    book = OrderBook("X", max_levels=256, weight_depth=20)
+    bids, asks = {}, {}
+    for _ in range(n):
+        if rng.random() < 0.5:
+            p = round(100.0 - 0.01 * rng.randint(1, 60), 2)
+            q = 0.0 if rng.random() < 0.25 else float(rng.randint(1, 500))
+            book.apply_delta("bid", p, q)
+            bids[p] = q
+        else:
+            p = round(100.0 + 0.01 * rng.randint(1, 60), 2)
+            q = 0.0 if rng.random() < 0.25 else float(rng.randint(1, 500))
+            book.apply_delta("ask", p, q)
+            asks[p] = q
+    return book, bids, asks
+
+
+def test_deltas_match_full_recompute():
+    book, bids, asks = _random_book()
+    bp, bq = _reference(bids, lambda kv: -kv[0])
+    ap, aq = _reference(asks, lambda kv: kv[0])
+
+    got_bp, got_bq = book.levels("bid")
+    got_ap, got_aq = book.levels("ask")
+    assert got_bp.tolist() == bp and got_bq.tolist() == bq
+    assert got_ap.tolist() == ap and got_aq.tolist() == aq
+    assert book.best_bid == bp[0] and book.best_ask == ap[0]
+
+    for k in (1, 3, 5, 10, 1000):
+        assert book.depth_sums(k) == pytest.approx((sum(bq[:k]), sum(aq[:k])))
+        assert book.obi(k) == pytest.approx(obi_lk(bq, aq, k))
+    assert book.obi(1) == pytest.approx(obi_l1(bq, aq))
+
+    wb = sum(q / (1 + i) for i, q in enumerate(bq[:20]))
+    wa = sum(q / (1 + i) for i, q in enumerate(aq[:20]))
+    assert book.weighted_obi() == pytest.approx((wb - wa) / (wb + wa))
+
+
+def test_queue_ahead_and_capacity():
+    book = OrderBook(max_levels=3)
+    book.apply_snapshot([(99.0, 5), (98.0, 7), (97.0, 9)], [(101.0, 4), (102.0, 6)])
+    assert book.queue_ahead("bid", 98.0) == 7
+    assert book.queue_ahead("bid", 98.0, include_better=True) == 12
+    assert book.queue_ahead("bid", 98.5, include_better=True) == 5
+    assert book.depth_to_price("ask", 102.0) == 10
+    assert book.depth_to_price("ask", 102.0, inclusive=False) == 4
+
+    # full side: a better level pushes the worst out, a worse one is ignored
+    book.apply_delta("bid", 99.5, 1)
+    assert book.levels("bid")[0].tolist() == [99.5, 99.0, 98.0]
+    book.apply_delta("bid", 90.0, 1)
+    assert book.levels("bid")[0].tolist() == [99.5, 99.0, 98.0]
+    book.apply_delta("bid", 99.5, 0)
+    assert book.best_bid == 99.0 and book.depth_sums(5)[0] == 12
+
+    book.apply_snapshot([], [])
+    assert math.isnan(book.best_bid) and book.obi(5) == 0.0
+
+
+def test_streams_book_path_matches_snapshot_path():
+    from core.types import MarketSnapshot
+
+    bids = [(100.0, 10.0), (99.9, 8.0), (99.8, 6.0), (99.7, 4.0), (99.6, 2.0)]
+    asks = [(100.1, 12.0), (100.2, 9.0), (100.3, 7.0), (100.4, 5.0), (100.5, 3.0)]
+    book = OrderBook(weight_depth=20)
+    book.apply_snapshot(bids, asks)
+    snap = MarketSnapshot(
+        timestamp=1.0,
+        bid_price=100.0,
+        ask_price=100.1,
+        bid_volumes_l=[q for _, q in bids],
+        ask_volumes_l=[q for _, q in asks],
+    )
+
+    a = OBIStream(levels=3).update(snap)
+    b = OBIStream(levels=3).update_book(book)
+    assert a.keys() == b.keys()
+    for key in a:
+        assert float(a[key]) == pytest.approx(b[key])
+
+    eng = MicrostructureEngine(max_depth=20)
+    fb = eng.compute_book_features(book, timestamp=1.0)
+    assert fb.obi_depth_5 == pytest.approx(float(eng._compute_obi(snap, 5)))
+    assert fb.obi_depth_10 == pytest.approx(float(eng._compute_obi(snap, 10)))
+    assert fb.obi_weighted == pytest.approx(float(eng._compute_weighted_obi(snap)))
+    assert fb.micro_price == pytest.approx(float(eng._compute_micro_price(snap)))
+    assert fb.market_depth == pytest.approx(66.0)
+    # all five ask levels lie below mid·1.01 ≈ 101.05
+    assert fb.absorption_ratio == pytest.approx(1.0)
+    eng3 = MicrostructureEngine(max_depth=3)
+    assert eng3.compute_book_features(book, 1.0).obi_weighted == pytest.approx(
+        float(eng3._compute_weighted_obi(snap))
+    )
+
+    s1, s2 = AbsorptionStream(), AbsorptionStream()
+    s1.update(snap)
+    s2.update_book(book, ts=1.0)
+    book.apply_delta("bid", 100.0, 7.0)
+    snap2 = MarketSnapshot(
+        timestamp=1.5,
+        bid_price=100.0,
+        ask_price=100.1,
+        bid_volumes_l=[7.0, 8.0, 6.0, 4.0, 2.0],
+        ask_volumes_l=[q for _, q in asks],
+    )
+    assert s1.update(snap2) == pytest.approx(s2.update_book(book, ts=1.5))
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from core.risk.cvar import RollingCVaR
+
+
+def _ref(window, alpha):
+    # RollingCVaR semantics: mean of the order statistics from the VaR rank up
+    x = sorted(window)
+    k = max(0, min(len(x) - 1, int(math.ceil(alpha * len(x)) - 1)))
+    return x[k], sum(x[k:]) / (len(x) - k)
+
+
+@pytest.mark.parametrize('window_n', [1, 7, 300])
+def test_rolling_matches_batch_estimator(window_n):
+    rnd = random.Random(window_n)
+    rc = RollingCVaR(window_n=window_n, alpha=0.95)
+    buf = []
+    for _ in range(4 * window_n + 50):
+        # ties and zero-clipped negatives on purpose
+        x = round(rnd.gauss(0.0, 1.0), 1) if rnd.random() < 0.5 else rnd.expovariate(1.0)
+        rc.update(x)
+        buf = (buf + [max(0.0, x)])[-window_n:]
+        var, cvar = rc.metrics()
+        rv, rcv = _ref(buf, 0.95)
+        assert var == rv
+        assert math.isclose(cvar, rcv, rel_tol=1e-12, abs_tol=1e-15)
+        assert cvar >= var
+    assert rc.sorted == sorted(buf)
+
+
+def test_metrics_multi_matches_per_alpha():
+    rnd = random.Random(4)
+    rc = RollingCVaR(window_n=500, alpha=0.99)
+    for _ in range(1200):
+        rc.update(rnd.lognormvariate(0.0, 1.0))
+    alphas = [0.5, 0.9, 0.975, 0.99, 1.0]
+    out = rc.metrics_multi(alphas)
+    win = list(rc.q)
+    for a in alphas:
+        var, cvar = out[a]
+        rv, rcv = _ref(win, a)
+        assert var == rv and math.isclose(cvar, rcv, rel_tol=1e-12)
+    assert out[0.99] == rc.metrics()
+    assert RollingCVaR().metrics_multi([0.9]) == {0.9: (0.0, 0.0)}
+
+
+def test_long_stream_tail_sum_stays_accurate():
+    rnd = random.Random(9)
+    rc = RollingCVaR(window_n=64, alpha=0.9)
+    for _ in range(20000):
+        rc.update(rnd.choice([1e-9, 1.0, 1e6]) * rnd.random())
+    rv, rcv = _ref(list(rc.q), 0.9)
+    var, cvar = rc.metrics()
+    assert var == rv and math.isclose(cvar, rcv, rel_tol=1e-9)
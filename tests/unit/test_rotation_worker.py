@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import gzip
+
+from core.order_logger import CommitPolicy, _JsonlWriter, _RotationWorker, rotation_worker
+
+
+def _fill(w, n=100):
+    for i in range(n):
+        w.write_line('{"i":%d,"pad":"xxxxxxxxxxxxxxxxxxxxxxxxxxxxxxxx"}' % i)
+
+
+def test_rotation_compresses_in_background(tmp_path):
+    p = tmp_path / 'ev.jsonl'
+    w = _JsonlWriter(p, max_bytes=512, retention_files=3, policy=CommitPolicy(fsync=False))
+    before = rotation_worker().stats['completed']
+    _fill(w)
+    assert rotation_worker().wait_idle(10.0)
+    assert rotation_worker().stats['completed'] > before
+    gz = sorted(tmp_path.glob('ev.jsonl.*.jsonl.gz'))
+    assert 1 <= len(gz) <= 3
+    assert not list(tmp_path.glob('ev.jsonl.*.part*.jsonl'))
+    with gzip.open(gz[-1], 'rt', encoding='utf-8') as f:
+        assert f.readline().startswith('{"i":')
+    w.close()
+
+
+def test_sync_rotation_opt_out(tmp_path):
+    p = tmp_path / 'ev.jsonl'
+    w = _JsonlWriter(p, max_bytes=512, background_rotation=False, policy=CommitPolicy(fsync=False))
+    _fill(w)
+    assert list(tmp_path.glob('ev.jsonl.*.jsonl.gz'))
+    w.close()
+
+
+def test_large_parts_go_through_process_pool(tmp_path):
+    part = tmp_path / 'ev.jsonl.20250101.000000.part1.jsonl'
+    part.write_text('{"a":1}\n' * 1000, encoding='utf-8')
+    w = _JsonlWriter(tmp_path / 'ev.jsonl', policy=CommitPolicy(fsync=False))
+    worker = _RotationWorker(process_min_bytes=0)
+    worker.submit(w, part)
+    assert worker.wait_idle(30.0)
+    assert worker.stats['completed'] == 1 and worker.stats['failed'] == 0
+    assert worker.stats['bytes_in'] == 8000
+    assert not part.exists()
+    with gzip.open(str(part) + '.gz', 'rt', encoding='utf-8') as f:
+        assert len(f.readlines()) == 1000
+
+
+def test_compression_failure_is_counted_and_part_kept(tmp_path):
+    part = tmp_path / 'ev.jsonl.20250101.000000.part1.jsonl'
+    part.write_text('{"a":1}\n', encoding='utf-8')
+    (tmp_path / (part.name + '.gz')).mkdir()  # gzip target cannot be opened
+    w = _JsonlWriter(tmp_path / 'ev.jsonl', policy=CommitPolicy(fsync=False))
+    worker = _RotationWorker()
+    worker.submit(w, part)
+    assert worker.wait_idle(10.0)
+    assert worker.stats['failed'] == 1 and worker.stats['completed'] == 0
+    assert part.exists()
+    w.close()
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from core.scalper.calibrator import IsotonicCalibrator as ScalperIsotonic
+from core.signal.score import ScoreModel
+
+
+class _ScalarCal:
+    def calibrate_prob(self, p):
+        return min(1.0, p * 1.2)
+
+
+class _BatchCal:
+    def __init__(self):
+        self.calls = 0
+
+    def calibrate_prob(self, p):
+        return p ** 2
+
+    def calibrate_prob_batch(self, p):
+        self.calls += 1
+        return np.asarray(p) ** 2
+
+
+def _model():
+    return ScoreModel(weights={"obi": 0.8, "microprice": 0.5, "tfi": -1.5}, intercept=-0.1, gamma=2.0, use_cross_asset=True)
+
+
+def test_score_batch_matches_score_event():
+    rng = np.random.default_rng(0)
+    m = _model()
+    n = 500
+    feats = {"obi": rng.normal(size=n), "tfi": rng.normal(size=n) * 30, "unused": rng.normal(size=n)}
+    beta, ret = rng.normal(size=n), rng.normal(size=n) * 0.01
+    out = m.score_batch(feats, cross_beta=beta, cross_return=ret, calibrator=_ScalarCal())
+    assert len(out) == n
+    for i in range(0, n, 37):
+        ref = m.score_event(
+            features={k: v[i] for k, v in feats.items()},
+            cross_beta=beta[i],
+            cross_return=ret[i],
+            calibrator=_ScalarCal(),
+        )
+        row = out.row(i)
+        assert row.score == pytest.approx(ref.score, rel=1e-12, abs=1e-12)
+        assert row.p_raw == pytest.approx(ref.p_raw, rel=1e-12, abs=1e-15)
+        assert row.p == pytest.approx(ref.p, rel=1e-12, abs=1e-15)
+        assert row.components == pytest.approx(ref.components)
+    # saturated scores stay finite and within [0, 1]
+    assert np.all(np.isfinite(out.p_raw) & (out.p_raw >= 0) & (out.p_raw <= 1))
+
+
+def test_score_batch_array_input_and_batch_calibrator():
+    m = _model()
+    assert tuple(m.feature_names()) == ("obi", "microprice", "tfi")
+    X = np.array([[0.1, 0.2, 0.0], [-0.5, 0.0, 0.3]])
+    cal = _BatchCal()
+    out = m.score_batch(X, calibrator=cal)
+    assert cal.calls == 1
+    assert np.allclose(out.p, out.p_raw ** 2)
+    d = m.score_batch({"obi": X[:, 0], "microprice": X[:, 1], "tfi": X[:, 2]}).as_dict()
+    assert np.allclose(d["score"], out.score) and np.all(d["comp_cross"] == 0.0)
+    with pytest.raises(ValueError):
+        m.score_batch(np.zeros((2, 2)))
+
+
+def test_score_batch_dispatches_calibrators_like_score_event():
+    rng = np.random.default_rng(1)
+    m = _model()
+    feats = {"obi": rng.normal(size=40), "tfi": rng.normal(size=40)}
+    # score→p batch map with no scalar p→p method: score_event leaves p raw
+    scalper = ScalperIsotonic(log_every=0)
+    scalper.fit(rng.uniform(-1, 1, 200), rng.integers(0, 2, 200))
+    out = m.score_batch(feats, calibrator=scalper)
+    for i in range(40):
+        ref = m.score_event(features={k: v[i] for k, v in feats.items()}, calibrator=scalper)
+        assert out.p[i] == pytest.approx(ref.p, abs=1e-15)
+    assert np.array_equal(out.p, out.p_raw)
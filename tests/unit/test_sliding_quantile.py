@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pytest
+
+from aurora.health import HealthGuard
+from core.utils.quantiles import SlidingQuantile, sketch_enabled
+from core.xai.alerts import CvarBreachAlert
+
+
+def _ref_quantile(xs, q):
+    s = sorted(xs)
+    pos = q * (len(s) - 1)
+    lo = int(pos)
+    hi = min(lo + 1, len(s) - 1)
+    f = pos - lo
+    return s[lo] * (1 - f) + s[hi] * f
+
+
+def test_count_window_matches_numpy_and_sorted_reference():
+    rnd = random.Random(3)
+    sq = SlidingQuantile(maxlen=300, block=8)
+    buf = []
+    for _ in range(3000):
+        # ties on purpose
+        x = rnd.gauss(0.0, 1.0) if rnd.random() < 0.8 else float(rnd.randint(-2, 2))
+        sq.add(x)
+        buf = (buf + [x])[-300:]
+        assert len(sq) == len(buf)
+        for p in (0, 10, 50, 95, 100):
+            assert sq.percentile(p) == float(np.percentile(np.array(buf), p))
+        assert sq.quantile(0.37) == _ref_quantile(buf, 0.37)
+    assert sq.values() == sorted(buf)
+    # rank lookups go through the block-count Fenwick even without tail_sums
+    assert [sq.kth(k) for k in range(len(sq))] == sorted(buf)
+
+
+def test_remove_and_tail_queries():
+    sq = SlidingQuantile(block=8)
+    sq.extend([5.0, 1.0, 3.0, 3.0, 9.0, float('nan')])
+    assert len(sq) == 5
+    assert sq.remove(3.0) and not sq.remove(4.0)
+    assert sq.values() == [1.0, 3.0, 5.0, 9.0]
+    assert sq.kth(2) == 5.0
+    assert sq.quantile_lower(0.5) == 3.0
+    assert sq.count_sum_ge(3.0) == (3, 17.0)
+    assert sq.count_sum_ge(10.0) == (0, 0.0)
+    with pytest.raises(IndexError):
+        sq.kth(4)
+    assert SlidingQuantile().quantile(0.5) == 0.0
+
+
+def test_flag_resolution(monkeypatch):
+    monkeypatch.setenv('AURORA_QUANTILE_SKETCH', '0')
+    assert sketch_enabled() is False
+    assert sketch_enabled(True) is True
+    monkeypatch.delenv('AURORA_QUANTILE_SKETCH')
+    assert sketch_enabled() is True
+
+
+def test_health_guard_time_window_parity():
+    rnd = random.Random(5)
+    a = HealthGuard(threshold_ms=1e9, window_sec=1, sketch=True)
+    b = HealthGuard(threshold_ms=1e9, window_sec=1, sketch=False)
+    t = 0.0
+    for _ in range(2000):
+        t += rnd.random() * 0.01
+        x = rnd.lognormvariate(1.0, 0.5)
+        assert a.record(x, now=t) == b.record(x, now=t)
+
+
+def test_cvar_alert_parity():
+    rnd = random.Random(11)
+    a = CvarBreachAlert(window_size=200, alpha=0.9, min_interval_ns=0, sketch=True)
+    b = CvarBreachAlert(window_size=200, alpha=0.9, min_interval_ns=0, sketch=False)
+    a._limit = b._limit = 0.015
+    for i in range(1500):
+        r = rnd.gauss(0.0, 0.01)
+        ra, rb = a.update(i, r), b.update(i, r)
+        assert (ra is None) == (rb is None)
+        if ra is not None:
+            assert ra.message == rb.message
+
+
+@pytest.mark.parametrize("indexed", [True, False])
+def test_fenwick_tail_sums_match_sorted_reference(indexed):
+    rng = random.Random(9)
+    sq = SlidingQuantile(block=8, tail_sums=indexed, refresh=50)
+    ref = []
+    for t in range(3000):
+        if ref and rng.random() < 0.45:
+            x = ref.pop(rng.randrange(len(ref)))
+            assert sq.remove(x)
+        else:
+            x = float(rng.randint(0, 40)) if rng.random() < 0.3 else rng.random() * 40
+            sq.add(x)
+            ref.append(x)
+        if ref and t % 7 == 0:
+            srt = sorted(ref)
+            k = rng.randrange(len(srt))
+            v, s = sq.tail(k)
+            assert v == srt[k] == sq.kth(k)
+            assert s == pytest.approx(sum(srt[k:]), rel=1e-9, abs=1e-9)
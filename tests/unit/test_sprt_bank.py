@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from core.governance.composite_sprt import AlphaSpendingLedger, create_gaussian_sprt
+from core.governance.sprt_bank import ACCEPT_H0, ACCEPT_H1, CONTINUE, SPRTBank
+from core.governance.sprt_glr import CompositeSPRT as GlrSPRT, SPRTConfig, SPRTOutcome
+
+
+def _stream(seed, n_tests, n_obs, shift):
+    rng = np.random.default_rng(seed)
+    tests = rng.integers(0, n_tests, n_obs)
+    x = rng.normal(size=n_obs) + shift[tests]
+    return tests, x
+
+
+def test_gaussian_bank_matches_one_by_one_composite_sprt():
+    n_tests = 40
+    shift = np.linspace(-0.5, 1.5, n_tests)
+    tests, x = _stream(1, n_tests, 3000, shift)
+    bank = SPRTBank(n_tests, model="gaussian", mu0=0.0, mu1=1.0, sigma=1.0, alpha=0.05, beta=0.2)
+    for lo in range(0, tests.size, 250):  # uneven batches with repeated tests
+        bank.update(tests[lo:lo + 250], x[lo:lo + 250])
+
+    for i in range(n_tests):
+        ref = create_gaussian_sprt(mu_0=0.0, mu_1=1.0, sigma=1.0)
+        ref._log_sprt_decision = lambda *a, **k: None
+        decision = None
+        for xi in x[tests == i]:
+            decision = ref.update(float(xi), ref.model_h0, ref.model_h1).decision
+            if decision is not None:
+                break
+        assert bank.llr[i] == pytest.approx(ref.log_lr, abs=1e-9)
+        assert bank.n[i] == ref.n_samples
+        want = {None: CONTINUE, 'accept_h1': ACCEPT_H1, 'accept_h0': ACCEPT_H0}[decision]
+        assert bank.decision[i] == want
+    assert (bank.decision == ACCEPT_H1).any() and (bank.decision == ACCEPT_H0).any()
+
+
+def test_t_bank_matches_glr_sprt_with_min_and_max_samples():
+    n_tests = 25
+    shift = np.linspace(-0.2, 0.4, n_tests)
+    tests, x = _stream(2, n_tests, 2500, shift)
+    bank = SPRTBank(n_tests, model="t", mu0=0.0, mu1=0.3, alpha=0.05, beta=0.2, min_samples=5, max_samples=60)
+    bank.update(tests, x)
+    for i in range(n_tests):
+        ref = GlrSPRT(SPRTConfig(mu0=0.0, mu1=0.3, alpha=0.05, beta=0.2, min_samples=5, max_samples=60))
+        for xi in x[tests == i]:
+            d = ref.update(float(xi))
+            if d.stop:
+                break
+        assert bank.n[i] == ref.state.n_samples
+        assert bank.llr[i] == pytest.approx(ref.state.llr, rel=1e-9, abs=1e-9)
+        want = {SPRTOutcome.ACCEPT_H1: ACCEPT_H1, SPRTOutcome.ACCEPT_H0: ACCEPT_H0}.get(d.outcome, CONTINUE)
+        assert bank.decision[i] == (want if d.stop else CONTINUE)
+
+
+def test_decisions_spend_alpha_in_bulk_and_freeze_until_reset():
+    ledger = AlphaSpendingLedger(total_alpha=1.0, policy="pocock")
+    ledger.set_expected_tests(1)
+    bank = SPRTBank(
+        4, model="bernoulli", p0=0.5, p1=0.8, alpha=0.05, beta=0.2,
+        alpha_ledger=ledger, test_ids=["a", "b", "c", "d"], policy_id="canary",
+    )
+    out = bank.update([0, 1] * 12 + [2], [1, 0] * 12 + [1])
+    assert set(out.decided.tolist()) == {0, 1}
+    assert bank.decision[0] == ACCEPT_H1 and bank.decision[1] == ACCEPT_H0
+    assert bank.decision[2] == CONTINUE and bank.n[2] == 1 and bank.n[3] == 0
+    assert [e.test_id for e in ledger.entries] == ["a", "b"]
+    assert all(e.policy_id == "canary" and e.test_type == "SPRTBank_bernoulli" for e in ledger.entries)
+    assert out.alpha_spent.tolist() == [e.alpha_spent for e in ledger.entries]
+    assert ledger.cumulative_alpha == pytest.approx(sum(out.alpha_spent))
+
+    n0 = int(bank.n[0])
+    again = bank.update([0, 0, 3], [1.0, 1.0, 1.0])
+    assert again.tests.tolist() == [3] and bank.n[0] == n0
+    bank.reset([0])
+    assert bank.n[0] == 0 and bank.decision[0] == CONTINUE and 0 in bank.active()
+
+
+def test_weights_scale_increments():
+    a = SPRTBank(2, model="gaussian", mu0=0.0, mu1=[1.0, 2.0], sigma=[1.0, 2.0])
+    b = SPRTBank(2, model="gaussian", mu0=0.0, mu1=[1.0, 2.0], sigma=[1.0, 2.0])
+    a.update([0, 1, 0], [0.2, 0.3, -0.1], weight=[0.5, 2.0, 1.0])
+    b.update([0, 1, 0], [0.2, 0.3, -0.1])
+    inc = np.array([(0.2 ** 2 - (0.2 - 1.0) ** 2) / 2, (0.3 ** 2 - (0.3 - 2.0) ** 2) / 8, (0.01 - 1.21) / 2])
+    assert a.llr == pytest.approx([0.5 * inc[0] + inc[2], 2.0 * inc[1]])
+    assert b.llr == pytest.approx([inc[0] + inc[2], inc[1]])
+    with pytest.raises(ValueError):
+        SPRTBank(1, model="t", mu0=0.0, mu1=1.0).update([0], [1.0], weight=[2.0])
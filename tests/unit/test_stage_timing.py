@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import json
+import random
+
+from core.aurora.gate_params import GateParams
+from core.aurora.pipeline import PretradePipeline
+from core.aurora.stage_timing import StageTiming
+
+
+class _Hist:
+    def __init__(self):
+        self.obs = {}
+
+    def labels(self, stage):
+        h = self
+
+        class _C:
+            def observe(self_inner, v):
+                h.obs.setdefault(stage, []).append(v)
+
+        return _C()
+
+
+def _decide(pipe, **market):
+    m = {'latency_ms': 1.0, 'score': 0.5, 'a_bps': 5.0, 'b_bps': 20.0, 'spread_bps': 2.0}
+    m.update(market)
+    return pipe.decide(account={'mode': 'testnet'}, order={'base_notional': 1.0}, market=m, fees_bps=0.5)
+
+
+def test_stage_timings_exported_to_histogram_and_obs():
+    hist = _Hist()
+    timing = StageTiming(histogram=hist, expose_obs=True)
+    pipe = PretradePipeline(emitter=None, trap_window=None, health_guard=None, risk_manager=None, params=GateParams(), timing=timing)
+    allow, _, obs, _ = _decide(pipe)
+    assert allow
+    t = obs['timings_ns']
+    for stage in ('latency', 'health', 'trap', 'expected_return', 'slippage', 'risk', 'sprt', 'spread'):
+        assert stage in t and t[stage] >= 0
+    assert t['total'] == sum(v for k, v in t.items() if k != 'total')
+    assert set(hist.obs) >= {'latency', 'spread', 'total'}
+
+
+def test_no_timing_leaves_obs_untouched():
+    pipe = PretradePipeline(emitter=None, trap_window=None, health_guard=None, risk_manager=None, params=GateParams())
+    _, _, obs, _ = _decide(pipe)
+    assert 'timings_ns' not in obs
+
+
+def test_sampled_trace_file(tmp_path):
+    trace = tmp_path / 'trace.jsonl'
+    timing = StageTiming(sample_rate=0.5, trace_path=trace, rng=random.Random(7))
+    pipe = PretradePipeline(emitter=None, trap_window=None, health_guard=None, risk_manager=None, params=GateParams(), timing=timing)
+    for _ in range(40):
+        _decide(pipe, spread_bps=1000.0)
+    timing.close()
+    rows = [json.loads(x) for x in trace.read_text(encoding='utf-8').splitlines()]
+    assert 5 < len(rows) < 35
+    assert rows[0]['allow'] is False and rows[0]['reason'].startswith('spread_bps_too_wide')
+    assert rows[0]['total_ns'] == sum(rows[0]['stages_ns'].values())
+
+
+def test_from_cfg(tmp_path):
+    assert StageTiming.from_cfg({'observability': {'stage_timing': {'enabled': False}}}, env={}) is None
+    t = StageTiming.from_cfg({'observability': {'stage_timing': {'obs': True, 'sample_rate': 0.1}}}, session_dir=tmp_path, env={})
+    assert t is not None and t.expose_obs and t.sample_rate == 0.1
+    t.close()
@@ -0,0 +1,67 @@
+import random
+
+import pytest
+
+from core.features.tfi import TFIStream, _Rolling, vpin_volume_buckets, vpin_like
+from core.types import Side, Trade
+
+
+def _trades(n=3000, seed=5, p_buy=0.6):
+    rng = random.Random(seed)
+    ts = 1_000.0
+    out = []
+    for _ in range(n):
+        ts += rng.expovariate(50.0)
+        side = Side.BUY if rng.random() < p_buy else Side.SELL
+        out.append(Trade(timestamp=ts, price=100.0, size=max(0.1, rng.gauss(10.0, 4.0)), side=side))
+    return out
+
+
+def _window_sums(trades, now, h):
+    b = sum(float(t.size) for t in trades if t.timestamp >= now - h and t.side == Side.BUY)
+    s = sum(float(t.size) for t in trades if t.timestamp >= now - h and t.side == Side.SELL)
+    return b, s
+
+
+def test_vpin_buckets_match_batch_when_horizon_unbounded():
+    tr = _trades()
+    stream = TFIStream(window_s=1e9, bucket_volume=75.0, max_trades=10**9, max_buckets=40)
+    for i, t in enumerate(tr):
+        stream.ingest_trade(t)
+        if i % 250 == 0 or i == len(tr) - 1:
+            ref = vpin_volume_buckets(tr[: i + 1], 75.0, max_buckets=40)
+            assert stream.features(now_ts=t.timestamp)["vpin_bucketed"] == pytest.approx(ref, abs=1e-9)
+
+
+def test_multi_window_tfi_shares_one_log():
+    tr = _trades(n=2000)
+    stream = TFIStream(window_s=2.0, bucket_volume=50.0, windows=(0.5, 10.0))
+    for i, t in enumerate(tr):
+        stream.ingest_trade(t)
+        if i % 97 == 0:
+            now = t.timestamp + 0.1
+            f = stream.features(now_ts=now)
+            for key, h in (("", 2.0), ("_0.5s", 0.5), ("_10s", 10.0)):
+                b, s = _window_sums(tr[: i + 1], now, h)
+                assert f["tfi" + key] == pytest.approx(b - s, abs=1e-6)
+                assert f["vpin_like" + key] == pytest.approx(vpin_like(b, s), abs=1e-9)
+    # the shared log only keeps what the longest window needs
+    horizon = [t for t in tr if t.timestamp >= tr[-1].timestamp - 10.0]
+    assert len(stream._log.q) <= len(horizon) + 1
+    assert 0.0 <= stream.features(now_ts=tr[-1].timestamp)["vpin_bucketed"] <= 1.0
+
+
+def test_rolling_standalone_and_bucket_horizon():
+    r = _Rolling(1.0)
+    r.add(0.0, buy=1.0, sell=0.0)
+    r.add(0.5, buy=0.0, sell=2.0)
+    assert r.sums(0.9) == (1.0, 2.0)
+    assert r.sums(1.2) == (0.0, 2.0)
+    assert r.sums(5.0) == (0.0, 0.0) and len(r.log.q) == 0
+
+    stream = TFIStream(window_s=1.0, bucket_volume=10.0, max_trades=5)
+    for i in range(20):
+        stream.ingest_trade(Trade(timestamp=float(i) * 0.01, price=1.0, size=10.0, side=Side.BUY))
+    # one bucket per trade; only buckets started within the last 5 trades count
+    assert len(stream._buckets) == 5
+    assert stream.vpin_bucketed() == pytest.approx(1.0)
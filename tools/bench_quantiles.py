@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Accuracy/throughput benchmark: SlidingQuantile vs sort-per-call estimators.
+
+For each migrated pattern (TRAP RollingPercentiles, HealthGuard p95, SLA
+_Quantile, RegimeManager thresholds) the legacy path and the sketch path
+consume the same stream; we report updates+queries per second and the max
+absolute difference of the returned quantiles (expected 0.0: the sketch is exact).
+
+Usage: python tools/bench_quantiles.py [--n 20000] [--window 2000]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path as _P
+from typing import Callable, List, Tuple
+
+# Ensure repo root is on sys.path for direct script execution
+ROOT = _P(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from aurora.health import HealthGuard
+from core.execution.sla import _Quantile
+from core.regime.manager import RegimeManager
+from core.scalper.trap import RollingPercentiles
+
+
+def _stream(n: int, seed: int = 7) -> List[float]:
+    rnd = random.Random(seed)
+    # latency-like: lognormal body with occasional spikes
+    return [rnd.lognormvariate(1.5, 0.6) * (10.0 if rnd.random() < 0.01 else 1.0) for _ in range(n)]
+
+
+def _run(step: Callable[[float], Tuple[float, ...]], xs: List[float]) -> Tuple[float, List[Tuple[float, ...]]]:
+    out: List[Tuple[float, ...]] = []
+    t0 = time.perf_counter()
+    for x in xs:
+        out.append(step(x))
+    return time.perf_counter() - t0, out
+
+
+def _cases(window: int):
+    def trap(sketch: bool):
+        rp = RollingPercentiles(maxlen=window, sketch=sketch)
+
+        def step(x: float):
+            rp.add(x)
+            return tuple(rp.percentiles([10, 50, 90]))
+        return step
+
+    def health(sketch: bool):
+        # 1 sample per ms of fake time, window sized to `window` samples
+        hg = HealthGuard(threshold_ms=1e9, window_sec=max(1, window // 1000), sketch=sketch)
+        clock = [0.0]
+
+        def step(x: float):
+            clock[0] += 0.001
+            return (hg.record(x, now=clock[0])[1],)
+        return step
+
+    def sla(sketch: bool):
+        q = _Quantile(limit=window, sketch=sketch)
+
+        def step(x: float):
+            q.push(x)
+            s = q.summary()
+            return (s.p50_ms, s.p90_ms, s.p99_ms)
+        return step
+
+    def regime(sketch: bool):
+        rm = RegimeManager(trend_q=0.6, grind_q=0.4, window=window, min_dwell=10, sketch=sketch)
+
+        def step(x: float):
+            st = rm.update(x - 5.0)
+            return (st.q_lo, st.q_hi, st.proxy)
+        return step
+
+    return [('trap.RollingPercentiles', trap), ('HealthGuard.p95', health), ('sla._Quantile', sla), ('RegimeManager', regime)]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--n', type=int, default=20000)
+    ap.add_argument('--window', type=int, default=2000)
+    args = ap.parse_args()
+    xs = _stream(args.n)
+    print(f"n={args.n} window={args.window}")
+    print(f"{'estimator':26s} {'legacy ops/s':>14s} {'sketch ops/s':>14s} {'speedup':>8s} {'max|err|':>10s}")
+    for name, make in _cases(args.window):
+        t_old, r_old = _run(make(False), xs)
+        t_new, r_new = _run(make(True), xs)
+        err = max((abs(a - b) for ro, rn in zip(r_old, r_new) for a, b in zip(ro, rn)), default=0.0)
+        print(f"{name:26s} {args.n / t_old:14.0f} {args.n / t_new:14.0f} {t_old / t_new:7.1f}x {err:10.3g}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Convert raw JSONL market events into a columnar tick store for replay.
+
+Each input is normalized once through `Normalizer(strict=False)` and written
+as per-(symbol, UTC day) binary files (see core/ingestion/tickstore.py).
+Re-running on more inputs extends the existing day files.
+
+Usage: python tools/build_tickstore.py --out data/ticks data/raw/*.jsonl[.gz]
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import sys
+import time
+from pathlib import Path as _P
+from typing import Any, Iterator, Mapping
+
+# Ensure repo root is on sys.path for direct script execution
+ROOT = _P(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.ingestion.normalizer import Normalizer
+from core.ingestion.tickstore import TickStoreWriter
+
+
+def _read_jsonl(path: _P) -> Iterator[Mapping[str, Any]]:
+    opener = gzip.open if path.suffix == '.gz' else open
+    with opener(path, 'rt', encoding='utf-8') as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                obj = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(obj, dict):
+                yield obj
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description='Build a tick store from raw JSONL events')
+    ap.add_argument('inputs', nargs='+', help='JSONL or JSONL.gz files with raw events')
+    ap.add_argument('--out', required=True, help='tick store root directory')
+    ap.add_argument('--source-tag', default='replay')
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    norm = Normalizer(source_tag=args.source_tag, strict=False)
+    raw_n = 0
+    with TickStoreWriter(args.out) as w:
+        for p in args.inputs:
+            for raw in _read_jsonl(_P(p)):
+                raw_n += 1
+                evt = norm.normalize(raw)
+                if evt is not None:
+                    w.append(evt)
+        kept = w.appended
+    print(f"raw={raw_n} written={kept} dropped={raw_n - kept} seconds={time.perf_counter() - t0:.2f} out={args.out}")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())